@@ -1,8 +1,31 @@
 from hpack.hpack import (
+    Encoder,
+    Decoder,
     encode_integer,
-    decode_integer
+    decode_integer,
+    _encode_integer,
+    _decode_integer
 )
 
+# A typical request, which the encoder and decoder mostly handle with
+# single-byte integers.
+REQUEST_HEADERS = [
+    (':method', 'GET'),
+    (':scheme', 'https'),
+    (':authority', 'www.example.com'),
+    (':path', '/index.html'),
+    ('user-agent', 'Mozilla/5.0 (X11; Linux x86_64; rv:58.0) Firefox/58.0'),
+    ('accept', 'text/html,application/xhtml+xml'),
+    ('accept-encoding', 'gzip, deflate, br'),
+    ('cookie', 'session=0123456789abcdef'),
+]
+
+# The batch benchmarks handle 100 header blocks per round, which takes
+# milliseconds, so they run a fixed number of rounds rather than the minimum
+# that tox sets for microbenchmarks.
+BATCH_SIZE = 100
+BATCH_ROUNDS = 1000
+
 
 class TestHpackEncodingIntegersBenchmarks:
     def test_encode_small_integer_large_prefix(self, benchmark):
@@ -34,3 +57,94 @@ class TestHpackDecodingIntegersBenchmarks:
     def test_decode_large_integer_small_prefix(self, benchmark):
         data = bytes(encode_integer(integer=120000, prefix_bits=1))
         benchmark(decode_integer, data=data, prefix_bits=1)
+
+
+class TestHpackIntegerFastPathBenchmarks:
+    def test_encode_small_integer_with_flags(self, benchmark):
+        benchmark(_encode_integer, integer=120, prefix_bits=7, flags=0x80)
+
+    def test_encode_large_integer_with_flags(self, benchmark):
+        benchmark(_encode_integer, integer=120000, prefix_bits=7, flags=0x80)
+
+    def test_decode_small_integer_at_offset(self, benchmark):
+        data = b'\x00' + _encode_integer(120, 7, 0x80)
+        benchmark(_decode_integer, data=data, offset=1, prefix_bits=7)
+
+    def test_decode_large_integer_at_offset(self, benchmark):
+        data = b'\x00' + _encode_integer(120000, 7, 0x80)
+        benchmark(_decode_integer, data=data, offset=1, prefix_bits=7)
+
+
+class TestHpackHeaderBlockBenchmarks:
+    def test_encode_first_request(self, benchmark):
+        benchmark(lambda: Encoder().encode(REQUEST_HEADERS))
+
+    def test_encode_repeated_request(self, benchmark):
+        encoder = Encoder()
+        encoder.encode(REQUEST_HEADERS)
+        benchmark(encoder.encode, REQUEST_HEADERS)
+
+    def test_encode_into_repeated_request(self, benchmark):
+        encoder = Encoder()
+        encoder.encode(REQUEST_HEADERS)
+        buf = bytearray(1024)
+        benchmark(encoder.encode_into, REQUEST_HEADERS, buf, 9)
+
+    def test_encode_many_repeated_requests(self, benchmark):
+        encoder = Encoder()
+        encoder.encode(REQUEST_HEADERS)
+        benchmark.pedantic(
+            encoder.encode_many, args=([REQUEST_HEADERS] * BATCH_SIZE,),
+            rounds=BATCH_ROUNDS, warmup_rounds=1
+        )
+
+    def test_encode_repeated_requests_sequentially(self, benchmark):
+        encoder = Encoder()
+        encoder.encode(REQUEST_HEADERS)
+        benchmark.pedantic(
+            lambda: [
+                encoder.encode(REQUEST_HEADERS) for _ in range(BATCH_SIZE)
+            ],
+            rounds=BATCH_ROUNDS, warmup_rounds=1
+        )
+
+    def test_decode_first_request(self, benchmark):
+        data = Encoder().encode(REQUEST_HEADERS)
+        benchmark(lambda: Decoder().decode(data))
+
+    def test_decode_repeated_request(self, benchmark):
+        encoder = Encoder()
+        decoder = Decoder()
+        decoder.decode(encoder.encode(REQUEST_HEADERS))
+        data = encoder.encode(REQUEST_HEADERS)
+        benchmark(decoder.decode, data)
+
+    def test_decode_many_repeated_requests(self, benchmark):
+        encoder = Encoder()
+        decoder = Decoder()
+        decoder.decode(encoder.encode(REQUEST_HEADERS))
+        blocks = [encoder.encode(REQUEST_HEADERS)] * BATCH_SIZE
+        benchmark.pedantic(
+            decoder.decode_many, args=(blocks,), rounds=BATCH_ROUNDS,
+            warmup_rounds=1
+        )
+
+    def test_decode_many_repeated_requests_flat(self, benchmark):
+        encoder = Encoder()
+        decoder = Decoder()
+        decoder.decode(encoder.encode(REQUEST_HEADERS))
+        blocks = [encoder.encode(REQUEST_HEADERS)] * BATCH_SIZE
+        benchmark.pedantic(
+            decoder.decode_many, args=(blocks,), kwargs={'flat': True},
+            rounds=BATCH_ROUNDS, warmup_rounds=1
+        )
+
+    def test_decode_repeated_requests_sequentially(self, benchmark):
+        encoder = Encoder()
+        decoder = Decoder()
+        decoder.decode(encoder.encode(REQUEST_HEADERS))
+        blocks = [encoder.encode(REQUEST_HEADERS)] * BATCH_SIZE
+        benchmark.pedantic(
+            lambda: [decoder.decode(data) for data in blocks],
+            rounds=BATCH_ROUNDS, warmup_rounds=1
+        )
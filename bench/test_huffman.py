@@ -0,0 +1,35 @@
+import pytest
+
+from hpack.huffman import HuffmanEncoder
+from hpack.huffman_constants import (
+    REQUEST_CODES, REQUEST_CODES_LENGTH
+)
+
+# Encoding a long value takes up to a millisecond, so those benchmarks run a
+# fixed number of rounds rather than the minimum that tox sets for
+# microbenchmarks.
+LONG_VALUE_ROUNDS = 1000
+
+
+def _token(length):
+    """
+    A base64-ish value of the given length, like a cookie or JWT.
+    """
+    alphabet = (
+        b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.'
+    )
+    return (alphabet * (length // len(alphabet) + 1))[:length]
+
+
+class TestHuffmanEncodingBenchmarks:
+    @pytest.mark.parametrize('length', [1024, 2048, 4096, 8192])
+    def test_encode_long_value(self, benchmark, length):
+        encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+        benchmark.pedantic(
+            encoder.encode, args=(_token(length),), rounds=LONG_VALUE_ROUNDS,
+            warmup_rounds=1
+        )
+
+    def test_encode_short_value(self, benchmark):
+        encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+        benchmark(encoder.encode, b'text/html; charset=utf-8')
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+from hpack import Encoder
+from hpack.indexing import (
+    IndexingPolicy, DenylistIndexingPolicy, MaxSizeIndexingPolicy,
+    AdaptiveIndexingPolicy, CombinedIndexingPolicy
+)
+
+
+RAW_DATA = os.path.join(
+    os.path.dirname(__file__), '..', 'test', 'test_fixtures', 'raw-data'
+)
+
+
+def _load_stories():
+    """
+    Loads the header sets of every raw-data story.
+    """
+    stories = []
+    for filename in sorted(os.listdir(RAW_DATA)):
+        with open(os.path.join(RAW_DATA, filename)) as f:
+            story = json.load(f)
+        stories.append([
+            [(n, v) for header in case['headers'] for n, v in header.items()]
+            for case in story['cases']
+        ])
+    return stories
+
+
+STORIES = _load_stories()
+
+# Encoding every story takes a fraction of a second, so each policy runs a
+# fixed number of rounds rather than the minimum that tox sets for
+# microbenchmarks.
+STORY_ROUNDS = 5
+
+POLICIES = {
+    'none': IndexingPolicy,
+    'denylist': DenylistIndexingPolicy,
+    'max-size': MaxSizeIndexingPolicy,
+    'adaptive': AdaptiveIndexingPolicy,
+    'combined': lambda: CombinedIndexingPolicy(
+        DenylistIndexingPolicy(), MaxSizeIndexingPolicy(),
+        AdaptiveIndexingPolicy()
+    ),
+}
+
+
+def _encode_stories(policy_factory):
+    """
+    Encodes every story with a fresh encoder, as a connection would, and
+    returns the total size of the header blocks.
+    """
+    total = 0
+    for story in STORIES:
+        encoder = Encoder(indexing_policy=policy_factory())
+        for header_set in story:
+            total += len(encoder.encode(header_set))
+    return total
+
+
+class TestIndexingPolicyBenchmarks:
+    @pytest.mark.parametrize('policy', sorted(POLICIES))
+    def test_encode_stories(self, benchmark, policy):
+        # The uncompressed size counts each header as a name and value with a
+        # separator and line ending, as in HTTP/1.1.
+        uncompressed = sum(
+            len(name) + len(value) + 4
+            for story in STORIES
+            for header_set in story
+            for name, value in header_set
+        )
+        encoded = benchmark.pedantic(
+            _encode_stories, args=(POLICIES[policy],), rounds=STORY_ROUNDS,
+            warmup_rounds=1
+        )
+        benchmark.extra_info['encoded_size'] = encoded
+        benchmark.extra_info['compression_ratio'] = (
+            float(uncompressed) / encoded
+        )
@@ -0,0 +1,152 @@
+"""
+Benchmarks of the memory each connection's HPACK state retains: one Encoder
+and one Decoder, with their header tables empty or full.
+
+The retained sizes are recorded in ``extra_info``, so that saved benchmark
+runs track them over time alongside the timings.
+"""
+import gc
+import sys
+from collections import deque
+
+import pytest
+
+from hpack import Encoder, Decoder
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+
+def _connection(table_size):
+    """
+    Builds the HPACK state of a connection, with both header tables filled
+    to ``table_size`` bytes by the headers of one header block.
+    """
+    encoder = Encoder()
+    decoder = Decoder()
+    if table_size:
+        encoder.header_table_size = table_size
+        decoder.max_allowed_table_size = table_size
+
+    # Each entry takes 100 bytes of the table: 32 bytes of overhead, and a
+    # 20 byte name and 48 byte value.
+    headers = [
+        ('x-header-%011d' % i, 'v' * 48) for i in range(table_size // 100)
+    ]
+    decoder.decode(encoder.encode(headers))
+    return encoder, decoder
+
+
+def _referents(obj):
+    """
+    Yields the objects that an object refers to through its container items,
+    attributes and slots.
+    """
+    if isinstance(obj, dict):
+        for item in obj.items():
+            for referent in item:
+                yield referent
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        for referent in obj:
+            yield referent
+
+    if hasattr(obj, '__dict__'):
+        yield obj.__dict__
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            if hasattr(obj, slot):
+                yield getattr(obj, slot)
+
+
+def _deep_size(obj, seen):
+    """
+    Sums sys.getsizeof over an object and everything it refers to, skipping
+    objects whose ids are in ``seen`` and adding the rest to it. Classes and
+    functions are never counted.
+    """
+    if id(obj) in seen or isinstance(obj, type) or callable(obj):
+        return 0
+    seen.add(id(obj))
+    return sys.getsizeof(obj) + sum(
+        _deep_size(referent, seen) for referent in _referents(obj)
+    )
+
+
+def _shared_ids():
+    """
+    The ids of the objects that are shared between connections, such as the
+    Huffman code tables, found by walking another connection.
+    """
+    first, second = _connection(0), _connection(0)
+    first_ids = set()
+    _deep_size(first, first_ids)
+    second_ids = set()
+    _deep_size(second, second_ids)
+    return first_ids & second_ids
+
+
+def _traced_size(table_size):
+    """
+    Measures with tracemalloc the memory allocated by building a connection
+    that is still held once garbage has been collected.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        connection = _connection(table_size)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del connection
+    return after - before
+
+
+class TestConnectionMemoryBenchmarks:
+    @pytest.mark.parametrize(
+        'table_size', [0, 4096, 65536], ids=['empty', '4KB', '64KB']
+    )
+    def test_connection_memory(self, benchmark, table_size):
+        # Build one connection first, so that process-wide state such as the
+        # Huffman decoding table isn't counted.
+        _connection(table_size)
+
+        encoder, decoder = benchmark.pedantic(
+            _connection, args=(table_size,), rounds=5, warmup_rounds=1
+        )
+        shared = _shared_ids()
+        benchmark.extra_info['encoder_bytes'] = _deep_size(
+            encoder, set(shared)
+        )
+        benchmark.extra_info['decoder_bytes'] = _deep_size(
+            decoder, set(shared)
+        )
+        benchmark.extra_info['getsizeof_bytes'] = _deep_size(
+            (encoder, decoder), set(shared)
+        )
+        if tracemalloc is not None:
+            benchmark.extra_info['tracemalloc_bytes'] = _traced_size(
+                table_size
+            )
+
+
+class TestForkBenchmarks:
+    """
+    Forks an encoder whose header table has been filled, as a connection
+    pool would to start each new connection from a warmed table.
+    """
+    @pytest.mark.parametrize(
+        'table_size', [4096, 65536], ids=['4KB', '64KB']
+    )
+    def test_fork(self, benchmark, table_size):
+        encoder, _ = _connection(table_size)
+        forked = benchmark(encoder.fork)
+
+        # The memory a fork holds beyond what it shares with the encoder it
+        # was forked from.
+        shared = _shared_ids()
+        _deep_size(encoder, shared)
+        benchmark.extra_info['fork_bytes'] = _deep_size(forked, shared)
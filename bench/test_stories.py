@@ -0,0 +1,232 @@
+"""
+Benchmarks that replay the HPACK fixture stories, as connections would, and
+microbenchmarks of the pieces they spend their time in.
+
+Each story benchmark records in ``extra_info`` how many headers and bytes it
+handles per round, and the resulting rates at the median round time.
+"""
+import json
+import os
+from binascii import unhexlify
+
+import pytest
+
+from hpack.hpack import Encoder, Decoder
+from hpack.huffman import HuffmanEncoder
+from hpack.huffman_constants import REQUEST_CODES, REQUEST_CODES_LENGTH
+from hpack.huffman_table import decode_huffman
+from hpack.table import HeaderTable
+
+
+FIXTURES = os.path.join(
+    os.path.dirname(__file__), '..', 'test', 'test_fixtures'
+)
+
+# Replaying every story takes seconds, so the story benchmarks run a fixed
+# number of rounds rather than the minimum that tox sets for microbenchmarks.
+STORY_ROUNDS = 5
+
+
+def _load_json(directory):
+    """
+    Loads every story in a fixture directory, in name order.
+    """
+    stories = []
+    for filename in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, filename)) as f:
+            stories.append(json.load(f))
+    return stories
+
+
+def _load_wire_stories():
+    """
+    Loads the cases of every draft 9 story that has header blocks, as tuples
+    of the header table size change before the block, if any, the block and
+    its headers.
+    """
+    stories = []
+    for directory in sorted(os.listdir(FIXTURES)):
+        if directory == 'raw-data':
+            continue
+        for story in _load_json(os.path.join(FIXTURES, directory)):
+            if story['draft'] != 9:
+                continue
+            stories.append([
+                (
+                    case.get('header_table_size'),
+                    unhexlify(case['wire']),
+                    [(n, v) for header in case['headers']
+                     for n, v in header.items()],
+                )
+                for case in story['cases']
+            ])
+    return stories
+
+
+def _load_raw_stories():
+    """
+    Loads the header sets of every raw-data story.
+    """
+    return [
+        [
+            [(n, v) for header in case['headers'] for n, v in header.items()]
+            for case in story['cases']
+        ]
+        for story in _load_json(os.path.join(FIXTURES, 'raw-data'))
+    ]
+
+
+WIRE_STORIES = _load_wire_stories()
+RAW_STORIES = _load_raw_stories()
+
+
+def _decode_stories(raw):
+    """
+    Decodes every story with a fresh decoder.
+    """
+    for story in WIRE_STORIES:
+        decoder = Decoder()
+        for header_table_size, data, _ in story:
+            if header_table_size is not None:
+                decoder.header_table_size = header_table_size
+            decoder.decode(data, raw=raw)
+
+
+def _encode_stories(huffman):
+    """
+    Encodes every raw-data story with a fresh encoder.
+    """
+    for story in RAW_STORIES:
+        encoder = Encoder()
+        for header_set in story:
+            encoder.encode(header_set, huffman=huffman)
+
+
+def _header_bytes(header_set):
+    """
+    The size of a header set, counting each header as its name and value.
+    """
+    return sum(len(name) + len(value) for name, value in header_set)
+
+
+def _record_rates(benchmark, headers, size):
+    """
+    Records the headers and bytes handled per round, and per second at the
+    median round time.
+    """
+    benchmark.extra_info['headers'] = headers
+    benchmark.extra_info['bytes'] = size
+
+    # Benchmarks run with --benchmark-disable have no timings.
+    if benchmark.stats is None:
+        return
+    median = benchmark.stats.stats.median
+    benchmark.extra_info['headers_per_second'] = headers / median
+    benchmark.extra_info['bytes_per_second'] = size / median
+
+
+class TestStoryBenchmarks:
+    @pytest.mark.parametrize('raw', [False, True])
+    def test_decode_stories(self, benchmark, raw):
+        benchmark.pedantic(
+            _decode_stories, args=(raw,), rounds=STORY_ROUNDS,
+            warmup_rounds=1
+        )
+
+        cases = [case for story in WIRE_STORIES for case in story]
+        _record_rates(
+            benchmark,
+            sum(len(headers) for _, _, headers in cases),
+            sum(len(data) for _, data, _ in cases),
+        )
+
+    @pytest.mark.parametrize('huffman', [True, False])
+    def test_encode_stories(self, benchmark, huffman):
+        benchmark.pedantic(
+            _encode_stories, args=(huffman,), rounds=STORY_ROUNDS,
+            warmup_rounds=1
+        )
+
+        header_sets = [
+            header_set for story in RAW_STORIES for header_set in story
+        ]
+        _record_rates(
+            benchmark,
+            sum(len(header_set) for header_set in header_sets),
+            sum(_header_bytes(header_set) for header_set in header_sets),
+        )
+
+
+class TestHuffmanStoryBenchmarks:
+    """
+    Huffman codes every distinct value in the raw-data stories.
+    """
+    values = sorted(set(
+        value.encode('utf-8')
+        for story in RAW_STORIES
+        for header_set in story
+        for _, value in header_set
+    ))
+
+    def test_encode_values(self, benchmark):
+        encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+
+        def encode_values():
+            for value in self.values:
+                encoder.encode(value)
+
+        benchmark.pedantic(
+            encode_values, rounds=STORY_ROUNDS * 10, warmup_rounds=1
+        )
+        _record_rates(
+            benchmark, len(self.values), sum(map(len, self.values))
+        )
+
+    def test_decode_values(self, benchmark):
+        encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+        encoded = [encoder.encode(value) for value in self.values]
+
+        def decode_values():
+            for value in encoded:
+                decode_huffman(value)
+
+        benchmark.pedantic(
+            decode_values, rounds=STORY_ROUNDS * 10, warmup_rounds=1
+        )
+        _record_rates(benchmark, len(encoded), sum(map(len, encoded)))
+
+
+class TestHeaderTableSearchBenchmarks:
+    """
+    Searches header tables filled with the given number of distinct entries.
+    """
+    @staticmethod
+    def _table(entries):
+        table = HeaderTable()
+        table.maxsize = 2 ** 20
+        for i in range(entries):
+            table.add(
+                ('x-custom-%d' % i).encode('ascii'),
+                ('value-%d' % i).encode('ascii')
+            )
+        return table
+
+    @pytest.mark.parametrize('entries', [0, 16, 128, 1024])
+    def test_search_miss(self, benchmark, entries):
+        table = self._table(entries)
+        benchmark(table.search, b'x-not-present', b'value')
+
+    @pytest.mark.parametrize('entries', [16, 128, 1024])
+    def test_search_oldest_entry(self, benchmark, entries):
+        table = self._table(entries)
+        benchmark(table.search, b'x-custom-0', b'value-0')
+
+    @pytest.mark.parametrize('entries', [16, 128, 1024])
+    def test_search_name_only(self, benchmark, entries):
+        table = self._table(entries)
+        benchmark(table.search, b'x-custom-0', b'other-value')
+
+    @pytest.mark.parametrize('entries', [0, 16, 128, 1024])
+    def test_search_static_entry(self, benchmark, entries):
+        table = self._table(entries)
+        benchmark(table.search, b':method', b'GET')
@@ -5,16 +5,17 @@ hpack
 
 HTTP/2 header encoding for Python.
 """
-from .hpack import Encoder, Decoder
+from .hpack import Encoder, Decoder, set_debug_logging
 from .struct import HeaderTuple, NeverIndexedHeaderTuple
 from .exceptions import (
-    HPACKError, HPACKDecodingError, InvalidTableIndex, OversizedHeaderListError
+    HPACKError, HPACKDecodingError, InvalidTableIndex,
+    OversizedHeaderListError, InvalidSnapshotError
 )
 
 __all__ = [
     'Encoder', 'Decoder', 'HPACKError', 'HPACKDecodingError',
     'InvalidTableIndex', 'HeaderTuple', 'NeverIndexedHeaderTuple',
-    'OversizedHeaderListError'
+    'OversizedHeaderListError', 'InvalidSnapshotError', 'set_debug_logging'
 ]
 
 __version__ = '3.1.0dev0'
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+hpack/cache
+~~~~~~~~~~~
+
+Implements the bounded caches used by the encoder.
+"""
+from collections import OrderedDict
+import sys
+import threading
+
+
+class LRUCache(object):
+    """
+    A bounded mapping that discards its least recently used entries.
+
+    Each entry has a weight, which by default is 1, and entries are discarded
+    whenever the total weight exceeds ``maxsize``. An entry that is heavier
+    than ``maxsize`` on its own is never stored.
+
+    The cache counts its hits, misses and evictions, which can be used to
+    judge whether it is sized sensibly.
+
+    :param maxsize: The maximum total weight of the entries in the cache.
+    :param weigh: (optional) A function that takes a key and value and returns
+        the weight of that entry.
+    """
+    def __init__(self, maxsize, weigh=None):
+        #: The maximum total weight of the entries in the cache.
+        self.maxsize = maxsize
+
+        #: The total weight of the entries in the cache.
+        self.size = 0
+
+        #: The number of lookups that found an entry.
+        self.hits = 0
+
+        #: The number of lookups that found no entry.
+        self.misses = 0
+
+        #: The number of entries discarded to make room for new ones.
+        self.evictions = 0
+
+        self._weigh = weigh
+
+        # Maps each key to a tuple of its value and weight, from the least to
+        # the most recently used.
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored for ``key``, marking it as the most recently
+        used entry, or ``default`` if there is none.
+        """
+        try:
+            entry = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._entries[key] = entry
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        """
+        Stores ``value`` for ``key`` as the most recently used entry, evicting
+        the least recently used entries if needed to make room.
+        """
+        weight = 1 if self._weigh is None else self._weigh(key, value)
+        if weight > self.maxsize:
+            return
+
+        old_entry = self._entries.pop(key, None)
+        if old_entry is not None:
+            self.size -= old_entry[1]
+
+        self._entries[key] = (value, weight)
+        self.size += weight
+
+        while self.size > self.maxsize:
+            _, (_, evicted_weight) = self._entries.popitem(last=False)
+            self.size -= evicted_weight
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Discards every entry. The hit, miss and eviction counts are kept.
+        """
+        self._entries.clear()
+        self.size = 0
+
+
+class SynchronizedLRUCache(LRUCache):
+    """
+    An :class:`LRUCache` that may safely be shared between threads.
+    """
+    def __init__(self, maxsize, weigh=None):
+        super(SynchronizedLRUCache, self).__init__(maxsize, weigh)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            return super(SynchronizedLRUCache, self).get(key, default)
+
+    def put(self, key, value):
+        with self._lock:
+            super(SynchronizedLRUCache, self).put(key, value)
+
+    def clear(self):
+        with self._lock:
+            super(SynchronizedLRUCache, self).clear()
+
+
+def object_sizes(key, value):
+    """
+    Weighs a cache entry by the memory used by its key and value objects.
+    """
+    return sys.getsizeof(key) + sys.getsizeof(value)
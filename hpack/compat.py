@@ -40,3 +40,13 @@ elif is_py3:
 
     unicode = str
     bytes = bytes
+
+
+def int_to_bytes(i, length):
+    """
+    Converts a non-negative integer to a big-endian bytestring of the given
+    length.
+    """
+    if is_py2:
+        return decode_hex('%0*x' % (length * 2, i))
+    return i.to_bytes(length, 'big')
@@ -47,3 +47,14 @@ class InvalidTableSizeError(HPACKDecodingError):
     .. versionadded:: 3.0.0
     """
     pass
+
+
+class InvalidSnapshotError(HPACKError):
+    """
+    A snapshot of an encoder, decoder or header table could not be restored,
+    because it is malformed, was taken of a different kind of object, or was
+    written by an incompatible version of ``hpack``.
+
+    .. versionadded:: 3.1.0
+    """
+    pass
@@ -6,11 +6,18 @@ hpack/hpack
 Implements the HPACK header compression algorithm as detailed by the IETF.
 """
 import logging
+import struct
 
-from .table import HeaderTable, table_entry_size
-from .compat import to_byte, to_bytes
+from . import table
+from .cache import LRUCache, SynchronizedLRUCache, object_sizes
+from .table import (
+    HeaderTable, table_entry_size, snapshot_header, unpack_snapshot,
+    check_snapshot_header
+)
+from .compat import to_byte, to_bytes, is_py3, unicode
 from .exceptions import (
-    HPACKDecodingError, OversizedHeaderListError, InvalidTableSizeError
+    HPACKDecodingError, OversizedHeaderListError, InvalidTableSizeError,
+    InvalidSnapshotError
 )
 from .huffman import HuffmanEncoder
 from .huffman_constants import (
@@ -21,6 +28,10 @@ from .struct import HeaderTuple, NeverIndexedHeaderTuple
 
 log = logging.getLogger(__name__)
 
+# Whether to log debug messages. Logging is skipped entirely unless this is
+# set, as even a disabled logger costs a call per header.
+_debug = log.isEnabledFor(logging.DEBUG)
+
 INDEX_NONE = b'\x00'
 INDEX_NEVER = b'\x10'
 INDEX_INCREMENTAL = b'\x40'
@@ -30,16 +41,88 @@ INDEX_INCREMENTAL = b'\x40'
 # as prefix numbers are not zero indexed.
 _PREFIX_BIT_MAX_NUMBERS = [(2 ** i) - 1 for i in range(9)]
 
+# The most continuation bytes an HPACK integer may have. Five carry 35 bits,
+# more than any length, index or table size needs, and reject integers that
+# never end, which would otherwise be buffered without limit.
+_MAX_INTEGER_CONTINUATION_BYTES = 5
+
+# Every possible single byte, so that integers that fit in their prefix can be
+# encoded by lookup rather than by building a new bytestring.
+_SINGLE_BYTES = tuple(bytes(bytearray([i])) for i in range(256))
+
 try:  # pragma: no cover
     basestring = basestring
 except NameError:  # pragma: no cover
     basestring = (str, bytes)
 
+# The exact types of the header names and values that are sent as they are,
+# or as their UTF-8 encoding.
+_STRING_TYPES = frozenset([bytes, unicode])
+
 
 # We default the maximum header list we're willing to accept to 64kB. That's a
 # lot of headers, but if applications want to raise it they can do.
 DEFAULT_MAX_HEADER_LIST_SIZE = 2 ** 16
 
+#: The process-wide cache of Huffman-encoded strings, shared by every
+#: :class:`Encoder` created with ``huffman_cache=True``. It is bounded by the
+#: memory used by the cached strings, which defaults to 1MB: change its
+#: ``maxsize`` to adjust that. Its ``hits``, ``misses`` and ``evictions``
+#: counters show how well it is working.
+HUFFMAN_CACHE = SynchronizedLRUCache(2 ** 20, weigh=object_sizes)
+
+# The Huffman encoders shared by every Encoder, with and without the
+# HUFFMAN_CACHE. They hold no per-connection state.
+_HUFFMAN_ENCODER = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+_CACHING_HUFFMAN_ENCODER = HuffmanEncoder(
+    REQUEST_CODES, REQUEST_CODES_LENGTH, cache=HUFFMAN_CACHE
+)
+
+# Every static table entry as a HeaderTuple, in index order, so that decoding
+# an indexed static entry doesn't build a new one.
+_STATIC_HEADERS = tuple(
+    HeaderTuple(name, value) for name, value in HeaderTable.STATIC_TABLE
+)
+
+# The unicode form of every static table name and value, and of every static
+# table entry, so that decoding them as text shares these objects rather than
+# decoding UTF-8 again.
+_STATIC_TEXT = dict(
+    (string, string.decode('utf-8'))
+    for entry in HeaderTable.STATIC_TABLE
+    for string in entry
+)
+_STATIC_TEXT_HEADERS = dict(
+    (entry, HeaderTuple(_STATIC_TEXT[entry[0]], _STATIC_TEXT[entry[1]]))
+    for entry in HeaderTable.STATIC_TABLE
+)
+
+# The fields that follow the header table in Encoder and Decoder snapshots.
+# An Encoder's are the number of pending table size changes, followed by each
+# of them. A Decoder's are its maximum allowed table size, whether a header
+# block being fed has decoded any headers yet and their size, and the length
+# of its pending data, followed by that data.
+_SNAPSHOT_COUNT = struct.Struct('>I')
+_DECODER_STATE = struct.Struct('>I?II')
+
+
+def set_debug_logging(enabled):
+    """
+    Turns debug logging by the encoder, decoder and header table on or off.
+
+    To keep the cost of encoding and decoding down, their debug messages are
+    not passed to :mod:`logging` at all unless this is turned on. It is on if
+    the ``hpack`` loggers were already set to log debug messages when
+    ``hpack`` was imported, and off otherwise.
+
+    .. versionadded:: 3.1.0
+
+    :param enabled: Whether to log debug messages.
+    :type enabled: ``bool``
+    """
+    global _debug
+    _debug = table._debug = bool(enabled)
+
 
 def _unicode_if_needed(header, raw):
     """
@@ -59,7 +142,8 @@ def encode_integer(integer, prefix_bits):
     This encodes an integer according to the wacky integer encoding rules
     defined in the HPACK spec.
     """
-    log.debug("Encoding %d with %d bits", integer, prefix_bits)
+    if _debug:
+        log.debug("Encoding %d with %d bits", integer, prefix_bits)
 
     if integer < 0:
         raise ValueError(
@@ -76,16 +160,40 @@ def encode_integer(integer, prefix_bits):
     if integer < max_number:
         return bytearray([integer])  # Seriously?
     else:
-        elements = [max_number]
-        integer -= max_number
+        return bytearray(_integer_elements(integer, max_number))
+
 
-        while integer >= 128:
-            elements.append((integer & 127) + 128)
-            integer >>= 7
+def _encode_integer(integer, prefix_bits, flags):
+    """
+    Encodes an integer as :func:`encode_integer` does, without validating the
+    arguments, and sets the bits in ``flags`` in the first byte. Returns a
+    bytestring.
+    """
+    max_number = _PREFIX_BIT_MAX_NUMBERS[prefix_bits]
+
+    if integer < max_number:
+        return _SINGLE_BYTES[integer | flags]
+
+    elements = _integer_elements(integer, max_number)
+    elements[0] |= flags
+    return bytes(bytearray(elements))
+
+
+def _integer_elements(integer, max_number):
+    """
+    Returns the list of byte values that encode an integer too large to fit in
+    its prefix, which is all ones, ``max_number``.
+    """
+    elements = [max_number]
+    integer -= max_number
+
+    while integer >= 128:
+        elements.append((integer & 127) + 128)
+        integer >>= 7
 
-        elements.append(integer)
+    elements.append(integer)
 
-        return bytearray(elements)
+    return elements
 
 
 def decode_integer(data, prefix_bits):
@@ -100,35 +208,155 @@ def decode_integer(data, prefix_bits):
             "Prefix bits must be between 1 and 8, got %s" % prefix_bits
         )
 
+    return _decode_integer(data, 0, prefix_bits)
+
+
+def _decode_integer(data, offset, prefix_bits):
+    """
+    Decodes the integer that starts at ``offset`` in ``data``, without
+    validating ``prefix_bits``. Returns a tuple of the decoded integer and the
+    offset of the first byte after it.
+    """
     max_number = _PREFIX_BIT_MAX_NUMBERS[prefix_bits]
-    index = 1
+    index = offset + 1
     shift = 0
-    mask = (0xFF >> (8 - prefix_bits))
 
     try:
-        number = to_byte(data[0]) & mask
-        if number == max_number:
-            while True:
-                next_byte = to_byte(data[index])
-                index += 1
-
-                if next_byte >= 128:
-                    number += (next_byte - 128) << shift
-                else:
-                    number += next_byte << shift
-                    break
-                shift += 7
+        number = to_byte(data[offset]) & max_number
+        if number < max_number:
+            # Most integers fit in their prefix.
+            return number, index
+
+        while True:
+            next_byte = to_byte(data[index])
+            index += 1
+
+            if next_byte >= 128:
+                number += (next_byte - 128) << shift
+            else:
+                number += next_byte << shift
+                break
+            shift += 7
+
+            if index - offset > _MAX_INTEGER_CONTINUATION_BYTES:
+                raise HPACKDecodingError(
+                    "HPACK integer representation is too long: %r" %
+                    data[offset:index]
+                )
 
     except IndexError:
         raise HPACKDecodingError(
-            "Unable to decode HPACK integer representation from %r" % data
+            "Unable to decode HPACK integer representation from %r" %
+            data[offset:]
         )
 
-    log.debug("Decoded %d, consumed %d bytes", number, index)
+    if _debug:
+        log.debug("Decoded %d, consumed %d bytes", number, index - offset)
 
     return number, index
 
 
+def _partial_integer(data, offset, prefix_bits):
+    """
+    Decodes the integer that starts at ``offset`` in ``data``, which may be
+    cut short. Returns a tuple of the integer and the offset just past it, or
+    of ``None`` and ``None`` if ``data`` ends partway through the integer.
+    """
+    try:
+        return _decode_integer(data, offset, prefix_bits)
+    except HPACKDecodingError:
+        # With enough bytes for the longest valid integer, it was not cut
+        # short but is invalid.
+        if len(data) - offset > _MAX_INTEGER_CONTINUATION_BYTES:
+            raise
+        return None, None
+
+
+def _representation_bounds(data, offset):
+    """
+    Works out how much of ``data`` is taken up by the header field
+    representation that starts at ``offset``, without decoding it. Returns a
+    tuple of the offset just past it, which may lie beyond the end of
+    ``data``, or ``None`` if ``data`` ends too soon to tell, and a lower bound
+    on the size the representation adds to the header list.
+    """
+    # Every header field costs at least the 32 bytes of per-entry overhead,
+    # but encoding context updates don't add to the header list at all.
+    first_byte = to_byte(data[offset])
+    if first_byte & 0x80:
+        prefix_bits, string_count, min_size = 7, 0, 32
+    elif first_byte & 0x40:
+        prefix_bits, string_count, min_size = 6, 1, 32
+    elif first_byte & 0x20:
+        prefix_bits, string_count, min_size = 5, 0, 0
+    else:
+        prefix_bits, string_count, min_size = 4, 1, 32
+
+    if string_count and not first_byte & _PREFIX_BIT_MAX_NUMBERS[prefix_bits]:
+        # A literal header name follows the first byte.
+        string_count = 2
+        offset += 1
+    else:
+        offset = _partial_integer(data, offset, prefix_bits)[1]
+        if offset is None:
+            return None, min_size
+
+    for i in range(string_count):
+        # Only the last string may run past the end of the data, as the
+        # length of any string after it is still to come.
+        if i and offset >= len(data):
+            return None, min_size
+        offset, string_size = _string_bounds(data, offset)
+        min_size += string_size
+        if offset is None:
+            return None, min_size
+
+    return offset, min_size
+
+
+def _string_bounds(data, offset):
+    """
+    Works out where the length-prefixed string at ``offset`` in ``data`` ends.
+    Returns a tuple of the end offset, or ``None`` if the length is not all
+    present, and a lower bound on the length of the decoded string.
+    """
+    if offset >= len(data):
+        return None, 0
+    length, end = _partial_integer(data, offset, 7)
+    if length is None:
+        return None, 0
+
+    # Huffman codes are at most 30 bits long, which bounds how short the
+    # decoded string can be.
+    if to_byte(data[offset]) & 0x80:
+        return end + length, length * 8 // 30
+    return end + length, length
+
+
+def _read_string(data, octets, offset):
+    """
+    Reads the length-prefixed, possibly Huffman-coded, string at ``offset``
+    in ``data``, whose byte values are ``octets``. Returns the string and the
+    offset just past it.
+    """
+    try:
+        first = octets[offset]
+    except IndexError:
+        raise HPACKDecodingError("Truncated header block")
+    length = first & 0x7F
+    if length < 0x7F:
+        offset += 1
+    else:
+        length, offset = _decode_integer(data, offset, 7)
+    end = offset + length
+    if end > len(data):
+        raise HPACKDecodingError("Truncated header block")
+
+    if first & 0x80:
+        return decode_huffman(data[offset:end]), end
+    return data[offset:end], end
+
+
 def _dict_to_iterable(header_dict):
     """
     This converts a dictionary to an iterable of two-tuples. This is a
@@ -154,19 +382,125 @@ def _to_bytes(string):
     return string if isinstance(string, bytes) else string.encode('utf-8')
 
 
+def _byte_view(buf):
+    """
+    Returns a writable ``memoryview`` of the bytes of ``buf``, so that its
+    length and offsets count bytes whatever the buffer's item size. Raises
+    ``TypeError`` if ``buf`` is read-only or can't be viewed as bytes.
+    """
+    try:
+        view = memoryview(buf)
+        if is_py3:
+            view = view.cast('B')
+        elif view.format != 'B' or view.ndim != 1:
+            raise TypeError("memoryview: cannot cast view format")
+    except (TypeError, ValueError) as e:
+        raise TypeError("Cannot encode into %r buffer: %s" % (
+            type(buf).__name__, e
+        ))
+
+    if view.readonly:
+        raise TypeError("Cannot encode into a read-only buffer")
+    return view
+
+
+def _cache_key_field(header):
+    """
+    Returns a header's name and value, in a form that compares equal only to
+    names and values that are sent as the same bytes, and whether the header
+    is sensitive.
+    """
+    sensitive = False
+    if isinstance(header, HeaderTuple):
+        sensitive = not header.indexable
+    elif len(header) > 2:
+        sensitive = bool(header[2])
+
+    # Text and bytes that compare equal are always sent the same way, but
+    # other values, such as 1 and True, may not be.
+    name, value = header[0], header[1]
+    if type(name) not in _STRING_TYPES:
+        name = _to_bytes(name)
+    if type(value) not in _STRING_TYPES:
+        value = _to_bytes(value)
+    return name, value, sensitive
+
+
 class Encoder(object):
     """
     An HPACK encoder object. This object takes HTTP headers and emits encoded
     HTTP/2 header blocks.
+
+    .. versionchanged:: 3.1.0
+       Added ``block_cache_size``, ``huffman_cache`` and ``indexing_policy``
+       arguments.
+
+    :param block_cache_size: The number of encoded header blocks to remember.
+        Only blocks that leave the header table unchanged are remembered. If
+        an identical list of headers is encoded again while the header table
+        is in the same state, the remembered block is reused instead of
+        encoding the headers again. This helps most when the same header
+        sets, such as common response headers, are sent many times.
+
+        Header sets that hold any sensitive header are never cached, so that
+        the cache doesn't keep their values alive.
+
+        Defaults to 0, which disables the cache.
+    :type block_cache_size: ``int``
+    :param huffman_cache: Whether to look up Huffman-encoded strings in, and
+        add them to, the process-wide :data:`HUFFMAN_CACHE
+        <hpack.hpack.HUFFMAN_CACHE>`. This lets all the encoders in a process
+        share the work of encoding commonly sent names and values. Values of
+        sensitive headers are never cached.
+
+        Defaults to False.
+    :type huffman_cache: ``bool``
+    :param indexing_policy: The :class:`IndexingPolicy
+        <hpack.indexing.IndexingPolicy>` that decides which headers are added
+        to the header table. Headers whose values rarely repeat, such as
+        ``date`` or ``content-length``, push more useful entries out of the
+        table, and a policy can keep them out.
+
+        Defaults to None, which indexes every header that isn't sensitive.
     """
+    __slots__ = (
+        'header_table', 'huffman_coder', 'table_size_changes', '_block_cache',
+        'indexing_policy',
+    )
 
-    def __init__(self):
+    def __init__(self, block_cache_size=0, huffman_cache=False,
+                 indexing_policy=None):
         self.header_table = HeaderTable()
-        self.huffman_coder = HuffmanEncoder(
-            REQUEST_CODES, REQUEST_CODES_LENGTH
+        self.huffman_coder = (
+            _CACHING_HUFFMAN_ENCODER if huffman_cache else _HUFFMAN_ENCODER
         )
         self.table_size_changes = []
 
+        self._block_cache = None
+        if block_cache_size:
+            self._block_cache = LRUCache(block_cache_size)
+
+        #: The :class:`IndexingPolicy <hpack.indexing.IndexingPolicy>` that
+        #: decides which headers are added to the header table, or ``None``
+        #: to index every header that isn't sensitive.
+        #:
+        #: .. versionadded:: 3.1.0
+        self.indexing_policy = indexing_policy
+
+    @property
+    def block_cache(self):
+        """
+        The :class:`LRUCache <hpack.cache.LRUCache>` of encoded header
+        blocks, or ``None`` if block caching is disabled. Its ``hits``,
+        ``misses`` and ``evictions`` counters show how well it is working.
+
+        The cached blocks are only valid for this encoder's header table, so
+        the cache can't be replaced or shared with other encoders.
+
+        .. versionadded:: 3.1.0
+        """
+        return self._block_cache
+
     @property
     def header_table_size(self):
         """
@@ -224,14 +558,251 @@ class Encoder(object):
 
         :returns: A bytestring containing the HPACK-encoded header block.
         """
+        if _debug:
+            log.debug("HPACK encoding %s", headers)
+
+        # Any pending table size changes must be emitted, so cached blocks
+        # can't be used.
+        if self._block_cache is None or self.header_table.resized:
+            header_block = self._encode_headers(headers, huffman)
+        else:
+            header_block = self._encode_cached(headers, huffman)
+
+        if _debug:
+            log.debug("Encoded header block to %s", header_block)
+
+        return header_block
+
+    def encode_into(self, headers, buf, offset=0, huffman=True):
+        """
+        Takes a set of headers and encodes them into a HPACK-encoded header
+        block, which is written straight into ``buf`` starting at ``offset``.
+        This saves building the header block as a bytestring and then copying
+        it again into, for instance, a frame buffer.
+
+        A ``bytearray`` grows as needed to hold the header block. Any other
+        buffer is written as bytes, whatever its item size, and must already
+        have room for the header block, or ``ValueError`` is raised.
+        Because the header table has already been updated by then, the header
+        block is lost and the encoder can't be used on that connection again.
+
+        .. versionadded:: 3.1.0
+
+        :param headers: The headers to encode, as for :meth:`encode`.
+        :param buf: The ``bytearray``, or writable buffer such as a
+                    ``memoryview`` or ``array``, to write the header block
+                    to.
+        :param offset: (optional) The byte offset in ``buf`` to start writing
+                       at. This may be no more than the size of ``buf`` in
+                       bytes. Defaults to 0.
+        :param huffman: (optional) Whether to Huffman-encode any header sent as
+                        a literal value. Except for use when debugging, it is
+                        recommended that this be left enabled.
+
+        :returns: The number of bytes written to ``buf``.
+        :raises TypeError: If ``buf`` is not a writable buffer that can be
+                           viewed as bytes. This is checked before the headers
+                           are encoded, so the encoder can still be used.
+        """
+        # Other buffers are written through a view of their bytes.
+        if not isinstance(buf, bytearray):
+            buf = _byte_view(buf)
+        if offset < 0 or offset > len(buf):
+            raise ValueError(
+                "Offset %d is outside a buffer of length %d" %
+                (offset, len(buf))
+            )
+
+        if _debug:
+            log.debug("HPACK encoding %s", headers)
+
+        if self._block_cache is None or self.header_table.resized:
+            header_block = self._encode_headers(headers, huffman)
+        else:
+            header_block = self._encode_cached(headers, huffman)
+
+        size = len(header_block)
+        if not isinstance(buf, bytearray) and offset + size > len(buf):
+            raise ValueError(
+                "Header block of %d bytes does not fit in buffer of length %d "
+                "at offset %d" % (size, len(buf), offset)
+            )
+
+        # Bytearray slice assignment overwrites in place, and grows the
+        # bytearray when writing past its end. Writing the fields one at a
+        # time costs more than joining them first.
+        buf[offset:offset + size] = header_block
+
+        if _debug:
+            log.debug("Encoded header block to %s", header_block)
+
+        return size
+
+    def encode_many(self, header_sets, huffman=True):
+        """
+        Takes a sequence of header sets and encodes each of them into a
+        HPACK-encoded header block, in order. This returns exactly what
+        calling :meth:`encode` on each header set in turn would, but avoids
+        some of the overhead of each call, which helps when many header blocks
+        are sent at once on the same connection.
+
+        .. versionadded:: 3.1.0
+
+        :param header_sets: An iterable of header sets, each of which is
+                            anything that :meth:`encode` accepts.
+        :param huffman: (optional) Whether to Huffman-encode any header sent as
+                        a literal value. Except for use when debugging, it is
+                        recommended that this be left enabled.
+
+        :returns: A list of bytestrings containing the HPACK-encoded header
+                  blocks, one for each header set.
+        """
+        # The block cache is consulted per header set, so leave that to
+        # encode.
+        if self._block_cache is not None:
+            return [self.encode(headers, huffman) for headers in header_sets]
+
+        header_table = self.header_table
+        append_fields = self._append_fields
+        join = b''.join
+        header_blocks = []
+        header_block = []
+
+        for headers in header_sets:
+            if _debug:
+                log.debug("HPACK encoding %s", headers)
+
+            if isinstance(headers, dict):
+                headers = _dict_to_iterable(headers)
+
+            # Pending table size changes go at the start of the first block.
+            if header_table.resized:
+                header_block.append(self._encode_table_size_change())
+                header_table.resized = False
+
+            append_fields(header_block, headers, huffman)
+            encoded = join(header_block)
+            del header_block[:]
+            header_blocks.append(encoded)
+
+            if _debug:
+                log.debug("Encoded header block to %s", encoded)
+
+        return header_blocks
+
+    def snapshot(self):
+        """
+        Returns the compression context of this encoder as a bytestring: the
+        contents and size of its header table, and any table size changes
+        not yet sent. Passing it to :meth:`restore` on a new encoder, perhaps
+        in another process, lets that encoder carry on encoding for the same
+        connection.
+
+        The block cache and indexing policy are not part of the snapshot.
+
+        .. versionadded:: 3.1.0
+
+        :returns: A bytestring holding the snapshot.
+        """
+        parts = [snapshot_header(b'E'), self.header_table.snapshot()]
+        parts.append(_SNAPSHOT_COUNT.pack(len(self.table_size_changes)))
+        for size in self.table_size_changes:
+            parts.append(_SNAPSHOT_COUNT.pack(size))
+        return b''.join(parts)
+
+    def restore(self, data):
+        """
+        Replaces the compression context of this encoder with one returned
+        by :meth:`snapshot`.
+
+        .. versionadded:: 3.1.0
+
+        :param data: A bytestring returned by :meth:`snapshot`.
+        :raises InvalidSnapshotError: If ``data`` is not a valid encoder
+                                      snapshot. The encoder is left
+                                      unchanged.
+        """
+        data = to_bytes(data)
+        offset = check_snapshot_header(b'E', data, 0)
+        table_state, offset = HeaderTable._parse_snapshot(data, offset)
+        (count,), offset = unpack_snapshot(_SNAPSHOT_COUNT, data, offset)
+        table_size_changes = []
+        for _ in range(count):
+            (size,), offset = unpack_snapshot(_SNAPSHOT_COUNT, data, offset)
+            table_size_changes.append(size)
+        if offset != len(data):
+            raise InvalidSnapshotError("Trailing data after snapshot")
+
+        self.header_table._apply_snapshot(*table_state)
+        self.table_size_changes = table_size_changes
+
+    def fork(self):
+        """
+        Returns a new encoder with the same compression context as this one,
+        such as one whose header table has been warmed up with common
+        headers. This takes constant time and memory however full the header
+        table is: the two encoders share their header table entries until
+        either of them changes its table.
+
+        The new encoder has a block cache of the same size, which starts
+        empty, and shares this encoder's indexing policy.
+
+        .. versionadded:: 3.1.0
+
+        :returns: A new :class:`Encoder`.
+        """
+        forked = type(self).__new__(type(self))
+        forked.header_table = self.header_table.fork()
+        forked.huffman_coder = self.huffman_coder
+        forked.table_size_changes = list(self.table_size_changes)
+        forked._block_cache = None
+        if self._block_cache is not None:
+            forked._block_cache = LRUCache(self._block_cache.maxsize)
+        forked.indexing_policy = self.indexing_policy
+        return forked
+
+    def _encode_cached(self, headers, huffman):
+        """
+        Encodes a set of headers using the block cache.
+        """
+        if isinstance(headers, dict):
+            headers = _dict_to_iterable(headers)
+
+        # The cache is keyed on the headers as they are sent, rather than as
+        # given, as headers that compare equal may be sent differently.
+        headers = tuple(map(_cache_key_field, headers))
+
+        # Sensitive values must not be kept alive as part of a cache key.
+        for _, _, sensitive in headers:
+            if sensitive:
+                return self._encode_headers(headers, huffman)
+
+        generation = self.header_table.generation
+        key = (huffman, generation, headers)
+        header_block = self._block_cache.get(key)
+        if header_block is not None:
+            return header_block
+
+        header_block = self._encode_headers(headers, huffman)
+
+        # A block that changed the header table could never be looked up
+        # again, as every change moves the table to a new generation.
+        if self.header_table.generation == generation:
+            self._block_cache.put(key, header_block)
+        return header_block
+
+    def _encode_headers(self, headers, huffman):
+        """
+        Encodes a set of headers into a header block.
+        """
         # Transforming the headers into a header block is a procedure that can
         # be modeled as a chain or pipe. First, the headers are encoded. This
         # encoding can be done a number of ways. If the header name-value pair
         # are already in the header table we can represent them using the
         # indexed representation: the same is true if they are in the static
         # table. Otherwise, a literal representation will be used.
-        log.debug("HPACK encoding %s", headers)
         header_block = []
+        header_table = self.header_table
 
         # Turn the headers into a list of tuples if possible. This is the
         # natural way to interact with them in HPACK. Because dictionaries are
@@ -241,11 +812,21 @@ class Encoder(object):
 
         # Before we begin, if the header table size has been changed we need
         # to signal all changes since last emission appropriately.
-        if self.header_table.resized:
+        if header_table.resized:
             header_block.append(self._encode_table_size_change())
-            self.header_table.resized = False
+            header_table.resized = False
+
+        self._append_fields(header_block, headers, huffman)
+        return b''.join(header_block)
+
+    def _append_fields(self, header_block, headers, huffman):
+        """
+        Encodes each header in ``headers`` and appends its representation to
+        the list ``header_block``.
+        """
+        add = self.add
+        append = header_block.append
 
-        # Add each header to the header block
         for header in headers:
             sensitive = False
             if isinstance(header, HeaderTuple):
@@ -254,65 +835,64 @@ class Encoder(object):
                 sensitive = header[2]
 
             header = (_to_bytes(header[0]), _to_bytes(header[1]))
-            header_block.append(self.add(header, sensitive, huffman))
-
-        header_block = b''.join(header_block)
-
-        log.debug("Encoded header block to %s", header_block)
-
-        return header_block
+            append(add(header, sensitive, huffman))
 
     def add(self, to_add, sensitive, huffman=False):
         """
         This function takes a header key-value tuple and serializes it.
         """
-        log.debug("Adding %s to the header table", to_add)
+        if _debug:
+            log.debug("Adding %s to the header table", to_add)
 
         name, value = to_add
 
-        # Set our indexing mode
-        indexbit = INDEX_INCREMENTAL if not sensitive else INDEX_NEVER
-
         # Search for a matching header in the header table.
         match = self.header_table.search(name, value)
 
+        if match is not None and match[2]:
+            # We matched perfectly, so we can use the indexed representation.
+            index = match[0]
+            if (self.indexing_policy is not None and
+                    index > HeaderTable.STATIC_TABLE_LENGTH):
+                self.indexing_policy.reused(name, value)
+            return self._encode_indexed(index)
+
+        # Set our indexing mode
+        indexbit = self._indexbit(name, value, sensitive)
+
         if match is None:
-            # Not in the header table. Encode using the literal syntax,
-            # and add it to the header table.
+            # Not in the header table. Encode using the literal syntax.
             encoded = self._encode_literal(name, value, indexbit, huffman)
-            if not sensitive:
-                self.header_table.add(name, value)
-            return encoded
-
-        # The header is in the table, break out the values. If we matched
-        # perfectly, we can use the indexed representation: otherwise we
-        # can use the indexed literal.
-        index, name, perfect = match
-
-        if perfect:
-            # Indexed representation.
-            encoded = self._encode_indexed(index)
         else:
-            # Indexed literal. We are going to add header to the
-            # header table unconditionally. It is a future todo to
-            # filter out headers which are known to be ineffective for
-            # indexing since they just take space in the table and
-            # pushed out other valuable headers.
+            # The name is in the table, so we can use the indexed literal.
             encoded = self._encode_indexed_literal(
-                index, value, indexbit, huffman
+                match[0], value, indexbit, huffman
             )
-            if not sensitive:
-                self.header_table.add(name, value)
+
+        if indexbit == INDEX_INCREMENTAL:
+            self.header_table.add(name, value)
 
         return encoded
 
+    def _indexbit(self, name, value, sensitive):
+        """
+        Chooses how a header that isn't in the header table is indexed.
+        Sensitive headers are never indexed, and others are indexed unless
+        the indexing policy declines.
+        """
+        if sensitive:
+            return INDEX_NEVER
+        if (self.indexing_policy is None or
+                self.indexing_policy.should_index(name, value)):
+            return INDEX_INCREMENTAL
+        return INDEX_NONE
+
     def _encode_indexed(self, index):
         """
         Encodes a header using the indexed representation.
         """
-        field = encode_integer(index, 7)
-        field[0] |= 0x80  # we set the top bit
-        return bytes(field)
+        # We set the top bit.
+        return _encode_integer(index, 7, 0x80)
 
     def _encode_literal(self, name, value, indexbit, huffman=False):
         """
@@ -320,20 +900,11 @@ class Encoder(object):
         is True, the header will be added to the header table: otherwise it
         will not.
         """
-        if huffman:
-            name = self.huffman_coder.encode(name)
-            value = self.huffman_coder.encode(value)
-
-        name_len = encode_integer(len(name), 7)
-        value_len = encode_integer(len(value), 7)
-
-        if huffman:
-            name_len[0] |= 0x80
-            value_len[0] |= 0x80
-
-        return b''.join(
-            [indexbit, bytes(name_len), name, bytes(value_len), value]
-        )
+        return b''.join([
+            indexbit,
+            self._encode_string(name, huffman),
+            self._encode_string(value, huffman, indexbit != INDEX_NEVER)
+        ])
 
     def _encode_indexed_literal(self, index, value, indexbit, huffman=False):
         """
@@ -341,21 +912,28 @@ class Encoder(object):
         incremental indexing.
         """
         if indexbit != INDEX_INCREMENTAL:
-            prefix = encode_integer(index, 4)
+            prefix = _encode_integer(index, 4, ord(indexbit))
         else:
-            prefix = encode_integer(index, 6)
-
-        prefix[0] |= ord(indexbit)
+            prefix = _encode_integer(index, 6, 0x40)
 
-        if huffman:
-            value = self.huffman_coder.encode(value)
-
-        value_len = encode_integer(len(value), 7)
+        return prefix + self._encode_string(
+            value, huffman, indexbit != INDEX_NEVER
+        )
 
+    def _encode_string(self, string, huffman, cache=True):
+        """
+        Encodes a string literal along with its length. If ``huffman`` is
+        True, the string is Huffman-encoded, unless that would not make it any
+        shorter. If ``cache`` is False, the string is never kept in the
+        Huffman cache, which is how sensitive values are encoded.
+        """
         if huffman:
-            value_len[0] |= 0x80
+            coder = self.huffman_coder if cache else _HUFFMAN_ENCODER
+            encoded = coder.encode(string)
+            if len(encoded) < len(string):
+                return _encode_integer(len(encoded), 7, 0x80) + encoded
 
-        return b''.join([bytes(prefix), bytes(value_len), value])
+        return _encode_integer(len(string), 7, 0) + string
 
     def _encode_table_size_change(self):
         """
@@ -364,13 +942,18 @@ class Encoder(object):
         """
         block = b''
         for size_bytes in self.table_size_changes:
-            size_bytes = encode_integer(size_bytes, 5)
-            size_bytes[0] |= 0x20
-            block += bytes(size_bytes)
+            block += _encode_integer(size_bytes, 5, 0x20)
         self.table_size_changes = []
         return block
 
 
+# The Decoder methods whose work is inlined by Decoder._decode_block_fused.
+_FUSED_METHODS = (
+    '_decode_field', '_decode_indexed', '_decode_literal_index',
+    '_decode_literal_no_index', '_decode_literal', '_decode_string',
+)
+
+
 class Decoder(object):
     """
     An HPACK decoder object.
@@ -378,6 +961,9 @@ class Decoder(object):
     .. versionchanged:: 2.3.0
        Added ``max_header_list_size`` argument.
 
+    .. versionchanged:: 3.1.0
+       Added ``intern_pool_size`` and ``cache_text`` arguments.
+
     :param max_header_list_size: The maximum decompressed size we will allow
         for any single header block. This is a protection against DoS attacks
         that attempt to force the application to expand a relatively small
@@ -391,8 +977,37 @@ class Decoder(object):
 
         Defaults to 64kB.
     :type max_header_list_size: ``int``
+    :param intern_pool_size: The number of decoded header names and values to
+        remember. When headers are decoded as unicode, a name or value that
+        was decoded before is returned as the same ``str`` object, rather
+        than decoded again. This saves memory, and time spent hashing, when
+        the same headers arrive on every request. Values of headers that must
+        never be indexed are not remembered.
+
+        Static table names and values, and whole static table entries, are
+        always shared, whatever this is set to.
+
+        Defaults to 0, which disables the pool.
+    :type intern_pool_size: ``int``
+    :param cache_text: Whether to keep the unicode form of each header table
+        entry once it has been decoded as unicode, until the entry is
+        evicted. A header that repeats is then returned as the same
+        ``HeaderTuple``, without being decoded from UTF-8 again. This costs
+        memory: the unicode forms take about as much again as the header
+        table itself, so a full 64kB table holds around twice as much.
+
+        Defaults to False.
+    :type cache_text: ``bool``
     """
-    def __init__(self, max_header_list_size=DEFAULT_MAX_HEADER_LIST_SIZE):
+    __slots__ = (
+        'header_table', 'max_header_list_size', 'max_allowed_table_size',
+        'intern_pool', 'cache_text', '_pending', '_pending_size',
+        '_pending_end', '_streamed_headers', '_streamed_size', '_fused',
+    )
+
+    def __init__(self, max_header_list_size=DEFAULT_MAX_HEADER_LIST_SIZE,
+                 intern_pool_size=0,
+                 cache_text=False):
         self.header_table = HeaderTable()
 
         #: The maximum decompressed size we will allow for any single header
@@ -420,6 +1035,39 @@ class Decoder(object):
         #: to confirm that it fits in this size.
         self.max_allowed_table_size = self.header_table.maxsize
 
+        #: The :class:`LRUCache <hpack.cache.LRUCache>` mapping decoded
+        #: header names and values to their unicode forms, or ``None`` if
+        #: the intern pool is disabled.
+        #:
+        #: .. versionadded:: 3.1.0
+        self.intern_pool = None
+        if intern_pool_size:
+            self.intern_pool = LRUCache(intern_pool_size)
+
+        #: Whether the unicode form of each header table entry is kept, once
+        #: decoded, until the entry is evicted.
+        #:
+        #: .. versionadded:: 3.1.0
+        self.cache_text = cache_text
+
+        # The state of a header block being decoded with feed: the fragments
+        # holding any partial representation, their total length, and the
+        # length the representation needs, once that is known. Then whether
+        # any header has been decoded yet, and the size of the headers
+        # decoded so far.
+        self._pending = []
+        self._pending_size = 0
+        self._pending_end = 0
+        self._streamed_headers = False
+        self._streamed_size = 0
+
+        # Whole header blocks are decoded in a single loop, unless a subclass
+        # overrides any of the methods that loop stands in for.
+        self._fused = all(
+            getattr(type(self), method) == getattr(Decoder, method)
+            for method in _FUSED_METHODS
+        )
+
     @property
     def header_table_size(self):
         """
@@ -431,91 +1079,511 @@ class Decoder(object):
     def header_table_size(self, value):
         self.header_table.maxsize = value
 
-    def decode(self, data, raw=False):
+    def decode(self, data, raw=False, zero_copy=False):
         """
         Takes an HPACK-encoded header block and decodes it into a header set.
 
+        .. versionchanged:: 3.1.0
+           Added ``zero_copy`` argument.
+
         :param data: A bytestring representing a complete HPACK-encoded header
                      block.
         :param raw: (optional) Whether to return the headers as tuples of raw
                     byte strings or to decode them as UTF-8 before returning
                     them. The default value is False, which returns tuples of
                     Unicode strings
+        :param zero_copy: (optional) Only used when ``raw`` is True. If set,
+                          header names and values that appear as plain
+                          literals in ``data``, and that are not added to the
+                          header table, are returned as ``memoryview`` slices
+                          of ``data`` rather than copied. These are only valid
+                          for as long as ``data`` is unchanged, so this is only
+                          suitable for callers that consume the headers
+                          immediately. The default value is False.
         :returns: A list of two-tuples of ``(name, value)`` representing the
                   HPACK-encoded headers, in the order they were decoded.
         :raises HPACKDecodingError: If an error is encountered while decoding
                                     the header block.
         """
-        log.debug("Decoding %s", data)
+        if _debug:
+            log.debug("Decoding %s", data)
+
+        # Names and values are sliced straight out of the block. Slicing
+        # bytes copies each of them exactly once. For any other buffer, slice
+        # a memoryview instead, and copy the slices at the end unless the
+        # caller asked for views.
+        zero_copy = raw and zero_copy
+        if zero_copy or not isinstance(data, bytes):
+            data = memoryview(data)
 
-        data_mem = memoryview(data)
         headers = []
+        self._decode_block(data, headers)
+
+        if zero_copy or (raw and isinstance(data, bytes)):
+            return headers
+        return self._unicode_headers(headers, raw)
+
+    def decode_many(self, blocks, raw=False, flat=False):
+        """
+        Takes a sequence of HPACK-encoded header blocks and decodes each of
+        them into a header set, in order. This returns the same headers as
+        calling :meth:`decode` on each block in turn would, but collects them
+        all in a single list, which avoids some of the overhead of each call.
+
+        If a block fails to decode, the exception is raised straight away. The
+        blocks before it have already updated the header table, just as they
+        would have with :meth:`decode`. Unless ``raw`` is set, headers are
+        decoded as UTF-8 once every block has been decoded.
+
+        .. versionadded:: 3.1.0
+
+        :param blocks: An iterable of bytestrings, each representing a
+                       complete HPACK-encoded header block.
+        :param raw: (optional) Whether to return the headers as tuples of raw
+                    byte strings or to decode them as UTF-8 before returning
+                    them. The default value is False, which returns tuples of
+                    Unicode strings
+        :param flat: (optional) If set, return the headers of every block in
+                     one list, along with a list of offsets into it: the
+                     headers of block ``i`` are
+                     ``headers[offsets[i]:offsets[i + 1]]``. The default value
+                     is False, which returns a list of header sets.
+        :returns: A list of header sets, one for each block, each of which is
+                  a list of two-tuples of ``(name, value)``. If ``flat`` is
+                  set, a tuple of the list of every header and the list of
+                  offsets, which has one more entry than there are blocks.
+        :raises HPACKDecodingError: If an error is encountered while decoding
+                                    a header block.
+        """
+        headers = []
+        offsets = []
+        decode_block = self._decode_block
+        copy = not raw
+
+        for data in blocks:
+            if _debug:
+                log.debug("Decoding %s", data)
+
+            if not isinstance(data, bytes):
+                data = memoryview(data)
+                copy = True
+
+            offsets.append(len(headers))
+            decode_block(data, headers)
+
+        offsets.append(len(headers))
+        if copy:
+            headers = self._unicode_headers(headers, raw)
+
+        if flat:
+            return headers, offsets
+        return [
+            headers[start:end] for start, end in zip(offsets, offsets[1:])
+        ]
+
+    def _decode_block(self, data, headers):
+        """
+        Decodes the complete header block ``data``, which is a bytestring or a
+        memoryview, and appends its headers to the list ``headers``.
+        """
+        # The single-pass loop bypasses the per-field methods, so it is only
+        # used when a subclass hasn't overridden them and nothing needs to be
+        # logged.
+        if self._fused and not _debug:
+            return self._decode_block_fused(data, headers)
+
+        start = len(headers)
+        append = headers.append
+        decode_field = self._decode_field
+        max_header_list_size = self.max_header_list_size
         data_len = len(data)
         inflated_size = 0
         current_index = 0
 
         while current_index < data_len:
-            # Work out what kind of header we're decoding.
-            # If the high bit is 1, it's an indexed field.
-            current = to_byte(data[current_index])
-            indexed = True if current & 0x80 else False
-
-            # Otherwise, if the second-highest bit is 1 it's a field that does
-            # alter the header table.
-            literal_index = True if current & 0x40 else False
-
-            # Otherwise, if the third-highest bit is 1 it's an encoding context
-            # update.
-            encoding_update = True if current & 0x20 else False
-
-            if indexed:
-                header, consumed = self._decode_indexed(
-                    data_mem[current_index:]
-                )
-            elif literal_index:
-                # It's a literal header that does affect the header table.
-                header, consumed = self._decode_literal_index(
-                    data_mem[current_index:]
-                )
-            elif encoding_update:
-                # It's an update to the encoding context. These are forbidden
-                # in a header block after any actual header.
-                if headers:
-                    raise HPACKDecodingError(
-                        "Table size update not at the start of the block"
-                    )
-                consumed = self._update_encoding_context(
-                    data_mem[current_index:]
-                )
-                header = None
-            else:
-                # It's a literal header that does not affect the header table.
-                header, consumed = self._decode_literal_no_index(
-                    data_mem[current_index:]
-                )
+            header, current_index = decode_field(
+                data, current_index, len(headers) > start
+            )
 
             if header:
-                headers.append(header)
+                append(header)
                 inflated_size += table_entry_size(*header)
 
-                if inflated_size > self.max_header_list_size:
+                if inflated_size > max_header_list_size:
                     raise OversizedHeaderListError(
                         "A header list larger than %d has been received" %
-                        self.max_header_list_size
+                        max_header_list_size
                     )
 
-            current_index += consumed
-
         # Confirm that the table size is lower than the maximum. We do this
         # here to ensure that we catch when the max has been *shrunk* and the
         # remote peer hasn't actually done that.
         self._assert_valid_table_size()
 
+    def _decode_block_fused(self, data, headers):  # noqa: C901
+        """
+        Decodes a complete header block as :meth:`_decode_block` does, in a
+        single loop that inlines the work of :meth:`_decode_field` and the
+        methods it calls.
+        """
+        start = len(headers)
+        append = headers.append
+        new_header = tuple.__new__
+        header_table = self.header_table
+        get_by_index = header_table.get_by_index
+        static_table = _STATIC_HEADERS
+        static_length = HeaderTable.STATIC_TABLE_LENGTH
+        max_header_list_size = self.max_header_list_size
+        data_len = len(data)
+        inflated_size = 0
+        offset = 0
+
+        # Integers are read from octets, and strings are sliced from data.
+        octets = data if is_py3 else bytearray(data)
+
+        while offset < data_len:
+            first = octets[offset]
+
+            if first & 0x80:
+                # Indexed header field.
+                index = first & 0x7F
+                if index < 0x7F:
+                    offset += 1
+                else:
+                    index, offset = _decode_integer(data, offset, 7)
+                if 0 < index <= static_length:
+                    header = static_table[index - 1]
+                else:
+                    header = new_header(HeaderTuple, get_by_index(index))
+                name, value = header
+
+            elif first & 0x40 or not first & 0x20:
+                # Literal header field, with or without indexing.
+                if first & 0x40:
+                    should_index, kind, mask = True, HeaderTuple, 0x3F
+                elif first & 0x10:
+                    should_index, kind, mask = (
+                        False, NeverIndexedHeaderTuple, 0x0F
+                    )
+                else:
+                    should_index, kind, mask = False, HeaderTuple, 0x0F
+
+                index = first & mask
+                if not index:
+                    name, offset = _read_string(data, octets, offset + 1)
+                else:
+                    if index < mask:
+                        offset += 1
+                    else:
+                        index, offset = _decode_integer(
+                            data, offset, 6 if should_index else 4
+                        )
+                    name = get_by_index(index)[0]
+
+                value, offset = _read_string(data, octets, offset)
+
+                if should_index:
+                    name = to_bytes(name)
+                    value = to_bytes(value)
+                    header_table.add(name, value)
+                header = new_header(kind, (name, value))
+
+            else:
+                # Encoding context update, only allowed before any header.
+                if len(headers) > start:
+                    raise HPACKDecodingError(
+                        "Table size update not at the start of the block"
+                    )
+                offset = self._update_encoding_context(data, offset)
+                continue
+
+            append(header)
+            inflated_size += 32 + len(name) + len(value)
+            if inflated_size > max_header_list_size:
+                raise OversizedHeaderListError(
+                    "A header list larger than %d has been received" %
+                    max_header_list_size
+                )
+
+        self._assert_valid_table_size()
+
+    def feed(self, data, raw=False):
+        """
+        Decodes part of an HPACK-encoded header block, such as the payload of
+        a single HEADERS or CONTINUATION frame. Every header field
+        representation that is complete once ``data`` is added is decoded
+        straight away. Any trailing partial representation is kept until
+        more data is fed. Once the whole block has been fed, call
+        :meth:`finish`.
+
+        The ``max_header_list_size`` is enforced as data arrives. A block is
+        rejected as soon as the headers decoded so far, plus the smallest
+        size the pending representation could decode to, exceed it, or once
+        more of a partial representation is pending than any representation
+        within that size could take up.
+
+        .. versionadded:: 3.1.0
+
+        :param data: A bytestring holding the next fragment of the header
+                     block.
+        :param raw: (optional) Whether to return the headers as tuples of raw
+                    byte strings or to decode them as UTF-8 before returning
+                    them. The default value is False, which returns tuples of
+                    Unicode strings
+        :returns: A list of two-tuples of ``(name, value)`` representing the
+                  headers completed by this fragment, in the order they were
+                  decoded.
+        :raises HPACKDecodingError: If an error is encountered while decoding
+                                    the header block.
+        """
+        if _debug:
+            log.debug("Decoding fragment %s", data)
+
+        data = to_bytes(data)
+        if self._pending:
+            # Until the partial representation is complete, just keep the
+            # fragments, rather than joining and parsing them each time.
+            self._pending.append(data)
+            self._pending_size += len(data)
+            if self._pending_size < self._pending_end:
+                self._check_pending_size()
+                return []
+            data = b''.join(self._pending)
+
+        headers = []
+        data_len = len(data)
+        current_index = 0
+        end = None
+
+        while current_index < data_len:
+            end, min_size = _representation_bounds(data, current_index)
+            if end is None or end > data_len:
+                self._check_streamed_size(min_size)
+                break
+
+            header, current_index = self._decode_field(
+                data, current_index, self._streamed_headers
+            )
+
+            if header:
+                headers.append(header)
+                self._streamed_headers = True
+                self._streamed_size += table_entry_size(*header)
+                self._check_streamed_size(0)
+
+        pending = data[current_index:]
+        self._pending = [pending] if pending else []
+        self._pending_size = len(pending)
+        self._pending_end = 0
+        if pending and end is not None:
+            self._pending_end = end - current_index
+        self._check_pending_size()
+
+        if raw:
+            return headers
+        return self._unicode_headers(headers, raw)
+
+    def finish(self):
+        """
+        Completes a header block that was decoded with :meth:`feed`, and
+        readies the decoder for the next header block.
+
+        .. versionadded:: 3.1.0
+
+        :raises HPACKDecodingError: If the header block ended partway through
+                                    a header field representation.
+        """
+        pending = self._pending
+        self._pending = []
+        self._pending_size = 0
+        self._pending_end = 0
+        self._streamed_headers = False
+        self._streamed_size = 0
+
+        if pending:
+            raise HPACKDecodingError("Truncated header block")
+
+        self._assert_valid_table_size()
+
+    def snapshot(self):
+        """
+        Returns the compression context of this decoder as a bytestring: the
+        contents and size of its header table, its maximum allowed table
+        size, and any part of a header block fed to it but not finished.
+        Passing it to :meth:`restore` on a new decoder, perhaps in another
+        process, lets that decoder carry on decoding for the same
+        connection.
+
+        The maximum header list size, intern pool and ``cache_text`` setting
+        are not part of the snapshot.
+
+        .. versionadded:: 3.1.0
+
+        :returns: A bytestring holding the snapshot.
+        """
+        return b''.join([
+            snapshot_header(b'D'),
+            self.header_table.snapshot(),
+            _DECODER_STATE.pack(
+                self.max_allowed_table_size, self._streamed_headers,
+                self._streamed_size, self._pending_size
+            ),
+        ] + self._pending)
+
+    def restore(self, data):
+        """
+        Replaces the compression context of this decoder with one returned
+        by :meth:`snapshot`.
+
+        .. versionadded:: 3.1.0
+
+        :param data: A bytestring returned by :meth:`snapshot`.
+        :raises InvalidSnapshotError: If ``data`` is not a valid decoder
+                                      snapshot. The decoder is left
+                                      unchanged.
+        """
+        data = to_bytes(data)
+        offset = check_snapshot_header(b'D', data, 0)
+        table_state, offset = HeaderTable._parse_snapshot(data, offset)
+        (max_size, streamed, streamed_size, pending_len), offset = (
+            unpack_snapshot(_DECODER_STATE, data, offset)
+        )
+        pending = data[offset:offset + pending_len]
+        if len(pending) != pending_len:
+            raise InvalidSnapshotError("Truncated snapshot")
+        if offset + pending_len != len(data):
+            raise InvalidSnapshotError("Trailing data after snapshot")
+
+        self.header_table._apply_snapshot(*table_state)
+        self.max_allowed_table_size = max_size
+        self._streamed_headers = streamed
+        self._streamed_size = streamed_size
+        self._pending = [pending] if pending else []
+        self._pending_size = pending_len
+        self._pending_end = 0
+
+    def _check_pending_size(self):
+        """
+        Check that the partial representation being fed to the decoder is no
+        longer than any representation within the maximum header list size
+        could be. Huffman coding takes at most 30 bits per byte, so each byte
+        of a string takes at most four bytes on the wire, and the integers
+        around the strings take a few more.
+        """
+        if self._pending_size > 4 * self.max_header_list_size + 32:
+            raise OversizedHeaderListError(
+                "A header list larger than %d has been received" %
+                self.max_header_list_size
+            )
+
+    def _check_streamed_size(self, pending_size):
+        """
+        Check that the header block being fed to the decoder, plus
+        ``pending_size`` bytes still to be decoded, is within the maximum
+        header list size.
+        """
+        if self._streamed_size + pending_size > self.max_header_list_size:
+            raise OversizedHeaderListError(
+                "A header list larger than %d has been received" %
+                self.max_header_list_size
+            )
+
+    def _unicode_headers(self, headers, raw):
+        """
+        Converts decoded headers to bytestrings, or to unicode strings if raw
+        is False.
+        """
         try:
-            return [_unicode_if_needed(h, raw) for h in headers]
+            if raw:
+                return [_unicode_if_needed(h, raw) for h in headers]
+            return [self._text_header(h) for h in headers]
         except UnicodeDecodeError:
             raise HPACKDecodingError("Unable to decode headers as UTF-8.")
 
+    def _text_header(self, header):
+        """
+        Converts a decoded header to unicode strings, sharing the strings of
+        static and dynamic table entries and of the intern pool.
+        """
+        name = to_bytes(header[0])
+        value = to_bytes(header[1])
+
+        if header.__class__ is HeaderTuple:
+            text_header = _STATIC_TEXT_HEADERS.get((name, value))
+            if text_header is not None:
+                return text_header
+
+            if not self.cache_text:
+                return HeaderTuple(self._text(name), self._text(value))
+
+            # Entries in the dynamic table are decoded once, the first time
+            # they are needed as text, and reused until they are evicted.
+            header_table = self.header_table
+            text_header = header_table.get_text(name, value)
+            if text_header is None:
+                text_header = HeaderTuple(self._text(name), self._text(value))
+                header_table.set_text(name, value, text_header)
+            return text_header
+
+        # Sensitive values are not kept around in the pool.
+        return header.__class__(self._text(name), value.decode('utf-8'))
+
+    def _text(self, string):
+        """
+        Decodes a header name or value as UTF-8, reusing the unicode string
+        from the static table or the intern pool if there is one.
+        """
+        text = _STATIC_TEXT.get(string)
+        if text is not None:
+            return text
+
+        pool = self.intern_pool
+        if pool is None:
+            return string.decode('utf-8')
+
+        text = pool.get(string)
+        if text is None:
+            text = string.decode('utf-8')
+            pool.put(string, text)
+        return text
+
+    def _decode_field(self, data, offset, after_headers):
+        """
+        Decodes the header field representation at ``offset`` in ``data``.
+        Returns the header, or ``None`` for an encoding context update, and
+        the offset just past the representation. ``after_headers`` says
+        whether any header has already been decoded from the header block.
+        """
+        # Work out what kind of header we're decoding.
+        # If the high bit is 1, it's an indexed field.
+        current = to_byte(data[offset])
+        indexed = True if current & 0x80 else False
+
+        # Otherwise, if the second-highest bit is 1 it's a field that does
+        # alter the header table.
+        literal_index = True if current & 0x40 else False
+
+        # Otherwise, if the third-highest bit is 1 it's an encoding context
+        # update.
+        encoding_update = True if current & 0x20 else False
+
+        if indexed:
+            return self._decode_indexed(data, offset)
+        elif literal_index:
+            # It's a literal header that does affect the header table.
+            return self._decode_literal_index(data, offset)
+        elif encoding_update:
+            # It's an update to the encoding context. These are forbidden
+            # in a header block after any actual header.
+            if after_headers:
+                raise HPACKDecodingError(
+                    "Table size update not at the start of the block"
+                )
+            return None, self._update_encoding_context(data, offset)
+        else:
+            # It's a literal header that does not affect the header table.
+            return self._decode_literal_no_index(data, offset)
+
     def _assert_valid_table_size(self):
         """
         Check that the table size set by the encoder is lower than the maximum
@@ -526,88 +1594,79 @@ class Decoder(object):
                 "Encoder did not shrink table size to within the max"
             )
 
-    def _update_encoding_context(self, data):
+    def _update_encoding_context(self, data, offset):
         """
         Handles a byte that updates the encoding context.
         """
         # We've been asked to resize the header table.
-        new_size, consumed = decode_integer(data, 5)
+        new_size, offset = _decode_integer(data, offset, 5)
         if new_size > self.max_allowed_table_size:
             raise InvalidTableSizeError(
                 "Encoder exceeded max allowable table size"
             )
         self.header_table_size = new_size
-        return consumed
+        return offset
 
-    def _decode_indexed(self, data):
+    def _decode_indexed(self, data, offset):
         """
         Decodes a header represented using the indexed representation.
         """
-        index, consumed = decode_integer(data, 7)
+        index = to_byte(data[offset]) & 0x7F
+        if index < 0x7F:
+            end = offset + 1
+        else:
+            index, end = _decode_integer(data, offset, 7)
         header = HeaderTuple(*self.header_table.get_by_index(index))
-        log.debug("Decoded %s, consumed %d", header, consumed)
-        return header, consumed
+        if _debug:
+            log.debug("Decoded %s, consumed %d", header, end - offset)
+        return header, end
 
-    def _decode_literal_no_index(self, data):
-        return self._decode_literal(data, False)
+    def _decode_literal_no_index(self, data, offset):
+        return self._decode_literal(data, offset, False)
 
-    def _decode_literal_index(self, data):
-        return self._decode_literal(data, True)
+    def _decode_literal_index(self, data, offset):
+        return self._decode_literal(data, offset, True)
 
-    def _decode_literal(self, data, should_index):
+    def _decode_literal(self, data, offset, should_index):
         """
         Decodes a header represented with a literal.
         """
-        total_consumed = 0
+        start = offset
 
         # When should_index is true, if the low six bits of the first byte are
         # nonzero, the header name is indexed.
         # When should_index is false, if the low four bits of the first byte
         # are nonzero the header name is indexed.
         if should_index:
-            indexed_name = to_byte(data[0]) & 0x3F
+            indexed_name = to_byte(data[offset]) & 0x3F
             name_len = 6
             not_indexable = False
         else:
-            high_byte = to_byte(data[0])
+            high_byte = to_byte(data[offset])
             indexed_name = high_byte & 0x0F
             name_len = 4
             not_indexable = high_byte & 0x10
 
         if indexed_name:
             # Indexed header name.
-            index, consumed = decode_integer(data, name_len)
+            index, offset = _decode_integer(data, offset, name_len)
             name = self.header_table.get_by_index(index)[0]
-
-            total_consumed = consumed
-            length = 0
         else:
             # Literal header name. The first byte was consumed, so we need to
             # move forward.
-            data = data[1:]
-
-            length, consumed = decode_integer(data, 7)
-            name = data[consumed:consumed + length]
-            if len(name) != length:
-                raise HPACKDecodingError("Truncated header block")
-
-            if to_byte(data[0]) & 0x80:
-                name = decode_huffman(name)
-            total_consumed = consumed + length + 1  # Since we moved forward 1.
-
-        data = data[consumed + length:]
+            name, offset = self._decode_string(data, offset + 1)
 
         # The header value is definitely length-based.
-        length, consumed = decode_integer(data, 7)
-        value = data[consumed:consumed + length]
-        if len(value) != length:
-            raise HPACKDecodingError("Truncated header block")
-
-        if to_byte(data[0]) & 0x80:
-            value = decode_huffman(value)
+        value, offset = self._decode_string(data, offset)
 
-        # Updated the total consumed length.
-        total_consumed += length + consumed
+        # If we've been asked to index this, add it to the header table. The
+        # table indexes its entries, so they must be hashable bytestrings
+        # rather than views of the data being decoded. Those same bytestrings
+        # are returned, so that nothing is copied twice.
+        if should_index:
+            name = to_bytes(name)
+            value = to_bytes(value)
+            self.header_table.add(name, value)
 
         # If we have been told never to index the header field, encode that in
         # the tuple we use.
@@ -616,15 +1675,35 @@ class Decoder(object):
         else:
             header = HeaderTuple(name, value)
 
-        # If we've been asked to index this, add it to the header table.
-        if should_index:
-            self.header_table.add(name, value)
+        if _debug:
+            log.debug(
+                "Decoded %s, total consumed %d bytes, indexed %s",
+                header,
+                offset - start,
+                should_index
+            )
 
-        log.debug(
-            "Decoded %s, total consumed %d bytes, indexed %s",
-            header,
-            total_consumed,
-            should_index
-        )
+        return header, offset
+
+    def _decode_string(self, data, offset):
+        """
+        Decodes the length-prefixed, possibly Huffman-coded, string at
+        ``offset`` in ``data``. Returns the string and the offset just past
+        it.
+        """
+        try:
+            first = to_byte(data[offset])
+        except IndexError:
+            raise HPACKDecodingError("Truncated header block")
+        length = first & 0x7F
+        if length < 0x7F:
+            start = offset + 1
+        else:
+            length, start = _decode_integer(data, offset, 7)
+        end = start + length
+        if end > len(data):
+            raise HPACKDecodingError("Truncated header block")
 
-        return header, total_consumed
+        if first & 0x80:
+            return decode_huffman(data[start:end]), end
+        return data[start:end], end
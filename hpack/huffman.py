@@ -6,17 +6,31 @@ hpack/huffman_decoder
 An implementation of a bitwise prefix tree specially built for decoding
 Huffman-coded content where we already know the Huffman table.
 """
-from .compat import to_byte, decode_hex
+from .compat import int_to_bytes
 
 
 class HuffmanEncoder(object):
     """
     Encodes a string according to the Huffman encoding table defined in the
     HPACK specification.
+
+    If ``cache`` is given, it is used to remember the encodings of strings.
+    It must only be shared with other encoders that use the same code table.
     """
-    def __init__(self, huffman_code_list, huffman_code_list_lengths):
+    __slots__ = (
+        'huffman_code_list', 'huffman_code_list_lengths', 'cache',
+        '_bit_strings',
+    )
+
+    def __init__(self, huffman_code_list, huffman_code_list_lengths,
+                 cache=None):
         self.huffman_code_list = huffman_code_list
         self.huffman_code_list_lengths = huffman_code_list_lengths
+        self.cache = cache
+
+        self._bit_strings = _bit_strings_for(
+            huffman_code_list, huffman_code_list_lengths
+        )
 
     def encode(self, bytes_to_encode):
         """
@@ -27,42 +41,55 @@ class HuffmanEncoder(object):
         if not bytes_to_encode:
             return b''
 
-        final_num = 0
-        final_int_len = 0
+        cache = self.cache
+        if cache is not None:
+            encoded = cache.get(bytes_to_encode)
+            if encoded is None:
+                encoded = self._encode(bytes_to_encode)
+                cache.put(bytes_to_encode, encoded)
+            return encoded
 
+        return self._encode(bytes_to_encode)
+
+    def _encode(self, bytes_to_encode):
+        """
+        Huffman-encodes a non-empty string of bytes.
+        """
         # Turn each byte into its huffman code. These codes aren't necessarily
-        # octet aligned, so keep track of how far through an octet we are. To
-        # handle this cleanly, just use a single giant integer.
-        for char in bytes_to_encode:
-            byte = to_byte(char)
-            bin_int_len = self.huffman_code_list_lengths[byte]
-            bin_int = self.huffman_code_list[byte] & (
-                2 ** (bin_int_len + 1) - 1
-            )
-            final_num <<= bin_int_len
-            final_num |= bin_int
-            final_int_len += bin_int_len
+        # octet aligned, so rather than shifting them together one at a time
+        # we concatenate their binary digits and let int() parse the lot in
+        # a single linear pass.
+        bit_strings = self._bit_strings
+        bits = ''.join([bit_strings[b] for b in bytearray(bytes_to_encode)])
 
         # Pad out to an octet with ones.
-        bits_to_be_padded = (8 - (final_int_len % 8)) % 8
-        final_num <<= bits_to_be_padded
-        final_num |= (1 << bits_to_be_padded) - 1
+        bits += '1' * (-len(bits) % 8)
 
-        # Convert the number to hex and strip off the leading '0x' and the
-        # trailing 'L', if present.
-        final_num = hex(final_num)[2:].rstrip('L')
+        return int_to_bytes(int(bits, 2), len(bits) // 8)
 
-        # If this is odd, prepend a zero.
-        final_num = '0' + final_num if len(final_num) % 2 != 0 else final_num
 
-        # This number should have twice as many digits as bytes. If not, we're
-        # missing some leading zeroes. Work out how many bytes we want and how
-        # many digits we have, then add the missing zero digits to the front.
-        total_bytes = (final_int_len + bits_to_be_padded) // 8
-        expected_digits = total_bytes * 2
+# Maps the identities of a code list and its lengths to a tuple of those lists
+# and their bit strings. Holding on to the lists means their ids can't be
+# reused while they are in here.
+_BIT_STRINGS = {}
 
-        if len(final_num) != expected_digits:
-            missing_digits = expected_digits - len(final_num)
-            final_num = ('0' * missing_digits) + final_num
 
-        return decode_hex(final_num)
+def _bit_strings_for(huffman_code_list, huffman_code_list_lengths):
+    """
+    Returns the code for each byte, written out as a string of binary digits.
+    These are shared between all the encoders that use the same code table.
+    """
+    key = (id(huffman_code_list), id(huffman_code_list_lengths))
+    try:
+        return _BIT_STRINGS[key][2]
+    except KeyError:
+        bit_strings = [
+            '{0:0{1}b}'.format(code, length)
+            for code, length in zip(
+                huffman_code_list, huffman_code_list_lengths
+            )
+        ]
+        _BIT_STRINGS[key] = (
+            huffman_code_list, huffman_code_list_lengths, bit_strings
+        )
+        return bit_strings
@@ -39,22 +39,22 @@ data to the state machine each time, which uses those 4 bits of data along with
 the current accumulated state data to process the data given.
 
 For the sake of efficiency, the in-memory representation of the states,
-transitions, and result values of the state machine are represented as a long
-list containing three-tuples. This list is enormously long, and viewing it as
-an in-memory representation is not very clear, but it is laid out here in a way
-that is intended to be *somewhat* more clear.
+transitions, and result values of the state machine are represented as three
+parallel arrays of bytes. In this file they are written out as one long run of
+hex, three bytes per entry, which is unpacked once at import time. This is
+enormously long, and viewing it as an in-memory representation is not very
+clear, but it is laid out here in a way that is intended to be *somewhat* more
+clear.
 
-Essentially, the list is structured as 256 collections of 16 entries (one for
-each nibble) of three-tuples. Each collection is called a "node", and the
-zeroth collection is called the "root node". The state machine tracks one
-value: the "state" byte.
+Essentially, the table is structured as 256 collections of 16 entries (one for
+each nibble). Each collection is called a "node", and the zeroth collection is
+called the "root node". The state machine tracks one value: the "state" byte.
 
 For each nibble passed to the state machine, it first multiplies the "state"
 byte by 16 and adds the numerical value of the nibble. This number is the index
-into the large flat list.
+into each of the arrays.
 
-The three-tuple that is found by looking up that index consists of three
-values:
+The entry that is found by looking up that index consists of three values:
 
 - a new state value, used for subsequent decoding
 - a collection of flags, used to determine whether data is emitted or whether
@@ -69,7 +69,23 @@ This approach has relatively little indirection, and therefore performs
 relatively well, particularly on implementations like PyPy where the cost of
 loops at the Python-level is not too expensive. The total number of loop
 iterations is 4x the number of bytes passed to the decoder.
+
+On CPython, however, the per-nibble work dominates the cost of decoding. For
+that reason the default decoder uses a second state machine derived from the
+first, which consumes a whole byte per step. Running two nibble transitions
+back to back emits at most two symbols, so each of its 256 x 256 transitions
+is stored as a new state and the index of a (possibly empty) bytestring to
+emit, in two compact arrays of unsigned shorts. Only the distinct bytestrings
+are kept, in a list that the emit indexes refer to. Whether
+the state machine is complete depends only on the state it is in, and all
+failing transitions lead to a dead state that never leaves, so the decoding
+loop does not need to consult any flags until the input is exhausted. The
+byte transitions are derived from the nibble table the first time they are
+needed.
 """
+from array import array
+
+from .compat import decode_hex
 from .exceptions import HPACKDecodingError
 
 
@@ -84,6 +100,38 @@ def decode_huffman(huffman_string):
     if not huffman_string:
         return b''
 
+    if _BYTE_NEXT_STATE is None:
+        _build_byte_transitions()
+
+    next_state = _BYTE_NEXT_STATE
+    emit = _BYTE_EMIT
+    strings = _BYTE_EMIT_STRINGS
+    state = 0
+    decoded_bytes = bytearray()
+
+    for input_byte in bytearray(huffman_string):
+        index = (state << 8) | input_byte
+        state = next_state[index]
+        decoded_bytes += strings[emit[index]]
+
+    if state == _BYTE_DEAD_STATE:
+        raise HPACKDecodingError("Invalid Huffman String")
+
+    if not _BYTE_ACCEPTING[state]:
+        raise HPACKDecodingError("Incomplete Huffman string")
+
+    return bytes(decoded_bytes)
+
+
+def decode_huffman_nibbles(huffman_string):
+    """
+    Given a bytestring of Huffman-encoded data for HPACK, returns a bytestring
+    of the decompressed data. This uses the nibble-based state machine
+    directly, and is mostly useful as a reference for :func:`decode_huffman`.
+    """
+    if not huffman_string:
+        return b''
+
     state = 0
     flags = 0
     decoded_bytes = bytearray()
@@ -99,22 +147,24 @@ def decode_huffman(huffman_string):
     # a bit longer, but that's ok.
     for input_byte in huffman_string:
         index = (state * 16) + (input_byte >> 4)
-        state, flags, output_byte = HUFFMAN_TABLE[index]
+        state = HUFFMAN_STATES[index]
+        flags = HUFFMAN_FLAGS[index]
 
         if flags & HUFFMAN_FAIL:
             raise HPACKDecodingError("Invalid Huffman String")
 
         if flags & HUFFMAN_EMIT_SYMBOL:
-            decoded_bytes.append(output_byte)
+            decoded_bytes.append(HUFFMAN_SYMBOLS[index])
 
         index = (state * 16) + (input_byte & 0x0F)
-        state, flags, output_byte = HUFFMAN_TABLE[index]
+        state = HUFFMAN_STATES[index]
+        flags = HUFFMAN_FLAGS[index]
 
         if flags & HUFFMAN_FAIL:
             raise HPACKDecodingError("Invalid Huffman String")
 
         if flags & HUFFMAN_EMIT_SYMBOL:
-            decoded_bytes.append(output_byte)
+            decoded_bytes.append(HUFFMAN_SYMBOLS[index])
 
     if not (flags & HUFFMAN_COMPLETE):
         raise HPACKDecodingError("Incomplete Huffman string")
@@ -122,4618 +172,1109 @@ def decode_huffman(huffman_string):
     return bytes(decoded_bytes)
 
 
+def _build_byte_transitions():
+    """
+    Derives the byte-at-a-time state machine from the nibble state machine.
+    """
+    global _BYTE_NEXT_STATE, _BYTE_EMIT, _BYTE_EMIT_STRINGS, _BYTE_ACCEPTING
+
+    symbols = [bytes(bytearray([byte])) for byte in range(256)]
+    transitions = (_BYTE_DEAD_STATE + 1) * 256
+    next_state = array('H', [_BYTE_DEAD_STATE]) * transitions
+    emit = array('H', [0]) * transitions
+    accepting = [False] * (_BYTE_DEAD_STATE + 1)
+
+    # Many transitions emit the same symbols: each distinct string is stored
+    # once, and the transitions refer to it by its index. The empty string
+    # has index 0.
+    strings = [b'']
+    string_indexes = {b'': 0}
+
+    for state in range(256):
+        for high_nibble in range(16):
+            index = (state * 16) + high_nibble
+            middle_state = HUFFMAN_STATES[index]
+            flags = HUFFMAN_FLAGS[index]
+            if flags & HUFFMAN_FAIL:
+                continue
+
+            prefix = b''
+            if flags & HUFFMAN_EMIT_SYMBOL:
+                prefix = symbols[HUFFMAN_SYMBOLS[index]]
+
+            for low_nibble in range(16):
+                index = (middle_state * 16) + low_nibble
+                flags = HUFFMAN_FLAGS[index]
+                if flags & HUFFMAN_FAIL:
+                    continue
+
+                output = prefix
+                if flags & HUFFMAN_EMIT_SYMBOL:
+                    output = prefix + symbols[HUFFMAN_SYMBOLS[index]]
+
+                string_index = string_indexes.get(output)
+                if string_index is None:
+                    string_index = string_indexes[output] = len(strings)
+                    strings.append(output)
+
+                new_state = HUFFMAN_STATES[index]
+                byte_index = (state << 8) | (high_nibble << 4) | low_nibble
+                next_state[byte_index] = new_state
+                emit[byte_index] = string_index
+                accepting[new_state] = bool(flags & HUFFMAN_COMPLETE)
+
+    _BYTE_ACCEPTING = accepting
+    _BYTE_EMIT_STRINGS = strings
+    _BYTE_EMIT = emit
+    _BYTE_NEXT_STATE = next_state
+
+
 # Some decoder flags to control state transitions.
 HUFFMAN_COMPLETE = 1
 HUFFMAN_EMIT_SYMBOL = (1 << 1)
 HUFFMAN_FAIL = (1 << 2)
 
-# This is the monster table. Avert your eyes, children.
-HUFFMAN_TABLE = [
+# The byte-at-a-time state machine. Every failing transition leads to the dead
+# state, whose own transitions all lead back to it. These are built by
+# _build_byte_transitions the first time decode_huffman is called.
+_BYTE_DEAD_STATE = 256
+_BYTE_NEXT_STATE = None
+_BYTE_EMIT = None
+_BYTE_EMIT_STRINGS = None
+_BYTE_ACCEPTING = None
+
+# This is the monster table. Avert your eyes, children. Each entry is packed
+# as three bytes, written here in hex: the new state, the flags and the symbol
+# to emit. Each node is 16 entries, one for each nibble.
+_HUFFMAN_TABLE_DATA = (
     # Node 0 (Root Node, never emits symbols.)
-    (4, 0, 0),
-    (5, 0, 0),
-    (7, 0, 0),
-    (8, 0, 0),
-    (11, 0, 0),
-    (12, 0, 0),
-    (16, 0, 0),
-    (19, 0, 0),
-    (25, 0, 0),
-    (28, 0, 0),
-    (32, 0, 0),
-    (35, 0, 0),
-    (42, 0, 0),
-    (49, 0, 0),
-    (57, 0, 0),
-    (64, HUFFMAN_COMPLETE, 0),
+    '0400000500000700000800000b00000c0000100000130000'
+    '1900001c00002000002300002a0000310000390000400100'
 
     # Node 1
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 48),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 49),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 50),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 97),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 99),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 101),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 105),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 111),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 115),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 116),
-    (13, 0, 0),
-    (14, 0, 0),
-    (17, 0, 0),
-    (18, 0, 0),
-    (20, 0, 0),
-    (21, 0, 0),
+    '00033000033100033200036100036300036500036900036f'
+    '0003730003740d00000e0000110000120000140000150000'
 
     # Node 2
-    (1, HUFFMAN_EMIT_SYMBOL, 48),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 48),
-    (1, HUFFMAN_EMIT_SYMBOL, 49),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 49),
-    (1, HUFFMAN_EMIT_SYMBOL, 50),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 50),
-    (1, HUFFMAN_EMIT_SYMBOL, 97),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 97),
-    (1, HUFFMAN_EMIT_SYMBOL, 99),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 99),
-    (1, HUFFMAN_EMIT_SYMBOL, 101),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 101),
-    (1, HUFFMAN_EMIT_SYMBOL, 105),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 105),
-    (1, HUFFMAN_EMIT_SYMBOL, 111),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 111),
+    '010230160330010231160331010232160332010261160361'
+    '01026316036301026516036501026916036901026f16036f'
 
     # Node 3
-    (2, HUFFMAN_EMIT_SYMBOL, 48),
-    (9, HUFFMAN_EMIT_SYMBOL, 48),
-    (23, HUFFMAN_EMIT_SYMBOL, 48),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 48),
-    (2, HUFFMAN_EMIT_SYMBOL, 49),
-    (9, HUFFMAN_EMIT_SYMBOL, 49),
-    (23, HUFFMAN_EMIT_SYMBOL, 49),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 49),
-    (2, HUFFMAN_EMIT_SYMBOL, 50),
-    (9, HUFFMAN_EMIT_SYMBOL, 50),
-    (23, HUFFMAN_EMIT_SYMBOL, 50),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 50),
-    (2, HUFFMAN_EMIT_SYMBOL, 97),
-    (9, HUFFMAN_EMIT_SYMBOL, 97),
-    (23, HUFFMAN_EMIT_SYMBOL, 97),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 97),
+    '020230090230170230280330020231090231170231280331'
+    '020232090232170232280332020261090261170261280361'
 
     # Node 4
-    (3, HUFFMAN_EMIT_SYMBOL, 48),
-    (6, HUFFMAN_EMIT_SYMBOL, 48),
-    (10, HUFFMAN_EMIT_SYMBOL, 48),
-    (15, HUFFMAN_EMIT_SYMBOL, 48),
-    (24, HUFFMAN_EMIT_SYMBOL, 48),
-    (31, HUFFMAN_EMIT_SYMBOL, 48),
-    (41, HUFFMAN_EMIT_SYMBOL, 48),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 48),
-    (3, HUFFMAN_EMIT_SYMBOL, 49),
-    (6, HUFFMAN_EMIT_SYMBOL, 49),
-    (10, HUFFMAN_EMIT_SYMBOL, 49),
-    (15, HUFFMAN_EMIT_SYMBOL, 49),
-    (24, HUFFMAN_EMIT_SYMBOL, 49),
-    (31, HUFFMAN_EMIT_SYMBOL, 49),
-    (41, HUFFMAN_EMIT_SYMBOL, 49),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 49),
+    '0302300602300a02300f02301802301f0230290230380330'
+    '0302310602310a02310f02311802311f0231290231380331'
 
     # Node 5
-    (3, HUFFMAN_EMIT_SYMBOL, 50),
-    (6, HUFFMAN_EMIT_SYMBOL, 50),
-    (10, HUFFMAN_EMIT_SYMBOL, 50),
-    (15, HUFFMAN_EMIT_SYMBOL, 50),
-    (24, HUFFMAN_EMIT_SYMBOL, 50),
-    (31, HUFFMAN_EMIT_SYMBOL, 50),
-    (41, HUFFMAN_EMIT_SYMBOL, 50),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 50),
-    (3, HUFFMAN_EMIT_SYMBOL, 97),
-    (6, HUFFMAN_EMIT_SYMBOL, 97),
-    (10, HUFFMAN_EMIT_SYMBOL, 97),
-    (15, HUFFMAN_EMIT_SYMBOL, 97),
-    (24, HUFFMAN_EMIT_SYMBOL, 97),
-    (31, HUFFMAN_EMIT_SYMBOL, 97),
-    (41, HUFFMAN_EMIT_SYMBOL, 97),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 97),
+    '0302320602320a02320f02321802321f0232290232380332'
+    '0302610602610a02610f02611802611f0261290261380361'
 
     # Node 6
-    (2, HUFFMAN_EMIT_SYMBOL, 99),
-    (9, HUFFMAN_EMIT_SYMBOL, 99),
-    (23, HUFFMAN_EMIT_SYMBOL, 99),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 99),
-    (2, HUFFMAN_EMIT_SYMBOL, 101),
-    (9, HUFFMAN_EMIT_SYMBOL, 101),
-    (23, HUFFMAN_EMIT_SYMBOL, 101),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 101),
-    (2, HUFFMAN_EMIT_SYMBOL, 105),
-    (9, HUFFMAN_EMIT_SYMBOL, 105),
-    (23, HUFFMAN_EMIT_SYMBOL, 105),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 105),
-    (2, HUFFMAN_EMIT_SYMBOL, 111),
-    (9, HUFFMAN_EMIT_SYMBOL, 111),
-    (23, HUFFMAN_EMIT_SYMBOL, 111),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 111),
+    '020263090263170263280363020265090265170265280365'
+    '02026909026917026928036902026f09026f17026f28036f'
 
     # Node 7
-    (3, HUFFMAN_EMIT_SYMBOL, 99),
-    (6, HUFFMAN_EMIT_SYMBOL, 99),
-    (10, HUFFMAN_EMIT_SYMBOL, 99),
-    (15, HUFFMAN_EMIT_SYMBOL, 99),
-    (24, HUFFMAN_EMIT_SYMBOL, 99),
-    (31, HUFFMAN_EMIT_SYMBOL, 99),
-    (41, HUFFMAN_EMIT_SYMBOL, 99),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 99),
-    (3, HUFFMAN_EMIT_SYMBOL, 101),
-    (6, HUFFMAN_EMIT_SYMBOL, 101),
-    (10, HUFFMAN_EMIT_SYMBOL, 101),
-    (15, HUFFMAN_EMIT_SYMBOL, 101),
-    (24, HUFFMAN_EMIT_SYMBOL, 101),
-    (31, HUFFMAN_EMIT_SYMBOL, 101),
-    (41, HUFFMAN_EMIT_SYMBOL, 101),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 101),
+    '0302630602630a02630f02631802631f0263290263380363'
+    '0302650602650a02650f02651802651f0265290265380365'
 
     # Node 8
-    (3, HUFFMAN_EMIT_SYMBOL, 105),
-    (6, HUFFMAN_EMIT_SYMBOL, 105),
-    (10, HUFFMAN_EMIT_SYMBOL, 105),
-    (15, HUFFMAN_EMIT_SYMBOL, 105),
-    (24, HUFFMAN_EMIT_SYMBOL, 105),
-    (31, HUFFMAN_EMIT_SYMBOL, 105),
-    (41, HUFFMAN_EMIT_SYMBOL, 105),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 105),
-    (3, HUFFMAN_EMIT_SYMBOL, 111),
-    (6, HUFFMAN_EMIT_SYMBOL, 111),
-    (10, HUFFMAN_EMIT_SYMBOL, 111),
-    (15, HUFFMAN_EMIT_SYMBOL, 111),
-    (24, HUFFMAN_EMIT_SYMBOL, 111),
-    (31, HUFFMAN_EMIT_SYMBOL, 111),
-    (41, HUFFMAN_EMIT_SYMBOL, 111),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 111),
+    '0302690602690a02690f02691802691f0269290269380369'
+    '03026f06026f0a026f0f026f18026f1f026f29026f38036f'
 
     # Node 9
-    (1, HUFFMAN_EMIT_SYMBOL, 115),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 115),
-    (1, HUFFMAN_EMIT_SYMBOL, 116),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 116),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 32),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 37),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 45),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 46),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 47),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 51),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 52),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 53),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 54),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 55),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 56),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 57),
+    '01027316037301027416037400032000032500032d00032e'
+    '00032f000333000334000335000336000337000338000339'
 
     # Node 10
-    (2, HUFFMAN_EMIT_SYMBOL, 115),
-    (9, HUFFMAN_EMIT_SYMBOL, 115),
-    (23, HUFFMAN_EMIT_SYMBOL, 115),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 115),
-    (2, HUFFMAN_EMIT_SYMBOL, 116),
-    (9, HUFFMAN_EMIT_SYMBOL, 116),
-    (23, HUFFMAN_EMIT_SYMBOL, 116),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 116),
-    (1, HUFFMAN_EMIT_SYMBOL, 32),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 32),
-    (1, HUFFMAN_EMIT_SYMBOL, 37),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 37),
-    (1, HUFFMAN_EMIT_SYMBOL, 45),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 45),
-    (1, HUFFMAN_EMIT_SYMBOL, 46),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 46),
+    '020273090273170273280373020274090274170274280374'
+    '01022016032001022516032501022d16032d01022e16032e'
 
     # Node 11
-    (3, HUFFMAN_EMIT_SYMBOL, 115),
-    (6, HUFFMAN_EMIT_SYMBOL, 115),
-    (10, HUFFMAN_EMIT_SYMBOL, 115),
-    (15, HUFFMAN_EMIT_SYMBOL, 115),
-    (24, HUFFMAN_EMIT_SYMBOL, 115),
-    (31, HUFFMAN_EMIT_SYMBOL, 115),
-    (41, HUFFMAN_EMIT_SYMBOL, 115),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 115),
-    (3, HUFFMAN_EMIT_SYMBOL, 116),
-    (6, HUFFMAN_EMIT_SYMBOL, 116),
-    (10, HUFFMAN_EMIT_SYMBOL, 116),
-    (15, HUFFMAN_EMIT_SYMBOL, 116),
-    (24, HUFFMAN_EMIT_SYMBOL, 116),
-    (31, HUFFMAN_EMIT_SYMBOL, 116),
-    (41, HUFFMAN_EMIT_SYMBOL, 116),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 116),
+    '0302730602730a02730f02731802731f0273290273380373'
+    '0302740602740a02740f02741802741f0274290274380374'
 
     # Node 12
-    (2, HUFFMAN_EMIT_SYMBOL, 32),
-    (9, HUFFMAN_EMIT_SYMBOL, 32),
-    (23, HUFFMAN_EMIT_SYMBOL, 32),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 32),
-    (2, HUFFMAN_EMIT_SYMBOL, 37),
-    (9, HUFFMAN_EMIT_SYMBOL, 37),
-    (23, HUFFMAN_EMIT_SYMBOL, 37),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 37),
-    (2, HUFFMAN_EMIT_SYMBOL, 45),
-    (9, HUFFMAN_EMIT_SYMBOL, 45),
-    (23, HUFFMAN_EMIT_SYMBOL, 45),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 45),
-    (2, HUFFMAN_EMIT_SYMBOL, 46),
-    (9, HUFFMAN_EMIT_SYMBOL, 46),
-    (23, HUFFMAN_EMIT_SYMBOL, 46),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 46),
+    '020220090220170220280320020225090225170225280325'
+    '02022d09022d17022d28032d02022e09022e17022e28032e'
 
     # Node 13
-    (3, HUFFMAN_EMIT_SYMBOL, 32),
-    (6, HUFFMAN_EMIT_SYMBOL, 32),
-    (10, HUFFMAN_EMIT_SYMBOL, 32),
-    (15, HUFFMAN_EMIT_SYMBOL, 32),
-    (24, HUFFMAN_EMIT_SYMBOL, 32),
-    (31, HUFFMAN_EMIT_SYMBOL, 32),
-    (41, HUFFMAN_EMIT_SYMBOL, 32),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 32),
-    (3, HUFFMAN_EMIT_SYMBOL, 37),
-    (6, HUFFMAN_EMIT_SYMBOL, 37),
-    (10, HUFFMAN_EMIT_SYMBOL, 37),
-    (15, HUFFMAN_EMIT_SYMBOL, 37),
-    (24, HUFFMAN_EMIT_SYMBOL, 37),
-    (31, HUFFMAN_EMIT_SYMBOL, 37),
-    (41, HUFFMAN_EMIT_SYMBOL, 37),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 37),
+    '0302200602200a02200f02201802201f0220290220380320'
+    '0302250602250a02250f02251802251f0225290225380325'
 
     # Node 14
-    (3, HUFFMAN_EMIT_SYMBOL, 45),
-    (6, HUFFMAN_EMIT_SYMBOL, 45),
-    (10, HUFFMAN_EMIT_SYMBOL, 45),
-    (15, HUFFMAN_EMIT_SYMBOL, 45),
-    (24, HUFFMAN_EMIT_SYMBOL, 45),
-    (31, HUFFMAN_EMIT_SYMBOL, 45),
-    (41, HUFFMAN_EMIT_SYMBOL, 45),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 45),
-    (3, HUFFMAN_EMIT_SYMBOL, 46),
-    (6, HUFFMAN_EMIT_SYMBOL, 46),
-    (10, HUFFMAN_EMIT_SYMBOL, 46),
-    (15, HUFFMAN_EMIT_SYMBOL, 46),
-    (24, HUFFMAN_EMIT_SYMBOL, 46),
-    (31, HUFFMAN_EMIT_SYMBOL, 46),
-    (41, HUFFMAN_EMIT_SYMBOL, 46),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 46),
+    '03022d06022d0a022d0f022d18022d1f022d29022d38032d'
+    '03022e06022e0a022e0f022e18022e1f022e29022e38032e'
 
     # Node 15
-    (1, HUFFMAN_EMIT_SYMBOL, 47),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 47),
-    (1, HUFFMAN_EMIT_SYMBOL, 51),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 51),
-    (1, HUFFMAN_EMIT_SYMBOL, 52),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 52),
-    (1, HUFFMAN_EMIT_SYMBOL, 53),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 53),
-    (1, HUFFMAN_EMIT_SYMBOL, 54),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 54),
-    (1, HUFFMAN_EMIT_SYMBOL, 55),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 55),
-    (1, HUFFMAN_EMIT_SYMBOL, 56),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 56),
-    (1, HUFFMAN_EMIT_SYMBOL, 57),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 57),
+    '01022f16032f010233160333010234160334010235160335'
+    '010236160336010237160337010238160338010239160339'
 
     # Node 16
-    (2, HUFFMAN_EMIT_SYMBOL, 47),
-    (9, HUFFMAN_EMIT_SYMBOL, 47),
-    (23, HUFFMAN_EMIT_SYMBOL, 47),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 47),
-    (2, HUFFMAN_EMIT_SYMBOL, 51),
-    (9, HUFFMAN_EMIT_SYMBOL, 51),
-    (23, HUFFMAN_EMIT_SYMBOL, 51),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 51),
-    (2, HUFFMAN_EMIT_SYMBOL, 52),
-    (9, HUFFMAN_EMIT_SYMBOL, 52),
-    (23, HUFFMAN_EMIT_SYMBOL, 52),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 52),
-    (2, HUFFMAN_EMIT_SYMBOL, 53),
-    (9, HUFFMAN_EMIT_SYMBOL, 53),
-    (23, HUFFMAN_EMIT_SYMBOL, 53),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 53),
+    '02022f09022f17022f28032f020233090233170233280333'
+    '020234090234170234280334020235090235170235280335'
 
     # Node 17
-    (3, HUFFMAN_EMIT_SYMBOL, 47),
-    (6, HUFFMAN_EMIT_SYMBOL, 47),
-    (10, HUFFMAN_EMIT_SYMBOL, 47),
-    (15, HUFFMAN_EMIT_SYMBOL, 47),
-    (24, HUFFMAN_EMIT_SYMBOL, 47),
-    (31, HUFFMAN_EMIT_SYMBOL, 47),
-    (41, HUFFMAN_EMIT_SYMBOL, 47),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 47),
-    (3, HUFFMAN_EMIT_SYMBOL, 51),
-    (6, HUFFMAN_EMIT_SYMBOL, 51),
-    (10, HUFFMAN_EMIT_SYMBOL, 51),
-    (15, HUFFMAN_EMIT_SYMBOL, 51),
-    (24, HUFFMAN_EMIT_SYMBOL, 51),
-    (31, HUFFMAN_EMIT_SYMBOL, 51),
-    (41, HUFFMAN_EMIT_SYMBOL, 51),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 51),
+    '03022f06022f0a022f0f022f18022f1f022f29022f38032f'
+    '0302330602330a02330f02331802331f0233290233380333'
 
     # Node 18
-    (3, HUFFMAN_EMIT_SYMBOL, 52),
-    (6, HUFFMAN_EMIT_SYMBOL, 52),
-    (10, HUFFMAN_EMIT_SYMBOL, 52),
-    (15, HUFFMAN_EMIT_SYMBOL, 52),
-    (24, HUFFMAN_EMIT_SYMBOL, 52),
-    (31, HUFFMAN_EMIT_SYMBOL, 52),
-    (41, HUFFMAN_EMIT_SYMBOL, 52),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 52),
-    (3, HUFFMAN_EMIT_SYMBOL, 53),
-    (6, HUFFMAN_EMIT_SYMBOL, 53),
-    (10, HUFFMAN_EMIT_SYMBOL, 53),
-    (15, HUFFMAN_EMIT_SYMBOL, 53),
-    (24, HUFFMAN_EMIT_SYMBOL, 53),
-    (31, HUFFMAN_EMIT_SYMBOL, 53),
-    (41, HUFFMAN_EMIT_SYMBOL, 53),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 53),
+    '0302340602340a02340f02341802341f0234290234380334'
+    '0302350602350a02350f02351802351f0235290235380335'
 
     # Node 19
-    (2, HUFFMAN_EMIT_SYMBOL, 54),
-    (9, HUFFMAN_EMIT_SYMBOL, 54),
-    (23, HUFFMAN_EMIT_SYMBOL, 54),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 54),
-    (2, HUFFMAN_EMIT_SYMBOL, 55),
-    (9, HUFFMAN_EMIT_SYMBOL, 55),
-    (23, HUFFMAN_EMIT_SYMBOL, 55),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 55),
-    (2, HUFFMAN_EMIT_SYMBOL, 56),
-    (9, HUFFMAN_EMIT_SYMBOL, 56),
-    (23, HUFFMAN_EMIT_SYMBOL, 56),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 56),
-    (2, HUFFMAN_EMIT_SYMBOL, 57),
-    (9, HUFFMAN_EMIT_SYMBOL, 57),
-    (23, HUFFMAN_EMIT_SYMBOL, 57),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 57),
+    '020236090236170236280336020237090237170237280337'
+    '020238090238170238280338020239090239170239280339'
 
     # Node 20
-    (3, HUFFMAN_EMIT_SYMBOL, 54),
-    (6, HUFFMAN_EMIT_SYMBOL, 54),
-    (10, HUFFMAN_EMIT_SYMBOL, 54),
-    (15, HUFFMAN_EMIT_SYMBOL, 54),
-    (24, HUFFMAN_EMIT_SYMBOL, 54),
-    (31, HUFFMAN_EMIT_SYMBOL, 54),
-    (41, HUFFMAN_EMIT_SYMBOL, 54),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 54),
-    (3, HUFFMAN_EMIT_SYMBOL, 55),
-    (6, HUFFMAN_EMIT_SYMBOL, 55),
-    (10, HUFFMAN_EMIT_SYMBOL, 55),
-    (15, HUFFMAN_EMIT_SYMBOL, 55),
-    (24, HUFFMAN_EMIT_SYMBOL, 55),
-    (31, HUFFMAN_EMIT_SYMBOL, 55),
-    (41, HUFFMAN_EMIT_SYMBOL, 55),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 55),
+    '0302360602360a02360f02361802361f0236290236380336'
+    '0302370602370a02370f02371802371f0237290237380337'
 
     # Node 21
-    (3, HUFFMAN_EMIT_SYMBOL, 56),
-    (6, HUFFMAN_EMIT_SYMBOL, 56),
-    (10, HUFFMAN_EMIT_SYMBOL, 56),
-    (15, HUFFMAN_EMIT_SYMBOL, 56),
-    (24, HUFFMAN_EMIT_SYMBOL, 56),
-    (31, HUFFMAN_EMIT_SYMBOL, 56),
-    (41, HUFFMAN_EMIT_SYMBOL, 56),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 56),
-    (3, HUFFMAN_EMIT_SYMBOL, 57),
-    (6, HUFFMAN_EMIT_SYMBOL, 57),
-    (10, HUFFMAN_EMIT_SYMBOL, 57),
-    (15, HUFFMAN_EMIT_SYMBOL, 57),
-    (24, HUFFMAN_EMIT_SYMBOL, 57),
-    (31, HUFFMAN_EMIT_SYMBOL, 57),
-    (41, HUFFMAN_EMIT_SYMBOL, 57),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 57),
+    '0302380602380a02380f02381802381f0238290238380338'
+    '0302390602390a02390f02391802391f0239290239380339'
 
     # Node 22
-    (26, 0, 0),
-    (27, 0, 0),
-    (29, 0, 0),
-    (30, 0, 0),
-    (33, 0, 0),
-    (34, 0, 0),
-    (36, 0, 0),
-    (37, 0, 0),
-    (43, 0, 0),
-    (46, 0, 0),
-    (50, 0, 0),
-    (53, 0, 0),
-    (58, 0, 0),
-    (61, 0, 0),
-    (65, 0, 0),
-    (68, HUFFMAN_COMPLETE, 0),
+    '1a00001b00001d00001e0000210000220000240000250000'
+    '2b00002e00003200003500003a00003d0000410000440100'
 
     # Node 23
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 61),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 65),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 95),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 98),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 100),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 102),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 103),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 104),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 108),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 109),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 110),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 112),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 114),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 117),
-    (38, 0, 0),
-    (39, 0, 0),
+    '00033d00034100035f000362000364000366000367000368'
+    '00036c00036d00036e000370000372000375260000270000'
 
     # Node 24
-    (1, HUFFMAN_EMIT_SYMBOL, 61),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 61),
-    (1, HUFFMAN_EMIT_SYMBOL, 65),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 65),
-    (1, HUFFMAN_EMIT_SYMBOL, 95),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 95),
-    (1, HUFFMAN_EMIT_SYMBOL, 98),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 98),
-    (1, HUFFMAN_EMIT_SYMBOL, 100),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 100),
-    (1, HUFFMAN_EMIT_SYMBOL, 102),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 102),
-    (1, HUFFMAN_EMIT_SYMBOL, 103),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 103),
-    (1, HUFFMAN_EMIT_SYMBOL, 104),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 104),
+    '01023d16033d01024116034101025f16035f010262160362'
+    '010264160364010266160366010267160367010268160368'
 
     # Node 25
-    (2, HUFFMAN_EMIT_SYMBOL, 61),
-    (9, HUFFMAN_EMIT_SYMBOL, 61),
-    (23, HUFFMAN_EMIT_SYMBOL, 61),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 61),
-    (2, HUFFMAN_EMIT_SYMBOL, 65),
-    (9, HUFFMAN_EMIT_SYMBOL, 65),
-    (23, HUFFMAN_EMIT_SYMBOL, 65),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 65),
-    (2, HUFFMAN_EMIT_SYMBOL, 95),
-    (9, HUFFMAN_EMIT_SYMBOL, 95),
-    (23, HUFFMAN_EMIT_SYMBOL, 95),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 95),
-    (2, HUFFMAN_EMIT_SYMBOL, 98),
-    (9, HUFFMAN_EMIT_SYMBOL, 98),
-    (23, HUFFMAN_EMIT_SYMBOL, 98),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 98),
+    '02023d09023d17023d28033d020241090241170241280341'
+    '02025f09025f17025f28035f020262090262170262280362'
 
     # Node 26
-    (3, HUFFMAN_EMIT_SYMBOL, 61),
-    (6, HUFFMAN_EMIT_SYMBOL, 61),
-    (10, HUFFMAN_EMIT_SYMBOL, 61),
-    (15, HUFFMAN_EMIT_SYMBOL, 61),
-    (24, HUFFMAN_EMIT_SYMBOL, 61),
-    (31, HUFFMAN_EMIT_SYMBOL, 61),
-    (41, HUFFMAN_EMIT_SYMBOL, 61),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 61),
-    (3, HUFFMAN_EMIT_SYMBOL, 65),
-    (6, HUFFMAN_EMIT_SYMBOL, 65),
-    (10, HUFFMAN_EMIT_SYMBOL, 65),
-    (15, HUFFMAN_EMIT_SYMBOL, 65),
-    (24, HUFFMAN_EMIT_SYMBOL, 65),
-    (31, HUFFMAN_EMIT_SYMBOL, 65),
-    (41, HUFFMAN_EMIT_SYMBOL, 65),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 65),
+    '03023d06023d0a023d0f023d18023d1f023d29023d38033d'
+    '0302410602410a02410f02411802411f0241290241380341'
 
     # Node 27
-    (3, HUFFMAN_EMIT_SYMBOL, 95),
-    (6, HUFFMAN_EMIT_SYMBOL, 95),
-    (10, HUFFMAN_EMIT_SYMBOL, 95),
-    (15, HUFFMAN_EMIT_SYMBOL, 95),
-    (24, HUFFMAN_EMIT_SYMBOL, 95),
-    (31, HUFFMAN_EMIT_SYMBOL, 95),
-    (41, HUFFMAN_EMIT_SYMBOL, 95),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 95),
-    (3, HUFFMAN_EMIT_SYMBOL, 98),
-    (6, HUFFMAN_EMIT_SYMBOL, 98),
-    (10, HUFFMAN_EMIT_SYMBOL, 98),
-    (15, HUFFMAN_EMIT_SYMBOL, 98),
-    (24, HUFFMAN_EMIT_SYMBOL, 98),
-    (31, HUFFMAN_EMIT_SYMBOL, 98),
-    (41, HUFFMAN_EMIT_SYMBOL, 98),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 98),
+    '03025f06025f0a025f0f025f18025f1f025f29025f38035f'
+    '0302620602620a02620f02621802621f0262290262380362'
 
     # Node 28
-    (2, HUFFMAN_EMIT_SYMBOL, 100),
-    (9, HUFFMAN_EMIT_SYMBOL, 100),
-    (23, HUFFMAN_EMIT_SYMBOL, 100),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 100),
-    (2, HUFFMAN_EMIT_SYMBOL, 102),
-    (9, HUFFMAN_EMIT_SYMBOL, 102),
-    (23, HUFFMAN_EMIT_SYMBOL, 102),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 102),
-    (2, HUFFMAN_EMIT_SYMBOL, 103),
-    (9, HUFFMAN_EMIT_SYMBOL, 103),
-    (23, HUFFMAN_EMIT_SYMBOL, 103),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 103),
-    (2, HUFFMAN_EMIT_SYMBOL, 104),
-    (9, HUFFMAN_EMIT_SYMBOL, 104),
-    (23, HUFFMAN_EMIT_SYMBOL, 104),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 104),
+    '020264090264170264280364020266090266170266280366'
+    '020267090267170267280367020268090268170268280368'
 
     # Node 29
-    (3, HUFFMAN_EMIT_SYMBOL, 100),
-    (6, HUFFMAN_EMIT_SYMBOL, 100),
-    (10, HUFFMAN_EMIT_SYMBOL, 100),
-    (15, HUFFMAN_EMIT_SYMBOL, 100),
-    (24, HUFFMAN_EMIT_SYMBOL, 100),
-    (31, HUFFMAN_EMIT_SYMBOL, 100),
-    (41, HUFFMAN_EMIT_SYMBOL, 100),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 100),
-    (3, HUFFMAN_EMIT_SYMBOL, 102),
-    (6, HUFFMAN_EMIT_SYMBOL, 102),
-    (10, HUFFMAN_EMIT_SYMBOL, 102),
-    (15, HUFFMAN_EMIT_SYMBOL, 102),
-    (24, HUFFMAN_EMIT_SYMBOL, 102),
-    (31, HUFFMAN_EMIT_SYMBOL, 102),
-    (41, HUFFMAN_EMIT_SYMBOL, 102),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 102),
+    '0302640602640a02640f02641802641f0264290264380364'
+    '0302660602660a02660f02661802661f0266290266380366'
 
     # Node 30
-    (3, HUFFMAN_EMIT_SYMBOL, 103),
-    (6, HUFFMAN_EMIT_SYMBOL, 103),
-    (10, HUFFMAN_EMIT_SYMBOL, 103),
-    (15, HUFFMAN_EMIT_SYMBOL, 103),
-    (24, HUFFMAN_EMIT_SYMBOL, 103),
-    (31, HUFFMAN_EMIT_SYMBOL, 103),
-    (41, HUFFMAN_EMIT_SYMBOL, 103),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 103),
-    (3, HUFFMAN_EMIT_SYMBOL, 104),
-    (6, HUFFMAN_EMIT_SYMBOL, 104),
-    (10, HUFFMAN_EMIT_SYMBOL, 104),
-    (15, HUFFMAN_EMIT_SYMBOL, 104),
-    (24, HUFFMAN_EMIT_SYMBOL, 104),
-    (31, HUFFMAN_EMIT_SYMBOL, 104),
-    (41, HUFFMAN_EMIT_SYMBOL, 104),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 104),
+    '0302670602670a02670f02671802671f0267290267380367'
+    '0302680602680a02680f02681802681f0268290268380368'
 
     # Node 31
-    (1, HUFFMAN_EMIT_SYMBOL, 108),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 108),
-    (1, HUFFMAN_EMIT_SYMBOL, 109),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 109),
-    (1, HUFFMAN_EMIT_SYMBOL, 110),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 110),
-    (1, HUFFMAN_EMIT_SYMBOL, 112),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 112),
-    (1, HUFFMAN_EMIT_SYMBOL, 114),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 114),
-    (1, HUFFMAN_EMIT_SYMBOL, 117),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 117),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 58),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 66),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 67),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 68),
+    '01026c16036c01026d16036d01026e16036e010270160370'
+    '01027216037201027516037500033a000342000343000344'
 
     # Node 32
-    (2, HUFFMAN_EMIT_SYMBOL, 108),
-    (9, HUFFMAN_EMIT_SYMBOL, 108),
-    (23, HUFFMAN_EMIT_SYMBOL, 108),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 108),
-    (2, HUFFMAN_EMIT_SYMBOL, 109),
-    (9, HUFFMAN_EMIT_SYMBOL, 109),
-    (23, HUFFMAN_EMIT_SYMBOL, 109),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 109),
-    (2, HUFFMAN_EMIT_SYMBOL, 110),
-    (9, HUFFMAN_EMIT_SYMBOL, 110),
-    (23, HUFFMAN_EMIT_SYMBOL, 110),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 110),
-    (2, HUFFMAN_EMIT_SYMBOL, 112),
-    (9, HUFFMAN_EMIT_SYMBOL, 112),
-    (23, HUFFMAN_EMIT_SYMBOL, 112),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 112),
+    '02026c09026c17026c28036c02026d09026d17026d28036d'
+    '02026e09026e17026e28036e020270090270170270280370'
 
     # Node 33
-    (3, HUFFMAN_EMIT_SYMBOL, 108),
-    (6, HUFFMAN_EMIT_SYMBOL, 108),
-    (10, HUFFMAN_EMIT_SYMBOL, 108),
-    (15, HUFFMAN_EMIT_SYMBOL, 108),
-    (24, HUFFMAN_EMIT_SYMBOL, 108),
-    (31, HUFFMAN_EMIT_SYMBOL, 108),
-    (41, HUFFMAN_EMIT_SYMBOL, 108),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 108),
-    (3, HUFFMAN_EMIT_SYMBOL, 109),
-    (6, HUFFMAN_EMIT_SYMBOL, 109),
-    (10, HUFFMAN_EMIT_SYMBOL, 109),
-    (15, HUFFMAN_EMIT_SYMBOL, 109),
-    (24, HUFFMAN_EMIT_SYMBOL, 109),
-    (31, HUFFMAN_EMIT_SYMBOL, 109),
-    (41, HUFFMAN_EMIT_SYMBOL, 109),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 109),
+    '03026c06026c0a026c0f026c18026c1f026c29026c38036c'
+    '03026d06026d0a026d0f026d18026d1f026d29026d38036d'
 
     # Node 34
-    (3, HUFFMAN_EMIT_SYMBOL, 110),
-    (6, HUFFMAN_EMIT_SYMBOL, 110),
-    (10, HUFFMAN_EMIT_SYMBOL, 110),
-    (15, HUFFMAN_EMIT_SYMBOL, 110),
-    (24, HUFFMAN_EMIT_SYMBOL, 110),
-    (31, HUFFMAN_EMIT_SYMBOL, 110),
-    (41, HUFFMAN_EMIT_SYMBOL, 110),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 110),
-    (3, HUFFMAN_EMIT_SYMBOL, 112),
-    (6, HUFFMAN_EMIT_SYMBOL, 112),
-    (10, HUFFMAN_EMIT_SYMBOL, 112),
-    (15, HUFFMAN_EMIT_SYMBOL, 112),
-    (24, HUFFMAN_EMIT_SYMBOL, 112),
-    (31, HUFFMAN_EMIT_SYMBOL, 112),
-    (41, HUFFMAN_EMIT_SYMBOL, 112),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 112),
+    '03026e06026e0a026e0f026e18026e1f026e29026e38036e'
+    '0302700602700a02700f02701802701f0270290270380370'
 
     # Node 35
-    (2, HUFFMAN_EMIT_SYMBOL, 114),
-    (9, HUFFMAN_EMIT_SYMBOL, 114),
-    (23, HUFFMAN_EMIT_SYMBOL, 114),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 114),
-    (2, HUFFMAN_EMIT_SYMBOL, 117),
-    (9, HUFFMAN_EMIT_SYMBOL, 117),
-    (23, HUFFMAN_EMIT_SYMBOL, 117),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 117),
-    (1, HUFFMAN_EMIT_SYMBOL, 58),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 58),
-    (1, HUFFMAN_EMIT_SYMBOL, 66),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 66),
-    (1, HUFFMAN_EMIT_SYMBOL, 67),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 67),
-    (1, HUFFMAN_EMIT_SYMBOL, 68),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 68),
+    '020272090272170272280372020275090275170275280375'
+    '01023a16033a010242160342010243160343010244160344'
 
     # Node 36
-    (3, HUFFMAN_EMIT_SYMBOL, 114),
-    (6, HUFFMAN_EMIT_SYMBOL, 114),
-    (10, HUFFMAN_EMIT_SYMBOL, 114),
-    (15, HUFFMAN_EMIT_SYMBOL, 114),
-    (24, HUFFMAN_EMIT_SYMBOL, 114),
-    (31, HUFFMAN_EMIT_SYMBOL, 114),
-    (41, HUFFMAN_EMIT_SYMBOL, 114),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 114),
-    (3, HUFFMAN_EMIT_SYMBOL, 117),
-    (6, HUFFMAN_EMIT_SYMBOL, 117),
-    (10, HUFFMAN_EMIT_SYMBOL, 117),
-    (15, HUFFMAN_EMIT_SYMBOL, 117),
-    (24, HUFFMAN_EMIT_SYMBOL, 117),
-    (31, HUFFMAN_EMIT_SYMBOL, 117),
-    (41, HUFFMAN_EMIT_SYMBOL, 117),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 117),
+    '0302720602720a02720f02721802721f0272290272380372'
+    '0302750602750a02750f02751802751f0275290275380375'
 
     # Node 37
-    (2, HUFFMAN_EMIT_SYMBOL, 58),
-    (9, HUFFMAN_EMIT_SYMBOL, 58),
-    (23, HUFFMAN_EMIT_SYMBOL, 58),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 58),
-    (2, HUFFMAN_EMIT_SYMBOL, 66),
-    (9, HUFFMAN_EMIT_SYMBOL, 66),
-    (23, HUFFMAN_EMIT_SYMBOL, 66),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 66),
-    (2, HUFFMAN_EMIT_SYMBOL, 67),
-    (9, HUFFMAN_EMIT_SYMBOL, 67),
-    (23, HUFFMAN_EMIT_SYMBOL, 67),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 67),
-    (2, HUFFMAN_EMIT_SYMBOL, 68),
-    (9, HUFFMAN_EMIT_SYMBOL, 68),
-    (23, HUFFMAN_EMIT_SYMBOL, 68),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 68),
+    '02023a09023a17023a28033a020242090242170242280342'
+    '020243090243170243280343020244090244170244280344'
 
     # Node 38
-    (3, HUFFMAN_EMIT_SYMBOL, 58),
-    (6, HUFFMAN_EMIT_SYMBOL, 58),
-    (10, HUFFMAN_EMIT_SYMBOL, 58),
-    (15, HUFFMAN_EMIT_SYMBOL, 58),
-    (24, HUFFMAN_EMIT_SYMBOL, 58),
-    (31, HUFFMAN_EMIT_SYMBOL, 58),
-    (41, HUFFMAN_EMIT_SYMBOL, 58),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 58),
-    (3, HUFFMAN_EMIT_SYMBOL, 66),
-    (6, HUFFMAN_EMIT_SYMBOL, 66),
-    (10, HUFFMAN_EMIT_SYMBOL, 66),
-    (15, HUFFMAN_EMIT_SYMBOL, 66),
-    (24, HUFFMAN_EMIT_SYMBOL, 66),
-    (31, HUFFMAN_EMIT_SYMBOL, 66),
-    (41, HUFFMAN_EMIT_SYMBOL, 66),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 66),
+    '03023a06023a0a023a0f023a18023a1f023a29023a38033a'
+    '0302420602420a02420f02421802421f0242290242380342'
 
     # Node 39
-    (3, HUFFMAN_EMIT_SYMBOL, 67),
-    (6, HUFFMAN_EMIT_SYMBOL, 67),
-    (10, HUFFMAN_EMIT_SYMBOL, 67),
-    (15, HUFFMAN_EMIT_SYMBOL, 67),
-    (24, HUFFMAN_EMIT_SYMBOL, 67),
-    (31, HUFFMAN_EMIT_SYMBOL, 67),
-    (41, HUFFMAN_EMIT_SYMBOL, 67),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 67),
-    (3, HUFFMAN_EMIT_SYMBOL, 68),
-    (6, HUFFMAN_EMIT_SYMBOL, 68),
-    (10, HUFFMAN_EMIT_SYMBOL, 68),
-    (15, HUFFMAN_EMIT_SYMBOL, 68),
-    (24, HUFFMAN_EMIT_SYMBOL, 68),
-    (31, HUFFMAN_EMIT_SYMBOL, 68),
-    (41, HUFFMAN_EMIT_SYMBOL, 68),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 68),
+    '0302430602430a02430f02431802431f0243290243380343'
+    '0302440602440a02440f02441802441f0244290244380344'
 
     # Node 40
-    (44, 0, 0),
-    (45, 0, 0),
-    (47, 0, 0),
-    (48, 0, 0),
-    (51, 0, 0),
-    (52, 0, 0),
-    (54, 0, 0),
-    (55, 0, 0),
-    (59, 0, 0),
-    (60, 0, 0),
-    (62, 0, 0),
-    (63, 0, 0),
-    (66, 0, 0),
-    (67, 0, 0),
-    (69, 0, 0),
-    (72, HUFFMAN_COMPLETE, 0),
+    '2c00002d00002f0000300000330000340000360000370000'
+    '3b00003c00003e00003f0000420000430000450000480100'
 
     # Node 41
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 69),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 70),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 71),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 72),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 73),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 74),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 75),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 76),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 77),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 78),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 79),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 80),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 81),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 82),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 83),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 84),
+    '00034500034600034700034800034900034a00034b00034c'
+    '00034d00034e00034f000350000351000352000353000354'
 
     # Node 42
-    (1, HUFFMAN_EMIT_SYMBOL, 69),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 69),
-    (1, HUFFMAN_EMIT_SYMBOL, 70),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 70),
-    (1, HUFFMAN_EMIT_SYMBOL, 71),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 71),
-    (1, HUFFMAN_EMIT_SYMBOL, 72),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 72),
-    (1, HUFFMAN_EMIT_SYMBOL, 73),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 73),
-    (1, HUFFMAN_EMIT_SYMBOL, 74),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 74),
-    (1, HUFFMAN_EMIT_SYMBOL, 75),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 75),
-    (1, HUFFMAN_EMIT_SYMBOL, 76),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 76),
+    '010245160345010246160346010247160347010248160348'
+    '01024916034901024a16034a01024b16034b01024c16034c'
 
     # Node 43
-    (2, HUFFMAN_EMIT_SYMBOL, 69),
-    (9, HUFFMAN_EMIT_SYMBOL, 69),
-    (23, HUFFMAN_EMIT_SYMBOL, 69),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 69),
-    (2, HUFFMAN_EMIT_SYMBOL, 70),
-    (9, HUFFMAN_EMIT_SYMBOL, 70),
-    (23, HUFFMAN_EMIT_SYMBOL, 70),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 70),
-    (2, HUFFMAN_EMIT_SYMBOL, 71),
-    (9, HUFFMAN_EMIT_SYMBOL, 71),
-    (23, HUFFMAN_EMIT_SYMBOL, 71),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 71),
-    (2, HUFFMAN_EMIT_SYMBOL, 72),
-    (9, HUFFMAN_EMIT_SYMBOL, 72),
-    (23, HUFFMAN_EMIT_SYMBOL, 72),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 72),
+    '020245090245170245280345020246090246170246280346'
+    '020247090247170247280347020248090248170248280348'
 
     # Node 44
-    (3, HUFFMAN_EMIT_SYMBOL, 69),
-    (6, HUFFMAN_EMIT_SYMBOL, 69),
-    (10, HUFFMAN_EMIT_SYMBOL, 69),
-    (15, HUFFMAN_EMIT_SYMBOL, 69),
-    (24, HUFFMAN_EMIT_SYMBOL, 69),
-    (31, HUFFMAN_EMIT_SYMBOL, 69),
-    (41, HUFFMAN_EMIT_SYMBOL, 69),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 69),
-    (3, HUFFMAN_EMIT_SYMBOL, 70),
-    (6, HUFFMAN_EMIT_SYMBOL, 70),
-    (10, HUFFMAN_EMIT_SYMBOL, 70),
-    (15, HUFFMAN_EMIT_SYMBOL, 70),
-    (24, HUFFMAN_EMIT_SYMBOL, 70),
-    (31, HUFFMAN_EMIT_SYMBOL, 70),
-    (41, HUFFMAN_EMIT_SYMBOL, 70),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 70),
+    '0302450602450a02450f02451802451f0245290245380345'
+    '0302460602460a02460f02461802461f0246290246380346'
 
     # Node 45
-    (3, HUFFMAN_EMIT_SYMBOL, 71),
-    (6, HUFFMAN_EMIT_SYMBOL, 71),
-    (10, HUFFMAN_EMIT_SYMBOL, 71),
-    (15, HUFFMAN_EMIT_SYMBOL, 71),
-    (24, HUFFMAN_EMIT_SYMBOL, 71),
-    (31, HUFFMAN_EMIT_SYMBOL, 71),
-    (41, HUFFMAN_EMIT_SYMBOL, 71),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 71),
-    (3, HUFFMAN_EMIT_SYMBOL, 72),
-    (6, HUFFMAN_EMIT_SYMBOL, 72),
-    (10, HUFFMAN_EMIT_SYMBOL, 72),
-    (15, HUFFMAN_EMIT_SYMBOL, 72),
-    (24, HUFFMAN_EMIT_SYMBOL, 72),
-    (31, HUFFMAN_EMIT_SYMBOL, 72),
-    (41, HUFFMAN_EMIT_SYMBOL, 72),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 72),
+    '0302470602470a02470f02471802471f0247290247380347'
+    '0302480602480a02480f02481802481f0248290248380348'
 
     # Node 46
-    (2, HUFFMAN_EMIT_SYMBOL, 73),
-    (9, HUFFMAN_EMIT_SYMBOL, 73),
-    (23, HUFFMAN_EMIT_SYMBOL, 73),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 73),
-    (2, HUFFMAN_EMIT_SYMBOL, 74),
-    (9, HUFFMAN_EMIT_SYMBOL, 74),
-    (23, HUFFMAN_EMIT_SYMBOL, 74),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 74),
-    (2, HUFFMAN_EMIT_SYMBOL, 75),
-    (9, HUFFMAN_EMIT_SYMBOL, 75),
-    (23, HUFFMAN_EMIT_SYMBOL, 75),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 75),
-    (2, HUFFMAN_EMIT_SYMBOL, 76),
-    (9, HUFFMAN_EMIT_SYMBOL, 76),
-    (23, HUFFMAN_EMIT_SYMBOL, 76),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 76),
+    '02024909024917024928034902024a09024a17024a28034a'
+    '02024b09024b17024b28034b02024c09024c17024c28034c'
 
     # Node 47
-    (3, HUFFMAN_EMIT_SYMBOL, 73),
-    (6, HUFFMAN_EMIT_SYMBOL, 73),
-    (10, HUFFMAN_EMIT_SYMBOL, 73),
-    (15, HUFFMAN_EMIT_SYMBOL, 73),
-    (24, HUFFMAN_EMIT_SYMBOL, 73),
-    (31, HUFFMAN_EMIT_SYMBOL, 73),
-    (41, HUFFMAN_EMIT_SYMBOL, 73),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 73),
-    (3, HUFFMAN_EMIT_SYMBOL, 74),
-    (6, HUFFMAN_EMIT_SYMBOL, 74),
-    (10, HUFFMAN_EMIT_SYMBOL, 74),
-    (15, HUFFMAN_EMIT_SYMBOL, 74),
-    (24, HUFFMAN_EMIT_SYMBOL, 74),
-    (31, HUFFMAN_EMIT_SYMBOL, 74),
-    (41, HUFFMAN_EMIT_SYMBOL, 74),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 74),
+    '0302490602490a02490f02491802491f0249290249380349'
+    '03024a06024a0a024a0f024a18024a1f024a29024a38034a'
 
     # Node 48
-    (3, HUFFMAN_EMIT_SYMBOL, 75),
-    (6, HUFFMAN_EMIT_SYMBOL, 75),
-    (10, HUFFMAN_EMIT_SYMBOL, 75),
-    (15, HUFFMAN_EMIT_SYMBOL, 75),
-    (24, HUFFMAN_EMIT_SYMBOL, 75),
-    (31, HUFFMAN_EMIT_SYMBOL, 75),
-    (41, HUFFMAN_EMIT_SYMBOL, 75),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 75),
-    (3, HUFFMAN_EMIT_SYMBOL, 76),
-    (6, HUFFMAN_EMIT_SYMBOL, 76),
-    (10, HUFFMAN_EMIT_SYMBOL, 76),
-    (15, HUFFMAN_EMIT_SYMBOL, 76),
-    (24, HUFFMAN_EMIT_SYMBOL, 76),
-    (31, HUFFMAN_EMIT_SYMBOL, 76),
-    (41, HUFFMAN_EMIT_SYMBOL, 76),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 76),
+    '03024b06024b0a024b0f024b18024b1f024b29024b38034b'
+    '03024c06024c0a024c0f024c18024c1f024c29024c38034c'
 
     # Node 49
-    (1, HUFFMAN_EMIT_SYMBOL, 77),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 77),
-    (1, HUFFMAN_EMIT_SYMBOL, 78),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 78),
-    (1, HUFFMAN_EMIT_SYMBOL, 79),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 79),
-    (1, HUFFMAN_EMIT_SYMBOL, 80),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 80),
-    (1, HUFFMAN_EMIT_SYMBOL, 81),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 81),
-    (1, HUFFMAN_EMIT_SYMBOL, 82),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 82),
-    (1, HUFFMAN_EMIT_SYMBOL, 83),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 83),
-    (1, HUFFMAN_EMIT_SYMBOL, 84),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 84),
+    '01024d16034d01024e16034e01024f16034f010250160350'
+    '010251160351010252160352010253160353010254160354'
 
     # Node 50
-    (2, HUFFMAN_EMIT_SYMBOL, 77),
-    (9, HUFFMAN_EMIT_SYMBOL, 77),
-    (23, HUFFMAN_EMIT_SYMBOL, 77),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 77),
-    (2, HUFFMAN_EMIT_SYMBOL, 78),
-    (9, HUFFMAN_EMIT_SYMBOL, 78),
-    (23, HUFFMAN_EMIT_SYMBOL, 78),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 78),
-    (2, HUFFMAN_EMIT_SYMBOL, 79),
-    (9, HUFFMAN_EMIT_SYMBOL, 79),
-    (23, HUFFMAN_EMIT_SYMBOL, 79),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 79),
-    (2, HUFFMAN_EMIT_SYMBOL, 80),
-    (9, HUFFMAN_EMIT_SYMBOL, 80),
-    (23, HUFFMAN_EMIT_SYMBOL, 80),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 80),
+    '02024d09024d17024d28034d02024e09024e17024e28034e'
+    '02024f09024f17024f28034f020250090250170250280350'
 
     # Node 51
-    (3, HUFFMAN_EMIT_SYMBOL, 77),
-    (6, HUFFMAN_EMIT_SYMBOL, 77),
-    (10, HUFFMAN_EMIT_SYMBOL, 77),
-    (15, HUFFMAN_EMIT_SYMBOL, 77),
-    (24, HUFFMAN_EMIT_SYMBOL, 77),
-    (31, HUFFMAN_EMIT_SYMBOL, 77),
-    (41, HUFFMAN_EMIT_SYMBOL, 77),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 77),
-    (3, HUFFMAN_EMIT_SYMBOL, 78),
-    (6, HUFFMAN_EMIT_SYMBOL, 78),
-    (10, HUFFMAN_EMIT_SYMBOL, 78),
-    (15, HUFFMAN_EMIT_SYMBOL, 78),
-    (24, HUFFMAN_EMIT_SYMBOL, 78),
-    (31, HUFFMAN_EMIT_SYMBOL, 78),
-    (41, HUFFMAN_EMIT_SYMBOL, 78),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 78),
+    '03024d06024d0a024d0f024d18024d1f024d29024d38034d'
+    '03024e06024e0a024e0f024e18024e1f024e29024e38034e'
 
     # Node 52
-    (3, HUFFMAN_EMIT_SYMBOL, 79),
-    (6, HUFFMAN_EMIT_SYMBOL, 79),
-    (10, HUFFMAN_EMIT_SYMBOL, 79),
-    (15, HUFFMAN_EMIT_SYMBOL, 79),
-    (24, HUFFMAN_EMIT_SYMBOL, 79),
-    (31, HUFFMAN_EMIT_SYMBOL, 79),
-    (41, HUFFMAN_EMIT_SYMBOL, 79),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 79),
-    (3, HUFFMAN_EMIT_SYMBOL, 80),
-    (6, HUFFMAN_EMIT_SYMBOL, 80),
-    (10, HUFFMAN_EMIT_SYMBOL, 80),
-    (15, HUFFMAN_EMIT_SYMBOL, 80),
-    (24, HUFFMAN_EMIT_SYMBOL, 80),
-    (31, HUFFMAN_EMIT_SYMBOL, 80),
-    (41, HUFFMAN_EMIT_SYMBOL, 80),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 80),
+    '03024f06024f0a024f0f024f18024f1f024f29024f38034f'
+    '0302500602500a02500f02501802501f0250290250380350'
 
     # Node 53
-    (2, HUFFMAN_EMIT_SYMBOL, 81),
-    (9, HUFFMAN_EMIT_SYMBOL, 81),
-    (23, HUFFMAN_EMIT_SYMBOL, 81),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 81),
-    (2, HUFFMAN_EMIT_SYMBOL, 82),
-    (9, HUFFMAN_EMIT_SYMBOL, 82),
-    (23, HUFFMAN_EMIT_SYMBOL, 82),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 82),
-    (2, HUFFMAN_EMIT_SYMBOL, 83),
-    (9, HUFFMAN_EMIT_SYMBOL, 83),
-    (23, HUFFMAN_EMIT_SYMBOL, 83),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 83),
-    (2, HUFFMAN_EMIT_SYMBOL, 84),
-    (9, HUFFMAN_EMIT_SYMBOL, 84),
-    (23, HUFFMAN_EMIT_SYMBOL, 84),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 84),
+    '020251090251170251280351020252090252170252280352'
+    '020253090253170253280353020254090254170254280354'
 
     # Node 54
-    (3, HUFFMAN_EMIT_SYMBOL, 81),
-    (6, HUFFMAN_EMIT_SYMBOL, 81),
-    (10, HUFFMAN_EMIT_SYMBOL, 81),
-    (15, HUFFMAN_EMIT_SYMBOL, 81),
-    (24, HUFFMAN_EMIT_SYMBOL, 81),
-    (31, HUFFMAN_EMIT_SYMBOL, 81),
-    (41, HUFFMAN_EMIT_SYMBOL, 81),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 81),
-    (3, HUFFMAN_EMIT_SYMBOL, 82),
-    (6, HUFFMAN_EMIT_SYMBOL, 82),
-    (10, HUFFMAN_EMIT_SYMBOL, 82),
-    (15, HUFFMAN_EMIT_SYMBOL, 82),
-    (24, HUFFMAN_EMIT_SYMBOL, 82),
-    (31, HUFFMAN_EMIT_SYMBOL, 82),
-    (41, HUFFMAN_EMIT_SYMBOL, 82),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 82),
+    '0302510602510a02510f02511802511f0251290251380351'
+    '0302520602520a02520f02521802521f0252290252380352'
 
     # Node 55
-    (3, HUFFMAN_EMIT_SYMBOL, 83),
-    (6, HUFFMAN_EMIT_SYMBOL, 83),
-    (10, HUFFMAN_EMIT_SYMBOL, 83),
-    (15, HUFFMAN_EMIT_SYMBOL, 83),
-    (24, HUFFMAN_EMIT_SYMBOL, 83),
-    (31, HUFFMAN_EMIT_SYMBOL, 83),
-    (41, HUFFMAN_EMIT_SYMBOL, 83),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 83),
-    (3, HUFFMAN_EMIT_SYMBOL, 84),
-    (6, HUFFMAN_EMIT_SYMBOL, 84),
-    (10, HUFFMAN_EMIT_SYMBOL, 84),
-    (15, HUFFMAN_EMIT_SYMBOL, 84),
-    (24, HUFFMAN_EMIT_SYMBOL, 84),
-    (31, HUFFMAN_EMIT_SYMBOL, 84),
-    (41, HUFFMAN_EMIT_SYMBOL, 84),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 84),
+    '0302530602530a02530f02531802531f0253290253380353'
+    '0302540602540a02540f02541802541f0254290254380354'
 
     # Node 56
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 85),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 86),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 87),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 89),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 106),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 107),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 113),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 118),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 119),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 120),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 121),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 122),
-    (70, 0, 0),
-    (71, 0, 0),
-    (73, 0, 0),
-    (74, HUFFMAN_COMPLETE, 0),
+    '00035500035600035700035900036a00036b000371000376'
+    '00037700037800037900037a4600004700004900004a0100'
 
     # Node 57
-    (1, HUFFMAN_EMIT_SYMBOL, 85),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 85),
-    (1, HUFFMAN_EMIT_SYMBOL, 86),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 86),
-    (1, HUFFMAN_EMIT_SYMBOL, 87),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 87),
-    (1, HUFFMAN_EMIT_SYMBOL, 89),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 89),
-    (1, HUFFMAN_EMIT_SYMBOL, 106),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 106),
-    (1, HUFFMAN_EMIT_SYMBOL, 107),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 107),
-    (1, HUFFMAN_EMIT_SYMBOL, 113),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 113),
-    (1, HUFFMAN_EMIT_SYMBOL, 118),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 118),
+    '010255160355010256160356010257160357010259160359'
+    '01026a16036a01026b16036b010271160371010276160376'
 
     # Node 58
-    (2, HUFFMAN_EMIT_SYMBOL, 85),
-    (9, HUFFMAN_EMIT_SYMBOL, 85),
-    (23, HUFFMAN_EMIT_SYMBOL, 85),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 85),
-    (2, HUFFMAN_EMIT_SYMBOL, 86),
-    (9, HUFFMAN_EMIT_SYMBOL, 86),
-    (23, HUFFMAN_EMIT_SYMBOL, 86),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 86),
-    (2, HUFFMAN_EMIT_SYMBOL, 87),
-    (9, HUFFMAN_EMIT_SYMBOL, 87),
-    (23, HUFFMAN_EMIT_SYMBOL, 87),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 87),
-    (2, HUFFMAN_EMIT_SYMBOL, 89),
-    (9, HUFFMAN_EMIT_SYMBOL, 89),
-    (23, HUFFMAN_EMIT_SYMBOL, 89),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 89),
+    '020255090255170255280355020256090256170256280356'
+    '020257090257170257280357020259090259170259280359'
 
     # Node 59
-    (3, HUFFMAN_EMIT_SYMBOL, 85),
-    (6, HUFFMAN_EMIT_SYMBOL, 85),
-    (10, HUFFMAN_EMIT_SYMBOL, 85),
-    (15, HUFFMAN_EMIT_SYMBOL, 85),
-    (24, HUFFMAN_EMIT_SYMBOL, 85),
-    (31, HUFFMAN_EMIT_SYMBOL, 85),
-    (41, HUFFMAN_EMIT_SYMBOL, 85),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 85),
-    (3, HUFFMAN_EMIT_SYMBOL, 86),
-    (6, HUFFMAN_EMIT_SYMBOL, 86),
-    (10, HUFFMAN_EMIT_SYMBOL, 86),
-    (15, HUFFMAN_EMIT_SYMBOL, 86),
-    (24, HUFFMAN_EMIT_SYMBOL, 86),
-    (31, HUFFMAN_EMIT_SYMBOL, 86),
-    (41, HUFFMAN_EMIT_SYMBOL, 86),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 86),
+    '0302550602550a02550f02551802551f0255290255380355'
+    '0302560602560a02560f02561802561f0256290256380356'
 
     # Node 60
-    (3, HUFFMAN_EMIT_SYMBOL, 87),
-    (6, HUFFMAN_EMIT_SYMBOL, 87),
-    (10, HUFFMAN_EMIT_SYMBOL, 87),
-    (15, HUFFMAN_EMIT_SYMBOL, 87),
-    (24, HUFFMAN_EMIT_SYMBOL, 87),
-    (31, HUFFMAN_EMIT_SYMBOL, 87),
-    (41, HUFFMAN_EMIT_SYMBOL, 87),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 87),
-    (3, HUFFMAN_EMIT_SYMBOL, 89),
-    (6, HUFFMAN_EMIT_SYMBOL, 89),
-    (10, HUFFMAN_EMIT_SYMBOL, 89),
-    (15, HUFFMAN_EMIT_SYMBOL, 89),
-    (24, HUFFMAN_EMIT_SYMBOL, 89),
-    (31, HUFFMAN_EMIT_SYMBOL, 89),
-    (41, HUFFMAN_EMIT_SYMBOL, 89),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 89),
+    '0302570602570a02570f02571802571f0257290257380357'
+    '0302590602590a02590f02591802591f0259290259380359'
 
     # Node 61
-    (2, HUFFMAN_EMIT_SYMBOL, 106),
-    (9, HUFFMAN_EMIT_SYMBOL, 106),
-    (23, HUFFMAN_EMIT_SYMBOL, 106),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 106),
-    (2, HUFFMAN_EMIT_SYMBOL, 107),
-    (9, HUFFMAN_EMIT_SYMBOL, 107),
-    (23, HUFFMAN_EMIT_SYMBOL, 107),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 107),
-    (2, HUFFMAN_EMIT_SYMBOL, 113),
-    (9, HUFFMAN_EMIT_SYMBOL, 113),
-    (23, HUFFMAN_EMIT_SYMBOL, 113),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 113),
-    (2, HUFFMAN_EMIT_SYMBOL, 118),
-    (9, HUFFMAN_EMIT_SYMBOL, 118),
-    (23, HUFFMAN_EMIT_SYMBOL, 118),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 118),
+    '02026a09026a17026a28036a02026b09026b17026b28036b'
+    '020271090271170271280371020276090276170276280376'
 
     # Node 62
-    (3, HUFFMAN_EMIT_SYMBOL, 106),
-    (6, HUFFMAN_EMIT_SYMBOL, 106),
-    (10, HUFFMAN_EMIT_SYMBOL, 106),
-    (15, HUFFMAN_EMIT_SYMBOL, 106),
-    (24, HUFFMAN_EMIT_SYMBOL, 106),
-    (31, HUFFMAN_EMIT_SYMBOL, 106),
-    (41, HUFFMAN_EMIT_SYMBOL, 106),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 106),
-    (3, HUFFMAN_EMIT_SYMBOL, 107),
-    (6, HUFFMAN_EMIT_SYMBOL, 107),
-    (10, HUFFMAN_EMIT_SYMBOL, 107),
-    (15, HUFFMAN_EMIT_SYMBOL, 107),
-    (24, HUFFMAN_EMIT_SYMBOL, 107),
-    (31, HUFFMAN_EMIT_SYMBOL, 107),
-    (41, HUFFMAN_EMIT_SYMBOL, 107),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 107),
+    '03026a06026a0a026a0f026a18026a1f026a29026a38036a'
+    '03026b06026b0a026b0f026b18026b1f026b29026b38036b'
 
     # Node 63
-    (3, HUFFMAN_EMIT_SYMBOL, 113),
-    (6, HUFFMAN_EMIT_SYMBOL, 113),
-    (10, HUFFMAN_EMIT_SYMBOL, 113),
-    (15, HUFFMAN_EMIT_SYMBOL, 113),
-    (24, HUFFMAN_EMIT_SYMBOL, 113),
-    (31, HUFFMAN_EMIT_SYMBOL, 113),
-    (41, HUFFMAN_EMIT_SYMBOL, 113),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 113),
-    (3, HUFFMAN_EMIT_SYMBOL, 118),
-    (6, HUFFMAN_EMIT_SYMBOL, 118),
-    (10, HUFFMAN_EMIT_SYMBOL, 118),
-    (15, HUFFMAN_EMIT_SYMBOL, 118),
-    (24, HUFFMAN_EMIT_SYMBOL, 118),
-    (31, HUFFMAN_EMIT_SYMBOL, 118),
-    (41, HUFFMAN_EMIT_SYMBOL, 118),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 118),
+    '0302710602710a02710f02711802711f0271290271380371'
+    '0302760602760a02760f02761802761f0276290276380376'
 
     # Node 64
-    (1, HUFFMAN_EMIT_SYMBOL, 119),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 119),
-    (1, HUFFMAN_EMIT_SYMBOL, 120),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 120),
-    (1, HUFFMAN_EMIT_SYMBOL, 121),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 121),
-    (1, HUFFMAN_EMIT_SYMBOL, 122),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 122),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 38),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 42),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 44),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 59),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 88),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 90),
-    (75, 0, 0),
-    (78, 0, 0),
+    '01027716037701027816037801027916037901027a16037a'
+    '00032600032a00032c00033b00035800035a4b00004e0000'
 
     # Node 65
-    (2, HUFFMAN_EMIT_SYMBOL, 119),
-    (9, HUFFMAN_EMIT_SYMBOL, 119),
-    (23, HUFFMAN_EMIT_SYMBOL, 119),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 119),
-    (2, HUFFMAN_EMIT_SYMBOL, 120),
-    (9, HUFFMAN_EMIT_SYMBOL, 120),
-    (23, HUFFMAN_EMIT_SYMBOL, 120),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 120),
-    (2, HUFFMAN_EMIT_SYMBOL, 121),
-    (9, HUFFMAN_EMIT_SYMBOL, 121),
-    (23, HUFFMAN_EMIT_SYMBOL, 121),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 121),
-    (2, HUFFMAN_EMIT_SYMBOL, 122),
-    (9, HUFFMAN_EMIT_SYMBOL, 122),
-    (23, HUFFMAN_EMIT_SYMBOL, 122),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 122),
+    '020277090277170277280377020278090278170278280378'
+    '02027909027917027928037902027a09027a17027a28037a'
 
     # Node 66
-    (3, HUFFMAN_EMIT_SYMBOL, 119),
-    (6, HUFFMAN_EMIT_SYMBOL, 119),
-    (10, HUFFMAN_EMIT_SYMBOL, 119),
-    (15, HUFFMAN_EMIT_SYMBOL, 119),
-    (24, HUFFMAN_EMIT_SYMBOL, 119),
-    (31, HUFFMAN_EMIT_SYMBOL, 119),
-    (41, HUFFMAN_EMIT_SYMBOL, 119),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 119),
-    (3, HUFFMAN_EMIT_SYMBOL, 120),
-    (6, HUFFMAN_EMIT_SYMBOL, 120),
-    (10, HUFFMAN_EMIT_SYMBOL, 120),
-    (15, HUFFMAN_EMIT_SYMBOL, 120),
-    (24, HUFFMAN_EMIT_SYMBOL, 120),
-    (31, HUFFMAN_EMIT_SYMBOL, 120),
-    (41, HUFFMAN_EMIT_SYMBOL, 120),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 120),
+    '0302770602770a02770f02771802771f0277290277380377'
+    '0302780602780a02780f02781802781f0278290278380378'
 
     # Node 67
-    (3, HUFFMAN_EMIT_SYMBOL, 121),
-    (6, HUFFMAN_EMIT_SYMBOL, 121),
-    (10, HUFFMAN_EMIT_SYMBOL, 121),
-    (15, HUFFMAN_EMIT_SYMBOL, 121),
-    (24, HUFFMAN_EMIT_SYMBOL, 121),
-    (31, HUFFMAN_EMIT_SYMBOL, 121),
-    (41, HUFFMAN_EMIT_SYMBOL, 121),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 121),
-    (3, HUFFMAN_EMIT_SYMBOL, 122),
-    (6, HUFFMAN_EMIT_SYMBOL, 122),
-    (10, HUFFMAN_EMIT_SYMBOL, 122),
-    (15, HUFFMAN_EMIT_SYMBOL, 122),
-    (24, HUFFMAN_EMIT_SYMBOL, 122),
-    (31, HUFFMAN_EMIT_SYMBOL, 122),
-    (41, HUFFMAN_EMIT_SYMBOL, 122),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 122),
+    '0302790602790a02790f02791802791f0279290279380379'
+    '03027a06027a0a027a0f027a18027a1f027a29027a38037a'
 
     # Node 68
-    (1, HUFFMAN_EMIT_SYMBOL, 38),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 38),
-    (1, HUFFMAN_EMIT_SYMBOL, 42),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 42),
-    (1, HUFFMAN_EMIT_SYMBOL, 44),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 44),
-    (1, HUFFMAN_EMIT_SYMBOL, 59),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 59),
-    (1, HUFFMAN_EMIT_SYMBOL, 88),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 88),
-    (1, HUFFMAN_EMIT_SYMBOL, 90),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 90),
-    (76, 0, 0),
-    (77, 0, 0),
-    (79, 0, 0),
-    (81, 0, 0),
+    '01022616032601022a16032a01022c16032c01023b16033b'
+    '01025816035801025a16035a4c00004d00004f0000510000'
 
     # Node 69
-    (2, HUFFMAN_EMIT_SYMBOL, 38),
-    (9, HUFFMAN_EMIT_SYMBOL, 38),
-    (23, HUFFMAN_EMIT_SYMBOL, 38),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 38),
-    (2, HUFFMAN_EMIT_SYMBOL, 42),
-    (9, HUFFMAN_EMIT_SYMBOL, 42),
-    (23, HUFFMAN_EMIT_SYMBOL, 42),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 42),
-    (2, HUFFMAN_EMIT_SYMBOL, 44),
-    (9, HUFFMAN_EMIT_SYMBOL, 44),
-    (23, HUFFMAN_EMIT_SYMBOL, 44),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 44),
-    (2, HUFFMAN_EMIT_SYMBOL, 59),
-    (9, HUFFMAN_EMIT_SYMBOL, 59),
-    (23, HUFFMAN_EMIT_SYMBOL, 59),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 59),
+    '02022609022617022628032602022a09022a17022a28032a'
+    '02022c09022c17022c28032c02023b09023b17023b28033b'
 
     # Node 70
-    (3, HUFFMAN_EMIT_SYMBOL, 38),
-    (6, HUFFMAN_EMIT_SYMBOL, 38),
-    (10, HUFFMAN_EMIT_SYMBOL, 38),
-    (15, HUFFMAN_EMIT_SYMBOL, 38),
-    (24, HUFFMAN_EMIT_SYMBOL, 38),
-    (31, HUFFMAN_EMIT_SYMBOL, 38),
-    (41, HUFFMAN_EMIT_SYMBOL, 38),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 38),
-    (3, HUFFMAN_EMIT_SYMBOL, 42),
-    (6, HUFFMAN_EMIT_SYMBOL, 42),
-    (10, HUFFMAN_EMIT_SYMBOL, 42),
-    (15, HUFFMAN_EMIT_SYMBOL, 42),
-    (24, HUFFMAN_EMIT_SYMBOL, 42),
-    (31, HUFFMAN_EMIT_SYMBOL, 42),
-    (41, HUFFMAN_EMIT_SYMBOL, 42),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 42),
+    '0302260602260a02260f02261802261f0226290226380326'
+    '03022a06022a0a022a0f022a18022a1f022a29022a38032a'
 
     # Node 71
-    (3, HUFFMAN_EMIT_SYMBOL, 44),
-    (6, HUFFMAN_EMIT_SYMBOL, 44),
-    (10, HUFFMAN_EMIT_SYMBOL, 44),
-    (15, HUFFMAN_EMIT_SYMBOL, 44),
-    (24, HUFFMAN_EMIT_SYMBOL, 44),
-    (31, HUFFMAN_EMIT_SYMBOL, 44),
-    (41, HUFFMAN_EMIT_SYMBOL, 44),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 44),
-    (3, HUFFMAN_EMIT_SYMBOL, 59),
-    (6, HUFFMAN_EMIT_SYMBOL, 59),
-    (10, HUFFMAN_EMIT_SYMBOL, 59),
-    (15, HUFFMAN_EMIT_SYMBOL, 59),
-    (24, HUFFMAN_EMIT_SYMBOL, 59),
-    (31, HUFFMAN_EMIT_SYMBOL, 59),
-    (41, HUFFMAN_EMIT_SYMBOL, 59),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 59),
+    '03022c06022c0a022c0f022c18022c1f022c29022c38032c'
+    '03023b06023b0a023b0f023b18023b1f023b29023b38033b'
 
     # Node 72
-    (2, HUFFMAN_EMIT_SYMBOL, 88),
-    (9, HUFFMAN_EMIT_SYMBOL, 88),
-    (23, HUFFMAN_EMIT_SYMBOL, 88),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 88),
-    (2, HUFFMAN_EMIT_SYMBOL, 90),
-    (9, HUFFMAN_EMIT_SYMBOL, 90),
-    (23, HUFFMAN_EMIT_SYMBOL, 90),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 90),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 33),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 34),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 40),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 41),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 63),
-    (80, 0, 0),
-    (82, 0, 0),
-    (84, 0, 0),
+    '02025809025817025828035802025a09025a17025a28035a'
+    '00032100032200032800032900033f500000520000540000'
 
     # Node 73
-    (3, HUFFMAN_EMIT_SYMBOL, 88),
-    (6, HUFFMAN_EMIT_SYMBOL, 88),
-    (10, HUFFMAN_EMIT_SYMBOL, 88),
-    (15, HUFFMAN_EMIT_SYMBOL, 88),
-    (24, HUFFMAN_EMIT_SYMBOL, 88),
-    (31, HUFFMAN_EMIT_SYMBOL, 88),
-    (41, HUFFMAN_EMIT_SYMBOL, 88),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 88),
-    (3, HUFFMAN_EMIT_SYMBOL, 90),
-    (6, HUFFMAN_EMIT_SYMBOL, 90),
-    (10, HUFFMAN_EMIT_SYMBOL, 90),
-    (15, HUFFMAN_EMIT_SYMBOL, 90),
-    (24, HUFFMAN_EMIT_SYMBOL, 90),
-    (31, HUFFMAN_EMIT_SYMBOL, 90),
-    (41, HUFFMAN_EMIT_SYMBOL, 90),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 90),
+    '0302580602580a02580f02581802581f0258290258380358'
+    '03025a06025a0a025a0f025a18025a1f025a29025a38035a'
 
     # Node 74
-    (1, HUFFMAN_EMIT_SYMBOL, 33),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 33),
-    (1, HUFFMAN_EMIT_SYMBOL, 34),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 34),
-    (1, HUFFMAN_EMIT_SYMBOL, 40),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 40),
-    (1, HUFFMAN_EMIT_SYMBOL, 41),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 41),
-    (1, HUFFMAN_EMIT_SYMBOL, 63),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 63),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 39),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 43),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 124),
-    (83, 0, 0),
-    (85, 0, 0),
-    (88, 0, 0),
+    '010221160321010222160322010228160328010229160329'
+    '01023f16033f00032700032b00037c530000550000580000'
 
     # Node 75
-    (2, HUFFMAN_EMIT_SYMBOL, 33),
-    (9, HUFFMAN_EMIT_SYMBOL, 33),
-    (23, HUFFMAN_EMIT_SYMBOL, 33),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 33),
-    (2, HUFFMAN_EMIT_SYMBOL, 34),
-    (9, HUFFMAN_EMIT_SYMBOL, 34),
-    (23, HUFFMAN_EMIT_SYMBOL, 34),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 34),
-    (2, HUFFMAN_EMIT_SYMBOL, 40),
-    (9, HUFFMAN_EMIT_SYMBOL, 40),
-    (23, HUFFMAN_EMIT_SYMBOL, 40),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 40),
-    (2, HUFFMAN_EMIT_SYMBOL, 41),
-    (9, HUFFMAN_EMIT_SYMBOL, 41),
-    (23, HUFFMAN_EMIT_SYMBOL, 41),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 41),
+    '020221090221170221280321020222090222170222280322'
+    '020228090228170228280328020229090229170229280329'
 
     # Node 76
-    (3, HUFFMAN_EMIT_SYMBOL, 33),
-    (6, HUFFMAN_EMIT_SYMBOL, 33),
-    (10, HUFFMAN_EMIT_SYMBOL, 33),
-    (15, HUFFMAN_EMIT_SYMBOL, 33),
-    (24, HUFFMAN_EMIT_SYMBOL, 33),
-    (31, HUFFMAN_EMIT_SYMBOL, 33),
-    (41, HUFFMAN_EMIT_SYMBOL, 33),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 33),
-    (3, HUFFMAN_EMIT_SYMBOL, 34),
-    (6, HUFFMAN_EMIT_SYMBOL, 34),
-    (10, HUFFMAN_EMIT_SYMBOL, 34),
-    (15, HUFFMAN_EMIT_SYMBOL, 34),
-    (24, HUFFMAN_EMIT_SYMBOL, 34),
-    (31, HUFFMAN_EMIT_SYMBOL, 34),
-    (41, HUFFMAN_EMIT_SYMBOL, 34),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 34),
+    '0302210602210a02210f02211802211f0221290221380321'
+    '0302220602220a02220f02221802221f0222290222380322'
 
     # Node 77
-    (3, HUFFMAN_EMIT_SYMBOL, 40),
-    (6, HUFFMAN_EMIT_SYMBOL, 40),
-    (10, HUFFMAN_EMIT_SYMBOL, 40),
-    (15, HUFFMAN_EMIT_SYMBOL, 40),
-    (24, HUFFMAN_EMIT_SYMBOL, 40),
-    (31, HUFFMAN_EMIT_SYMBOL, 40),
-    (41, HUFFMAN_EMIT_SYMBOL, 40),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 40),
-    (3, HUFFMAN_EMIT_SYMBOL, 41),
-    (6, HUFFMAN_EMIT_SYMBOL, 41),
-    (10, HUFFMAN_EMIT_SYMBOL, 41),
-    (15, HUFFMAN_EMIT_SYMBOL, 41),
-    (24, HUFFMAN_EMIT_SYMBOL, 41),
-    (31, HUFFMAN_EMIT_SYMBOL, 41),
-    (41, HUFFMAN_EMIT_SYMBOL, 41),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 41),
+    '0302280602280a02280f02281802281f0228290228380328'
+    '0302290602290a02290f02291802291f0229290229380329'
 
     # Node 78
-    (2, HUFFMAN_EMIT_SYMBOL, 63),
-    (9, HUFFMAN_EMIT_SYMBOL, 63),
-    (23, HUFFMAN_EMIT_SYMBOL, 63),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 63),
-    (1, HUFFMAN_EMIT_SYMBOL, 39),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 39),
-    (1, HUFFMAN_EMIT_SYMBOL, 43),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 43),
-    (1, HUFFMAN_EMIT_SYMBOL, 124),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 124),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 35),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 62),
-    (86, 0, 0),
-    (87, 0, 0),
-    (89, 0, 0),
-    (90, 0, 0),
+    '02023f09023f17023f28033f01022716032701022b16032b'
+    '01027c16037c00032300033e5600005700005900005a0000'
 
     # Node 79
-    (3, HUFFMAN_EMIT_SYMBOL, 63),
-    (6, HUFFMAN_EMIT_SYMBOL, 63),
-    (10, HUFFMAN_EMIT_SYMBOL, 63),
-    (15, HUFFMAN_EMIT_SYMBOL, 63),
-    (24, HUFFMAN_EMIT_SYMBOL, 63),
-    (31, HUFFMAN_EMIT_SYMBOL, 63),
-    (41, HUFFMAN_EMIT_SYMBOL, 63),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 63),
-    (2, HUFFMAN_EMIT_SYMBOL, 39),
-    (9, HUFFMAN_EMIT_SYMBOL, 39),
-    (23, HUFFMAN_EMIT_SYMBOL, 39),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 39),
-    (2, HUFFMAN_EMIT_SYMBOL, 43),
-    (9, HUFFMAN_EMIT_SYMBOL, 43),
-    (23, HUFFMAN_EMIT_SYMBOL, 43),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 43),
+    '03023f06023f0a023f0f023f18023f1f023f29023f38033f'
+    '02022709022717022728032702022b09022b17022b28032b'
 
     # Node 80
-    (3, HUFFMAN_EMIT_SYMBOL, 39),
-    (6, HUFFMAN_EMIT_SYMBOL, 39),
-    (10, HUFFMAN_EMIT_SYMBOL, 39),
-    (15, HUFFMAN_EMIT_SYMBOL, 39),
-    (24, HUFFMAN_EMIT_SYMBOL, 39),
-    (31, HUFFMAN_EMIT_SYMBOL, 39),
-    (41, HUFFMAN_EMIT_SYMBOL, 39),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 39),
-    (3, HUFFMAN_EMIT_SYMBOL, 43),
-    (6, HUFFMAN_EMIT_SYMBOL, 43),
-    (10, HUFFMAN_EMIT_SYMBOL, 43),
-    (15, HUFFMAN_EMIT_SYMBOL, 43),
-    (24, HUFFMAN_EMIT_SYMBOL, 43),
-    (31, HUFFMAN_EMIT_SYMBOL, 43),
-    (41, HUFFMAN_EMIT_SYMBOL, 43),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 43),
+    '0302270602270a02270f02271802271f0227290227380327'
+    '03022b06022b0a022b0f022b18022b1f022b29022b38032b'
 
     # Node 81
-    (2, HUFFMAN_EMIT_SYMBOL, 124),
-    (9, HUFFMAN_EMIT_SYMBOL, 124),
-    (23, HUFFMAN_EMIT_SYMBOL, 124),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 124),
-    (1, HUFFMAN_EMIT_SYMBOL, 35),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 35),
-    (1, HUFFMAN_EMIT_SYMBOL, 62),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 62),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 0),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 36),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 64),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 91),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 93),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 126),
-    (91, 0, 0),
-    (92, 0, 0),
+    '02027c09027c17027c28037c01022316032301023e16033e'
+    '00030000032400034000035b00035d00037e5b00005c0000'
 
     # Node 82
-    (3, HUFFMAN_EMIT_SYMBOL, 124),
-    (6, HUFFMAN_EMIT_SYMBOL, 124),
-    (10, HUFFMAN_EMIT_SYMBOL, 124),
-    (15, HUFFMAN_EMIT_SYMBOL, 124),
-    (24, HUFFMAN_EMIT_SYMBOL, 124),
-    (31, HUFFMAN_EMIT_SYMBOL, 124),
-    (41, HUFFMAN_EMIT_SYMBOL, 124),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 124),
-    (2, HUFFMAN_EMIT_SYMBOL, 35),
-    (9, HUFFMAN_EMIT_SYMBOL, 35),
-    (23, HUFFMAN_EMIT_SYMBOL, 35),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 35),
-    (2, HUFFMAN_EMIT_SYMBOL, 62),
-    (9, HUFFMAN_EMIT_SYMBOL, 62),
-    (23, HUFFMAN_EMIT_SYMBOL, 62),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 62),
+    '03027c06027c0a027c0f027c18027c1f027c29027c38037c'
+    '02022309022317022328032302023e09023e17023e28033e'
 
     # Node 83
-    (3, HUFFMAN_EMIT_SYMBOL, 35),
-    (6, HUFFMAN_EMIT_SYMBOL, 35),
-    (10, HUFFMAN_EMIT_SYMBOL, 35),
-    (15, HUFFMAN_EMIT_SYMBOL, 35),
-    (24, HUFFMAN_EMIT_SYMBOL, 35),
-    (31, HUFFMAN_EMIT_SYMBOL, 35),
-    (41, HUFFMAN_EMIT_SYMBOL, 35),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 35),
-    (3, HUFFMAN_EMIT_SYMBOL, 62),
-    (6, HUFFMAN_EMIT_SYMBOL, 62),
-    (10, HUFFMAN_EMIT_SYMBOL, 62),
-    (15, HUFFMAN_EMIT_SYMBOL, 62),
-    (24, HUFFMAN_EMIT_SYMBOL, 62),
-    (31, HUFFMAN_EMIT_SYMBOL, 62),
-    (41, HUFFMAN_EMIT_SYMBOL, 62),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 62),
+    '0302230602230a02230f02231802231f0223290223380323'
+    '03023e06023e0a023e0f023e18023e1f023e29023e38033e'
 
     # Node 84
-    (1, HUFFMAN_EMIT_SYMBOL, 0),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 0),
-    (1, HUFFMAN_EMIT_SYMBOL, 36),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 36),
-    (1, HUFFMAN_EMIT_SYMBOL, 64),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 64),
-    (1, HUFFMAN_EMIT_SYMBOL, 91),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 91),
-    (1, HUFFMAN_EMIT_SYMBOL, 93),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 93),
-    (1, HUFFMAN_EMIT_SYMBOL, 126),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 126),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 94),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 125),
-    (93, 0, 0),
-    (94, 0, 0),
+    '01020016030001022416032401024016034001025b16035b'
+    '01025d16035d01027e16037e00035e00037d5d00005e0000'
 
     # Node 85
-    (2, HUFFMAN_EMIT_SYMBOL, 0),
-    (9, HUFFMAN_EMIT_SYMBOL, 0),
-    (23, HUFFMAN_EMIT_SYMBOL, 0),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 0),
-    (2, HUFFMAN_EMIT_SYMBOL, 36),
-    (9, HUFFMAN_EMIT_SYMBOL, 36),
-    (23, HUFFMAN_EMIT_SYMBOL, 36),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 36),
-    (2, HUFFMAN_EMIT_SYMBOL, 64),
-    (9, HUFFMAN_EMIT_SYMBOL, 64),
-    (23, HUFFMAN_EMIT_SYMBOL, 64),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 64),
-    (2, HUFFMAN_EMIT_SYMBOL, 91),
-    (9, HUFFMAN_EMIT_SYMBOL, 91),
-    (23, HUFFMAN_EMIT_SYMBOL, 91),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 91),
+    '020200090200170200280300020224090224170224280324'
+    '02024009024017024028034002025b09025b17025b28035b'
 
     # Node 86
-    (3, HUFFMAN_EMIT_SYMBOL, 0),
-    (6, HUFFMAN_EMIT_SYMBOL, 0),
-    (10, HUFFMAN_EMIT_SYMBOL, 0),
-    (15, HUFFMAN_EMIT_SYMBOL, 0),
-    (24, HUFFMAN_EMIT_SYMBOL, 0),
-    (31, HUFFMAN_EMIT_SYMBOL, 0),
-    (41, HUFFMAN_EMIT_SYMBOL, 0),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 0),
-    (3, HUFFMAN_EMIT_SYMBOL, 36),
-    (6, HUFFMAN_EMIT_SYMBOL, 36),
-    (10, HUFFMAN_EMIT_SYMBOL, 36),
-    (15, HUFFMAN_EMIT_SYMBOL, 36),
-    (24, HUFFMAN_EMIT_SYMBOL, 36),
-    (31, HUFFMAN_EMIT_SYMBOL, 36),
-    (41, HUFFMAN_EMIT_SYMBOL, 36),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 36),
+    '0302000602000a02000f02001802001f0200290200380300'
+    '0302240602240a02240f02241802241f0224290224380324'
 
     # Node 87
-    (3, HUFFMAN_EMIT_SYMBOL, 64),
-    (6, HUFFMAN_EMIT_SYMBOL, 64),
-    (10, HUFFMAN_EMIT_SYMBOL, 64),
-    (15, HUFFMAN_EMIT_SYMBOL, 64),
-    (24, HUFFMAN_EMIT_SYMBOL, 64),
-    (31, HUFFMAN_EMIT_SYMBOL, 64),
-    (41, HUFFMAN_EMIT_SYMBOL, 64),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 64),
-    (3, HUFFMAN_EMIT_SYMBOL, 91),
-    (6, HUFFMAN_EMIT_SYMBOL, 91),
-    (10, HUFFMAN_EMIT_SYMBOL, 91),
-    (15, HUFFMAN_EMIT_SYMBOL, 91),
-    (24, HUFFMAN_EMIT_SYMBOL, 91),
-    (31, HUFFMAN_EMIT_SYMBOL, 91),
-    (41, HUFFMAN_EMIT_SYMBOL, 91),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 91),
+    '0302400602400a02400f02401802401f0240290240380340'
+    '03025b06025b0a025b0f025b18025b1f025b29025b38035b'
 
     # Node 88
-    (2, HUFFMAN_EMIT_SYMBOL, 93),
-    (9, HUFFMAN_EMIT_SYMBOL, 93),
-    (23, HUFFMAN_EMIT_SYMBOL, 93),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 93),
-    (2, HUFFMAN_EMIT_SYMBOL, 126),
-    (9, HUFFMAN_EMIT_SYMBOL, 126),
-    (23, HUFFMAN_EMIT_SYMBOL, 126),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 126),
-    (1, HUFFMAN_EMIT_SYMBOL, 94),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 94),
-    (1, HUFFMAN_EMIT_SYMBOL, 125),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 125),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 60),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 96),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 123),
-    (95, 0, 0),
+    '02025d09025d17025d28035d02027e09027e17027e28037e'
+    '01025e16035e01027d16037d00033c00036000037b5f0000'
 
     # Node 89
-    (3, HUFFMAN_EMIT_SYMBOL, 93),
-    (6, HUFFMAN_EMIT_SYMBOL, 93),
-    (10, HUFFMAN_EMIT_SYMBOL, 93),
-    (15, HUFFMAN_EMIT_SYMBOL, 93),
-    (24, HUFFMAN_EMIT_SYMBOL, 93),
-    (31, HUFFMAN_EMIT_SYMBOL, 93),
-    (41, HUFFMAN_EMIT_SYMBOL, 93),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 93),
-    (3, HUFFMAN_EMIT_SYMBOL, 126),
-    (6, HUFFMAN_EMIT_SYMBOL, 126),
-    (10, HUFFMAN_EMIT_SYMBOL, 126),
-    (15, HUFFMAN_EMIT_SYMBOL, 126),
-    (24, HUFFMAN_EMIT_SYMBOL, 126),
-    (31, HUFFMAN_EMIT_SYMBOL, 126),
-    (41, HUFFMAN_EMIT_SYMBOL, 126),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 126),
+    '03025d06025d0a025d0f025d18025d1f025d29025d38035d'
+    '03027e06027e0a027e0f027e18027e1f027e29027e38037e'
 
     # Node 90
-    (2, HUFFMAN_EMIT_SYMBOL, 94),
-    (9, HUFFMAN_EMIT_SYMBOL, 94),
-    (23, HUFFMAN_EMIT_SYMBOL, 94),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 94),
-    (2, HUFFMAN_EMIT_SYMBOL, 125),
-    (9, HUFFMAN_EMIT_SYMBOL, 125),
-    (23, HUFFMAN_EMIT_SYMBOL, 125),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 125),
-    (1, HUFFMAN_EMIT_SYMBOL, 60),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 60),
-    (1, HUFFMAN_EMIT_SYMBOL, 96),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 96),
-    (1, HUFFMAN_EMIT_SYMBOL, 123),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 123),
-    (96, 0, 0),
-    (110, 0, 0),
+    '02025e09025e17025e28035e02027d09027d17027d28037d'
+    '01023c16033c01026016036001027b16037b6000006e0000'
 
     # Node 91
-    (3, HUFFMAN_EMIT_SYMBOL, 94),
-    (6, HUFFMAN_EMIT_SYMBOL, 94),
-    (10, HUFFMAN_EMIT_SYMBOL, 94),
-    (15, HUFFMAN_EMIT_SYMBOL, 94),
-    (24, HUFFMAN_EMIT_SYMBOL, 94),
-    (31, HUFFMAN_EMIT_SYMBOL, 94),
-    (41, HUFFMAN_EMIT_SYMBOL, 94),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 94),
-    (3, HUFFMAN_EMIT_SYMBOL, 125),
-    (6, HUFFMAN_EMIT_SYMBOL, 125),
-    (10, HUFFMAN_EMIT_SYMBOL, 125),
-    (15, HUFFMAN_EMIT_SYMBOL, 125),
-    (24, HUFFMAN_EMIT_SYMBOL, 125),
-    (31, HUFFMAN_EMIT_SYMBOL, 125),
-    (41, HUFFMAN_EMIT_SYMBOL, 125),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 125),
+    '03025e06025e0a025e0f025e18025e1f025e29025e38035e'
+    '03027d06027d0a027d0f027d18027d1f027d29027d38037d'
 
     # Node 92
-    (2, HUFFMAN_EMIT_SYMBOL, 60),
-    (9, HUFFMAN_EMIT_SYMBOL, 60),
-    (23, HUFFMAN_EMIT_SYMBOL, 60),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 60),
-    (2, HUFFMAN_EMIT_SYMBOL, 96),
-    (9, HUFFMAN_EMIT_SYMBOL, 96),
-    (23, HUFFMAN_EMIT_SYMBOL, 96),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 96),
-    (2, HUFFMAN_EMIT_SYMBOL, 123),
-    (9, HUFFMAN_EMIT_SYMBOL, 123),
-    (23, HUFFMAN_EMIT_SYMBOL, 123),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 123),
-    (97, 0, 0),
-    (101, 0, 0),
-    (111, 0, 0),
-    (133, 0, 0),
+    '02023c09023c17023c28033c020260090260170260280360'
+    '02027b09027b17027b28037b6100006500006f0000850000'
 
     # Node 93
-    (3, HUFFMAN_EMIT_SYMBOL, 60),
-    (6, HUFFMAN_EMIT_SYMBOL, 60),
-    (10, HUFFMAN_EMIT_SYMBOL, 60),
-    (15, HUFFMAN_EMIT_SYMBOL, 60),
-    (24, HUFFMAN_EMIT_SYMBOL, 60),
-    (31, HUFFMAN_EMIT_SYMBOL, 60),
-    (41, HUFFMAN_EMIT_SYMBOL, 60),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 60),
-    (3, HUFFMAN_EMIT_SYMBOL, 96),
-    (6, HUFFMAN_EMIT_SYMBOL, 96),
-    (10, HUFFMAN_EMIT_SYMBOL, 96),
-    (15, HUFFMAN_EMIT_SYMBOL, 96),
-    (24, HUFFMAN_EMIT_SYMBOL, 96),
-    (31, HUFFMAN_EMIT_SYMBOL, 96),
-    (41, HUFFMAN_EMIT_SYMBOL, 96),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 96),
+    '03023c06023c0a023c0f023c18023c1f023c29023c38033c'
+    '0302600602600a02600f02601802601f0260290260380360'
 
     # Node 94
-    (3, HUFFMAN_EMIT_SYMBOL, 123),
-    (6, HUFFMAN_EMIT_SYMBOL, 123),
-    (10, HUFFMAN_EMIT_SYMBOL, 123),
-    (15, HUFFMAN_EMIT_SYMBOL, 123),
-    (24, HUFFMAN_EMIT_SYMBOL, 123),
-    (31, HUFFMAN_EMIT_SYMBOL, 123),
-    (41, HUFFMAN_EMIT_SYMBOL, 123),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 123),
-    (98, 0, 0),
-    (99, 0, 0),
-    (102, 0, 0),
-    (105, 0, 0),
-    (112, 0, 0),
-    (119, 0, 0),
-    (134, 0, 0),
-    (153, 0, 0),
+    '03027b06027b0a027b0f027b18027b1f027b29027b38037b'
+    '620000630000660000690000700000770000860000990000'
 
     # Node 95
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 92),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 195),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 208),
-    (100, 0, 0),
-    (103, 0, 0),
-    (104, 0, 0),
-    (106, 0, 0),
-    (107, 0, 0),
-    (113, 0, 0),
-    (116, 0, 0),
-    (120, 0, 0),
-    (126, 0, 0),
-    (135, 0, 0),
-    (142, 0, 0),
-    (154, 0, 0),
-    (169, 0, 0),
+    '00035c0003c30003d06400006700006800006a00006b0000'
+    '7100007400007800007e00008700008e00009a0000a90000'
 
     # Node 96
-    (1, HUFFMAN_EMIT_SYMBOL, 92),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 92),
-    (1, HUFFMAN_EMIT_SYMBOL, 195),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 195),
-    (1, HUFFMAN_EMIT_SYMBOL, 208),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 208),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 128),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 130),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 131),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 162),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 184),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 194),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 224),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 226),
-    (108, 0, 0),
-    (109, 0, 0),
+    '01025c16035c0102c31603c30102d01603d0000380000382'
+    '0003830003a20003b80003c20003e00003e26c00006d0000'
 
     # Node 97
-    (2, HUFFMAN_EMIT_SYMBOL, 92),
-    (9, HUFFMAN_EMIT_SYMBOL, 92),
-    (23, HUFFMAN_EMIT_SYMBOL, 92),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 92),
-    (2, HUFFMAN_EMIT_SYMBOL, 195),
-    (9, HUFFMAN_EMIT_SYMBOL, 195),
-    (23, HUFFMAN_EMIT_SYMBOL, 195),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 195),
-    (2, HUFFMAN_EMIT_SYMBOL, 208),
-    (9, HUFFMAN_EMIT_SYMBOL, 208),
-    (23, HUFFMAN_EMIT_SYMBOL, 208),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 208),
-    (1, HUFFMAN_EMIT_SYMBOL, 128),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 128),
-    (1, HUFFMAN_EMIT_SYMBOL, 130),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 130),
+    '02025c09025c17025c28035c0202c30902c31702c32803c3'
+    '0202d00902d01702d02803d0010280160380010282160382'
 
     # Node 98
-    (3, HUFFMAN_EMIT_SYMBOL, 92),
-    (6, HUFFMAN_EMIT_SYMBOL, 92),
-    (10, HUFFMAN_EMIT_SYMBOL, 92),
-    (15, HUFFMAN_EMIT_SYMBOL, 92),
-    (24, HUFFMAN_EMIT_SYMBOL, 92),
-    (31, HUFFMAN_EMIT_SYMBOL, 92),
-    (41, HUFFMAN_EMIT_SYMBOL, 92),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 92),
-    (3, HUFFMAN_EMIT_SYMBOL, 195),
-    (6, HUFFMAN_EMIT_SYMBOL, 195),
-    (10, HUFFMAN_EMIT_SYMBOL, 195),
-    (15, HUFFMAN_EMIT_SYMBOL, 195),
-    (24, HUFFMAN_EMIT_SYMBOL, 195),
-    (31, HUFFMAN_EMIT_SYMBOL, 195),
-    (41, HUFFMAN_EMIT_SYMBOL, 195),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 195),
+    '03025c06025c0a025c0f025c18025c1f025c29025c38035c'
+    '0302c30602c30a02c30f02c31802c31f02c32902c33803c3'
 
     # Node 99
-    (3, HUFFMAN_EMIT_SYMBOL, 208),
-    (6, HUFFMAN_EMIT_SYMBOL, 208),
-    (10, HUFFMAN_EMIT_SYMBOL, 208),
-    (15, HUFFMAN_EMIT_SYMBOL, 208),
-    (24, HUFFMAN_EMIT_SYMBOL, 208),
-    (31, HUFFMAN_EMIT_SYMBOL, 208),
-    (41, HUFFMAN_EMIT_SYMBOL, 208),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 208),
-    (2, HUFFMAN_EMIT_SYMBOL, 128),
-    (9, HUFFMAN_EMIT_SYMBOL, 128),
-    (23, HUFFMAN_EMIT_SYMBOL, 128),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 128),
-    (2, HUFFMAN_EMIT_SYMBOL, 130),
-    (9, HUFFMAN_EMIT_SYMBOL, 130),
-    (23, HUFFMAN_EMIT_SYMBOL, 130),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 130),
+    '0302d00602d00a02d00f02d01802d01f02d02902d03803d0'
+    '020280090280170280280380020282090282170282280382'
 
     # Node 100
-    (3, HUFFMAN_EMIT_SYMBOL, 128),
-    (6, HUFFMAN_EMIT_SYMBOL, 128),
-    (10, HUFFMAN_EMIT_SYMBOL, 128),
-    (15, HUFFMAN_EMIT_SYMBOL, 128),
-    (24, HUFFMAN_EMIT_SYMBOL, 128),
-    (31, HUFFMAN_EMIT_SYMBOL, 128),
-    (41, HUFFMAN_EMIT_SYMBOL, 128),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 128),
-    (3, HUFFMAN_EMIT_SYMBOL, 130),
-    (6, HUFFMAN_EMIT_SYMBOL, 130),
-    (10, HUFFMAN_EMIT_SYMBOL, 130),
-    (15, HUFFMAN_EMIT_SYMBOL, 130),
-    (24, HUFFMAN_EMIT_SYMBOL, 130),
-    (31, HUFFMAN_EMIT_SYMBOL, 130),
-    (41, HUFFMAN_EMIT_SYMBOL, 130),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 130),
+    '0302800602800a02800f02801802801f0280290280380380'
+    '0302820602820a02820f02821802821f0282290282380382'
 
     # Node 101
-    (1, HUFFMAN_EMIT_SYMBOL, 131),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 131),
-    (1, HUFFMAN_EMIT_SYMBOL, 162),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 162),
-    (1, HUFFMAN_EMIT_SYMBOL, 184),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 184),
-    (1, HUFFMAN_EMIT_SYMBOL, 194),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 194),
-    (1, HUFFMAN_EMIT_SYMBOL, 224),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 224),
-    (1, HUFFMAN_EMIT_SYMBOL, 226),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 226),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 153),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 161),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 167),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 172),
+    '0102831603830102a21603a20102b81603b80102c21603c2'
+    '0102e01603e00102e21603e20003990003a10003a70003ac'
 
     # Node 102
-    (2, HUFFMAN_EMIT_SYMBOL, 131),
-    (9, HUFFMAN_EMIT_SYMBOL, 131),
-    (23, HUFFMAN_EMIT_SYMBOL, 131),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 131),
-    (2, HUFFMAN_EMIT_SYMBOL, 162),
-    (9, HUFFMAN_EMIT_SYMBOL, 162),
-    (23, HUFFMAN_EMIT_SYMBOL, 162),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 162),
-    (2, HUFFMAN_EMIT_SYMBOL, 184),
-    (9, HUFFMAN_EMIT_SYMBOL, 184),
-    (23, HUFFMAN_EMIT_SYMBOL, 184),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 184),
-    (2, HUFFMAN_EMIT_SYMBOL, 194),
-    (9, HUFFMAN_EMIT_SYMBOL, 194),
-    (23, HUFFMAN_EMIT_SYMBOL, 194),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 194),
+    '0202830902831702832803830202a20902a21702a22803a2'
+    '0202b80902b81702b82803b80202c20902c21702c22803c2'
 
     # Node 103
-    (3, HUFFMAN_EMIT_SYMBOL, 131),
-    (6, HUFFMAN_EMIT_SYMBOL, 131),
-    (10, HUFFMAN_EMIT_SYMBOL, 131),
-    (15, HUFFMAN_EMIT_SYMBOL, 131),
-    (24, HUFFMAN_EMIT_SYMBOL, 131),
-    (31, HUFFMAN_EMIT_SYMBOL, 131),
-    (41, HUFFMAN_EMIT_SYMBOL, 131),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 131),
-    (3, HUFFMAN_EMIT_SYMBOL, 162),
-    (6, HUFFMAN_EMIT_SYMBOL, 162),
-    (10, HUFFMAN_EMIT_SYMBOL, 162),
-    (15, HUFFMAN_EMIT_SYMBOL, 162),
-    (24, HUFFMAN_EMIT_SYMBOL, 162),
-    (31, HUFFMAN_EMIT_SYMBOL, 162),
-    (41, HUFFMAN_EMIT_SYMBOL, 162),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 162),
+    '0302830602830a02830f02831802831f0283290283380383'
+    '0302a20602a20a02a20f02a21802a21f02a22902a23803a2'
 
     # Node 104
-    (3, HUFFMAN_EMIT_SYMBOL, 184),
-    (6, HUFFMAN_EMIT_SYMBOL, 184),
-    (10, HUFFMAN_EMIT_SYMBOL, 184),
-    (15, HUFFMAN_EMIT_SYMBOL, 184),
-    (24, HUFFMAN_EMIT_SYMBOL, 184),
-    (31, HUFFMAN_EMIT_SYMBOL, 184),
-    (41, HUFFMAN_EMIT_SYMBOL, 184),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 184),
-    (3, HUFFMAN_EMIT_SYMBOL, 194),
-    (6, HUFFMAN_EMIT_SYMBOL, 194),
-    (10, HUFFMAN_EMIT_SYMBOL, 194),
-    (15, HUFFMAN_EMIT_SYMBOL, 194),
-    (24, HUFFMAN_EMIT_SYMBOL, 194),
-    (31, HUFFMAN_EMIT_SYMBOL, 194),
-    (41, HUFFMAN_EMIT_SYMBOL, 194),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 194),
+    '0302b80602b80a02b80f02b81802b81f02b82902b83803b8'
+    '0302c20602c20a02c20f02c21802c21f02c22902c23803c2'
 
     # Node 105
-    (2, HUFFMAN_EMIT_SYMBOL, 224),
-    (9, HUFFMAN_EMIT_SYMBOL, 224),
-    (23, HUFFMAN_EMIT_SYMBOL, 224),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 224),
-    (2, HUFFMAN_EMIT_SYMBOL, 226),
-    (9, HUFFMAN_EMIT_SYMBOL, 226),
-    (23, HUFFMAN_EMIT_SYMBOL, 226),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 226),
-    (1, HUFFMAN_EMIT_SYMBOL, 153),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 153),
-    (1, HUFFMAN_EMIT_SYMBOL, 161),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 161),
-    (1, HUFFMAN_EMIT_SYMBOL, 167),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 167),
-    (1, HUFFMAN_EMIT_SYMBOL, 172),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 172),
+    '0202e00902e01702e02803e00202e20902e21702e22803e2'
+    '0102991603990102a11603a10102a71603a70102ac1603ac'
 
     # Node 106
-    (3, HUFFMAN_EMIT_SYMBOL, 224),
-    (6, HUFFMAN_EMIT_SYMBOL, 224),
-    (10, HUFFMAN_EMIT_SYMBOL, 224),
-    (15, HUFFMAN_EMIT_SYMBOL, 224),
-    (24, HUFFMAN_EMIT_SYMBOL, 224),
-    (31, HUFFMAN_EMIT_SYMBOL, 224),
-    (41, HUFFMAN_EMIT_SYMBOL, 224),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 224),
-    (3, HUFFMAN_EMIT_SYMBOL, 226),
-    (6, HUFFMAN_EMIT_SYMBOL, 226),
-    (10, HUFFMAN_EMIT_SYMBOL, 226),
-    (15, HUFFMAN_EMIT_SYMBOL, 226),
-    (24, HUFFMAN_EMIT_SYMBOL, 226),
-    (31, HUFFMAN_EMIT_SYMBOL, 226),
-    (41, HUFFMAN_EMIT_SYMBOL, 226),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 226),
+    '0302e00602e00a02e00f02e01802e01f02e02902e03803e0'
+    '0302e20602e20a02e20f02e21802e21f02e22902e23803e2'
 
     # Node 107
-    (2, HUFFMAN_EMIT_SYMBOL, 153),
-    (9, HUFFMAN_EMIT_SYMBOL, 153),
-    (23, HUFFMAN_EMIT_SYMBOL, 153),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 153),
-    (2, HUFFMAN_EMIT_SYMBOL, 161),
-    (9, HUFFMAN_EMIT_SYMBOL, 161),
-    (23, HUFFMAN_EMIT_SYMBOL, 161),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 161),
-    (2, HUFFMAN_EMIT_SYMBOL, 167),
-    (9, HUFFMAN_EMIT_SYMBOL, 167),
-    (23, HUFFMAN_EMIT_SYMBOL, 167),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 167),
-    (2, HUFFMAN_EMIT_SYMBOL, 172),
-    (9, HUFFMAN_EMIT_SYMBOL, 172),
-    (23, HUFFMAN_EMIT_SYMBOL, 172),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 172),
+    '0202990902991702992803990202a10902a11702a12803a1'
+    '0202a70902a71702a72803a70202ac0902ac1702ac2803ac'
 
     # Node 108
-    (3, HUFFMAN_EMIT_SYMBOL, 153),
-    (6, HUFFMAN_EMIT_SYMBOL, 153),
-    (10, HUFFMAN_EMIT_SYMBOL, 153),
-    (15, HUFFMAN_EMIT_SYMBOL, 153),
-    (24, HUFFMAN_EMIT_SYMBOL, 153),
-    (31, HUFFMAN_EMIT_SYMBOL, 153),
-    (41, HUFFMAN_EMIT_SYMBOL, 153),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 153),
-    (3, HUFFMAN_EMIT_SYMBOL, 161),
-    (6, HUFFMAN_EMIT_SYMBOL, 161),
-    (10, HUFFMAN_EMIT_SYMBOL, 161),
-    (15, HUFFMAN_EMIT_SYMBOL, 161),
-    (24, HUFFMAN_EMIT_SYMBOL, 161),
-    (31, HUFFMAN_EMIT_SYMBOL, 161),
-    (41, HUFFMAN_EMIT_SYMBOL, 161),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 161),
+    '0302990602990a02990f02991802991f0299290299380399'
+    '0302a10602a10a02a10f02a11802a11f02a12902a13803a1'
 
     # Node 109
-    (3, HUFFMAN_EMIT_SYMBOL, 167),
-    (6, HUFFMAN_EMIT_SYMBOL, 167),
-    (10, HUFFMAN_EMIT_SYMBOL, 167),
-    (15, HUFFMAN_EMIT_SYMBOL, 167),
-    (24, HUFFMAN_EMIT_SYMBOL, 167),
-    (31, HUFFMAN_EMIT_SYMBOL, 167),
-    (41, HUFFMAN_EMIT_SYMBOL, 167),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 167),
-    (3, HUFFMAN_EMIT_SYMBOL, 172),
-    (6, HUFFMAN_EMIT_SYMBOL, 172),
-    (10, HUFFMAN_EMIT_SYMBOL, 172),
-    (15, HUFFMAN_EMIT_SYMBOL, 172),
-    (24, HUFFMAN_EMIT_SYMBOL, 172),
-    (31, HUFFMAN_EMIT_SYMBOL, 172),
-    (41, HUFFMAN_EMIT_SYMBOL, 172),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 172),
+    '0302a70602a70a02a70f02a71802a71f02a72902a73803a7'
+    '0302ac0602ac0a02ac0f02ac1802ac1f02ac2902ac3803ac'
 
     # Node 110
-    (114, 0, 0),
-    (115, 0, 0),
-    (117, 0, 0),
-    (118, 0, 0),
-    (121, 0, 0),
-    (123, 0, 0),
-    (127, 0, 0),
-    (130, 0, 0),
-    (136, 0, 0),
-    (139, 0, 0),
-    (143, 0, 0),
-    (146, 0, 0),
-    (155, 0, 0),
-    (162, 0, 0),
-    (170, 0, 0),
-    (180, 0, 0),
+    '7200007300007500007600007900007b00007f0000820000'
+    '8800008b00008f00009200009b0000a20000aa0000b40000'
 
     # Node 111
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 176),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 177),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 179),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 209),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 216),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 217),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 227),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 229),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 230),
-    (122, 0, 0),
-    (124, 0, 0),
-    (125, 0, 0),
-    (128, 0, 0),
-    (129, 0, 0),
-    (131, 0, 0),
-    (132, 0, 0),
+    '0003b00003b10003b30003d10003d80003d90003e30003e5'
+    '0003e67a00007c00007d0000800000810000830000840000'
 
     # Node 112
-    (1, HUFFMAN_EMIT_SYMBOL, 176),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 176),
-    (1, HUFFMAN_EMIT_SYMBOL, 177),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 177),
-    (1, HUFFMAN_EMIT_SYMBOL, 179),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 179),
-    (1, HUFFMAN_EMIT_SYMBOL, 209),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 209),
-    (1, HUFFMAN_EMIT_SYMBOL, 216),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 216),
-    (1, HUFFMAN_EMIT_SYMBOL, 217),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 217),
-    (1, HUFFMAN_EMIT_SYMBOL, 227),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 227),
-    (1, HUFFMAN_EMIT_SYMBOL, 229),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 229),
+    '0102b01603b00102b11603b10102b31603b30102d11603d1'
+    '0102d81603d80102d91603d90102e31603e30102e51603e5'
 
     # Node 113
-    (2, HUFFMAN_EMIT_SYMBOL, 176),
-    (9, HUFFMAN_EMIT_SYMBOL, 176),
-    (23, HUFFMAN_EMIT_SYMBOL, 176),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 176),
-    (2, HUFFMAN_EMIT_SYMBOL, 177),
-    (9, HUFFMAN_EMIT_SYMBOL, 177),
-    (23, HUFFMAN_EMIT_SYMBOL, 177),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 177),
-    (2, HUFFMAN_EMIT_SYMBOL, 179),
-    (9, HUFFMAN_EMIT_SYMBOL, 179),
-    (23, HUFFMAN_EMIT_SYMBOL, 179),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 179),
-    (2, HUFFMAN_EMIT_SYMBOL, 209),
-    (9, HUFFMAN_EMIT_SYMBOL, 209),
-    (23, HUFFMAN_EMIT_SYMBOL, 209),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 209),
+    '0202b00902b01702b02803b00202b10902b11702b12803b1'
+    '0202b30902b31702b32803b30202d10902d11702d12803d1'
 
     # Node 114
-    (3, HUFFMAN_EMIT_SYMBOL, 176),
-    (6, HUFFMAN_EMIT_SYMBOL, 176),
-    (10, HUFFMAN_EMIT_SYMBOL, 176),
-    (15, HUFFMAN_EMIT_SYMBOL, 176),
-    (24, HUFFMAN_EMIT_SYMBOL, 176),
-    (31, HUFFMAN_EMIT_SYMBOL, 176),
-    (41, HUFFMAN_EMIT_SYMBOL, 176),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 176),
-    (3, HUFFMAN_EMIT_SYMBOL, 177),
-    (6, HUFFMAN_EMIT_SYMBOL, 177),
-    (10, HUFFMAN_EMIT_SYMBOL, 177),
-    (15, HUFFMAN_EMIT_SYMBOL, 177),
-    (24, HUFFMAN_EMIT_SYMBOL, 177),
-    (31, HUFFMAN_EMIT_SYMBOL, 177),
-    (41, HUFFMAN_EMIT_SYMBOL, 177),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 177),
+    '0302b00602b00a02b00f02b01802b01f02b02902b03803b0'
+    '0302b10602b10a02b10f02b11802b11f02b12902b13803b1'
 
     # Node 115
-    (3, HUFFMAN_EMIT_SYMBOL, 179),
-    (6, HUFFMAN_EMIT_SYMBOL, 179),
-    (10, HUFFMAN_EMIT_SYMBOL, 179),
-    (15, HUFFMAN_EMIT_SYMBOL, 179),
-    (24, HUFFMAN_EMIT_SYMBOL, 179),
-    (31, HUFFMAN_EMIT_SYMBOL, 179),
-    (41, HUFFMAN_EMIT_SYMBOL, 179),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 179),
-    (3, HUFFMAN_EMIT_SYMBOL, 209),
-    (6, HUFFMAN_EMIT_SYMBOL, 209),
-    (10, HUFFMAN_EMIT_SYMBOL, 209),
-    (15, HUFFMAN_EMIT_SYMBOL, 209),
-    (24, HUFFMAN_EMIT_SYMBOL, 209),
-    (31, HUFFMAN_EMIT_SYMBOL, 209),
-    (41, HUFFMAN_EMIT_SYMBOL, 209),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 209),
+    '0302b30602b30a02b30f02b31802b31f02b32902b33803b3'
+    '0302d10602d10a02d10f02d11802d11f02d12902d13803d1'
 
     # Node 116
-    (2, HUFFMAN_EMIT_SYMBOL, 216),
-    (9, HUFFMAN_EMIT_SYMBOL, 216),
-    (23, HUFFMAN_EMIT_SYMBOL, 216),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 216),
-    (2, HUFFMAN_EMIT_SYMBOL, 217),
-    (9, HUFFMAN_EMIT_SYMBOL, 217),
-    (23, HUFFMAN_EMIT_SYMBOL, 217),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 217),
-    (2, HUFFMAN_EMIT_SYMBOL, 227),
-    (9, HUFFMAN_EMIT_SYMBOL, 227),
-    (23, HUFFMAN_EMIT_SYMBOL, 227),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 227),
-    (2, HUFFMAN_EMIT_SYMBOL, 229),
-    (9, HUFFMAN_EMIT_SYMBOL, 229),
-    (23, HUFFMAN_EMIT_SYMBOL, 229),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 229),
+    '0202d80902d81702d82803d80202d90902d91702d92803d9'
+    '0202e30902e31702e32803e30202e50902e51702e52803e5'
 
     # Node 117
-    (3, HUFFMAN_EMIT_SYMBOL, 216),
-    (6, HUFFMAN_EMIT_SYMBOL, 216),
-    (10, HUFFMAN_EMIT_SYMBOL, 216),
-    (15, HUFFMAN_EMIT_SYMBOL, 216),
-    (24, HUFFMAN_EMIT_SYMBOL, 216),
-    (31, HUFFMAN_EMIT_SYMBOL, 216),
-    (41, HUFFMAN_EMIT_SYMBOL, 216),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 216),
-    (3, HUFFMAN_EMIT_SYMBOL, 217),
-    (6, HUFFMAN_EMIT_SYMBOL, 217),
-    (10, HUFFMAN_EMIT_SYMBOL, 217),
-    (15, HUFFMAN_EMIT_SYMBOL, 217),
-    (24, HUFFMAN_EMIT_SYMBOL, 217),
-    (31, HUFFMAN_EMIT_SYMBOL, 217),
-    (41, HUFFMAN_EMIT_SYMBOL, 217),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 217),
+    '0302d80602d80a02d80f02d81802d81f02d82902d83803d8'
+    '0302d90602d90a02d90f02d91802d91f02d92902d93803d9'
 
     # Node 118
-    (3, HUFFMAN_EMIT_SYMBOL, 227),
-    (6, HUFFMAN_EMIT_SYMBOL, 227),
-    (10, HUFFMAN_EMIT_SYMBOL, 227),
-    (15, HUFFMAN_EMIT_SYMBOL, 227),
-    (24, HUFFMAN_EMIT_SYMBOL, 227),
-    (31, HUFFMAN_EMIT_SYMBOL, 227),
-    (41, HUFFMAN_EMIT_SYMBOL, 227),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 227),
-    (3, HUFFMAN_EMIT_SYMBOL, 229),
-    (6, HUFFMAN_EMIT_SYMBOL, 229),
-    (10, HUFFMAN_EMIT_SYMBOL, 229),
-    (15, HUFFMAN_EMIT_SYMBOL, 229),
-    (24, HUFFMAN_EMIT_SYMBOL, 229),
-    (31, HUFFMAN_EMIT_SYMBOL, 229),
-    (41, HUFFMAN_EMIT_SYMBOL, 229),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 229),
+    '0302e30602e30a02e30f02e31802e31f02e32902e33803e3'
+    '0302e50602e50a02e50f02e51802e51f02e52902e53803e5'
 
     # Node 119
-    (1, HUFFMAN_EMIT_SYMBOL, 230),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 230),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 129),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 132),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 133),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 134),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 136),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 146),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 154),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 156),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 160),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 163),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 164),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 169),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 170),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 173),
+    '0102e61603e6000381000384000385000386000388000392'
+    '00039a00039c0003a00003a30003a40003a90003aa0003ad'
 
     # Node 120
-    (2, HUFFMAN_EMIT_SYMBOL, 230),
-    (9, HUFFMAN_EMIT_SYMBOL, 230),
-    (23, HUFFMAN_EMIT_SYMBOL, 230),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 230),
-    (1, HUFFMAN_EMIT_SYMBOL, 129),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 129),
-    (1, HUFFMAN_EMIT_SYMBOL, 132),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 132),
-    (1, HUFFMAN_EMIT_SYMBOL, 133),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 133),
-    (1, HUFFMAN_EMIT_SYMBOL, 134),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 134),
-    (1, HUFFMAN_EMIT_SYMBOL, 136),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 136),
-    (1, HUFFMAN_EMIT_SYMBOL, 146),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 146),
+    '0202e60902e61702e62803e6010281160381010284160384'
+    '010285160385010286160386010288160388010292160392'
 
     # Node 121
-    (3, HUFFMAN_EMIT_SYMBOL, 230),
-    (6, HUFFMAN_EMIT_SYMBOL, 230),
-    (10, HUFFMAN_EMIT_SYMBOL, 230),
-    (15, HUFFMAN_EMIT_SYMBOL, 230),
-    (24, HUFFMAN_EMIT_SYMBOL, 230),
-    (31, HUFFMAN_EMIT_SYMBOL, 230),
-    (41, HUFFMAN_EMIT_SYMBOL, 230),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 230),
-    (2, HUFFMAN_EMIT_SYMBOL, 129),
-    (9, HUFFMAN_EMIT_SYMBOL, 129),
-    (23, HUFFMAN_EMIT_SYMBOL, 129),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 129),
-    (2, HUFFMAN_EMIT_SYMBOL, 132),
-    (9, HUFFMAN_EMIT_SYMBOL, 132),
-    (23, HUFFMAN_EMIT_SYMBOL, 132),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 132),
+    '0302e60602e60a02e60f02e61802e61f02e62902e63803e6'
+    '020281090281170281280381020284090284170284280384'
 
     # Node 122
-    (3, HUFFMAN_EMIT_SYMBOL, 129),
-    (6, HUFFMAN_EMIT_SYMBOL, 129),
-    (10, HUFFMAN_EMIT_SYMBOL, 129),
-    (15, HUFFMAN_EMIT_SYMBOL, 129),
-    (24, HUFFMAN_EMIT_SYMBOL, 129),
-    (31, HUFFMAN_EMIT_SYMBOL, 129),
-    (41, HUFFMAN_EMIT_SYMBOL, 129),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 129),
-    (3, HUFFMAN_EMIT_SYMBOL, 132),
-    (6, HUFFMAN_EMIT_SYMBOL, 132),
-    (10, HUFFMAN_EMIT_SYMBOL, 132),
-    (15, HUFFMAN_EMIT_SYMBOL, 132),
-    (24, HUFFMAN_EMIT_SYMBOL, 132),
-    (31, HUFFMAN_EMIT_SYMBOL, 132),
-    (41, HUFFMAN_EMIT_SYMBOL, 132),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 132),
+    '0302810602810a02810f02811802811f0281290281380381'
+    '0302840602840a02840f02841802841f0284290284380384'
 
     # Node 123
-    (2, HUFFMAN_EMIT_SYMBOL, 133),
-    (9, HUFFMAN_EMIT_SYMBOL, 133),
-    (23, HUFFMAN_EMIT_SYMBOL, 133),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 133),
-    (2, HUFFMAN_EMIT_SYMBOL, 134),
-    (9, HUFFMAN_EMIT_SYMBOL, 134),
-    (23, HUFFMAN_EMIT_SYMBOL, 134),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 134),
-    (2, HUFFMAN_EMIT_SYMBOL, 136),
-    (9, HUFFMAN_EMIT_SYMBOL, 136),
-    (23, HUFFMAN_EMIT_SYMBOL, 136),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 136),
-    (2, HUFFMAN_EMIT_SYMBOL, 146),
-    (9, HUFFMAN_EMIT_SYMBOL, 146),
-    (23, HUFFMAN_EMIT_SYMBOL, 146),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 146),
+    '020285090285170285280385020286090286170286280386'
+    '020288090288170288280388020292090292170292280392'
 
     # Node 124
-    (3, HUFFMAN_EMIT_SYMBOL, 133),
-    (6, HUFFMAN_EMIT_SYMBOL, 133),
-    (10, HUFFMAN_EMIT_SYMBOL, 133),
-    (15, HUFFMAN_EMIT_SYMBOL, 133),
-    (24, HUFFMAN_EMIT_SYMBOL, 133),
-    (31, HUFFMAN_EMIT_SYMBOL, 133),
-    (41, HUFFMAN_EMIT_SYMBOL, 133),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 133),
-    (3, HUFFMAN_EMIT_SYMBOL, 134),
-    (6, HUFFMAN_EMIT_SYMBOL, 134),
-    (10, HUFFMAN_EMIT_SYMBOL, 134),
-    (15, HUFFMAN_EMIT_SYMBOL, 134),
-    (24, HUFFMAN_EMIT_SYMBOL, 134),
-    (31, HUFFMAN_EMIT_SYMBOL, 134),
-    (41, HUFFMAN_EMIT_SYMBOL, 134),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 134),
+    '0302850602850a02850f02851802851f0285290285380385'
+    '0302860602860a02860f02861802861f0286290286380386'
 
     # Node 125
-    (3, HUFFMAN_EMIT_SYMBOL, 136),
-    (6, HUFFMAN_EMIT_SYMBOL, 136),
-    (10, HUFFMAN_EMIT_SYMBOL, 136),
-    (15, HUFFMAN_EMIT_SYMBOL, 136),
-    (24, HUFFMAN_EMIT_SYMBOL, 136),
-    (31, HUFFMAN_EMIT_SYMBOL, 136),
-    (41, HUFFMAN_EMIT_SYMBOL, 136),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 136),
-    (3, HUFFMAN_EMIT_SYMBOL, 146),
-    (6, HUFFMAN_EMIT_SYMBOL, 146),
-    (10, HUFFMAN_EMIT_SYMBOL, 146),
-    (15, HUFFMAN_EMIT_SYMBOL, 146),
-    (24, HUFFMAN_EMIT_SYMBOL, 146),
-    (31, HUFFMAN_EMIT_SYMBOL, 146),
-    (41, HUFFMAN_EMIT_SYMBOL, 146),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 146),
+    '0302880602880a02880f02881802881f0288290288380388'
+    '0302920602920a02920f02921802921f0292290292380392'
 
     # Node 126
-    (1, HUFFMAN_EMIT_SYMBOL, 154),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 154),
-    (1, HUFFMAN_EMIT_SYMBOL, 156),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 156),
-    (1, HUFFMAN_EMIT_SYMBOL, 160),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 160),
-    (1, HUFFMAN_EMIT_SYMBOL, 163),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 163),
-    (1, HUFFMAN_EMIT_SYMBOL, 164),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 164),
-    (1, HUFFMAN_EMIT_SYMBOL, 169),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 169),
-    (1, HUFFMAN_EMIT_SYMBOL, 170),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 170),
-    (1, HUFFMAN_EMIT_SYMBOL, 173),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 173),
+    '01029a16039a01029c16039c0102a01603a00102a31603a3'
+    '0102a41603a40102a91603a90102aa1603aa0102ad1603ad'
 
     # Node 127
-    (2, HUFFMAN_EMIT_SYMBOL, 154),
-    (9, HUFFMAN_EMIT_SYMBOL, 154),
-    (23, HUFFMAN_EMIT_SYMBOL, 154),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 154),
-    (2, HUFFMAN_EMIT_SYMBOL, 156),
-    (9, HUFFMAN_EMIT_SYMBOL, 156),
-    (23, HUFFMAN_EMIT_SYMBOL, 156),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 156),
-    (2, HUFFMAN_EMIT_SYMBOL, 160),
-    (9, HUFFMAN_EMIT_SYMBOL, 160),
-    (23, HUFFMAN_EMIT_SYMBOL, 160),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 160),
-    (2, HUFFMAN_EMIT_SYMBOL, 163),
-    (9, HUFFMAN_EMIT_SYMBOL, 163),
-    (23, HUFFMAN_EMIT_SYMBOL, 163),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 163),
+    '02029a09029a17029a28039a02029c09029c17029c28039c'
+    '0202a00902a01702a02803a00202a30902a31702a32803a3'
 
     # Node 128
-    (3, HUFFMAN_EMIT_SYMBOL, 154),
-    (6, HUFFMAN_EMIT_SYMBOL, 154),
-    (10, HUFFMAN_EMIT_SYMBOL, 154),
-    (15, HUFFMAN_EMIT_SYMBOL, 154),
-    (24, HUFFMAN_EMIT_SYMBOL, 154),
-    (31, HUFFMAN_EMIT_SYMBOL, 154),
-    (41, HUFFMAN_EMIT_SYMBOL, 154),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 154),
-    (3, HUFFMAN_EMIT_SYMBOL, 156),
-    (6, HUFFMAN_EMIT_SYMBOL, 156),
-    (10, HUFFMAN_EMIT_SYMBOL, 156),
-    (15, HUFFMAN_EMIT_SYMBOL, 156),
-    (24, HUFFMAN_EMIT_SYMBOL, 156),
-    (31, HUFFMAN_EMIT_SYMBOL, 156),
-    (41, HUFFMAN_EMIT_SYMBOL, 156),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 156),
+    '03029a06029a0a029a0f029a18029a1f029a29029a38039a'
+    '03029c06029c0a029c0f029c18029c1f029c29029c38039c'
 
     # Node 129
-    (3, HUFFMAN_EMIT_SYMBOL, 160),
-    (6, HUFFMAN_EMIT_SYMBOL, 160),
-    (10, HUFFMAN_EMIT_SYMBOL, 160),
-    (15, HUFFMAN_EMIT_SYMBOL, 160),
-    (24, HUFFMAN_EMIT_SYMBOL, 160),
-    (31, HUFFMAN_EMIT_SYMBOL, 160),
-    (41, HUFFMAN_EMIT_SYMBOL, 160),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 160),
-    (3, HUFFMAN_EMIT_SYMBOL, 163),
-    (6, HUFFMAN_EMIT_SYMBOL, 163),
-    (10, HUFFMAN_EMIT_SYMBOL, 163),
-    (15, HUFFMAN_EMIT_SYMBOL, 163),
-    (24, HUFFMAN_EMIT_SYMBOL, 163),
-    (31, HUFFMAN_EMIT_SYMBOL, 163),
-    (41, HUFFMAN_EMIT_SYMBOL, 163),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 163),
+    '0302a00602a00a02a00f02a01802a01f02a02902a03803a0'
+    '0302a30602a30a02a30f02a31802a31f02a32902a33803a3'
 
     # Node 130
-    (2, HUFFMAN_EMIT_SYMBOL, 164),
-    (9, HUFFMAN_EMIT_SYMBOL, 164),
-    (23, HUFFMAN_EMIT_SYMBOL, 164),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 164),
-    (2, HUFFMAN_EMIT_SYMBOL, 169),
-    (9, HUFFMAN_EMIT_SYMBOL, 169),
-    (23, HUFFMAN_EMIT_SYMBOL, 169),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 169),
-    (2, HUFFMAN_EMIT_SYMBOL, 170),
-    (9, HUFFMAN_EMIT_SYMBOL, 170),
-    (23, HUFFMAN_EMIT_SYMBOL, 170),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 170),
-    (2, HUFFMAN_EMIT_SYMBOL, 173),
-    (9, HUFFMAN_EMIT_SYMBOL, 173),
-    (23, HUFFMAN_EMIT_SYMBOL, 173),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 173),
+    '0202a40902a41702a42803a40202a90902a91702a92803a9'
+    '0202aa0902aa1702aa2803aa0202ad0902ad1702ad2803ad'
 
     # Node 131
-    (3, HUFFMAN_EMIT_SYMBOL, 164),
-    (6, HUFFMAN_EMIT_SYMBOL, 164),
-    (10, HUFFMAN_EMIT_SYMBOL, 164),
-    (15, HUFFMAN_EMIT_SYMBOL, 164),
-    (24, HUFFMAN_EMIT_SYMBOL, 164),
-    (31, HUFFMAN_EMIT_SYMBOL, 164),
-    (41, HUFFMAN_EMIT_SYMBOL, 164),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 164),
-    (3, HUFFMAN_EMIT_SYMBOL, 169),
-    (6, HUFFMAN_EMIT_SYMBOL, 169),
-    (10, HUFFMAN_EMIT_SYMBOL, 169),
-    (15, HUFFMAN_EMIT_SYMBOL, 169),
-    (24, HUFFMAN_EMIT_SYMBOL, 169),
-    (31, HUFFMAN_EMIT_SYMBOL, 169),
-    (41, HUFFMAN_EMIT_SYMBOL, 169),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 169),
+    '0302a40602a40a02a40f02a41802a41f02a42902a43803a4'
+    '0302a90602a90a02a90f02a91802a91f02a92902a93803a9'
 
     # Node 132
-    (3, HUFFMAN_EMIT_SYMBOL, 170),
-    (6, HUFFMAN_EMIT_SYMBOL, 170),
-    (10, HUFFMAN_EMIT_SYMBOL, 170),
-    (15, HUFFMAN_EMIT_SYMBOL, 170),
-    (24, HUFFMAN_EMIT_SYMBOL, 170),
-    (31, HUFFMAN_EMIT_SYMBOL, 170),
-    (41, HUFFMAN_EMIT_SYMBOL, 170),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 170),
-    (3, HUFFMAN_EMIT_SYMBOL, 173),
-    (6, HUFFMAN_EMIT_SYMBOL, 173),
-    (10, HUFFMAN_EMIT_SYMBOL, 173),
-    (15, HUFFMAN_EMIT_SYMBOL, 173),
-    (24, HUFFMAN_EMIT_SYMBOL, 173),
-    (31, HUFFMAN_EMIT_SYMBOL, 173),
-    (41, HUFFMAN_EMIT_SYMBOL, 173),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 173),
+    '0302aa0602aa0a02aa0f02aa1802aa1f02aa2902aa3803aa'
+    '0302ad0602ad0a02ad0f02ad1802ad1f02ad2902ad3803ad'
 
     # Node 133
-    (137, 0, 0),
-    (138, 0, 0),
-    (140, 0, 0),
-    (141, 0, 0),
-    (144, 0, 0),
-    (145, 0, 0),
-    (147, 0, 0),
-    (150, 0, 0),
-    (156, 0, 0),
-    (159, 0, 0),
-    (163, 0, 0),
-    (166, 0, 0),
-    (171, 0, 0),
-    (174, 0, 0),
-    (181, 0, 0),
-    (190, 0, 0),
+    '8900008a00008c00008d0000900000910000930000960000'
+    '9c00009f0000a30000a60000ab0000ae0000b50000be0000'
 
     # Node 134
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 178),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 181),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 185),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 186),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 187),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 189),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 190),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 196),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 198),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 228),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 232),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 233),
-    (148, 0, 0),
-    (149, 0, 0),
-    (151, 0, 0),
-    (152, 0, 0),
+    '0003b20003b50003b90003ba0003bb0003bd0003be0003c4'
+    '0003c60003e40003e80003e9940000950000970000980000'
 
     # Node 135
-    (1, HUFFMAN_EMIT_SYMBOL, 178),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 178),
-    (1, HUFFMAN_EMIT_SYMBOL, 181),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 181),
-    (1, HUFFMAN_EMIT_SYMBOL, 185),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 185),
-    (1, HUFFMAN_EMIT_SYMBOL, 186),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 186),
-    (1, HUFFMAN_EMIT_SYMBOL, 187),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 187),
-    (1, HUFFMAN_EMIT_SYMBOL, 189),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 189),
-    (1, HUFFMAN_EMIT_SYMBOL, 190),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 190),
-    (1, HUFFMAN_EMIT_SYMBOL, 196),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 196),
+    '0102b21603b20102b51603b50102b91603b90102ba1603ba'
+    '0102bb1603bb0102bd1603bd0102be1603be0102c41603c4'
 
     # Node 136
-    (2, HUFFMAN_EMIT_SYMBOL, 178),
-    (9, HUFFMAN_EMIT_SYMBOL, 178),
-    (23, HUFFMAN_EMIT_SYMBOL, 178),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 178),
-    (2, HUFFMAN_EMIT_SYMBOL, 181),
-    (9, HUFFMAN_EMIT_SYMBOL, 181),
-    (23, HUFFMAN_EMIT_SYMBOL, 181),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 181),
-    (2, HUFFMAN_EMIT_SYMBOL, 185),
-    (9, HUFFMAN_EMIT_SYMBOL, 185),
-    (23, HUFFMAN_EMIT_SYMBOL, 185),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 185),
-    (2, HUFFMAN_EMIT_SYMBOL, 186),
-    (9, HUFFMAN_EMIT_SYMBOL, 186),
-    (23, HUFFMAN_EMIT_SYMBOL, 186),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 186),
+    '0202b20902b21702b22803b20202b50902b51702b52803b5'
+    '0202b90902b91702b92803b90202ba0902ba1702ba2803ba'
 
     # Node 137
-    (3, HUFFMAN_EMIT_SYMBOL, 178),
-    (6, HUFFMAN_EMIT_SYMBOL, 178),
-    (10, HUFFMAN_EMIT_SYMBOL, 178),
-    (15, HUFFMAN_EMIT_SYMBOL, 178),
-    (24, HUFFMAN_EMIT_SYMBOL, 178),
-    (31, HUFFMAN_EMIT_SYMBOL, 178),
-    (41, HUFFMAN_EMIT_SYMBOL, 178),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 178),
-    (3, HUFFMAN_EMIT_SYMBOL, 181),
-    (6, HUFFMAN_EMIT_SYMBOL, 181),
-    (10, HUFFMAN_EMIT_SYMBOL, 181),
-    (15, HUFFMAN_EMIT_SYMBOL, 181),
-    (24, HUFFMAN_EMIT_SYMBOL, 181),
-    (31, HUFFMAN_EMIT_SYMBOL, 181),
-    (41, HUFFMAN_EMIT_SYMBOL, 181),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 181),
+    '0302b20602b20a02b20f02b21802b21f02b22902b23803b2'
+    '0302b50602b50a02b50f02b51802b51f02b52902b53803b5'
 
     # Node 138
-    (3, HUFFMAN_EMIT_SYMBOL, 185),
-    (6, HUFFMAN_EMIT_SYMBOL, 185),
-    (10, HUFFMAN_EMIT_SYMBOL, 185),
-    (15, HUFFMAN_EMIT_SYMBOL, 185),
-    (24, HUFFMAN_EMIT_SYMBOL, 185),
-    (31, HUFFMAN_EMIT_SYMBOL, 185),
-    (41, HUFFMAN_EMIT_SYMBOL, 185),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 185),
-    (3, HUFFMAN_EMIT_SYMBOL, 186),
-    (6, HUFFMAN_EMIT_SYMBOL, 186),
-    (10, HUFFMAN_EMIT_SYMBOL, 186),
-    (15, HUFFMAN_EMIT_SYMBOL, 186),
-    (24, HUFFMAN_EMIT_SYMBOL, 186),
-    (31, HUFFMAN_EMIT_SYMBOL, 186),
-    (41, HUFFMAN_EMIT_SYMBOL, 186),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 186),
+    '0302b90602b90a02b90f02b91802b91f02b92902b93803b9'
+    '0302ba0602ba0a02ba0f02ba1802ba1f02ba2902ba3803ba'
 
     # Node 139
-    (2, HUFFMAN_EMIT_SYMBOL, 187),
-    (9, HUFFMAN_EMIT_SYMBOL, 187),
-    (23, HUFFMAN_EMIT_SYMBOL, 187),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 187),
-    (2, HUFFMAN_EMIT_SYMBOL, 189),
-    (9, HUFFMAN_EMIT_SYMBOL, 189),
-    (23, HUFFMAN_EMIT_SYMBOL, 189),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 189),
-    (2, HUFFMAN_EMIT_SYMBOL, 190),
-    (9, HUFFMAN_EMIT_SYMBOL, 190),
-    (23, HUFFMAN_EMIT_SYMBOL, 190),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 190),
-    (2, HUFFMAN_EMIT_SYMBOL, 196),
-    (9, HUFFMAN_EMIT_SYMBOL, 196),
-    (23, HUFFMAN_EMIT_SYMBOL, 196),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 196),
+    '0202bb0902bb1702bb2803bb0202bd0902bd1702bd2803bd'
+    '0202be0902be1702be2803be0202c40902c41702c42803c4'
 
     # Node 140
-    (3, HUFFMAN_EMIT_SYMBOL, 187),
-    (6, HUFFMAN_EMIT_SYMBOL, 187),
-    (10, HUFFMAN_EMIT_SYMBOL, 187),
-    (15, HUFFMAN_EMIT_SYMBOL, 187),
-    (24, HUFFMAN_EMIT_SYMBOL, 187),
-    (31, HUFFMAN_EMIT_SYMBOL, 187),
-    (41, HUFFMAN_EMIT_SYMBOL, 187),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 187),
-    (3, HUFFMAN_EMIT_SYMBOL, 189),
-    (6, HUFFMAN_EMIT_SYMBOL, 189),
-    (10, HUFFMAN_EMIT_SYMBOL, 189),
-    (15, HUFFMAN_EMIT_SYMBOL, 189),
-    (24, HUFFMAN_EMIT_SYMBOL, 189),
-    (31, HUFFMAN_EMIT_SYMBOL, 189),
-    (41, HUFFMAN_EMIT_SYMBOL, 189),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 189),
+    '0302bb0602bb0a02bb0f02bb1802bb1f02bb2902bb3803bb'
+    '0302bd0602bd0a02bd0f02bd1802bd1f02bd2902bd3803bd'
 
     # Node 141
-    (3, HUFFMAN_EMIT_SYMBOL, 190),
-    (6, HUFFMAN_EMIT_SYMBOL, 190),
-    (10, HUFFMAN_EMIT_SYMBOL, 190),
-    (15, HUFFMAN_EMIT_SYMBOL, 190),
-    (24, HUFFMAN_EMIT_SYMBOL, 190),
-    (31, HUFFMAN_EMIT_SYMBOL, 190),
-    (41, HUFFMAN_EMIT_SYMBOL, 190),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 190),
-    (3, HUFFMAN_EMIT_SYMBOL, 196),
-    (6, HUFFMAN_EMIT_SYMBOL, 196),
-    (10, HUFFMAN_EMIT_SYMBOL, 196),
-    (15, HUFFMAN_EMIT_SYMBOL, 196),
-    (24, HUFFMAN_EMIT_SYMBOL, 196),
-    (31, HUFFMAN_EMIT_SYMBOL, 196),
-    (41, HUFFMAN_EMIT_SYMBOL, 196),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 196),
+    '0302be0602be0a02be0f02be1802be1f02be2902be3803be'
+    '0302c40602c40a02c40f02c41802c41f02c42902c43803c4'
 
     # Node 142
-    (1, HUFFMAN_EMIT_SYMBOL, 198),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 198),
-    (1, HUFFMAN_EMIT_SYMBOL, 228),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 228),
-    (1, HUFFMAN_EMIT_SYMBOL, 232),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 232),
-    (1, HUFFMAN_EMIT_SYMBOL, 233),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 233),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 1),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 135),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 137),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 138),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 139),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 140),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 141),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 143),
+    '0102c61603c60102e41603e40102e81603e80102e91603e9'
+    '00030100038700038900038a00038b00038c00038d00038f'
 
     # Node 143
-    (2, HUFFMAN_EMIT_SYMBOL, 198),
-    (9, HUFFMAN_EMIT_SYMBOL, 198),
-    (23, HUFFMAN_EMIT_SYMBOL, 198),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 198),
-    (2, HUFFMAN_EMIT_SYMBOL, 228),
-    (9, HUFFMAN_EMIT_SYMBOL, 228),
-    (23, HUFFMAN_EMIT_SYMBOL, 228),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 228),
-    (2, HUFFMAN_EMIT_SYMBOL, 232),
-    (9, HUFFMAN_EMIT_SYMBOL, 232),
-    (23, HUFFMAN_EMIT_SYMBOL, 232),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 232),
-    (2, HUFFMAN_EMIT_SYMBOL, 233),
-    (9, HUFFMAN_EMIT_SYMBOL, 233),
-    (23, HUFFMAN_EMIT_SYMBOL, 233),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 233),
+    '0202c60902c61702c62803c60202e40902e41702e42803e4'
+    '0202e80902e81702e82803e80202e90902e91702e92803e9'
 
     # Node 144
-    (3, HUFFMAN_EMIT_SYMBOL, 198),
-    (6, HUFFMAN_EMIT_SYMBOL, 198),
-    (10, HUFFMAN_EMIT_SYMBOL, 198),
-    (15, HUFFMAN_EMIT_SYMBOL, 198),
-    (24, HUFFMAN_EMIT_SYMBOL, 198),
-    (31, HUFFMAN_EMIT_SYMBOL, 198),
-    (41, HUFFMAN_EMIT_SYMBOL, 198),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 198),
-    (3, HUFFMAN_EMIT_SYMBOL, 228),
-    (6, HUFFMAN_EMIT_SYMBOL, 228),
-    (10, HUFFMAN_EMIT_SYMBOL, 228),
-    (15, HUFFMAN_EMIT_SYMBOL, 228),
-    (24, HUFFMAN_EMIT_SYMBOL, 228),
-    (31, HUFFMAN_EMIT_SYMBOL, 228),
-    (41, HUFFMAN_EMIT_SYMBOL, 228),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 228),
+    '0302c60602c60a02c60f02c61802c61f02c62902c63803c6'
+    '0302e40602e40a02e40f02e41802e41f02e42902e43803e4'
 
     # Node 145
-    (3, HUFFMAN_EMIT_SYMBOL, 232),
-    (6, HUFFMAN_EMIT_SYMBOL, 232),
-    (10, HUFFMAN_EMIT_SYMBOL, 232),
-    (15, HUFFMAN_EMIT_SYMBOL, 232),
-    (24, HUFFMAN_EMIT_SYMBOL, 232),
-    (31, HUFFMAN_EMIT_SYMBOL, 232),
-    (41, HUFFMAN_EMIT_SYMBOL, 232),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 232),
-    (3, HUFFMAN_EMIT_SYMBOL, 233),
-    (6, HUFFMAN_EMIT_SYMBOL, 233),
-    (10, HUFFMAN_EMIT_SYMBOL, 233),
-    (15, HUFFMAN_EMIT_SYMBOL, 233),
-    (24, HUFFMAN_EMIT_SYMBOL, 233),
-    (31, HUFFMAN_EMIT_SYMBOL, 233),
-    (41, HUFFMAN_EMIT_SYMBOL, 233),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 233),
+    '0302e80602e80a02e80f02e81802e81f02e82902e83803e8'
+    '0302e90602e90a02e90f02e91802e91f02e92902e93803e9'
 
     # Node 146
-    (1, HUFFMAN_EMIT_SYMBOL, 1),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 1),
-    (1, HUFFMAN_EMIT_SYMBOL, 135),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 135),
-    (1, HUFFMAN_EMIT_SYMBOL, 137),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 137),
-    (1, HUFFMAN_EMIT_SYMBOL, 138),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 138),
-    (1, HUFFMAN_EMIT_SYMBOL, 139),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 139),
-    (1, HUFFMAN_EMIT_SYMBOL, 140),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 140),
-    (1, HUFFMAN_EMIT_SYMBOL, 141),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 141),
-    (1, HUFFMAN_EMIT_SYMBOL, 143),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 143),
+    '01020116030101028716038701028916038901028a16038a'
+    '01028b16038b01028c16038c01028d16038d01028f16038f'
 
     # Node 147
-    (2, HUFFMAN_EMIT_SYMBOL, 1),
-    (9, HUFFMAN_EMIT_SYMBOL, 1),
-    (23, HUFFMAN_EMIT_SYMBOL, 1),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 1),
-    (2, HUFFMAN_EMIT_SYMBOL, 135),
-    (9, HUFFMAN_EMIT_SYMBOL, 135),
-    (23, HUFFMAN_EMIT_SYMBOL, 135),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 135),
-    (2, HUFFMAN_EMIT_SYMBOL, 137),
-    (9, HUFFMAN_EMIT_SYMBOL, 137),
-    (23, HUFFMAN_EMIT_SYMBOL, 137),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 137),
-    (2, HUFFMAN_EMIT_SYMBOL, 138),
-    (9, HUFFMAN_EMIT_SYMBOL, 138),
-    (23, HUFFMAN_EMIT_SYMBOL, 138),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 138),
+    '020201090201170201280301020287090287170287280387'
+    '02028909028917028928038902028a09028a17028a28038a'
 
     # Node 148
-    (3, HUFFMAN_EMIT_SYMBOL, 1),
-    (6, HUFFMAN_EMIT_SYMBOL, 1),
-    (10, HUFFMAN_EMIT_SYMBOL, 1),
-    (15, HUFFMAN_EMIT_SYMBOL, 1),
-    (24, HUFFMAN_EMIT_SYMBOL, 1),
-    (31, HUFFMAN_EMIT_SYMBOL, 1),
-    (41, HUFFMAN_EMIT_SYMBOL, 1),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 1),
-    (3, HUFFMAN_EMIT_SYMBOL, 135),
-    (6, HUFFMAN_EMIT_SYMBOL, 135),
-    (10, HUFFMAN_EMIT_SYMBOL, 135),
-    (15, HUFFMAN_EMIT_SYMBOL, 135),
-    (24, HUFFMAN_EMIT_SYMBOL, 135),
-    (31, HUFFMAN_EMIT_SYMBOL, 135),
-    (41, HUFFMAN_EMIT_SYMBOL, 135),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 135),
+    '0302010602010a02010f02011802011f0201290201380301'
+    '0302870602870a02870f02871802871f0287290287380387'
 
     # Node 149
-    (3, HUFFMAN_EMIT_SYMBOL, 137),
-    (6, HUFFMAN_EMIT_SYMBOL, 137),
-    (10, HUFFMAN_EMIT_SYMBOL, 137),
-    (15, HUFFMAN_EMIT_SYMBOL, 137),
-    (24, HUFFMAN_EMIT_SYMBOL, 137),
-    (31, HUFFMAN_EMIT_SYMBOL, 137),
-    (41, HUFFMAN_EMIT_SYMBOL, 137),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 137),
-    (3, HUFFMAN_EMIT_SYMBOL, 138),
-    (6, HUFFMAN_EMIT_SYMBOL, 138),
-    (10, HUFFMAN_EMIT_SYMBOL, 138),
-    (15, HUFFMAN_EMIT_SYMBOL, 138),
-    (24, HUFFMAN_EMIT_SYMBOL, 138),
-    (31, HUFFMAN_EMIT_SYMBOL, 138),
-    (41, HUFFMAN_EMIT_SYMBOL, 138),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 138),
+    '0302890602890a02890f02891802891f0289290289380389'
+    '03028a06028a0a028a0f028a18028a1f028a29028a38038a'
 
     # Node 150
-    (2, HUFFMAN_EMIT_SYMBOL, 139),
-    (9, HUFFMAN_EMIT_SYMBOL, 139),
-    (23, HUFFMAN_EMIT_SYMBOL, 139),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 139),
-    (2, HUFFMAN_EMIT_SYMBOL, 140),
-    (9, HUFFMAN_EMIT_SYMBOL, 140),
-    (23, HUFFMAN_EMIT_SYMBOL, 140),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 140),
-    (2, HUFFMAN_EMIT_SYMBOL, 141),
-    (9, HUFFMAN_EMIT_SYMBOL, 141),
-    (23, HUFFMAN_EMIT_SYMBOL, 141),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 141),
-    (2, HUFFMAN_EMIT_SYMBOL, 143),
-    (9, HUFFMAN_EMIT_SYMBOL, 143),
-    (23, HUFFMAN_EMIT_SYMBOL, 143),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 143),
+    '02028b09028b17028b28038b02028c09028c17028c28038c'
+    '02028d09028d17028d28038d02028f09028f17028f28038f'
 
     # Node 151
-    (3, HUFFMAN_EMIT_SYMBOL, 139),
-    (6, HUFFMAN_EMIT_SYMBOL, 139),
-    (10, HUFFMAN_EMIT_SYMBOL, 139),
-    (15, HUFFMAN_EMIT_SYMBOL, 139),
-    (24, HUFFMAN_EMIT_SYMBOL, 139),
-    (31, HUFFMAN_EMIT_SYMBOL, 139),
-    (41, HUFFMAN_EMIT_SYMBOL, 139),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 139),
-    (3, HUFFMAN_EMIT_SYMBOL, 140),
-    (6, HUFFMAN_EMIT_SYMBOL, 140),
-    (10, HUFFMAN_EMIT_SYMBOL, 140),
-    (15, HUFFMAN_EMIT_SYMBOL, 140),
-    (24, HUFFMAN_EMIT_SYMBOL, 140),
-    (31, HUFFMAN_EMIT_SYMBOL, 140),
-    (41, HUFFMAN_EMIT_SYMBOL, 140),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 140),
+    '03028b06028b0a028b0f028b18028b1f028b29028b38038b'
+    '03028c06028c0a028c0f028c18028c1f028c29028c38038c'
 
     # Node 152
-    (3, HUFFMAN_EMIT_SYMBOL, 141),
-    (6, HUFFMAN_EMIT_SYMBOL, 141),
-    (10, HUFFMAN_EMIT_SYMBOL, 141),
-    (15, HUFFMAN_EMIT_SYMBOL, 141),
-    (24, HUFFMAN_EMIT_SYMBOL, 141),
-    (31, HUFFMAN_EMIT_SYMBOL, 141),
-    (41, HUFFMAN_EMIT_SYMBOL, 141),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 141),
-    (3, HUFFMAN_EMIT_SYMBOL, 143),
-    (6, HUFFMAN_EMIT_SYMBOL, 143),
-    (10, HUFFMAN_EMIT_SYMBOL, 143),
-    (15, HUFFMAN_EMIT_SYMBOL, 143),
-    (24, HUFFMAN_EMIT_SYMBOL, 143),
-    (31, HUFFMAN_EMIT_SYMBOL, 143),
-    (41, HUFFMAN_EMIT_SYMBOL, 143),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 143),
+    '03028d06028d0a028d0f028d18028d1f028d29028d38038d'
+    '03028f06028f0a028f0f028f18028f1f028f29028f38038f'
 
     # Node 153
-    (157, 0, 0),
-    (158, 0, 0),
-    (160, 0, 0),
-    (161, 0, 0),
-    (164, 0, 0),
-    (165, 0, 0),
-    (167, 0, 0),
-    (168, 0, 0),
-    (172, 0, 0),
-    (173, 0, 0),
-    (175, 0, 0),
-    (177, 0, 0),
-    (182, 0, 0),
-    (185, 0, 0),
-    (191, 0, 0),
-    (207, 0, 0),
+    '9d00009e0000a00000a10000a40000a50000a70000a80000'
+    'ac0000ad0000af0000b10000b60000b90000bf0000cf0000'
 
     # Node 154
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 147),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 149),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 150),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 151),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 152),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 155),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 157),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 158),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 165),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 166),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 168),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 174),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 175),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 180),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 182),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 183),
+    '00039300039500039600039700039800039b00039d00039e'
+    '0003a50003a60003a80003ae0003af0003b40003b60003b7'
 
     # Node 155
-    (1, HUFFMAN_EMIT_SYMBOL, 147),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 147),
-    (1, HUFFMAN_EMIT_SYMBOL, 149),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 149),
-    (1, HUFFMAN_EMIT_SYMBOL, 150),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 150),
-    (1, HUFFMAN_EMIT_SYMBOL, 151),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 151),
-    (1, HUFFMAN_EMIT_SYMBOL, 152),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 152),
-    (1, HUFFMAN_EMIT_SYMBOL, 155),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 155),
-    (1, HUFFMAN_EMIT_SYMBOL, 157),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 157),
-    (1, HUFFMAN_EMIT_SYMBOL, 158),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 158),
+    '010293160393010295160395010296160396010297160397'
+    '01029816039801029b16039b01029d16039d01029e16039e'
 
     # Node 156
-    (2, HUFFMAN_EMIT_SYMBOL, 147),
-    (9, HUFFMAN_EMIT_SYMBOL, 147),
-    (23, HUFFMAN_EMIT_SYMBOL, 147),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 147),
-    (2, HUFFMAN_EMIT_SYMBOL, 149),
-    (9, HUFFMAN_EMIT_SYMBOL, 149),
-    (23, HUFFMAN_EMIT_SYMBOL, 149),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 149),
-    (2, HUFFMAN_EMIT_SYMBOL, 150),
-    (9, HUFFMAN_EMIT_SYMBOL, 150),
-    (23, HUFFMAN_EMIT_SYMBOL, 150),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 150),
-    (2, HUFFMAN_EMIT_SYMBOL, 151),
-    (9, HUFFMAN_EMIT_SYMBOL, 151),
-    (23, HUFFMAN_EMIT_SYMBOL, 151),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 151),
+    '020293090293170293280393020295090295170295280395'
+    '020296090296170296280396020297090297170297280397'
 
     # Node 157
-    (3, HUFFMAN_EMIT_SYMBOL, 147),
-    (6, HUFFMAN_EMIT_SYMBOL, 147),
-    (10, HUFFMAN_EMIT_SYMBOL, 147),
-    (15, HUFFMAN_EMIT_SYMBOL, 147),
-    (24, HUFFMAN_EMIT_SYMBOL, 147),
-    (31, HUFFMAN_EMIT_SYMBOL, 147),
-    (41, HUFFMAN_EMIT_SYMBOL, 147),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 147),
-    (3, HUFFMAN_EMIT_SYMBOL, 149),
-    (6, HUFFMAN_EMIT_SYMBOL, 149),
-    (10, HUFFMAN_EMIT_SYMBOL, 149),
-    (15, HUFFMAN_EMIT_SYMBOL, 149),
-    (24, HUFFMAN_EMIT_SYMBOL, 149),
-    (31, HUFFMAN_EMIT_SYMBOL, 149),
-    (41, HUFFMAN_EMIT_SYMBOL, 149),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 149),
+    '0302930602930a02930f02931802931f0293290293380393'
+    '0302950602950a02950f02951802951f0295290295380395'
 
     # Node 158
-    (3, HUFFMAN_EMIT_SYMBOL, 150),
-    (6, HUFFMAN_EMIT_SYMBOL, 150),
-    (10, HUFFMAN_EMIT_SYMBOL, 150),
-    (15, HUFFMAN_EMIT_SYMBOL, 150),
-    (24, HUFFMAN_EMIT_SYMBOL, 150),
-    (31, HUFFMAN_EMIT_SYMBOL, 150),
-    (41, HUFFMAN_EMIT_SYMBOL, 150),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 150),
-    (3, HUFFMAN_EMIT_SYMBOL, 151),
-    (6, HUFFMAN_EMIT_SYMBOL, 151),
-    (10, HUFFMAN_EMIT_SYMBOL, 151),
-    (15, HUFFMAN_EMIT_SYMBOL, 151),
-    (24, HUFFMAN_EMIT_SYMBOL, 151),
-    (31, HUFFMAN_EMIT_SYMBOL, 151),
-    (41, HUFFMAN_EMIT_SYMBOL, 151),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 151),
+    '0302960602960a02960f02961802961f0296290296380396'
+    '0302970602970a02970f02971802971f0297290297380397'
 
     # Node 159
-    (2, HUFFMAN_EMIT_SYMBOL, 152),
-    (9, HUFFMAN_EMIT_SYMBOL, 152),
-    (23, HUFFMAN_EMIT_SYMBOL, 152),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 152),
-    (2, HUFFMAN_EMIT_SYMBOL, 155),
-    (9, HUFFMAN_EMIT_SYMBOL, 155),
-    (23, HUFFMAN_EMIT_SYMBOL, 155),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 155),
-    (2, HUFFMAN_EMIT_SYMBOL, 157),
-    (9, HUFFMAN_EMIT_SYMBOL, 157),
-    (23, HUFFMAN_EMIT_SYMBOL, 157),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 157),
-    (2, HUFFMAN_EMIT_SYMBOL, 158),
-    (9, HUFFMAN_EMIT_SYMBOL, 158),
-    (23, HUFFMAN_EMIT_SYMBOL, 158),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 158),
+    '02029809029817029828039802029b09029b17029b28039b'
+    '02029d09029d17029d28039d02029e09029e17029e28039e'
 
     # Node 160
-    (3, HUFFMAN_EMIT_SYMBOL, 152),
-    (6, HUFFMAN_EMIT_SYMBOL, 152),
-    (10, HUFFMAN_EMIT_SYMBOL, 152),
-    (15, HUFFMAN_EMIT_SYMBOL, 152),
-    (24, HUFFMAN_EMIT_SYMBOL, 152),
-    (31, HUFFMAN_EMIT_SYMBOL, 152),
-    (41, HUFFMAN_EMIT_SYMBOL, 152),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 152),
-    (3, HUFFMAN_EMIT_SYMBOL, 155),
-    (6, HUFFMAN_EMIT_SYMBOL, 155),
-    (10, HUFFMAN_EMIT_SYMBOL, 155),
-    (15, HUFFMAN_EMIT_SYMBOL, 155),
-    (24, HUFFMAN_EMIT_SYMBOL, 155),
-    (31, HUFFMAN_EMIT_SYMBOL, 155),
-    (41, HUFFMAN_EMIT_SYMBOL, 155),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 155),
+    '0302980602980a02980f02981802981f0298290298380398'
+    '03029b06029b0a029b0f029b18029b1f029b29029b38039b'
 
     # Node 161
-    (3, HUFFMAN_EMIT_SYMBOL, 157),
-    (6, HUFFMAN_EMIT_SYMBOL, 157),
-    (10, HUFFMAN_EMIT_SYMBOL, 157),
-    (15, HUFFMAN_EMIT_SYMBOL, 157),
-    (24, HUFFMAN_EMIT_SYMBOL, 157),
-    (31, HUFFMAN_EMIT_SYMBOL, 157),
-    (41, HUFFMAN_EMIT_SYMBOL, 157),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 157),
-    (3, HUFFMAN_EMIT_SYMBOL, 158),
-    (6, HUFFMAN_EMIT_SYMBOL, 158),
-    (10, HUFFMAN_EMIT_SYMBOL, 158),
-    (15, HUFFMAN_EMIT_SYMBOL, 158),
-    (24, HUFFMAN_EMIT_SYMBOL, 158),
-    (31, HUFFMAN_EMIT_SYMBOL, 158),
-    (41, HUFFMAN_EMIT_SYMBOL, 158),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 158),
+    '03029d06029d0a029d0f029d18029d1f029d29029d38039d'
+    '03029e06029e0a029e0f029e18029e1f029e29029e38039e'
 
     # Node 162
-    (1, HUFFMAN_EMIT_SYMBOL, 165),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 165),
-    (1, HUFFMAN_EMIT_SYMBOL, 166),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 166),
-    (1, HUFFMAN_EMIT_SYMBOL, 168),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 168),
-    (1, HUFFMAN_EMIT_SYMBOL, 174),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 174),
-    (1, HUFFMAN_EMIT_SYMBOL, 175),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 175),
-    (1, HUFFMAN_EMIT_SYMBOL, 180),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 180),
-    (1, HUFFMAN_EMIT_SYMBOL, 182),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 182),
-    (1, HUFFMAN_EMIT_SYMBOL, 183),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 183),
+    '0102a51603a50102a61603a60102a81603a80102ae1603ae'
+    '0102af1603af0102b41603b40102b61603b60102b71603b7'
 
     # Node 163
-    (2, HUFFMAN_EMIT_SYMBOL, 165),
-    (9, HUFFMAN_EMIT_SYMBOL, 165),
-    (23, HUFFMAN_EMIT_SYMBOL, 165),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 165),
-    (2, HUFFMAN_EMIT_SYMBOL, 166),
-    (9, HUFFMAN_EMIT_SYMBOL, 166),
-    (23, HUFFMAN_EMIT_SYMBOL, 166),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 166),
-    (2, HUFFMAN_EMIT_SYMBOL, 168),
-    (9, HUFFMAN_EMIT_SYMBOL, 168),
-    (23, HUFFMAN_EMIT_SYMBOL, 168),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 168),
-    (2, HUFFMAN_EMIT_SYMBOL, 174),
-    (9, HUFFMAN_EMIT_SYMBOL, 174),
-    (23, HUFFMAN_EMIT_SYMBOL, 174),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 174),
+    '0202a50902a51702a52803a50202a60902a61702a62803a6'
+    '0202a80902a81702a82803a80202ae0902ae1702ae2803ae'
 
     # Node 164
-    (3, HUFFMAN_EMIT_SYMBOL, 165),
-    (6, HUFFMAN_EMIT_SYMBOL, 165),
-    (10, HUFFMAN_EMIT_SYMBOL, 165),
-    (15, HUFFMAN_EMIT_SYMBOL, 165),
-    (24, HUFFMAN_EMIT_SYMBOL, 165),
-    (31, HUFFMAN_EMIT_SYMBOL, 165),
-    (41, HUFFMAN_EMIT_SYMBOL, 165),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 165),
-    (3, HUFFMAN_EMIT_SYMBOL, 166),
-    (6, HUFFMAN_EMIT_SYMBOL, 166),
-    (10, HUFFMAN_EMIT_SYMBOL, 166),
-    (15, HUFFMAN_EMIT_SYMBOL, 166),
-    (24, HUFFMAN_EMIT_SYMBOL, 166),
-    (31, HUFFMAN_EMIT_SYMBOL, 166),
-    (41, HUFFMAN_EMIT_SYMBOL, 166),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 166),
+    '0302a50602a50a02a50f02a51802a51f02a52902a53803a5'
+    '0302a60602a60a02a60f02a61802a61f02a62902a63803a6'
 
     # Node 165
-    (3, HUFFMAN_EMIT_SYMBOL, 168),
-    (6, HUFFMAN_EMIT_SYMBOL, 168),
-    (10, HUFFMAN_EMIT_SYMBOL, 168),
-    (15, HUFFMAN_EMIT_SYMBOL, 168),
-    (24, HUFFMAN_EMIT_SYMBOL, 168),
-    (31, HUFFMAN_EMIT_SYMBOL, 168),
-    (41, HUFFMAN_EMIT_SYMBOL, 168),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 168),
-    (3, HUFFMAN_EMIT_SYMBOL, 174),
-    (6, HUFFMAN_EMIT_SYMBOL, 174),
-    (10, HUFFMAN_EMIT_SYMBOL, 174),
-    (15, HUFFMAN_EMIT_SYMBOL, 174),
-    (24, HUFFMAN_EMIT_SYMBOL, 174),
-    (31, HUFFMAN_EMIT_SYMBOL, 174),
-    (41, HUFFMAN_EMIT_SYMBOL, 174),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 174),
+    '0302a80602a80a02a80f02a81802a81f02a82902a83803a8'
+    '0302ae0602ae0a02ae0f02ae1802ae1f02ae2902ae3803ae'
 
     # Node 166
-    (2, HUFFMAN_EMIT_SYMBOL, 175),
-    (9, HUFFMAN_EMIT_SYMBOL, 175),
-    (23, HUFFMAN_EMIT_SYMBOL, 175),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 175),
-    (2, HUFFMAN_EMIT_SYMBOL, 180),
-    (9, HUFFMAN_EMIT_SYMBOL, 180),
-    (23, HUFFMAN_EMIT_SYMBOL, 180),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 180),
-    (2, HUFFMAN_EMIT_SYMBOL, 182),
-    (9, HUFFMAN_EMIT_SYMBOL, 182),
-    (23, HUFFMAN_EMIT_SYMBOL, 182),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 182),
-    (2, HUFFMAN_EMIT_SYMBOL, 183),
-    (9, HUFFMAN_EMIT_SYMBOL, 183),
-    (23, HUFFMAN_EMIT_SYMBOL, 183),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 183),
+    '0202af0902af1702af2803af0202b40902b41702b42803b4'
+    '0202b60902b61702b62803b60202b70902b71702b72803b7'
 
     # Node 167
-    (3, HUFFMAN_EMIT_SYMBOL, 175),
-    (6, HUFFMAN_EMIT_SYMBOL, 175),
-    (10, HUFFMAN_EMIT_SYMBOL, 175),
-    (15, HUFFMAN_EMIT_SYMBOL, 175),
-    (24, HUFFMAN_EMIT_SYMBOL, 175),
-    (31, HUFFMAN_EMIT_SYMBOL, 175),
-    (41, HUFFMAN_EMIT_SYMBOL, 175),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 175),
-    (3, HUFFMAN_EMIT_SYMBOL, 180),
-    (6, HUFFMAN_EMIT_SYMBOL, 180),
-    (10, HUFFMAN_EMIT_SYMBOL, 180),
-    (15, HUFFMAN_EMIT_SYMBOL, 180),
-    (24, HUFFMAN_EMIT_SYMBOL, 180),
-    (31, HUFFMAN_EMIT_SYMBOL, 180),
-    (41, HUFFMAN_EMIT_SYMBOL, 180),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 180),
+    '0302af0602af0a02af0f02af1802af1f02af2902af3803af'
+    '0302b40602b40a02b40f02b41802b41f02b42902b43803b4'
 
     # Node 168
-    (3, HUFFMAN_EMIT_SYMBOL, 182),
-    (6, HUFFMAN_EMIT_SYMBOL, 182),
-    (10, HUFFMAN_EMIT_SYMBOL, 182),
-    (15, HUFFMAN_EMIT_SYMBOL, 182),
-    (24, HUFFMAN_EMIT_SYMBOL, 182),
-    (31, HUFFMAN_EMIT_SYMBOL, 182),
-    (41, HUFFMAN_EMIT_SYMBOL, 182),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 182),
-    (3, HUFFMAN_EMIT_SYMBOL, 183),
-    (6, HUFFMAN_EMIT_SYMBOL, 183),
-    (10, HUFFMAN_EMIT_SYMBOL, 183),
-    (15, HUFFMAN_EMIT_SYMBOL, 183),
-    (24, HUFFMAN_EMIT_SYMBOL, 183),
-    (31, HUFFMAN_EMIT_SYMBOL, 183),
-    (41, HUFFMAN_EMIT_SYMBOL, 183),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 183),
+    '0302b60602b60a02b60f02b61802b61f02b62902b63803b6'
+    '0302b70602b70a02b70f02b71802b71f02b72902b73803b7'
 
     # Node 169
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 188),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 191),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 197),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 231),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 239),
-    (176, 0, 0),
-    (178, 0, 0),
-    (179, 0, 0),
-    (183, 0, 0),
-    (184, 0, 0),
-    (186, 0, 0),
-    (187, 0, 0),
-    (192, 0, 0),
-    (199, 0, 0),
-    (208, 0, 0),
-    (223, 0, 0),
+    '0003bc0003bf0003c50003e70003efb00000b20000b30000'
+    'b70000b80000ba0000bb0000c00000c70000d00000df0000'
 
     # Node 170
-    (1, HUFFMAN_EMIT_SYMBOL, 188),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 188),
-    (1, HUFFMAN_EMIT_SYMBOL, 191),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 191),
-    (1, HUFFMAN_EMIT_SYMBOL, 197),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 197),
-    (1, HUFFMAN_EMIT_SYMBOL, 231),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 231),
-    (1, HUFFMAN_EMIT_SYMBOL, 239),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 239),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 9),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 142),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 144),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 145),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 148),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 159),
+    '0102bc1603bc0102bf1603bf0102c51603c50102e71603e7'
+    '0102ef1603ef00030900038e00039000039100039400039f'
 
     # Node 171
-    (2, HUFFMAN_EMIT_SYMBOL, 188),
-    (9, HUFFMAN_EMIT_SYMBOL, 188),
-    (23, HUFFMAN_EMIT_SYMBOL, 188),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 188),
-    (2, HUFFMAN_EMIT_SYMBOL, 191),
-    (9, HUFFMAN_EMIT_SYMBOL, 191),
-    (23, HUFFMAN_EMIT_SYMBOL, 191),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 191),
-    (2, HUFFMAN_EMIT_SYMBOL, 197),
-    (9, HUFFMAN_EMIT_SYMBOL, 197),
-    (23, HUFFMAN_EMIT_SYMBOL, 197),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 197),
-    (2, HUFFMAN_EMIT_SYMBOL, 231),
-    (9, HUFFMAN_EMIT_SYMBOL, 231),
-    (23, HUFFMAN_EMIT_SYMBOL, 231),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 231),
+    '0202bc0902bc1702bc2803bc0202bf0902bf1702bf2803bf'
+    '0202c50902c51702c52803c50202e70902e71702e72803e7'
 
     # Node 172
-    (3, HUFFMAN_EMIT_SYMBOL, 188),
-    (6, HUFFMAN_EMIT_SYMBOL, 188),
-    (10, HUFFMAN_EMIT_SYMBOL, 188),
-    (15, HUFFMAN_EMIT_SYMBOL, 188),
-    (24, HUFFMAN_EMIT_SYMBOL, 188),
-    (31, HUFFMAN_EMIT_SYMBOL, 188),
-    (41, HUFFMAN_EMIT_SYMBOL, 188),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 188),
-    (3, HUFFMAN_EMIT_SYMBOL, 191),
-    (6, HUFFMAN_EMIT_SYMBOL, 191),
-    (10, HUFFMAN_EMIT_SYMBOL, 191),
-    (15, HUFFMAN_EMIT_SYMBOL, 191),
-    (24, HUFFMAN_EMIT_SYMBOL, 191),
-    (31, HUFFMAN_EMIT_SYMBOL, 191),
-    (41, HUFFMAN_EMIT_SYMBOL, 191),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 191),
+    '0302bc0602bc0a02bc0f02bc1802bc1f02bc2902bc3803bc'
+    '0302bf0602bf0a02bf0f02bf1802bf1f02bf2902bf3803bf'
 
     # Node 173
-    (3, HUFFMAN_EMIT_SYMBOL, 197),
-    (6, HUFFMAN_EMIT_SYMBOL, 197),
-    (10, HUFFMAN_EMIT_SYMBOL, 197),
-    (15, HUFFMAN_EMIT_SYMBOL, 197),
-    (24, HUFFMAN_EMIT_SYMBOL, 197),
-    (31, HUFFMAN_EMIT_SYMBOL, 197),
-    (41, HUFFMAN_EMIT_SYMBOL, 197),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 197),
-    (3, HUFFMAN_EMIT_SYMBOL, 231),
-    (6, HUFFMAN_EMIT_SYMBOL, 231),
-    (10, HUFFMAN_EMIT_SYMBOL, 231),
-    (15, HUFFMAN_EMIT_SYMBOL, 231),
-    (24, HUFFMAN_EMIT_SYMBOL, 231),
-    (31, HUFFMAN_EMIT_SYMBOL, 231),
-    (41, HUFFMAN_EMIT_SYMBOL, 231),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 231),
+    '0302c50602c50a02c50f02c51802c51f02c52902c53803c5'
+    '0302e70602e70a02e70f02e71802e71f02e72902e73803e7'
 
     # Node 174
-    (2, HUFFMAN_EMIT_SYMBOL, 239),
-    (9, HUFFMAN_EMIT_SYMBOL, 239),
-    (23, HUFFMAN_EMIT_SYMBOL, 239),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 239),
-    (1, HUFFMAN_EMIT_SYMBOL, 9),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 9),
-    (1, HUFFMAN_EMIT_SYMBOL, 142),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 142),
-    (1, HUFFMAN_EMIT_SYMBOL, 144),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 144),
-    (1, HUFFMAN_EMIT_SYMBOL, 145),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 145),
-    (1, HUFFMAN_EMIT_SYMBOL, 148),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 148),
-    (1, HUFFMAN_EMIT_SYMBOL, 159),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 159),
+    '0202ef0902ef1702ef2803ef01020916030901028e16038e'
+    '01029016039001029116039101029416039401029f16039f'
 
     # Node 175
-    (3, HUFFMAN_EMIT_SYMBOL, 239),
-    (6, HUFFMAN_EMIT_SYMBOL, 239),
-    (10, HUFFMAN_EMIT_SYMBOL, 239),
-    (15, HUFFMAN_EMIT_SYMBOL, 239),
-    (24, HUFFMAN_EMIT_SYMBOL, 239),
-    (31, HUFFMAN_EMIT_SYMBOL, 239),
-    (41, HUFFMAN_EMIT_SYMBOL, 239),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 239),
-    (2, HUFFMAN_EMIT_SYMBOL, 9),
-    (9, HUFFMAN_EMIT_SYMBOL, 9),
-    (23, HUFFMAN_EMIT_SYMBOL, 9),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 9),
-    (2, HUFFMAN_EMIT_SYMBOL, 142),
-    (9, HUFFMAN_EMIT_SYMBOL, 142),
-    (23, HUFFMAN_EMIT_SYMBOL, 142),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 142),
+    '0302ef0602ef0a02ef0f02ef1802ef1f02ef2902ef3803ef'
+    '02020909020917020928030902028e09028e17028e28038e'
 
     # Node 176
-    (3, HUFFMAN_EMIT_SYMBOL, 9),
-    (6, HUFFMAN_EMIT_SYMBOL, 9),
-    (10, HUFFMAN_EMIT_SYMBOL, 9),
-    (15, HUFFMAN_EMIT_SYMBOL, 9),
-    (24, HUFFMAN_EMIT_SYMBOL, 9),
-    (31, HUFFMAN_EMIT_SYMBOL, 9),
-    (41, HUFFMAN_EMIT_SYMBOL, 9),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 9),
-    (3, HUFFMAN_EMIT_SYMBOL, 142),
-    (6, HUFFMAN_EMIT_SYMBOL, 142),
-    (10, HUFFMAN_EMIT_SYMBOL, 142),
-    (15, HUFFMAN_EMIT_SYMBOL, 142),
-    (24, HUFFMAN_EMIT_SYMBOL, 142),
-    (31, HUFFMAN_EMIT_SYMBOL, 142),
-    (41, HUFFMAN_EMIT_SYMBOL, 142),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 142),
+    '0302090602090a02090f02091802091f0209290209380309'
+    '03028e06028e0a028e0f028e18028e1f028e29028e38038e'
 
     # Node 177
-    (2, HUFFMAN_EMIT_SYMBOL, 144),
-    (9, HUFFMAN_EMIT_SYMBOL, 144),
-    (23, HUFFMAN_EMIT_SYMBOL, 144),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 144),
-    (2, HUFFMAN_EMIT_SYMBOL, 145),
-    (9, HUFFMAN_EMIT_SYMBOL, 145),
-    (23, HUFFMAN_EMIT_SYMBOL, 145),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 145),
-    (2, HUFFMAN_EMIT_SYMBOL, 148),
-    (9, HUFFMAN_EMIT_SYMBOL, 148),
-    (23, HUFFMAN_EMIT_SYMBOL, 148),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 148),
-    (2, HUFFMAN_EMIT_SYMBOL, 159),
-    (9, HUFFMAN_EMIT_SYMBOL, 159),
-    (23, HUFFMAN_EMIT_SYMBOL, 159),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 159),
+    '020290090290170290280390020291090291170291280391'
+    '02029409029417029428039402029f09029f17029f28039f'
 
     # Node 178
-    (3, HUFFMAN_EMIT_SYMBOL, 144),
-    (6, HUFFMAN_EMIT_SYMBOL, 144),
-    (10, HUFFMAN_EMIT_SYMBOL, 144),
-    (15, HUFFMAN_EMIT_SYMBOL, 144),
-    (24, HUFFMAN_EMIT_SYMBOL, 144),
-    (31, HUFFMAN_EMIT_SYMBOL, 144),
-    (41, HUFFMAN_EMIT_SYMBOL, 144),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 144),
-    (3, HUFFMAN_EMIT_SYMBOL, 145),
-    (6, HUFFMAN_EMIT_SYMBOL, 145),
-    (10, HUFFMAN_EMIT_SYMBOL, 145),
-    (15, HUFFMAN_EMIT_SYMBOL, 145),
-    (24, HUFFMAN_EMIT_SYMBOL, 145),
-    (31, HUFFMAN_EMIT_SYMBOL, 145),
-    (41, HUFFMAN_EMIT_SYMBOL, 145),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 145),
+    '0302900602900a02900f02901802901f0290290290380390'
+    '0302910602910a02910f02911802911f0291290291380391'
 
     # Node 179
-    (3, HUFFMAN_EMIT_SYMBOL, 148),
-    (6, HUFFMAN_EMIT_SYMBOL, 148),
-    (10, HUFFMAN_EMIT_SYMBOL, 148),
-    (15, HUFFMAN_EMIT_SYMBOL, 148),
-    (24, HUFFMAN_EMIT_SYMBOL, 148),
-    (31, HUFFMAN_EMIT_SYMBOL, 148),
-    (41, HUFFMAN_EMIT_SYMBOL, 148),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 148),
-    (3, HUFFMAN_EMIT_SYMBOL, 159),
-    (6, HUFFMAN_EMIT_SYMBOL, 159),
-    (10, HUFFMAN_EMIT_SYMBOL, 159),
-    (15, HUFFMAN_EMIT_SYMBOL, 159),
-    (24, HUFFMAN_EMIT_SYMBOL, 159),
-    (31, HUFFMAN_EMIT_SYMBOL, 159),
-    (41, HUFFMAN_EMIT_SYMBOL, 159),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 159),
+    '0302940602940a02940f02941802941f0294290294380394'
+    '03029f06029f0a029f0f029f18029f1f029f29029f38039f'
 
     # Node 180
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 171),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 206),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 215),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 225),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 236),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 237),
-    (188, 0, 0),
-    (189, 0, 0),
-    (193, 0, 0),
-    (196, 0, 0),
-    (200, 0, 0),
-    (203, 0, 0),
-    (209, 0, 0),
-    (216, 0, 0),
-    (224, 0, 0),
-    (238, 0, 0),
+    '0003ab0003ce0003d70003e10003ec0003edbc0000bd0000'
+    'c10000c40000c80000cb0000d10000d80000e00000ee0000'
 
     # Node 181
-    (1, HUFFMAN_EMIT_SYMBOL, 171),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 171),
-    (1, HUFFMAN_EMIT_SYMBOL, 206),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 206),
-    (1, HUFFMAN_EMIT_SYMBOL, 215),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 215),
-    (1, HUFFMAN_EMIT_SYMBOL, 225),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 225),
-    (1, HUFFMAN_EMIT_SYMBOL, 236),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 236),
-    (1, HUFFMAN_EMIT_SYMBOL, 237),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 237),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 199),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 207),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 234),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 235),
+    '0102ab1603ab0102ce1603ce0102d71603d70102e11603e1'
+    '0102ec1603ec0102ed1603ed0003c70003cf0003ea0003eb'
 
     # Node 182
-    (2, HUFFMAN_EMIT_SYMBOL, 171),
-    (9, HUFFMAN_EMIT_SYMBOL, 171),
-    (23, HUFFMAN_EMIT_SYMBOL, 171),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 171),
-    (2, HUFFMAN_EMIT_SYMBOL, 206),
-    (9, HUFFMAN_EMIT_SYMBOL, 206),
-    (23, HUFFMAN_EMIT_SYMBOL, 206),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 206),
-    (2, HUFFMAN_EMIT_SYMBOL, 215),
-    (9, HUFFMAN_EMIT_SYMBOL, 215),
-    (23, HUFFMAN_EMIT_SYMBOL, 215),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 215),
-    (2, HUFFMAN_EMIT_SYMBOL, 225),
-    (9, HUFFMAN_EMIT_SYMBOL, 225),
-    (23, HUFFMAN_EMIT_SYMBOL, 225),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 225),
+    '0202ab0902ab1702ab2803ab0202ce0902ce1702ce2803ce'
+    '0202d70902d71702d72803d70202e10902e11702e12803e1'
 
     # Node 183
-    (3, HUFFMAN_EMIT_SYMBOL, 171),
-    (6, HUFFMAN_EMIT_SYMBOL, 171),
-    (10, HUFFMAN_EMIT_SYMBOL, 171),
-    (15, HUFFMAN_EMIT_SYMBOL, 171),
-    (24, HUFFMAN_EMIT_SYMBOL, 171),
-    (31, HUFFMAN_EMIT_SYMBOL, 171),
-    (41, HUFFMAN_EMIT_SYMBOL, 171),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 171),
-    (3, HUFFMAN_EMIT_SYMBOL, 206),
-    (6, HUFFMAN_EMIT_SYMBOL, 206),
-    (10, HUFFMAN_EMIT_SYMBOL, 206),
-    (15, HUFFMAN_EMIT_SYMBOL, 206),
-    (24, HUFFMAN_EMIT_SYMBOL, 206),
-    (31, HUFFMAN_EMIT_SYMBOL, 206),
-    (41, HUFFMAN_EMIT_SYMBOL, 206),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 206),
+    '0302ab0602ab0a02ab0f02ab1802ab1f02ab2902ab3803ab'
+    '0302ce0602ce0a02ce0f02ce1802ce1f02ce2902ce3803ce'
 
     # Node 184
-    (3, HUFFMAN_EMIT_SYMBOL, 215),
-    (6, HUFFMAN_EMIT_SYMBOL, 215),
-    (10, HUFFMAN_EMIT_SYMBOL, 215),
-    (15, HUFFMAN_EMIT_SYMBOL, 215),
-    (24, HUFFMAN_EMIT_SYMBOL, 215),
-    (31, HUFFMAN_EMIT_SYMBOL, 215),
-    (41, HUFFMAN_EMIT_SYMBOL, 215),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 215),
-    (3, HUFFMAN_EMIT_SYMBOL, 225),
-    (6, HUFFMAN_EMIT_SYMBOL, 225),
-    (10, HUFFMAN_EMIT_SYMBOL, 225),
-    (15, HUFFMAN_EMIT_SYMBOL, 225),
-    (24, HUFFMAN_EMIT_SYMBOL, 225),
-    (31, HUFFMAN_EMIT_SYMBOL, 225),
-    (41, HUFFMAN_EMIT_SYMBOL, 225),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 225),
+    '0302d70602d70a02d70f02d71802d71f02d72902d73803d7'
+    '0302e10602e10a02e10f02e11802e11f02e12902e13803e1'
 
     # Node 185
-    (2, HUFFMAN_EMIT_SYMBOL, 236),
-    (9, HUFFMAN_EMIT_SYMBOL, 236),
-    (23, HUFFMAN_EMIT_SYMBOL, 236),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 236),
-    (2, HUFFMAN_EMIT_SYMBOL, 237),
-    (9, HUFFMAN_EMIT_SYMBOL, 237),
-    (23, HUFFMAN_EMIT_SYMBOL, 237),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 237),
-    (1, HUFFMAN_EMIT_SYMBOL, 199),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 199),
-    (1, HUFFMAN_EMIT_SYMBOL, 207),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 207),
-    (1, HUFFMAN_EMIT_SYMBOL, 234),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 234),
-    (1, HUFFMAN_EMIT_SYMBOL, 235),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 235),
+    '0202ec0902ec1702ec2803ec0202ed0902ed1702ed2803ed'
+    '0102c71603c70102cf1603cf0102ea1603ea0102eb1603eb'
 
     # Node 186
-    (3, HUFFMAN_EMIT_SYMBOL, 236),
-    (6, HUFFMAN_EMIT_SYMBOL, 236),
-    (10, HUFFMAN_EMIT_SYMBOL, 236),
-    (15, HUFFMAN_EMIT_SYMBOL, 236),
-    (24, HUFFMAN_EMIT_SYMBOL, 236),
-    (31, HUFFMAN_EMIT_SYMBOL, 236),
-    (41, HUFFMAN_EMIT_SYMBOL, 236),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 236),
-    (3, HUFFMAN_EMIT_SYMBOL, 237),
-    (6, HUFFMAN_EMIT_SYMBOL, 237),
-    (10, HUFFMAN_EMIT_SYMBOL, 237),
-    (15, HUFFMAN_EMIT_SYMBOL, 237),
-    (24, HUFFMAN_EMIT_SYMBOL, 237),
-    (31, HUFFMAN_EMIT_SYMBOL, 237),
-    (41, HUFFMAN_EMIT_SYMBOL, 237),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 237),
+    '0302ec0602ec0a02ec0f02ec1802ec1f02ec2902ec3803ec'
+    '0302ed0602ed0a02ed0f02ed1802ed1f02ed2902ed3803ed'
 
     # Node 187
-    (2, HUFFMAN_EMIT_SYMBOL, 199),
-    (9, HUFFMAN_EMIT_SYMBOL, 199),
-    (23, HUFFMAN_EMIT_SYMBOL, 199),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 199),
-    (2, HUFFMAN_EMIT_SYMBOL, 207),
-    (9, HUFFMAN_EMIT_SYMBOL, 207),
-    (23, HUFFMAN_EMIT_SYMBOL, 207),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 207),
-    (2, HUFFMAN_EMIT_SYMBOL, 234),
-    (9, HUFFMAN_EMIT_SYMBOL, 234),
-    (23, HUFFMAN_EMIT_SYMBOL, 234),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 234),
-    (2, HUFFMAN_EMIT_SYMBOL, 235),
-    (9, HUFFMAN_EMIT_SYMBOL, 235),
-    (23, HUFFMAN_EMIT_SYMBOL, 235),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 235),
+    '0202c70902c71702c72803c70202cf0902cf1702cf2803cf'
+    '0202ea0902ea1702ea2803ea0202eb0902eb1702eb2803eb'
 
     # Node 188
-    (3, HUFFMAN_EMIT_SYMBOL, 199),
-    (6, HUFFMAN_EMIT_SYMBOL, 199),
-    (10, HUFFMAN_EMIT_SYMBOL, 199),
-    (15, HUFFMAN_EMIT_SYMBOL, 199),
-    (24, HUFFMAN_EMIT_SYMBOL, 199),
-    (31, HUFFMAN_EMIT_SYMBOL, 199),
-    (41, HUFFMAN_EMIT_SYMBOL, 199),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 199),
-    (3, HUFFMAN_EMIT_SYMBOL, 207),
-    (6, HUFFMAN_EMIT_SYMBOL, 207),
-    (10, HUFFMAN_EMIT_SYMBOL, 207),
-    (15, HUFFMAN_EMIT_SYMBOL, 207),
-    (24, HUFFMAN_EMIT_SYMBOL, 207),
-    (31, HUFFMAN_EMIT_SYMBOL, 207),
-    (41, HUFFMAN_EMIT_SYMBOL, 207),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 207),
+    '0302c70602c70a02c70f02c71802c71f02c72902c73803c7'
+    '0302cf0602cf0a02cf0f02cf1802cf1f02cf2902cf3803cf'
 
     # Node 189
-    (3, HUFFMAN_EMIT_SYMBOL, 234),
-    (6, HUFFMAN_EMIT_SYMBOL, 234),
-    (10, HUFFMAN_EMIT_SYMBOL, 234),
-    (15, HUFFMAN_EMIT_SYMBOL, 234),
-    (24, HUFFMAN_EMIT_SYMBOL, 234),
-    (31, HUFFMAN_EMIT_SYMBOL, 234),
-    (41, HUFFMAN_EMIT_SYMBOL, 234),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 234),
-    (3, HUFFMAN_EMIT_SYMBOL, 235),
-    (6, HUFFMAN_EMIT_SYMBOL, 235),
-    (10, HUFFMAN_EMIT_SYMBOL, 235),
-    (15, HUFFMAN_EMIT_SYMBOL, 235),
-    (24, HUFFMAN_EMIT_SYMBOL, 235),
-    (31, HUFFMAN_EMIT_SYMBOL, 235),
-    (41, HUFFMAN_EMIT_SYMBOL, 235),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 235),
+    '0302ea0602ea0a02ea0f02ea1802ea1f02ea2902ea3803ea'
+    '0302eb0602eb0a02eb0f02eb1802eb1f02eb2902eb3803eb'
 
     # Node 190
-    (194, 0, 0),
-    (195, 0, 0),
-    (197, 0, 0),
-    (198, 0, 0),
-    (201, 0, 0),
-    (202, 0, 0),
-    (204, 0, 0),
-    (205, 0, 0),
-    (210, 0, 0),
-    (213, 0, 0),
-    (217, 0, 0),
-    (220, 0, 0),
-    (225, 0, 0),
-    (231, 0, 0),
-    (239, 0, 0),
-    (246, 0, 0),
+    'c20000c30000c50000c60000c90000ca0000cc0000cd0000'
+    'd20000d50000d90000dc0000e10000e70000ef0000f60000'
 
     # Node 191
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 192),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 193),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 200),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 201),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 202),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 205),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 210),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 213),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 218),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 219),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 238),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 240),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 242),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 243),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 255),
-    (206, 0, 0),
+    '0003c00003c10003c80003c90003ca0003cd0003d20003d5'
+    '0003da0003db0003ee0003f00003f20003f30003ffce0000'
 
     # Node 192
-    (1, HUFFMAN_EMIT_SYMBOL, 192),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 192),
-    (1, HUFFMAN_EMIT_SYMBOL, 193),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 193),
-    (1, HUFFMAN_EMIT_SYMBOL, 200),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 200),
-    (1, HUFFMAN_EMIT_SYMBOL, 201),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 201),
-    (1, HUFFMAN_EMIT_SYMBOL, 202),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 202),
-    (1, HUFFMAN_EMIT_SYMBOL, 205),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 205),
-    (1, HUFFMAN_EMIT_SYMBOL, 210),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 210),
-    (1, HUFFMAN_EMIT_SYMBOL, 213),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 213),
+    '0102c01603c00102c11603c10102c81603c80102c91603c9'
+    '0102ca1603ca0102cd1603cd0102d21603d20102d51603d5'
 
     # Node 193
-    (2, HUFFMAN_EMIT_SYMBOL, 192),
-    (9, HUFFMAN_EMIT_SYMBOL, 192),
-    (23, HUFFMAN_EMIT_SYMBOL, 192),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 192),
-    (2, HUFFMAN_EMIT_SYMBOL, 193),
-    (9, HUFFMAN_EMIT_SYMBOL, 193),
-    (23, HUFFMAN_EMIT_SYMBOL, 193),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 193),
-    (2, HUFFMAN_EMIT_SYMBOL, 200),
-    (9, HUFFMAN_EMIT_SYMBOL, 200),
-    (23, HUFFMAN_EMIT_SYMBOL, 200),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 200),
-    (2, HUFFMAN_EMIT_SYMBOL, 201),
-    (9, HUFFMAN_EMIT_SYMBOL, 201),
-    (23, HUFFMAN_EMIT_SYMBOL, 201),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 201),
+    '0202c00902c01702c02803c00202c10902c11702c12803c1'
+    '0202c80902c81702c82803c80202c90902c91702c92803c9'
 
     # Node 194
-    (3, HUFFMAN_EMIT_SYMBOL, 192),
-    (6, HUFFMAN_EMIT_SYMBOL, 192),
-    (10, HUFFMAN_EMIT_SYMBOL, 192),
-    (15, HUFFMAN_EMIT_SYMBOL, 192),
-    (24, HUFFMAN_EMIT_SYMBOL, 192),
-    (31, HUFFMAN_EMIT_SYMBOL, 192),
-    (41, HUFFMAN_EMIT_SYMBOL, 192),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 192),
-    (3, HUFFMAN_EMIT_SYMBOL, 193),
-    (6, HUFFMAN_EMIT_SYMBOL, 193),
-    (10, HUFFMAN_EMIT_SYMBOL, 193),
-    (15, HUFFMAN_EMIT_SYMBOL, 193),
-    (24, HUFFMAN_EMIT_SYMBOL, 193),
-    (31, HUFFMAN_EMIT_SYMBOL, 193),
-    (41, HUFFMAN_EMIT_SYMBOL, 193),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 193),
+    '0302c00602c00a02c00f02c01802c01f02c02902c03803c0'
+    '0302c10602c10a02c10f02c11802c11f02c12902c13803c1'
 
     # Node 195
-    (3, HUFFMAN_EMIT_SYMBOL, 200),
-    (6, HUFFMAN_EMIT_SYMBOL, 200),
-    (10, HUFFMAN_EMIT_SYMBOL, 200),
-    (15, HUFFMAN_EMIT_SYMBOL, 200),
-    (24, HUFFMAN_EMIT_SYMBOL, 200),
-    (31, HUFFMAN_EMIT_SYMBOL, 200),
-    (41, HUFFMAN_EMIT_SYMBOL, 200),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 200),
-    (3, HUFFMAN_EMIT_SYMBOL, 201),
-    (6, HUFFMAN_EMIT_SYMBOL, 201),
-    (10, HUFFMAN_EMIT_SYMBOL, 201),
-    (15, HUFFMAN_EMIT_SYMBOL, 201),
-    (24, HUFFMAN_EMIT_SYMBOL, 201),
-    (31, HUFFMAN_EMIT_SYMBOL, 201),
-    (41, HUFFMAN_EMIT_SYMBOL, 201),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 201),
+    '0302c80602c80a02c80f02c81802c81f02c82902c83803c8'
+    '0302c90602c90a02c90f02c91802c91f02c92902c93803c9'
 
     # Node 196
-    (2, HUFFMAN_EMIT_SYMBOL, 202),
-    (9, HUFFMAN_EMIT_SYMBOL, 202),
-    (23, HUFFMAN_EMIT_SYMBOL, 202),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 202),
-    (2, HUFFMAN_EMIT_SYMBOL, 205),
-    (9, HUFFMAN_EMIT_SYMBOL, 205),
-    (23, HUFFMAN_EMIT_SYMBOL, 205),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 205),
-    (2, HUFFMAN_EMIT_SYMBOL, 210),
-    (9, HUFFMAN_EMIT_SYMBOL, 210),
-    (23, HUFFMAN_EMIT_SYMBOL, 210),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 210),
-    (2, HUFFMAN_EMIT_SYMBOL, 213),
-    (9, HUFFMAN_EMIT_SYMBOL, 213),
-    (23, HUFFMAN_EMIT_SYMBOL, 213),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 213),
+    '0202ca0902ca1702ca2803ca0202cd0902cd1702cd2803cd'
+    '0202d20902d21702d22803d20202d50902d51702d52803d5'
 
     # Node 197
-    (3, HUFFMAN_EMIT_SYMBOL, 202),
-    (6, HUFFMAN_EMIT_SYMBOL, 202),
-    (10, HUFFMAN_EMIT_SYMBOL, 202),
-    (15, HUFFMAN_EMIT_SYMBOL, 202),
-    (24, HUFFMAN_EMIT_SYMBOL, 202),
-    (31, HUFFMAN_EMIT_SYMBOL, 202),
-    (41, HUFFMAN_EMIT_SYMBOL, 202),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 202),
-    (3, HUFFMAN_EMIT_SYMBOL, 205),
-    (6, HUFFMAN_EMIT_SYMBOL, 205),
-    (10, HUFFMAN_EMIT_SYMBOL, 205),
-    (15, HUFFMAN_EMIT_SYMBOL, 205),
-    (24, HUFFMAN_EMIT_SYMBOL, 205),
-    (31, HUFFMAN_EMIT_SYMBOL, 205),
-    (41, HUFFMAN_EMIT_SYMBOL, 205),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 205),
+    '0302ca0602ca0a02ca0f02ca1802ca1f02ca2902ca3803ca'
+    '0302cd0602cd0a02cd0f02cd1802cd1f02cd2902cd3803cd'
 
     # Node 198
-    (3, HUFFMAN_EMIT_SYMBOL, 210),
-    (6, HUFFMAN_EMIT_SYMBOL, 210),
-    (10, HUFFMAN_EMIT_SYMBOL, 210),
-    (15, HUFFMAN_EMIT_SYMBOL, 210),
-    (24, HUFFMAN_EMIT_SYMBOL, 210),
-    (31, HUFFMAN_EMIT_SYMBOL, 210),
-    (41, HUFFMAN_EMIT_SYMBOL, 210),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 210),
-    (3, HUFFMAN_EMIT_SYMBOL, 213),
-    (6, HUFFMAN_EMIT_SYMBOL, 213),
-    (10, HUFFMAN_EMIT_SYMBOL, 213),
-    (15, HUFFMAN_EMIT_SYMBOL, 213),
-    (24, HUFFMAN_EMIT_SYMBOL, 213),
-    (31, HUFFMAN_EMIT_SYMBOL, 213),
-    (41, HUFFMAN_EMIT_SYMBOL, 213),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 213),
+    '0302d20602d20a02d20f02d21802d21f02d22902d23803d2'
+    '0302d50602d50a02d50f02d51802d51f02d52902d53803d5'
 
     # Node 199
-    (1, HUFFMAN_EMIT_SYMBOL, 218),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 218),
-    (1, HUFFMAN_EMIT_SYMBOL, 219),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 219),
-    (1, HUFFMAN_EMIT_SYMBOL, 238),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 238),
-    (1, HUFFMAN_EMIT_SYMBOL, 240),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 240),
-    (1, HUFFMAN_EMIT_SYMBOL, 242),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 242),
-    (1, HUFFMAN_EMIT_SYMBOL, 243),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 243),
-    (1, HUFFMAN_EMIT_SYMBOL, 255),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 255),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 203),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 204),
+    '0102da1603da0102db1603db0102ee1603ee0102f01603f0'
+    '0102f21603f20102f31603f30102ff1603ff0003cb0003cc'
 
     # Node 200
-    (2, HUFFMAN_EMIT_SYMBOL, 218),
-    (9, HUFFMAN_EMIT_SYMBOL, 218),
-    (23, HUFFMAN_EMIT_SYMBOL, 218),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 218),
-    (2, HUFFMAN_EMIT_SYMBOL, 219),
-    (9, HUFFMAN_EMIT_SYMBOL, 219),
-    (23, HUFFMAN_EMIT_SYMBOL, 219),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 219),
-    (2, HUFFMAN_EMIT_SYMBOL, 238),
-    (9, HUFFMAN_EMIT_SYMBOL, 238),
-    (23, HUFFMAN_EMIT_SYMBOL, 238),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 238),
-    (2, HUFFMAN_EMIT_SYMBOL, 240),
-    (9, HUFFMAN_EMIT_SYMBOL, 240),
-    (23, HUFFMAN_EMIT_SYMBOL, 240),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 240),
+    '0202da0902da1702da2803da0202db0902db1702db2803db'
+    '0202ee0902ee1702ee2803ee0202f00902f01702f02803f0'
 
     # Node 201
-    (3, HUFFMAN_EMIT_SYMBOL, 218),
-    (6, HUFFMAN_EMIT_SYMBOL, 218),
-    (10, HUFFMAN_EMIT_SYMBOL, 218),
-    (15, HUFFMAN_EMIT_SYMBOL, 218),
-    (24, HUFFMAN_EMIT_SYMBOL, 218),
-    (31, HUFFMAN_EMIT_SYMBOL, 218),
-    (41, HUFFMAN_EMIT_SYMBOL, 218),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 218),
-    (3, HUFFMAN_EMIT_SYMBOL, 219),
-    (6, HUFFMAN_EMIT_SYMBOL, 219),
-    (10, HUFFMAN_EMIT_SYMBOL, 219),
-    (15, HUFFMAN_EMIT_SYMBOL, 219),
-    (24, HUFFMAN_EMIT_SYMBOL, 219),
-    (31, HUFFMAN_EMIT_SYMBOL, 219),
-    (41, HUFFMAN_EMIT_SYMBOL, 219),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 219),
+    '0302da0602da0a02da0f02da1802da1f02da2902da3803da'
+    '0302db0602db0a02db0f02db1802db1f02db2902db3803db'
 
     # Node 202
-    (3, HUFFMAN_EMIT_SYMBOL, 238),
-    (6, HUFFMAN_EMIT_SYMBOL, 238),
-    (10, HUFFMAN_EMIT_SYMBOL, 238),
-    (15, HUFFMAN_EMIT_SYMBOL, 238),
-    (24, HUFFMAN_EMIT_SYMBOL, 238),
-    (31, HUFFMAN_EMIT_SYMBOL, 238),
-    (41, HUFFMAN_EMIT_SYMBOL, 238),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 238),
-    (3, HUFFMAN_EMIT_SYMBOL, 240),
-    (6, HUFFMAN_EMIT_SYMBOL, 240),
-    (10, HUFFMAN_EMIT_SYMBOL, 240),
-    (15, HUFFMAN_EMIT_SYMBOL, 240),
-    (24, HUFFMAN_EMIT_SYMBOL, 240),
-    (31, HUFFMAN_EMIT_SYMBOL, 240),
-    (41, HUFFMAN_EMIT_SYMBOL, 240),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 240),
+    '0302ee0602ee0a02ee0f02ee1802ee1f02ee2902ee3803ee'
+    '0302f00602f00a02f00f02f01802f01f02f02902f03803f0'
 
     # Node 203
-    (2, HUFFMAN_EMIT_SYMBOL, 242),
-    (9, HUFFMAN_EMIT_SYMBOL, 242),
-    (23, HUFFMAN_EMIT_SYMBOL, 242),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 242),
-    (2, HUFFMAN_EMIT_SYMBOL, 243),
-    (9, HUFFMAN_EMIT_SYMBOL, 243),
-    (23, HUFFMAN_EMIT_SYMBOL, 243),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 243),
-    (2, HUFFMAN_EMIT_SYMBOL, 255),
-    (9, HUFFMAN_EMIT_SYMBOL, 255),
-    (23, HUFFMAN_EMIT_SYMBOL, 255),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 255),
-    (1, HUFFMAN_EMIT_SYMBOL, 203),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 203),
-    (1, HUFFMAN_EMIT_SYMBOL, 204),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 204),
+    '0202f20902f21702f22803f20202f30902f31702f32803f3'
+    '0202ff0902ff1702ff2803ff0102cb1603cb0102cc1603cc'
 
     # Node 204
-    (3, HUFFMAN_EMIT_SYMBOL, 242),
-    (6, HUFFMAN_EMIT_SYMBOL, 242),
-    (10, HUFFMAN_EMIT_SYMBOL, 242),
-    (15, HUFFMAN_EMIT_SYMBOL, 242),
-    (24, HUFFMAN_EMIT_SYMBOL, 242),
-    (31, HUFFMAN_EMIT_SYMBOL, 242),
-    (41, HUFFMAN_EMIT_SYMBOL, 242),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 242),
-    (3, HUFFMAN_EMIT_SYMBOL, 243),
-    (6, HUFFMAN_EMIT_SYMBOL, 243),
-    (10, HUFFMAN_EMIT_SYMBOL, 243),
-    (15, HUFFMAN_EMIT_SYMBOL, 243),
-    (24, HUFFMAN_EMIT_SYMBOL, 243),
-    (31, HUFFMAN_EMIT_SYMBOL, 243),
-    (41, HUFFMAN_EMIT_SYMBOL, 243),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 243),
+    '0302f20602f20a02f20f02f21802f21f02f22902f23803f2'
+    '0302f30602f30a02f30f02f31802f31f02f32902f33803f3'
 
     # Node 205
-    (3, HUFFMAN_EMIT_SYMBOL, 255),
-    (6, HUFFMAN_EMIT_SYMBOL, 255),
-    (10, HUFFMAN_EMIT_SYMBOL, 255),
-    (15, HUFFMAN_EMIT_SYMBOL, 255),
-    (24, HUFFMAN_EMIT_SYMBOL, 255),
-    (31, HUFFMAN_EMIT_SYMBOL, 255),
-    (41, HUFFMAN_EMIT_SYMBOL, 255),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 255),
-    (2, HUFFMAN_EMIT_SYMBOL, 203),
-    (9, HUFFMAN_EMIT_SYMBOL, 203),
-    (23, HUFFMAN_EMIT_SYMBOL, 203),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 203),
-    (2, HUFFMAN_EMIT_SYMBOL, 204),
-    (9, HUFFMAN_EMIT_SYMBOL, 204),
-    (23, HUFFMAN_EMIT_SYMBOL, 204),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 204),
+    '0302ff0602ff0a02ff0f02ff1802ff1f02ff2902ff3803ff'
+    '0202cb0902cb1702cb2803cb0202cc0902cc1702cc2803cc'
 
     # Node 206
-    (3, HUFFMAN_EMIT_SYMBOL, 203),
-    (6, HUFFMAN_EMIT_SYMBOL, 203),
-    (10, HUFFMAN_EMIT_SYMBOL, 203),
-    (15, HUFFMAN_EMIT_SYMBOL, 203),
-    (24, HUFFMAN_EMIT_SYMBOL, 203),
-    (31, HUFFMAN_EMIT_SYMBOL, 203),
-    (41, HUFFMAN_EMIT_SYMBOL, 203),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 203),
-    (3, HUFFMAN_EMIT_SYMBOL, 204),
-    (6, HUFFMAN_EMIT_SYMBOL, 204),
-    (10, HUFFMAN_EMIT_SYMBOL, 204),
-    (15, HUFFMAN_EMIT_SYMBOL, 204),
-    (24, HUFFMAN_EMIT_SYMBOL, 204),
-    (31, HUFFMAN_EMIT_SYMBOL, 204),
-    (41, HUFFMAN_EMIT_SYMBOL, 204),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 204),
+    '0302cb0602cb0a02cb0f02cb1802cb1f02cb2902cb3803cb'
+    '0302cc0602cc0a02cc0f02cc1802cc1f02cc2902cc3803cc'
 
     # Node 207
-    (211, 0, 0),
-    (212, 0, 0),
-    (214, 0, 0),
-    (215, 0, 0),
-    (218, 0, 0),
-    (219, 0, 0),
-    (221, 0, 0),
-    (222, 0, 0),
-    (226, 0, 0),
-    (228, 0, 0),
-    (232, 0, 0),
-    (235, 0, 0),
-    (240, 0, 0),
-    (243, 0, 0),
-    (247, 0, 0),
-    (250, 0, 0),
+    'd30000d40000d60000d70000da0000db0000dd0000de0000'
+    'e20000e40000e80000eb0000f00000f30000f70000fa0000'
 
     # Node 208
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 211),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 212),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 214),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 221),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 222),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 223),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 241),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 244),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 245),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 246),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 247),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 248),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 250),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 251),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 252),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 253),
+    '0003d30003d40003d60003dd0003de0003df0003f10003f4'
+    '0003f50003f60003f70003f80003fa0003fb0003fc0003fd'
 
     # Node 209
-    (1, HUFFMAN_EMIT_SYMBOL, 211),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 211),
-    (1, HUFFMAN_EMIT_SYMBOL, 212),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 212),
-    (1, HUFFMAN_EMIT_SYMBOL, 214),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 214),
-    (1, HUFFMAN_EMIT_SYMBOL, 221),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 221),
-    (1, HUFFMAN_EMIT_SYMBOL, 222),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 222),
-    (1, HUFFMAN_EMIT_SYMBOL, 223),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 223),
-    (1, HUFFMAN_EMIT_SYMBOL, 241),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 241),
-    (1, HUFFMAN_EMIT_SYMBOL, 244),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 244),
+    '0102d31603d30102d41603d40102d61603d60102dd1603dd'
+    '0102de1603de0102df1603df0102f11603f10102f41603f4'
 
     # Node 210
-    (2, HUFFMAN_EMIT_SYMBOL, 211),
-    (9, HUFFMAN_EMIT_SYMBOL, 211),
-    (23, HUFFMAN_EMIT_SYMBOL, 211),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 211),
-    (2, HUFFMAN_EMIT_SYMBOL, 212),
-    (9, HUFFMAN_EMIT_SYMBOL, 212),
-    (23, HUFFMAN_EMIT_SYMBOL, 212),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 212),
-    (2, HUFFMAN_EMIT_SYMBOL, 214),
-    (9, HUFFMAN_EMIT_SYMBOL, 214),
-    (23, HUFFMAN_EMIT_SYMBOL, 214),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 214),
-    (2, HUFFMAN_EMIT_SYMBOL, 221),
-    (9, HUFFMAN_EMIT_SYMBOL, 221),
-    (23, HUFFMAN_EMIT_SYMBOL, 221),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 221),
+    '0202d30902d31702d32803d30202d40902d41702d42803d4'
+    '0202d60902d61702d62803d60202dd0902dd1702dd2803dd'
 
     # Node 211
-    (3, HUFFMAN_EMIT_SYMBOL, 211),
-    (6, HUFFMAN_EMIT_SYMBOL, 211),
-    (10, HUFFMAN_EMIT_SYMBOL, 211),
-    (15, HUFFMAN_EMIT_SYMBOL, 211),
-    (24, HUFFMAN_EMIT_SYMBOL, 211),
-    (31, HUFFMAN_EMIT_SYMBOL, 211),
-    (41, HUFFMAN_EMIT_SYMBOL, 211),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 211),
-    (3, HUFFMAN_EMIT_SYMBOL, 212),
-    (6, HUFFMAN_EMIT_SYMBOL, 212),
-    (10, HUFFMAN_EMIT_SYMBOL, 212),
-    (15, HUFFMAN_EMIT_SYMBOL, 212),
-    (24, HUFFMAN_EMIT_SYMBOL, 212),
-    (31, HUFFMAN_EMIT_SYMBOL, 212),
-    (41, HUFFMAN_EMIT_SYMBOL, 212),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 212),
+    '0302d30602d30a02d30f02d31802d31f02d32902d33803d3'
+    '0302d40602d40a02d40f02d41802d41f02d42902d43803d4'
 
     # Node 212
-    (3, HUFFMAN_EMIT_SYMBOL, 214),
-    (6, HUFFMAN_EMIT_SYMBOL, 214),
-    (10, HUFFMAN_EMIT_SYMBOL, 214),
-    (15, HUFFMAN_EMIT_SYMBOL, 214),
-    (24, HUFFMAN_EMIT_SYMBOL, 214),
-    (31, HUFFMAN_EMIT_SYMBOL, 214),
-    (41, HUFFMAN_EMIT_SYMBOL, 214),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 214),
-    (3, HUFFMAN_EMIT_SYMBOL, 221),
-    (6, HUFFMAN_EMIT_SYMBOL, 221),
-    (10, HUFFMAN_EMIT_SYMBOL, 221),
-    (15, HUFFMAN_EMIT_SYMBOL, 221),
-    (24, HUFFMAN_EMIT_SYMBOL, 221),
-    (31, HUFFMAN_EMIT_SYMBOL, 221),
-    (41, HUFFMAN_EMIT_SYMBOL, 221),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 221),
+    '0302d60602d60a02d60f02d61802d61f02d62902d63803d6'
+    '0302dd0602dd0a02dd0f02dd1802dd1f02dd2902dd3803dd'
 
     # Node 213
-    (2, HUFFMAN_EMIT_SYMBOL, 222),
-    (9, HUFFMAN_EMIT_SYMBOL, 222),
-    (23, HUFFMAN_EMIT_SYMBOL, 222),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 222),
-    (2, HUFFMAN_EMIT_SYMBOL, 223),
-    (9, HUFFMAN_EMIT_SYMBOL, 223),
-    (23, HUFFMAN_EMIT_SYMBOL, 223),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 223),
-    (2, HUFFMAN_EMIT_SYMBOL, 241),
-    (9, HUFFMAN_EMIT_SYMBOL, 241),
-    (23, HUFFMAN_EMIT_SYMBOL, 241),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 241),
-    (2, HUFFMAN_EMIT_SYMBOL, 244),
-    (9, HUFFMAN_EMIT_SYMBOL, 244),
-    (23, HUFFMAN_EMIT_SYMBOL, 244),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 244),
+    '0202de0902de1702de2803de0202df0902df1702df2803df'
+    '0202f10902f11702f12803f10202f40902f41702f42803f4'
 
     # Node 214
-    (3, HUFFMAN_EMIT_SYMBOL, 222),
-    (6, HUFFMAN_EMIT_SYMBOL, 222),
-    (10, HUFFMAN_EMIT_SYMBOL, 222),
-    (15, HUFFMAN_EMIT_SYMBOL, 222),
-    (24, HUFFMAN_EMIT_SYMBOL, 222),
-    (31, HUFFMAN_EMIT_SYMBOL, 222),
-    (41, HUFFMAN_EMIT_SYMBOL, 222),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 222),
-    (3, HUFFMAN_EMIT_SYMBOL, 223),
-    (6, HUFFMAN_EMIT_SYMBOL, 223),
-    (10, HUFFMAN_EMIT_SYMBOL, 223),
-    (15, HUFFMAN_EMIT_SYMBOL, 223),
-    (24, HUFFMAN_EMIT_SYMBOL, 223),
-    (31, HUFFMAN_EMIT_SYMBOL, 223),
-    (41, HUFFMAN_EMIT_SYMBOL, 223),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 223),
+    '0302de0602de0a02de0f02de1802de1f02de2902de3803de'
+    '0302df0602df0a02df0f02df1802df1f02df2902df3803df'
 
     # Node 215
-    (3, HUFFMAN_EMIT_SYMBOL, 241),
-    (6, HUFFMAN_EMIT_SYMBOL, 241),
-    (10, HUFFMAN_EMIT_SYMBOL, 241),
-    (15, HUFFMAN_EMIT_SYMBOL, 241),
-    (24, HUFFMAN_EMIT_SYMBOL, 241),
-    (31, HUFFMAN_EMIT_SYMBOL, 241),
-    (41, HUFFMAN_EMIT_SYMBOL, 241),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 241),
-    (3, HUFFMAN_EMIT_SYMBOL, 244),
-    (6, HUFFMAN_EMIT_SYMBOL, 244),
-    (10, HUFFMAN_EMIT_SYMBOL, 244),
-    (15, HUFFMAN_EMIT_SYMBOL, 244),
-    (24, HUFFMAN_EMIT_SYMBOL, 244),
-    (31, HUFFMAN_EMIT_SYMBOL, 244),
-    (41, HUFFMAN_EMIT_SYMBOL, 244),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 244),
+    '0302f10602f10a02f10f02f11802f11f02f12902f13803f1'
+    '0302f40602f40a02f40f02f41802f41f02f42902f43803f4'
 
     # Node 216
-    (1, HUFFMAN_EMIT_SYMBOL, 245),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 245),
-    (1, HUFFMAN_EMIT_SYMBOL, 246),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 246),
-    (1, HUFFMAN_EMIT_SYMBOL, 247),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 247),
-    (1, HUFFMAN_EMIT_SYMBOL, 248),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 248),
-    (1, HUFFMAN_EMIT_SYMBOL, 250),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 250),
-    (1, HUFFMAN_EMIT_SYMBOL, 251),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 251),
-    (1, HUFFMAN_EMIT_SYMBOL, 252),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 252),
-    (1, HUFFMAN_EMIT_SYMBOL, 253),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 253),
+    '0102f51603f50102f61603f60102f71603f70102f81603f8'
+    '0102fa1603fa0102fb1603fb0102fc1603fc0102fd1603fd'
 
     # Node 217
-    (2, HUFFMAN_EMIT_SYMBOL, 245),
-    (9, HUFFMAN_EMIT_SYMBOL, 245),
-    (23, HUFFMAN_EMIT_SYMBOL, 245),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 245),
-    (2, HUFFMAN_EMIT_SYMBOL, 246),
-    (9, HUFFMAN_EMIT_SYMBOL, 246),
-    (23, HUFFMAN_EMIT_SYMBOL, 246),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 246),
-    (2, HUFFMAN_EMIT_SYMBOL, 247),
-    (9, HUFFMAN_EMIT_SYMBOL, 247),
-    (23, HUFFMAN_EMIT_SYMBOL, 247),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 247),
-    (2, HUFFMAN_EMIT_SYMBOL, 248),
-    (9, HUFFMAN_EMIT_SYMBOL, 248),
-    (23, HUFFMAN_EMIT_SYMBOL, 248),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 248),
+    '0202f50902f51702f52803f50202f60902f61702f62803f6'
+    '0202f70902f71702f72803f70202f80902f81702f82803f8'
 
     # Node 218
-    (3, HUFFMAN_EMIT_SYMBOL, 245),
-    (6, HUFFMAN_EMIT_SYMBOL, 245),
-    (10, HUFFMAN_EMIT_SYMBOL, 245),
-    (15, HUFFMAN_EMIT_SYMBOL, 245),
-    (24, HUFFMAN_EMIT_SYMBOL, 245),
-    (31, HUFFMAN_EMIT_SYMBOL, 245),
-    (41, HUFFMAN_EMIT_SYMBOL, 245),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 245),
-    (3, HUFFMAN_EMIT_SYMBOL, 246),
-    (6, HUFFMAN_EMIT_SYMBOL, 246),
-    (10, HUFFMAN_EMIT_SYMBOL, 246),
-    (15, HUFFMAN_EMIT_SYMBOL, 246),
-    (24, HUFFMAN_EMIT_SYMBOL, 246),
-    (31, HUFFMAN_EMIT_SYMBOL, 246),
-    (41, HUFFMAN_EMIT_SYMBOL, 246),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 246),
+    '0302f50602f50a02f50f02f51802f51f02f52902f53803f5'
+    '0302f60602f60a02f60f02f61802f61f02f62902f63803f6'
 
     # Node 219
-    (3, HUFFMAN_EMIT_SYMBOL, 247),
-    (6, HUFFMAN_EMIT_SYMBOL, 247),
-    (10, HUFFMAN_EMIT_SYMBOL, 247),
-    (15, HUFFMAN_EMIT_SYMBOL, 247),
-    (24, HUFFMAN_EMIT_SYMBOL, 247),
-    (31, HUFFMAN_EMIT_SYMBOL, 247),
-    (41, HUFFMAN_EMIT_SYMBOL, 247),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 247),
-    (3, HUFFMAN_EMIT_SYMBOL, 248),
-    (6, HUFFMAN_EMIT_SYMBOL, 248),
-    (10, HUFFMAN_EMIT_SYMBOL, 248),
-    (15, HUFFMAN_EMIT_SYMBOL, 248),
-    (24, HUFFMAN_EMIT_SYMBOL, 248),
-    (31, HUFFMAN_EMIT_SYMBOL, 248),
-    (41, HUFFMAN_EMIT_SYMBOL, 248),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 248),
+    '0302f70602f70a02f70f02f71802f71f02f72902f73803f7'
+    '0302f80602f80a02f80f02f81802f81f02f82902f83803f8'
 
     # Node 220
-    (2, HUFFMAN_EMIT_SYMBOL, 250),
-    (9, HUFFMAN_EMIT_SYMBOL, 250),
-    (23, HUFFMAN_EMIT_SYMBOL, 250),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 250),
-    (2, HUFFMAN_EMIT_SYMBOL, 251),
-    (9, HUFFMAN_EMIT_SYMBOL, 251),
-    (23, HUFFMAN_EMIT_SYMBOL, 251),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 251),
-    (2, HUFFMAN_EMIT_SYMBOL, 252),
-    (9, HUFFMAN_EMIT_SYMBOL, 252),
-    (23, HUFFMAN_EMIT_SYMBOL, 252),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 252),
-    (2, HUFFMAN_EMIT_SYMBOL, 253),
-    (9, HUFFMAN_EMIT_SYMBOL, 253),
-    (23, HUFFMAN_EMIT_SYMBOL, 253),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 253),
+    '0202fa0902fa1702fa2803fa0202fb0902fb1702fb2803fb'
+    '0202fc0902fc1702fc2803fc0202fd0902fd1702fd2803fd'
 
     # Node 221
-    (3, HUFFMAN_EMIT_SYMBOL, 250),
-    (6, HUFFMAN_EMIT_SYMBOL, 250),
-    (10, HUFFMAN_EMIT_SYMBOL, 250),
-    (15, HUFFMAN_EMIT_SYMBOL, 250),
-    (24, HUFFMAN_EMIT_SYMBOL, 250),
-    (31, HUFFMAN_EMIT_SYMBOL, 250),
-    (41, HUFFMAN_EMIT_SYMBOL, 250),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 250),
-    (3, HUFFMAN_EMIT_SYMBOL, 251),
-    (6, HUFFMAN_EMIT_SYMBOL, 251),
-    (10, HUFFMAN_EMIT_SYMBOL, 251),
-    (15, HUFFMAN_EMIT_SYMBOL, 251),
-    (24, HUFFMAN_EMIT_SYMBOL, 251),
-    (31, HUFFMAN_EMIT_SYMBOL, 251),
-    (41, HUFFMAN_EMIT_SYMBOL, 251),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 251),
+    '0302fa0602fa0a02fa0f02fa1802fa1f02fa2902fa3803fa'
+    '0302fb0602fb0a02fb0f02fb1802fb1f02fb2902fb3803fb'
 
     # Node 222
-    (3, HUFFMAN_EMIT_SYMBOL, 252),
-    (6, HUFFMAN_EMIT_SYMBOL, 252),
-    (10, HUFFMAN_EMIT_SYMBOL, 252),
-    (15, HUFFMAN_EMIT_SYMBOL, 252),
-    (24, HUFFMAN_EMIT_SYMBOL, 252),
-    (31, HUFFMAN_EMIT_SYMBOL, 252),
-    (41, HUFFMAN_EMIT_SYMBOL, 252),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 252),
-    (3, HUFFMAN_EMIT_SYMBOL, 253),
-    (6, HUFFMAN_EMIT_SYMBOL, 253),
-    (10, HUFFMAN_EMIT_SYMBOL, 253),
-    (15, HUFFMAN_EMIT_SYMBOL, 253),
-    (24, HUFFMAN_EMIT_SYMBOL, 253),
-    (31, HUFFMAN_EMIT_SYMBOL, 253),
-    (41, HUFFMAN_EMIT_SYMBOL, 253),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 253),
+    '0302fc0602fc0a02fc0f02fc1802fc1f02fc2902fc3803fc'
+    '0302fd0602fd0a02fd0f02fd1802fd1f02fd2902fd3803fd'
 
     # Node 223
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 254),
-    (227, 0, 0),
-    (229, 0, 0),
-    (230, 0, 0),
-    (233, 0, 0),
-    (234, 0, 0),
-    (236, 0, 0),
-    (237, 0, 0),
-    (241, 0, 0),
-    (242, 0, 0),
-    (244, 0, 0),
-    (245, 0, 0),
-    (248, 0, 0),
-    (249, 0, 0),
-    (251, 0, 0),
-    (252, 0, 0),
+    '0003fee30000e50000e60000e90000ea0000ec0000ed0000'
+    'f10000f20000f40000f50000f80000f90000fb0000fc0000'
 
     # Node 224
-    (1, HUFFMAN_EMIT_SYMBOL, 254),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 254),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 2),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 3),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 4),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 5),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 6),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 7),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 8),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 11),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 12),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 14),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 15),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 16),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 17),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 18),
+    '0102fe1603fe000302000303000304000305000306000307'
+    '00030800030b00030c00030e00030f000310000311000312'
 
     # Node 225
-    (2, HUFFMAN_EMIT_SYMBOL, 254),
-    (9, HUFFMAN_EMIT_SYMBOL, 254),
-    (23, HUFFMAN_EMIT_SYMBOL, 254),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 254),
-    (1, HUFFMAN_EMIT_SYMBOL, 2),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 2),
-    (1, HUFFMAN_EMIT_SYMBOL, 3),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 3),
-    (1, HUFFMAN_EMIT_SYMBOL, 4),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 4),
-    (1, HUFFMAN_EMIT_SYMBOL, 5),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 5),
-    (1, HUFFMAN_EMIT_SYMBOL, 6),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 6),
-    (1, HUFFMAN_EMIT_SYMBOL, 7),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 7),
+    '0202fe0902fe1702fe2803fe010202160302010203160303'
+    '010204160304010205160305010206160306010207160307'
 
     # Node 226
-    (3, HUFFMAN_EMIT_SYMBOL, 254),
-    (6, HUFFMAN_EMIT_SYMBOL, 254),
-    (10, HUFFMAN_EMIT_SYMBOL, 254),
-    (15, HUFFMAN_EMIT_SYMBOL, 254),
-    (24, HUFFMAN_EMIT_SYMBOL, 254),
-    (31, HUFFMAN_EMIT_SYMBOL, 254),
-    (41, HUFFMAN_EMIT_SYMBOL, 254),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 254),
-    (2, HUFFMAN_EMIT_SYMBOL, 2),
-    (9, HUFFMAN_EMIT_SYMBOL, 2),
-    (23, HUFFMAN_EMIT_SYMBOL, 2),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 2),
-    (2, HUFFMAN_EMIT_SYMBOL, 3),
-    (9, HUFFMAN_EMIT_SYMBOL, 3),
-    (23, HUFFMAN_EMIT_SYMBOL, 3),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 3),
+    '0302fe0602fe0a02fe0f02fe1802fe1f02fe2902fe3803fe'
+    '020202090202170202280302020203090203170203280303'
 
     # Node 227
-    (3, HUFFMAN_EMIT_SYMBOL, 2),
-    (6, HUFFMAN_EMIT_SYMBOL, 2),
-    (10, HUFFMAN_EMIT_SYMBOL, 2),
-    (15, HUFFMAN_EMIT_SYMBOL, 2),
-    (24, HUFFMAN_EMIT_SYMBOL, 2),
-    (31, HUFFMAN_EMIT_SYMBOL, 2),
-    (41, HUFFMAN_EMIT_SYMBOL, 2),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 2),
-    (3, HUFFMAN_EMIT_SYMBOL, 3),
-    (6, HUFFMAN_EMIT_SYMBOL, 3),
-    (10, HUFFMAN_EMIT_SYMBOL, 3),
-    (15, HUFFMAN_EMIT_SYMBOL, 3),
-    (24, HUFFMAN_EMIT_SYMBOL, 3),
-    (31, HUFFMAN_EMIT_SYMBOL, 3),
-    (41, HUFFMAN_EMIT_SYMBOL, 3),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 3),
+    '0302020602020a02020f02021802021f0202290202380302'
+    '0302030602030a02030f02031802031f0203290203380303'
 
     # Node 228
-    (2, HUFFMAN_EMIT_SYMBOL, 4),
-    (9, HUFFMAN_EMIT_SYMBOL, 4),
-    (23, HUFFMAN_EMIT_SYMBOL, 4),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 4),
-    (2, HUFFMAN_EMIT_SYMBOL, 5),
-    (9, HUFFMAN_EMIT_SYMBOL, 5),
-    (23, HUFFMAN_EMIT_SYMBOL, 5),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 5),
-    (2, HUFFMAN_EMIT_SYMBOL, 6),
-    (9, HUFFMAN_EMIT_SYMBOL, 6),
-    (23, HUFFMAN_EMIT_SYMBOL, 6),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 6),
-    (2, HUFFMAN_EMIT_SYMBOL, 7),
-    (9, HUFFMAN_EMIT_SYMBOL, 7),
-    (23, HUFFMAN_EMIT_SYMBOL, 7),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 7),
+    '020204090204170204280304020205090205170205280305'
+    '020206090206170206280306020207090207170207280307'
 
     # Node 229
-    (3, HUFFMAN_EMIT_SYMBOL, 4),
-    (6, HUFFMAN_EMIT_SYMBOL, 4),
-    (10, HUFFMAN_EMIT_SYMBOL, 4),
-    (15, HUFFMAN_EMIT_SYMBOL, 4),
-    (24, HUFFMAN_EMIT_SYMBOL, 4),
-    (31, HUFFMAN_EMIT_SYMBOL, 4),
-    (41, HUFFMAN_EMIT_SYMBOL, 4),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 4),
-    (3, HUFFMAN_EMIT_SYMBOL, 5),
-    (6, HUFFMAN_EMIT_SYMBOL, 5),
-    (10, HUFFMAN_EMIT_SYMBOL, 5),
-    (15, HUFFMAN_EMIT_SYMBOL, 5),
-    (24, HUFFMAN_EMIT_SYMBOL, 5),
-    (31, HUFFMAN_EMIT_SYMBOL, 5),
-    (41, HUFFMAN_EMIT_SYMBOL, 5),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 5),
+    '0302040602040a02040f02041802041f0204290204380304'
+    '0302050602050a02050f02051802051f0205290205380305'
 
     # Node 230
-    (3, HUFFMAN_EMIT_SYMBOL, 6),
-    (6, HUFFMAN_EMIT_SYMBOL, 6),
-    (10, HUFFMAN_EMIT_SYMBOL, 6),
-    (15, HUFFMAN_EMIT_SYMBOL, 6),
-    (24, HUFFMAN_EMIT_SYMBOL, 6),
-    (31, HUFFMAN_EMIT_SYMBOL, 6),
-    (41, HUFFMAN_EMIT_SYMBOL, 6),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 6),
-    (3, HUFFMAN_EMIT_SYMBOL, 7),
-    (6, HUFFMAN_EMIT_SYMBOL, 7),
-    (10, HUFFMAN_EMIT_SYMBOL, 7),
-    (15, HUFFMAN_EMIT_SYMBOL, 7),
-    (24, HUFFMAN_EMIT_SYMBOL, 7),
-    (31, HUFFMAN_EMIT_SYMBOL, 7),
-    (41, HUFFMAN_EMIT_SYMBOL, 7),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 7),
+    '0302060602060a02060f02061802061f0206290206380306'
+    '0302070602070a02070f02071802071f0207290207380307'
 
     # Node 231
-    (1, HUFFMAN_EMIT_SYMBOL, 8),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 8),
-    (1, HUFFMAN_EMIT_SYMBOL, 11),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 11),
-    (1, HUFFMAN_EMIT_SYMBOL, 12),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 12),
-    (1, HUFFMAN_EMIT_SYMBOL, 14),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 14),
-    (1, HUFFMAN_EMIT_SYMBOL, 15),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 15),
-    (1, HUFFMAN_EMIT_SYMBOL, 16),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 16),
-    (1, HUFFMAN_EMIT_SYMBOL, 17),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 17),
-    (1, HUFFMAN_EMIT_SYMBOL, 18),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 18),
+    '01020816030801020b16030b01020c16030c01020e16030e'
+    '01020f16030f010210160310010211160311010212160312'
 
     # Node 232
-    (2, HUFFMAN_EMIT_SYMBOL, 8),
-    (9, HUFFMAN_EMIT_SYMBOL, 8),
-    (23, HUFFMAN_EMIT_SYMBOL, 8),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 8),
-    (2, HUFFMAN_EMIT_SYMBOL, 11),
-    (9, HUFFMAN_EMIT_SYMBOL, 11),
-    (23, HUFFMAN_EMIT_SYMBOL, 11),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 11),
-    (2, HUFFMAN_EMIT_SYMBOL, 12),
-    (9, HUFFMAN_EMIT_SYMBOL, 12),
-    (23, HUFFMAN_EMIT_SYMBOL, 12),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 12),
-    (2, HUFFMAN_EMIT_SYMBOL, 14),
-    (9, HUFFMAN_EMIT_SYMBOL, 14),
-    (23, HUFFMAN_EMIT_SYMBOL, 14),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 14),
+    '02020809020817020828030802020b09020b17020b28030b'
+    '02020c09020c17020c28030c02020e09020e17020e28030e'
 
     # Node 233
-    (3, HUFFMAN_EMIT_SYMBOL, 8),
-    (6, HUFFMAN_EMIT_SYMBOL, 8),
-    (10, HUFFMAN_EMIT_SYMBOL, 8),
-    (15, HUFFMAN_EMIT_SYMBOL, 8),
-    (24, HUFFMAN_EMIT_SYMBOL, 8),
-    (31, HUFFMAN_EMIT_SYMBOL, 8),
-    (41, HUFFMAN_EMIT_SYMBOL, 8),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 8),
-    (3, HUFFMAN_EMIT_SYMBOL, 11),
-    (6, HUFFMAN_EMIT_SYMBOL, 11),
-    (10, HUFFMAN_EMIT_SYMBOL, 11),
-    (15, HUFFMAN_EMIT_SYMBOL, 11),
-    (24, HUFFMAN_EMIT_SYMBOL, 11),
-    (31, HUFFMAN_EMIT_SYMBOL, 11),
-    (41, HUFFMAN_EMIT_SYMBOL, 11),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 11),
+    '0302080602080a02080f02081802081f0208290208380308'
+    '03020b06020b0a020b0f020b18020b1f020b29020b38030b'
 
     # Node 234
-    (3, HUFFMAN_EMIT_SYMBOL, 12),
-    (6, HUFFMAN_EMIT_SYMBOL, 12),
-    (10, HUFFMAN_EMIT_SYMBOL, 12),
-    (15, HUFFMAN_EMIT_SYMBOL, 12),
-    (24, HUFFMAN_EMIT_SYMBOL, 12),
-    (31, HUFFMAN_EMIT_SYMBOL, 12),
-    (41, HUFFMAN_EMIT_SYMBOL, 12),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 12),
-    (3, HUFFMAN_EMIT_SYMBOL, 14),
-    (6, HUFFMAN_EMIT_SYMBOL, 14),
-    (10, HUFFMAN_EMIT_SYMBOL, 14),
-    (15, HUFFMAN_EMIT_SYMBOL, 14),
-    (24, HUFFMAN_EMIT_SYMBOL, 14),
-    (31, HUFFMAN_EMIT_SYMBOL, 14),
-    (41, HUFFMAN_EMIT_SYMBOL, 14),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 14),
+    '03020c06020c0a020c0f020c18020c1f020c29020c38030c'
+    '03020e06020e0a020e0f020e18020e1f020e29020e38030e'
 
     # Node 235
-    (2, HUFFMAN_EMIT_SYMBOL, 15),
-    (9, HUFFMAN_EMIT_SYMBOL, 15),
-    (23, HUFFMAN_EMIT_SYMBOL, 15),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 15),
-    (2, HUFFMAN_EMIT_SYMBOL, 16),
-    (9, HUFFMAN_EMIT_SYMBOL, 16),
-    (23, HUFFMAN_EMIT_SYMBOL, 16),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 16),
-    (2, HUFFMAN_EMIT_SYMBOL, 17),
-    (9, HUFFMAN_EMIT_SYMBOL, 17),
-    (23, HUFFMAN_EMIT_SYMBOL, 17),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 17),
-    (2, HUFFMAN_EMIT_SYMBOL, 18),
-    (9, HUFFMAN_EMIT_SYMBOL, 18),
-    (23, HUFFMAN_EMIT_SYMBOL, 18),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 18),
+    '02020f09020f17020f28030f020210090210170210280310'
+    '020211090211170211280311020212090212170212280312'
 
     # Node 236
-    (3, HUFFMAN_EMIT_SYMBOL, 15),
-    (6, HUFFMAN_EMIT_SYMBOL, 15),
-    (10, HUFFMAN_EMIT_SYMBOL, 15),
-    (15, HUFFMAN_EMIT_SYMBOL, 15),
-    (24, HUFFMAN_EMIT_SYMBOL, 15),
-    (31, HUFFMAN_EMIT_SYMBOL, 15),
-    (41, HUFFMAN_EMIT_SYMBOL, 15),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 15),
-    (3, HUFFMAN_EMIT_SYMBOL, 16),
-    (6, HUFFMAN_EMIT_SYMBOL, 16),
-    (10, HUFFMAN_EMIT_SYMBOL, 16),
-    (15, HUFFMAN_EMIT_SYMBOL, 16),
-    (24, HUFFMAN_EMIT_SYMBOL, 16),
-    (31, HUFFMAN_EMIT_SYMBOL, 16),
-    (41, HUFFMAN_EMIT_SYMBOL, 16),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 16),
+    '03020f06020f0a020f0f020f18020f1f020f29020f38030f'
+    '0302100602100a02100f02101802101f0210290210380310'
 
     # Node 237
-    (3, HUFFMAN_EMIT_SYMBOL, 17),
-    (6, HUFFMAN_EMIT_SYMBOL, 17),
-    (10, HUFFMAN_EMIT_SYMBOL, 17),
-    (15, HUFFMAN_EMIT_SYMBOL, 17),
-    (24, HUFFMAN_EMIT_SYMBOL, 17),
-    (31, HUFFMAN_EMIT_SYMBOL, 17),
-    (41, HUFFMAN_EMIT_SYMBOL, 17),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 17),
-    (3, HUFFMAN_EMIT_SYMBOL, 18),
-    (6, HUFFMAN_EMIT_SYMBOL, 18),
-    (10, HUFFMAN_EMIT_SYMBOL, 18),
-    (15, HUFFMAN_EMIT_SYMBOL, 18),
-    (24, HUFFMAN_EMIT_SYMBOL, 18),
-    (31, HUFFMAN_EMIT_SYMBOL, 18),
-    (41, HUFFMAN_EMIT_SYMBOL, 18),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 18),
+    '0302110602110a02110f02111802111f0211290211380311'
+    '0302120602120a02120f02121802121f0212290212380312'
 
     # Node 238
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 19),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 20),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 21),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 23),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 24),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 25),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 26),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 27),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 28),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 29),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 30),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 31),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 127),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 220),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 249),
-    (253, 0, 0),
+    '00031300031400031500031700031800031900031a00031b'
+    '00031c00031d00031e00031f00037f0003dc0003f9fd0000'
 
     # Node 239
-    (1, HUFFMAN_EMIT_SYMBOL, 19),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 19),
-    (1, HUFFMAN_EMIT_SYMBOL, 20),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 20),
-    (1, HUFFMAN_EMIT_SYMBOL, 21),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 21),
-    (1, HUFFMAN_EMIT_SYMBOL, 23),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 23),
-    (1, HUFFMAN_EMIT_SYMBOL, 24),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 24),
-    (1, HUFFMAN_EMIT_SYMBOL, 25),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 25),
-    (1, HUFFMAN_EMIT_SYMBOL, 26),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 26),
-    (1, HUFFMAN_EMIT_SYMBOL, 27),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 27),
+    '010213160313010214160314010215160315010217160317'
+    '01021816031801021916031901021a16031a01021b16031b'
 
     # Node 240
-    (2, HUFFMAN_EMIT_SYMBOL, 19),
-    (9, HUFFMAN_EMIT_SYMBOL, 19),
-    (23, HUFFMAN_EMIT_SYMBOL, 19),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 19),
-    (2, HUFFMAN_EMIT_SYMBOL, 20),
-    (9, HUFFMAN_EMIT_SYMBOL, 20),
-    (23, HUFFMAN_EMIT_SYMBOL, 20),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 20),
-    (2, HUFFMAN_EMIT_SYMBOL, 21),
-    (9, HUFFMAN_EMIT_SYMBOL, 21),
-    (23, HUFFMAN_EMIT_SYMBOL, 21),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 21),
-    (2, HUFFMAN_EMIT_SYMBOL, 23),
-    (9, HUFFMAN_EMIT_SYMBOL, 23),
-    (23, HUFFMAN_EMIT_SYMBOL, 23),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 23),
+    '020213090213170213280313020214090214170214280314'
+    '020215090215170215280315020217090217170217280317'
 
     # Node 241
-    (3, HUFFMAN_EMIT_SYMBOL, 19),
-    (6, HUFFMAN_EMIT_SYMBOL, 19),
-    (10, HUFFMAN_EMIT_SYMBOL, 19),
-    (15, HUFFMAN_EMIT_SYMBOL, 19),
-    (24, HUFFMAN_EMIT_SYMBOL, 19),
-    (31, HUFFMAN_EMIT_SYMBOL, 19),
-    (41, HUFFMAN_EMIT_SYMBOL, 19),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 19),
-    (3, HUFFMAN_EMIT_SYMBOL, 20),
-    (6, HUFFMAN_EMIT_SYMBOL, 20),
-    (10, HUFFMAN_EMIT_SYMBOL, 20),
-    (15, HUFFMAN_EMIT_SYMBOL, 20),
-    (24, HUFFMAN_EMIT_SYMBOL, 20),
-    (31, HUFFMAN_EMIT_SYMBOL, 20),
-    (41, HUFFMAN_EMIT_SYMBOL, 20),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 20),
+    '0302130602130a02130f02131802131f0213290213380313'
+    '0302140602140a02140f02141802141f0214290214380314'
 
     # Node 242
-    (3, HUFFMAN_EMIT_SYMBOL, 21),
-    (6, HUFFMAN_EMIT_SYMBOL, 21),
-    (10, HUFFMAN_EMIT_SYMBOL, 21),
-    (15, HUFFMAN_EMIT_SYMBOL, 21),
-    (24, HUFFMAN_EMIT_SYMBOL, 21),
-    (31, HUFFMAN_EMIT_SYMBOL, 21),
-    (41, HUFFMAN_EMIT_SYMBOL, 21),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 21),
-    (3, HUFFMAN_EMIT_SYMBOL, 23),
-    (6, HUFFMAN_EMIT_SYMBOL, 23),
-    (10, HUFFMAN_EMIT_SYMBOL, 23),
-    (15, HUFFMAN_EMIT_SYMBOL, 23),
-    (24, HUFFMAN_EMIT_SYMBOL, 23),
-    (31, HUFFMAN_EMIT_SYMBOL, 23),
-    (41, HUFFMAN_EMIT_SYMBOL, 23),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 23),
+    '0302150602150a02150f02151802151f0215290215380315'
+    '0302170602170a02170f02171802171f0217290217380317'
 
     # Node 243
-    (2, HUFFMAN_EMIT_SYMBOL, 24),
-    (9, HUFFMAN_EMIT_SYMBOL, 24),
-    (23, HUFFMAN_EMIT_SYMBOL, 24),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 24),
-    (2, HUFFMAN_EMIT_SYMBOL, 25),
-    (9, HUFFMAN_EMIT_SYMBOL, 25),
-    (23, HUFFMAN_EMIT_SYMBOL, 25),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 25),
-    (2, HUFFMAN_EMIT_SYMBOL, 26),
-    (9, HUFFMAN_EMIT_SYMBOL, 26),
-    (23, HUFFMAN_EMIT_SYMBOL, 26),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 26),
-    (2, HUFFMAN_EMIT_SYMBOL, 27),
-    (9, HUFFMAN_EMIT_SYMBOL, 27),
-    (23, HUFFMAN_EMIT_SYMBOL, 27),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 27),
+    '020218090218170218280318020219090219170219280319'
+    '02021a09021a17021a28031a02021b09021b17021b28031b'
 
     # Node 244
-    (3, HUFFMAN_EMIT_SYMBOL, 24),
-    (6, HUFFMAN_EMIT_SYMBOL, 24),
-    (10, HUFFMAN_EMIT_SYMBOL, 24),
-    (15, HUFFMAN_EMIT_SYMBOL, 24),
-    (24, HUFFMAN_EMIT_SYMBOL, 24),
-    (31, HUFFMAN_EMIT_SYMBOL, 24),
-    (41, HUFFMAN_EMIT_SYMBOL, 24),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 24),
-    (3, HUFFMAN_EMIT_SYMBOL, 25),
-    (6, HUFFMAN_EMIT_SYMBOL, 25),
-    (10, HUFFMAN_EMIT_SYMBOL, 25),
-    (15, HUFFMAN_EMIT_SYMBOL, 25),
-    (24, HUFFMAN_EMIT_SYMBOL, 25),
-    (31, HUFFMAN_EMIT_SYMBOL, 25),
-    (41, HUFFMAN_EMIT_SYMBOL, 25),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 25),
+    '0302180602180a02180f02181802181f0218290218380318'
+    '0302190602190a02190f02191802191f0219290219380319'
 
     # Node 245
-    (3, HUFFMAN_EMIT_SYMBOL, 26),
-    (6, HUFFMAN_EMIT_SYMBOL, 26),
-    (10, HUFFMAN_EMIT_SYMBOL, 26),
-    (15, HUFFMAN_EMIT_SYMBOL, 26),
-    (24, HUFFMAN_EMIT_SYMBOL, 26),
-    (31, HUFFMAN_EMIT_SYMBOL, 26),
-    (41, HUFFMAN_EMIT_SYMBOL, 26),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 26),
-    (3, HUFFMAN_EMIT_SYMBOL, 27),
-    (6, HUFFMAN_EMIT_SYMBOL, 27),
-    (10, HUFFMAN_EMIT_SYMBOL, 27),
-    (15, HUFFMAN_EMIT_SYMBOL, 27),
-    (24, HUFFMAN_EMIT_SYMBOL, 27),
-    (31, HUFFMAN_EMIT_SYMBOL, 27),
-    (41, HUFFMAN_EMIT_SYMBOL, 27),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 27),
+    '03021a06021a0a021a0f021a18021a1f021a29021a38031a'
+    '03021b06021b0a021b0f021b18021b1f021b29021b38031b'
 
     # Node 246
-    (1, HUFFMAN_EMIT_SYMBOL, 28),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 28),
-    (1, HUFFMAN_EMIT_SYMBOL, 29),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 29),
-    (1, HUFFMAN_EMIT_SYMBOL, 30),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 30),
-    (1, HUFFMAN_EMIT_SYMBOL, 31),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 31),
-    (1, HUFFMAN_EMIT_SYMBOL, 127),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 127),
-    (1, HUFFMAN_EMIT_SYMBOL, 220),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 220),
-    (1, HUFFMAN_EMIT_SYMBOL, 249),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 249),
-    (254, 0, 0),
-    (255, 0, 0),
+    '01021c16031c01021d16031d01021e16031e01021f16031f'
+    '01027f16037f0102dc1603dc0102f91603f9fe0000ff0000'
 
     # Node 247
-    (2, HUFFMAN_EMIT_SYMBOL, 28),
-    (9, HUFFMAN_EMIT_SYMBOL, 28),
-    (23, HUFFMAN_EMIT_SYMBOL, 28),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 28),
-    (2, HUFFMAN_EMIT_SYMBOL, 29),
-    (9, HUFFMAN_EMIT_SYMBOL, 29),
-    (23, HUFFMAN_EMIT_SYMBOL, 29),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 29),
-    (2, HUFFMAN_EMIT_SYMBOL, 30),
-    (9, HUFFMAN_EMIT_SYMBOL, 30),
-    (23, HUFFMAN_EMIT_SYMBOL, 30),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 30),
-    (2, HUFFMAN_EMIT_SYMBOL, 31),
-    (9, HUFFMAN_EMIT_SYMBOL, 31),
-    (23, HUFFMAN_EMIT_SYMBOL, 31),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 31),
+    '02021c09021c17021c28031c02021d09021d17021d28031d'
+    '02021e09021e17021e28031e02021f09021f17021f28031f'
 
     # Node 248
-    (3, HUFFMAN_EMIT_SYMBOL, 28),
-    (6, HUFFMAN_EMIT_SYMBOL, 28),
-    (10, HUFFMAN_EMIT_SYMBOL, 28),
-    (15, HUFFMAN_EMIT_SYMBOL, 28),
-    (24, HUFFMAN_EMIT_SYMBOL, 28),
-    (31, HUFFMAN_EMIT_SYMBOL, 28),
-    (41, HUFFMAN_EMIT_SYMBOL, 28),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 28),
-    (3, HUFFMAN_EMIT_SYMBOL, 29),
-    (6, HUFFMAN_EMIT_SYMBOL, 29),
-    (10, HUFFMAN_EMIT_SYMBOL, 29),
-    (15, HUFFMAN_EMIT_SYMBOL, 29),
-    (24, HUFFMAN_EMIT_SYMBOL, 29),
-    (31, HUFFMAN_EMIT_SYMBOL, 29),
-    (41, HUFFMAN_EMIT_SYMBOL, 29),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 29),
+    '03021c06021c0a021c0f021c18021c1f021c29021c38031c'
+    '03021d06021d0a021d0f021d18021d1f021d29021d38031d'
 
     # Node 249
-    (3, HUFFMAN_EMIT_SYMBOL, 30),
-    (6, HUFFMAN_EMIT_SYMBOL, 30),
-    (10, HUFFMAN_EMIT_SYMBOL, 30),
-    (15, HUFFMAN_EMIT_SYMBOL, 30),
-    (24, HUFFMAN_EMIT_SYMBOL, 30),
-    (31, HUFFMAN_EMIT_SYMBOL, 30),
-    (41, HUFFMAN_EMIT_SYMBOL, 30),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 30),
-    (3, HUFFMAN_EMIT_SYMBOL, 31),
-    (6, HUFFMAN_EMIT_SYMBOL, 31),
-    (10, HUFFMAN_EMIT_SYMBOL, 31),
-    (15, HUFFMAN_EMIT_SYMBOL, 31),
-    (24, HUFFMAN_EMIT_SYMBOL, 31),
-    (31, HUFFMAN_EMIT_SYMBOL, 31),
-    (41, HUFFMAN_EMIT_SYMBOL, 31),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 31),
+    '03021e06021e0a021e0f021e18021e1f021e29021e38031e'
+    '03021f06021f0a021f0f021f18021f1f021f29021f38031f'
 
     # Node 250
-    (2, HUFFMAN_EMIT_SYMBOL, 127),
-    (9, HUFFMAN_EMIT_SYMBOL, 127),
-    (23, HUFFMAN_EMIT_SYMBOL, 127),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 127),
-    (2, HUFFMAN_EMIT_SYMBOL, 220),
-    (9, HUFFMAN_EMIT_SYMBOL, 220),
-    (23, HUFFMAN_EMIT_SYMBOL, 220),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 220),
-    (2, HUFFMAN_EMIT_SYMBOL, 249),
-    (9, HUFFMAN_EMIT_SYMBOL, 249),
-    (23, HUFFMAN_EMIT_SYMBOL, 249),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 249),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 10),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 13),
-    (0, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 22),
-    (0, HUFFMAN_FAIL, 0),
+    '02027f09027f17027f28037f0202dc0902dc1702dc2803dc'
+    '0202f90902f91702f92803f900030a00030d000316000400'
 
     # Node 251
-    (3, HUFFMAN_EMIT_SYMBOL, 127),
-    (6, HUFFMAN_EMIT_SYMBOL, 127),
-    (10, HUFFMAN_EMIT_SYMBOL, 127),
-    (15, HUFFMAN_EMIT_SYMBOL, 127),
-    (24, HUFFMAN_EMIT_SYMBOL, 127),
-    (31, HUFFMAN_EMIT_SYMBOL, 127),
-    (41, HUFFMAN_EMIT_SYMBOL, 127),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 127),
-    (3, HUFFMAN_EMIT_SYMBOL, 220),
-    (6, HUFFMAN_EMIT_SYMBOL, 220),
-    (10, HUFFMAN_EMIT_SYMBOL, 220),
-    (15, HUFFMAN_EMIT_SYMBOL, 220),
-    (24, HUFFMAN_EMIT_SYMBOL, 220),
-    (31, HUFFMAN_EMIT_SYMBOL, 220),
-    (41, HUFFMAN_EMIT_SYMBOL, 220),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 220),
+    '03027f06027f0a027f0f027f18027f1f027f29027f38037f'
+    '0302dc0602dc0a02dc0f02dc1802dc1f02dc2902dc3803dc'
 
     # Node 252
-    (3, HUFFMAN_EMIT_SYMBOL, 249),
-    (6, HUFFMAN_EMIT_SYMBOL, 249),
-    (10, HUFFMAN_EMIT_SYMBOL, 249),
-    (15, HUFFMAN_EMIT_SYMBOL, 249),
-    (24, HUFFMAN_EMIT_SYMBOL, 249),
-    (31, HUFFMAN_EMIT_SYMBOL, 249),
-    (41, HUFFMAN_EMIT_SYMBOL, 249),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 249),
-    (1, HUFFMAN_EMIT_SYMBOL, 10),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 10),
-    (1, HUFFMAN_EMIT_SYMBOL, 13),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 13),
-    (1, HUFFMAN_EMIT_SYMBOL, 22),
-    (22, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 22),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
+    '0302f90602f90a02f90f02f91802f91f02f92902f93803f9'
+    '01020a16030a01020d16030d010216160316000400000400'
 
     # Node 253
-    (2, HUFFMAN_EMIT_SYMBOL, 10),
-    (9, HUFFMAN_EMIT_SYMBOL, 10),
-    (23, HUFFMAN_EMIT_SYMBOL, 10),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 10),
-    (2, HUFFMAN_EMIT_SYMBOL, 13),
-    (9, HUFFMAN_EMIT_SYMBOL, 13),
-    (23, HUFFMAN_EMIT_SYMBOL, 13),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 13),
-    (2, HUFFMAN_EMIT_SYMBOL, 22),
-    (9, HUFFMAN_EMIT_SYMBOL, 22),
-    (23, HUFFMAN_EMIT_SYMBOL, 22),
-    (40, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 22),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
+    '02020a09020a17020a28030a02020d09020d17020d28030d'
+    '020216090216170216280316000400000400000400000400'
 
     # Node 254
-    (3, HUFFMAN_EMIT_SYMBOL, 10),
-    (6, HUFFMAN_EMIT_SYMBOL, 10),
-    (10, HUFFMAN_EMIT_SYMBOL, 10),
-    (15, HUFFMAN_EMIT_SYMBOL, 10),
-    (24, HUFFMAN_EMIT_SYMBOL, 10),
-    (31, HUFFMAN_EMIT_SYMBOL, 10),
-    (41, HUFFMAN_EMIT_SYMBOL, 10),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 10),
-    (3, HUFFMAN_EMIT_SYMBOL, 13),
-    (6, HUFFMAN_EMIT_SYMBOL, 13),
-    (10, HUFFMAN_EMIT_SYMBOL, 13),
-    (15, HUFFMAN_EMIT_SYMBOL, 13),
-    (24, HUFFMAN_EMIT_SYMBOL, 13),
-    (31, HUFFMAN_EMIT_SYMBOL, 13),
-    (41, HUFFMAN_EMIT_SYMBOL, 13),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 13),
+    '03020a06020a0a020a0f020a18020a1f020a29020a38030a'
+    '03020d06020d0a020d0f020d18020d1f020d29020d38030d'
 
     # Node 255
-    (3, HUFFMAN_EMIT_SYMBOL, 22),
-    (6, HUFFMAN_EMIT_SYMBOL, 22),
-    (10, HUFFMAN_EMIT_SYMBOL, 22),
-    (15, HUFFMAN_EMIT_SYMBOL, 22),
-    (24, HUFFMAN_EMIT_SYMBOL, 22),
-    (31, HUFFMAN_EMIT_SYMBOL, 22),
-    (41, HUFFMAN_EMIT_SYMBOL, 22),
-    (56, HUFFMAN_COMPLETE | HUFFMAN_EMIT_SYMBOL, 22),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-    (0, HUFFMAN_FAIL, 0),
-]
+    '0302160602160a02160f02161802161f0216290216380316'
+    '000400000400000400000400000400000400000400000400'
+)
+
+# Unpack the table into parallel sequences, indexed by (state * 16) + nibble.
+_HUFFMAN_TABLE_BYTES = bytearray(decode_hex(_HUFFMAN_TABLE_DATA))
+HUFFMAN_STATES = _HUFFMAN_TABLE_BYTES[0::3]
+HUFFMAN_FLAGS = _HUFFMAN_TABLE_BYTES[1::3]
+HUFFMAN_SYMBOLS = _HUFFMAN_TABLE_BYTES[2::3]
+del _HUFFMAN_TABLE_DATA, _HUFFMAN_TABLE_BYTES
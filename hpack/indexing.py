@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+hpack/indexing
+~~~~~~~~~~~~~~
+
+Implements the policies that decide which headers the encoder adds to the
+header table.
+"""
+from .table import table_entry_size
+
+
+#: Names of headers whose values rarely repeat, so that indexing them mostly
+#: pushes more useful entries out of the header table. Headers like ``date``
+#: are left out: they change often, but are repeated by responses sent close
+#: together.
+DEFAULT_DENYLIST = frozenset([
+    b':path',
+    b'content-length',
+    b'content-range',
+    b'x-request-id',
+])
+
+
+class IndexingPolicy(object):
+    """
+    Decides whether the encoder should add a header to the header table.
+
+    This base policy indexes every header that isn't sensitive, which is what
+    the encoder does when it isn't given a policy. Subclasses override
+    :meth:`should_index`, and may override :meth:`reused` to learn from how
+    the header table is used.
+
+    .. versionadded:: 3.1.0
+    """
+    def should_index(self, name, value):
+        """
+        Returns whether a header that is not already in the header table
+        should be added to it. ``name`` and ``value`` are bytestrings.
+        """
+        return True
+
+    def reused(self, name, value):
+        """
+        Called whenever a header is encoded by referring to an entry that was
+        added to the dynamic table.
+        """
+
+
+class DenylistIndexingPolicy(IndexingPolicy):
+    """
+    Never indexes headers with any of the given names.
+
+    :param names: (optional) The names of the headers that shouldn't be
+        indexed, as bytestrings. Defaults to :data:`DEFAULT_DENYLIST`.
+    """
+    def __init__(self, names=DEFAULT_DENYLIST):
+        #: The names of the headers that aren't indexed.
+        self.names = frozenset(names)
+
+    def should_index(self, name, value):
+        return name not in self.names
+
+
+class MaxSizeIndexingPolicy(IndexingPolicy):
+    """
+    Only indexes headers whose header table entries would be no larger than
+    a given size. Entries that take up a large part of the header table push
+    out many smaller ones.
+
+    :param max_size: (optional) The largest entry size, as defined by
+        RFC 7541 Section 4.1, that will be indexed. Defaults to 512 octets.
+    """
+    def __init__(self, max_size=512):
+        #: The largest entry size that will be indexed.
+        self.max_size = max_size
+
+    def should_index(self, name, value):
+        return table_entry_size(name, value) <= self.max_size
+
+
+class AdaptiveIndexingPolicy(IndexingPolicy):
+    """
+    Learns how often the indexed headers with each name are reused, and stops
+    indexing headers with names whose entries are rarely reused.
+
+    For every name, this counts the entries it lets the encoder index, and the
+    times those entries are reused. Once a name has been indexed ``warmup``
+    times, its headers are only indexed while the entries are reused at least
+    ``min_reuse`` times each on average. A name that is no longer indexed is
+    still indexed once in every ``probe_interval`` headers, so that it is
+    picked up again if its values start repeating.
+
+    :param min_reuse: (optional) The average number of reuses per entry below
+        which a name stops being indexed. Defaults to 0.5.
+    :param warmup: (optional) The number of times a name is indexed before
+        its reuse rate is used. Defaults to 4.
+    :param probe_interval: (optional) How often headers with a name that
+        isn't being indexed are indexed anyway. Defaults to 16.
+    :param max_names: (optional) The maximum number of names to keep counts
+        for. Headers with other names are always indexed. Defaults to 1024.
+    """
+    def __init__(self, min_reuse=0.5, warmup=4, probe_interval=16,
+                 max_names=1024):
+        #: The average number of reuses per entry below which a name stops
+        #: being indexed.
+        self.min_reuse = min_reuse
+
+        #: The number of times a name is indexed before its reuse rate is
+        #: used.
+        self.warmup = warmup
+
+        #: How often headers with a name that isn't being indexed are indexed
+        #: anyway.
+        self.probe_interval = probe_interval
+
+        #: The maximum number of names to keep counts for.
+        self.max_names = max_names
+
+        # Maps each name to a list of the number of entries indexed, the
+        # number of reuses of those entries, and the number of headers not
+        # indexed since the last one that was.
+        self._stats = {}
+
+    def should_index(self, name, value):
+        stats = self._stats.get(name)
+        if stats is None:
+            if len(self._stats) < self.max_names:
+                self._stats[name] = [1, 0, 0]
+            return True
+
+        indexed, reuses, skipped = stats
+        if (indexed < self.warmup or
+                reuses >= indexed * self.min_reuse or
+                skipped + 1 >= self.probe_interval):
+            stats[0] += 1
+            stats[2] = 0
+            return True
+
+        stats[2] += 1
+        return False
+
+    def reused(self, name, value):
+        stats = self._stats.get(name)
+        if stats is not None:
+            stats[1] += 1
+
+
+class CombinedIndexingPolicy(IndexingPolicy):
+    """
+    Only indexes headers that every one of the given policies would index.
+
+    :param policies: The policies to combine. Each is consulted in turn,
+        until one declines to index the header.
+    """
+    def __init__(self, *policies):
+        #: The combined policies.
+        self.policies = policies
+
+    def should_index(self, name, value):
+        return all(p.should_index(name, value) for p in self.policies)
+
+    def reused(self, name, value):
+        for policy in self.policies:
+            policy.reused(name, value)
@@ -2,11 +2,27 @@
 # flake8: noqa
 from collections import deque
 import logging
+import struct
 
-from .exceptions import InvalidTableIndex
+from .compat import to_bytes
+from .exceptions import InvalidTableIndex, InvalidSnapshotError
 
 log = logging.getLogger(__name__)
 
+# Whether to log debug messages. See hpack.hpack.set_debug_logging.
+_debug = log.isEnabledFor(logging.DEBUG)
+
+# Every snapshot starts with a tag naming the kind of object it was taken of,
+# and the version of the snapshot format.
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('>cB')
+
+# A header table snapshot holds the maximum size, the resized flag and the
+# number of entries, then each entry from oldest to newest as the lengths of
+# its name and value followed by the name and value themselves.
+_TABLE_STATE = struct.Struct('>I?I')
+_ENTRY_LENGTHS = struct.Struct('>II')
+
 
 def table_entry_size(name, value):
     """
@@ -23,6 +39,44 @@ def table_entry_size(name, value):
     return 32 + len(name) + len(value)
 
 
+def snapshot_header(tag):
+    """
+    Returns the start of a snapshot of the kind of object named by ``tag``.
+    """
+    return _SNAPSHOT_HEADER.pack(tag, SNAPSHOT_VERSION)
+
+
+def unpack_snapshot(fmt, data, offset):
+    """
+    Unpacks the ``struct.Struct`` ``fmt`` from a snapshot at ``offset``.
+    Returns the unpacked values and the offset just past them.
+    """
+    end = offset + fmt.size
+    if end > len(data):
+        raise InvalidSnapshotError("Truncated snapshot")
+    return fmt.unpack(data[offset:end]), end
+
+
+def check_snapshot_header(tag, data, offset):
+    """
+    Checks that a snapshot of the kind of object named by ``tag``, in this
+    version of the format, starts at ``offset``. Returns the offset just past
+    the header.
+    """
+    (found_tag, version), offset = unpack_snapshot(
+        _SNAPSHOT_HEADER, data, offset
+    )
+    if found_tag != tag:
+        raise InvalidSnapshotError(
+            "Expected a snapshot of type %r, got %r" % (tag, found_tag)
+        )
+    if version != SNAPSHOT_VERSION:
+        raise InvalidSnapshotError(
+            "Unsupported snapshot version %d" % version
+        )
+    return offset
+
+
 class HeaderTable(object):
     """
     Implements the combined static and dynamic header table
@@ -33,6 +87,12 @@ class HeaderTable(object):
 
     See RFC7541 Section 2.3
     """
+    __slots__ = (
+        '_maxsize', '_current_size', 'resized', 'dynamic_entries',
+        '_entry_sizes', '_insert_count', '_name_index', '_header_index',
+        '_text_headers', 'generation', '_sharers',
+    )
+
     #: Default maximum size of the dynamic table. See
     #:  RFC7540 Section 6.5.2.
     DEFAULT_SIZE = 4096
@@ -111,6 +171,32 @@ class HeaderTable(object):
         self.resized = False
         self.dynamic_entries = deque()
 
+        # The size of each dynamic table entry, in the same order, so that
+        # eviction doesn't need to recompute them.
+        self._entry_sizes = deque()
+
+        # Hash indexes over the dynamic table, used by search. Each maps a
+        # key to the absolute insertion counter of the most recently added
+        # entry with that key. As the table is FIFO, the most recently added
+        # matching entry is always the one with the lowest HPACK index, which
+        # is the entry a linear scan would find first.
+        self._insert_count = 0
+        self._name_index = {}
+        self._header_index = {}
+
+        # The unicode forms of dynamic table entries that have been decoded
+        # as text, keyed like _header_index, so that each entry is only
+        # decoded from UTF-8 once.
+        self._text_headers = {}
+
+        #: A counter that changes whenever the table may have changed. Two
+        #: points in time with the same generation see identical tables.
+        self.generation = 0
+
+        # The number of tables sharing the containers above, held in a list
+        # that the tables share with them. See fork.
+        self._sharers = [1]
+
     def get_by_index(self, index):
         """
         Returns the entry specified by index
@@ -149,14 +235,21 @@ class HeaderTable(object):
         We reduce the table size if the entry will make the
         table size greater than maxsize.
         """
+        self.generation += 1
+
         # We just clear the table if the entry is too big
         size = table_entry_size(name, value)
         if size > self._maxsize:
-            self.dynamic_entries.clear()
-            self._current_size = 0
+            self._clear()
         else:
+            if self._sharers[0] > 1:
+                self._unshare()
             # Add new entry
             self.dynamic_entries.appendleft((name, value))
+            self._entry_sizes.appendleft(size)
+            self._name_index[name] = self._insert_count
+            self._header_index[(name, value)] = self._insert_count
+            self._insert_count += 1
             self._current_size += size
             self._shrink()
 
@@ -180,15 +273,148 @@ class HeaderTable(object):
             else:
                 partial = (header_name_search_result[0], name, None)
 
-        offset = HeaderTable.STATIC_TABLE_LENGTH + 1
-        for (i, (n, v)) in enumerate(self.dynamic_entries):
-            if n == name:
-                if v == value:
-                    return i + offset, n, v
-                elif partial is None:
-                    partial = (i + offset, n, None)
+        # An HPACK index is computed from an insertion counter by counting
+        # back from the most recent insertion.
+        offset = HeaderTable.STATIC_TABLE_LENGTH + self._insert_count
+        insertion = self._header_index.get((name, value))
+        if insertion is not None:
+            return offset - insertion, name, value
+
+        if partial is None:
+            insertion = self._name_index.get(name)
+            if insertion is not None:
+                partial = (offset - insertion, name, None)
         return partial
 
+    def get_text(self, name, value):
+        """
+        Returns the unicode form stored for the dynamic table entry with this
+        name and value, or ``None`` if there is none.
+        """
+        return self._text_headers.get((name, value))
+
+    def set_text(self, name, value, text):
+        """
+        Stores the unicode form of the dynamic table entry with this name and
+        value, to be returned by get_text until the entry is evicted. Does
+        nothing if there is no such entry.
+        """
+        key = (name, value)
+        if key in self._header_index:
+            if self._sharers[0] > 1:
+                self._unshare()
+            self._text_headers[key] = text
+
+    def fork(self):
+        """
+        Returns a new table with the same state as this one, in constant time
+        and memory. The two tables share their entries and indexes until
+        either of them is changed, when that table first takes its own copy.
+        """
+        forked = type(self).__new__(type(self))
+        forked._maxsize = self._maxsize
+        forked._current_size = self._current_size
+        forked.resized = self.resized
+        forked.dynamic_entries = self.dynamic_entries
+        forked._entry_sizes = self._entry_sizes
+        forked._insert_count = self._insert_count
+        forked._name_index = self._name_index
+        forked._header_index = self._header_index
+        forked._text_headers = self._text_headers
+        forked.generation = self.generation
+        forked._sharers = self._sharers
+        self._sharers[0] += 1
+        return forked
+
+    def _unshare(self):
+        """
+        Gives this table its own copies of the containers it shares with
+        forked tables, before it changes them.
+        """
+        self._sharers[0] -= 1
+        self._sharers = [1]
+        self.dynamic_entries = deque(self.dynamic_entries)
+        self._entry_sizes = deque(self._entry_sizes)
+        self._name_index = self._name_index.copy()
+        self._header_index = self._header_index.copy()
+        self._text_headers = self._text_headers.copy()
+
+    def snapshot(self):
+        """
+        Returns the state of the dynamic table as a bytestring, from which
+        restore can rebuild it in another process.
+        """
+        parts = [
+            snapshot_header(b'T'),
+            _TABLE_STATE.pack(
+                self._maxsize, self.resized, len(self.dynamic_entries)
+            ),
+        ]
+        for name, value in reversed(self.dynamic_entries):
+            parts.append(_ENTRY_LENGTHS.pack(len(name), len(value)))
+            parts.append(name)
+            parts.append(value)
+        return b''.join(parts)
+
+    def restore(self, data):
+        """
+        Replaces the state of the dynamic table with one returned by
+        snapshot. The table is left unchanged if ``data`` is not a valid
+        header table snapshot.
+        """
+        data = to_bytes(data)
+        state, offset = self._parse_snapshot(data, 0)
+        if offset != len(data):
+            raise InvalidSnapshotError("Trailing data after snapshot")
+        self._apply_snapshot(*state)
+
+    @staticmethod
+    def _parse_snapshot(data, offset):
+        """
+        Reads a header table snapshot starting at ``offset``. Returns the
+        maximum size, resized flag and entries it holds, and the offset just
+        past it.
+        """
+        offset = check_snapshot_header(b'T', data, offset)
+        (maxsize, resized, count), offset = unpack_snapshot(
+            _TABLE_STATE, data, offset
+        )
+
+        entries = []
+        size = 0
+        for _ in range(count):
+            (name_len, value_len), offset = unpack_snapshot(
+                _ENTRY_LENGTHS, data, offset
+            )
+            name_end = offset + name_len
+            end = name_end + value_len
+            if end > len(data):
+                raise InvalidSnapshotError("Truncated snapshot")
+            entries.append((data[offset:name_end], data[name_end:end]))
+            size += 32 + name_len + value_len
+            offset = end
+
+        # Entries that don't fit would be evicted as they were added, and the
+        # table would no longer match its peer's.
+        if size > maxsize:
+            raise InvalidSnapshotError(
+                "Snapshot entries of size %d exceed the table size %d" %
+                (size, maxsize)
+            )
+        return (maxsize, resized, entries), offset
+
+    def _apply_snapshot(self, maxsize, resized, entries):
+        """
+        Replaces the state of the dynamic table with that read by
+        _parse_snapshot.
+        """
+        self._clear()
+        self._maxsize = maxsize
+        for name, value in entries:
+            self.add(name, value)
+        self.resized = resized
+        self.generation += 1
+
     @property
     def maxsize(self):
         return self._maxsize
@@ -196,25 +422,67 @@ class HeaderTable(object):
     @maxsize.setter
     def maxsize(self, newmax):
         newmax = int(newmax)
-        log.debug("Resizing header table to %d from %d", newmax, self._maxsize)
+        if _debug:
+            log.debug(
+                "Resizing header table to %d from %d", newmax, self._maxsize
+            )
         oldmax = self._maxsize
         self._maxsize = newmax
+        self.generation += 1
         self.resized = (newmax != oldmax)
         if newmax <= 0:
-            self.dynamic_entries.clear()
-            self._current_size = 0
+            self._clear()
         elif oldmax > newmax:
             self._shrink()
 
+    def _clear(self):
+        """
+        Empties the dynamic table
+        """
+        if self._sharers[0] > 1:
+            # Rather than copy containers shared with forked tables only to
+            # empty them, take new ones.
+            self._sharers[0] -= 1
+            self._sharers = [1]
+            self.dynamic_entries = deque()
+            self._entry_sizes = deque()
+            self._name_index = {}
+            self._header_index = {}
+            self._text_headers = {}
+        else:
+            self.dynamic_entries.clear()
+            self._entry_sizes.clear()
+            self._name_index.clear()
+            self._header_index.clear()
+            self._text_headers.clear()
+        self._current_size = 0
+
     def _shrink(self):
         """
         Shrinks the dynamic table to be at or below maxsize
         """
         cursize = self._current_size
+        if cursize > self._maxsize and self._sharers[0] > 1:
+            self._unshare()
+
+        # The oldest entry in the table has the lowest insertion counter.
+        evicted = self._insert_count - len(self.dynamic_entries)
         while cursize > self._maxsize:
             name, value = self.dynamic_entries.pop()
-            cursize -= table_entry_size(name, value)
-            log.debug("Evicting %s: %s from the header table", name, value)
+            cursize -= self._entry_sizes.pop()
+            if _debug:
+                log.debug(
+                    "Evicting %s: %s from the header table", name, value
+                )
+
+            # Only drop index entries that still refer to the evicted entry:
+            # if a newer entry shares the key, the index points to that one.
+            if self._name_index.get(name) == evicted:
+                del self._name_index[name]
+            if self._header_index.get((name, value)) == evicted:
+                del self._header_index[(name, value)]
+                self._text_headers.pop((name, value), None)
+            evicted += 1
         self._current_size = cursize
 
 
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import sys
+import threading
+
+from hpack.cache import LRUCache, SynchronizedLRUCache, object_sizes
+
+
+class TestLRUCache(object):
+    def test_get_missing_returns_default(self):
+        cache = LRUCache(2)
+        assert cache.get('a') is None
+        assert cache.get('a', 1) == 1
+        assert cache.misses == 2
+        assert cache.hits == 0
+
+    def test_put_and_get(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        assert cache.get('a') == 1
+        assert 'a' in cache
+        assert len(cache) == 1
+        assert cache.hits == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.evictions == 1
+
+    def test_replacing_entry_does_not_evict(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+
+        assert cache.get('a') == 3
+        assert 'b' in cache
+        assert cache.size == 2
+        assert cache.evictions == 0
+
+    def test_weighted_entries(self):
+        cache = LRUCache(10, weigh=lambda key, value: len(value))
+        cache.put('a', b'12345')
+        cache.put('b', b'1234')
+        assert cache.size == 9
+
+        cache.put('c', b'12')
+        assert 'a' not in cache
+        assert cache.size == 6
+        assert cache.evictions == 1
+
+    def test_entries_heavier_than_maxsize_not_stored(self):
+        cache = LRUCache(4, weigh=lambda key, value: len(value))
+        cache.put('a', b'12345')
+
+        assert 'a' not in cache
+        assert cache.size == 0
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
+        assert cache.hits == 1
+
+
+class TestSynchronizedLRUCache(object):
+    def test_behaves_like_lru_cache(self):
+        cache = SynchronizedLRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+
+        assert 'b' not in cache
+        assert cache.evictions == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_concurrent_use_keeps_size_consistent(self):
+        cache = SynchronizedLRUCache(1000, weigh=object_sizes)
+
+        def worker(n):
+            for i in range(2000):
+                key = ('%d' % (i % 300 + n)).encode('ascii')
+                if cache.get(key) is None:
+                    cache.put(key, key * 2)
+
+        threads = [
+            threading.Thread(target=worker, args=(n,)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.size == sum(
+            object_sizes(key, value) for key, (value, _) in
+            cache._entries.items()
+        )
+        assert cache.size <= cache.maxsize
+
+
+class TestObjectSizes(object):
+    def test_weighs_key_and_value(self):
+        assert object_sizes(b'ab', b'abcd') == (
+            sys.getsizeof(b'ab') + sys.getsizeof(b'abcd')
+        )
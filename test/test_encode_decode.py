@@ -51,6 +51,14 @@ class TestIntegerDecoding(object):
         with pytest.raises(HPACKDecodingError):
             decode_integer(b'\x1f', 5)
 
+    def test_decode_longest_integer(self):
+        val = decode_integer(b'\x1f\xff\xff\xff\xff\x7f', 5)
+        assert val == (31 + 2 ** 35 - 1, 6)
+
+    def test_decode_overlong_integer_fails(self):
+        with pytest.raises(HPACKDecodingError):
+            decode_integer(b'\x1f\x80\x80\x80\x80\x80\x01', 5)
+
 
 class TestEncodingProperties(object):
     """
@@ -126,7 +134,7 @@ class TestEncodingProperties(object):
             assert consumed > 0
 
     @given(
-        integer=integers(min_value=0),
+        integer=integers(min_value=0, max_value=2 ** 35),
         prefix_bits=integers(min_value=1, max_value=8)
     )
     def test_encode_decode_round_trips(self, integer, prefix_bits):
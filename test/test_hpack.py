@@ -1,15 +1,23 @@
 # -*- coding: utf-8 -*-
-from hpack.hpack import Encoder, Decoder, _dict_to_iterable, _to_bytes
+from hpack.hpack import (
+    Encoder, Decoder, _dict_to_iterable, _to_bytes, HUFFMAN_CACHE,
+    encode_integer, decode_integer, set_debug_logging
+)
 from hpack.exceptions import (
     HPACKDecodingError, InvalidTableIndex, OversizedHeaderListError,
-    InvalidTableSizeError
+    InvalidTableSizeError, InvalidSnapshotError
 )
+from hpack.indexing import IndexingPolicy, DenylistIndexingPolicy
 from hpack.struct import HeaderTuple, NeverIndexedHeaderTuple
+import array
 import itertools
+import logging
 import pytest
 
 from hypothesis import given
-from hypothesis.strategies import text, binary, sets, one_of
+from hypothesis.strategies import (
+    text, binary, sets, one_of, sampled_from
+)
 
 try:
     unicode = unicode
@@ -87,6 +95,36 @@ class TestHPACKEncoder(object):
         ]
         assert e.encode(header_set, huffman=True) == result
 
+    def test_huffman_skipped_when_not_shorter(self):
+        """
+        Strings whose Huffman encoding is no shorter than the raw string are
+        sent raw, even when Huffman encoding is requested.
+        """
+        e = Encoder()
+        # '&' has an 8-bit Huffman code, and '{' a 15-bit one.
+        header_set = [('&', '{{')]
+        result = b'\x40\x01&\x02{{'
+
+        assert e.encode(header_set, huffman=True) == result
+        assert Decoder().decode(result) == header_set
+
+    def test_huffman_chosen_per_string(self):
+        e = Encoder()
+        header_set = [('custom-key', '{{')]
+        result = b'\x40\x88%\xa8I\xe9[\xa9}\x7f\x02{{'
+
+        assert e.encode(header_set, huffman=True) == result
+        assert Decoder().decode(result) == header_set
+
+    @given(value=binary())
+    def test_huffman_never_longer_than_raw(self, value):
+        header_set = [(b'custom-key', value)]
+        huffman = Encoder().encode(header_set, huffman=True)
+        raw = Encoder().encode(header_set, huffman=False)
+
+        assert len(huffman) <= len(raw)
+        assert Decoder().decode(huffman, raw=True) == header_set
+
     def test_header_table_size_getter(self):
         e = Encoder()
         assert e.header_table_size == 4096
@@ -337,6 +375,536 @@ class TestHPACKEncoder(object):
 
         assert len(e.header_table.dynamic_entries) == 1
 
+    def test_huffman_coder_shared(self):
+        assert Encoder().huffman_coder is Encoder().huffman_coder
+        assert (
+            Encoder(huffman_cache=True).huffman_coder is
+            Encoder(huffman_cache=True).huffman_coder
+        )
+
+    def test_slotted(self):
+        e = Encoder()
+
+        assert not hasattr(e, '__dict__')
+        assert not hasattr(e.huffman_coder, '__dict__')
+        assert not hasattr(e.header_table, '__dict__')
+
+
+class RecordingIndexingPolicy(IndexingPolicy):
+    """
+    An indexing policy that indexes headers with names starting with 'x-',
+    and records what it is told.
+    """
+    def __init__(self):
+        self.asked = []
+        self.reuses = []
+
+    def should_index(self, name, value):
+        self.asked.append((name, value))
+        return name.startswith(b'x-')
+
+    def reused(self, name, value):
+        self.reuses.append((name, value))
+
+
+class TestHPACKEncoderIndexingPolicy(object):
+    def test_declined_literal_is_not_indexed(self):
+        e = Encoder(indexing_policy=DenylistIndexingPolicy([b'custom']))
+        header_set = [('custom', '1')]
+        result = b'\x00\x06custom\x011'
+
+        assert e.encode(header_set, huffman=False) == result
+        assert len(e.header_table.dynamic_entries) == 0
+        assert Decoder().decode(result) == header_set
+
+    def test_declined_indexed_literal_is_not_indexed(self):
+        e = Encoder(indexing_policy=DenylistIndexingPolicy())
+        header_set = [('content-length', '1234')]
+        result = b'\x0f\x0d\x041234'
+
+        assert e.encode(header_set, huffman=False) == result
+        assert len(e.header_table.dynamic_entries) == 0
+        assert Decoder().decode(result) == header_set
+
+    def test_policy_sees_only_headers_not_in_table(self):
+        policy = RecordingIndexingPolicy()
+        e = Encoder(indexing_policy=policy)
+        header_set = [
+            (':method', 'GET'),
+            ('x-id', '1'),
+            ('server', 'nginx'),
+        ]
+        e.encode(header_set)
+        e.encode(header_set)
+
+        assert policy.asked == [
+            (b'x-id', b'1'), (b'server', b'nginx'), (b'server', b'nginx')
+        ]
+        assert policy.reuses == [(b'x-id', b'1')]
+        assert list(e.header_table.dynamic_entries) == [(b'x-id', b'1')]
+
+    def test_sensitive_headers_are_never_indexed(self):
+        policy = RecordingIndexingPolicy()
+        e = Encoder(indexing_policy=policy)
+        e.encode([('x-secret', 'hunter2', True)])
+
+        assert policy.asked == []
+        assert len(e.header_table.dynamic_entries) == 0
+
+    @given(
+        values=sets(binary(), min_size=1),
+        policy=sampled_from([
+            None, IndexingPolicy(), DenylistIndexingPolicy([b'custom'])
+        ])
+    )
+    def test_policies_round_trip(self, values, policy):
+        e = Encoder(indexing_policy=policy)
+        d = Decoder()
+        for value in sorted(values) * 2:
+            header_set = [(b'custom', value), (b'other', value)]
+            assert d.decode(e.encode(header_set), raw=True) == header_set
+
+
+class TestHPACKEncoderBlockCache(object):
+    """
+    Tests for the encoder's cache of encoded header blocks.
+    """
+    headers = [
+        (':status', '200'),
+        ('content-type', 'text/html; charset=utf-8'),
+        ('server', 'hpack'),
+        ('cache-control', 'max-age=600'),
+    ]
+
+    def test_disabled_by_default(self):
+        e = Encoder()
+        assert e.block_cache is None
+
+    def test_repeated_blocks_match_uncached_encoder(self):
+        """
+        A caching encoder emits exactly what an uncached one does, and
+        leaves its header table in the same state.
+        """
+        e = Encoder()
+        cached = Encoder(block_cache_size=4)
+
+        for _ in range(4):
+            assert cached.encode(self.headers) == e.encode(self.headers)
+            assert (
+                list(cached.header_table.dynamic_entries) ==
+                list(e.header_table.dynamic_entries)
+            )
+
+        # The first two blocks differ because the first fills the table; the
+        # rest reuse the second.
+        assert cached.block_cache.misses == 2
+        assert cached.block_cache.hits == 2
+
+    def test_blocks_that_change_table_not_cached(self):
+        """
+        A block that adds to the header table is not cached, as the table is
+        never in the same state again.
+        """
+        e = Encoder(block_cache_size=4)
+        e.encode([('custom-key', 'custom-value')])
+        assert len(e.block_cache) == 0
+
+        e.encode([('custom-key', 'custom-value')])
+        assert len(e.block_cache) == 1
+
+    def test_block_cache_is_read_only(self):
+        """
+        Cached blocks are only valid for the encoder's own header table, so
+        the cache can't be shared with another encoder.
+        """
+        e = Encoder(block_cache_size=4)
+        other = Encoder(block_cache_size=4)
+
+        with pytest.raises(AttributeError):
+            other.block_cache = e.block_cache
+
+    def test_sensitive_headers_not_cached(self):
+        """
+        Header sets holding a sensitive header bypass the cache, so that it
+        doesn't keep their values alive.
+        """
+        e = Encoder(block_cache_size=4)
+        header_sets = [
+            [NeverIndexedHeaderTuple('authorization', 'secret')],
+            [('custom-key', 'value'), ('authorization', 'secret', True)],
+        ]
+
+        for headers in header_sets:
+            assert e.encode(headers) == Encoder().encode(headers)
+        assert len(e.block_cache) == 0
+
+    def test_plain_tuple_after_never_indexed(self):
+        e = Encoder(block_cache_size=4)
+        sensitive = [NeverIndexedHeaderTuple('custom-key', 'custom-value')]
+        plain = [('custom-key', 'custom-value')]
+
+        assert e.encode(sensitive) == Encoder().encode(sensitive)
+        assert e.encode(plain) == Encoder().encode(plain)
+        assert e.block_cache.hits == 0
+
+    @pytest.mark.parametrize(
+        'first,second', [(1, True), (1.0, 1), (True, 1)]
+    )
+    def test_equal_values_sent_differently_not_confused(self, first, second):
+        """
+        Values that compare equal but are sent as different bytes are cached
+        separately.
+        """
+        # Nothing is added to the header table, so both blocks are encoded
+        # with the table in the same state.
+        e = Encoder(
+            block_cache_size=4,
+            indexing_policy=DenylistIndexingPolicy([b'x-flag']),
+        )
+        e.encode([('x-flag', first)])
+
+        headers = Decoder().decode(e.encode([('x-flag', second)]))
+        assert headers == [('x-flag', str(second))]
+        assert e.block_cache.hits == 0
+
+    def test_generators_and_dicts(self):
+        e = Encoder(block_cache_size=4)
+        plain = Encoder()
+
+        for _ in range(3):
+            assert (
+                e.encode(h for h in self.headers) ==
+                plain.encode(h for h in self.headers)
+            )
+            assert e.encode(dict(self.headers)) == plain.encode(
+                dict(self.headers)
+            )
+
+        # The headers are the same whichever way they are given, so only the
+        # first two blocks miss.
+        assert e.block_cache.hits == 4
+
+    def test_list_headers_cached(self):
+        e = Encoder(block_cache_size=4)
+        plain = Encoder()
+        headers = [['custom-key', 'custom-value']]
+
+        for _ in range(2):
+            assert e.encode(headers) == plain.encode(headers)
+        assert len(e.block_cache) == 1
+
+    def test_table_size_changes_bypass_cache(self):
+        e = Encoder(block_cache_size=4)
+        plain = Encoder()
+
+        for encoder in (e, plain):
+            encoder.encode(self.headers)
+            encoder.encode(self.headers)
+            encoder.header_table_size = 1024
+
+        block = e.encode(self.headers)
+        assert block == plain.encode(self.headers)
+        assert block.startswith(b'\x3f\xe1\x07')
+        assert e.encode(self.headers) == plain.encode(self.headers)
+
+    def test_huffman_setting_is_part_of_key(self):
+        e = Encoder(block_cache_size=4)
+        e.encode(self.headers)
+        huffman = e.encode(self.headers)
+        plain = e.encode(self.headers, huffman=False)
+
+        assert e.block_cache.hits == 0
+        assert huffman == plain
+
+
+class TestHPACKEncoderHuffmanCache(object):
+    """
+    Tests for the process-wide cache of Huffman-encoded strings.
+    """
+    def setup_method(self, method):
+        HUFFMAN_CACHE.clear()
+
+    def teardown_method(self, method):
+        HUFFMAN_CACHE.clear()
+
+    def test_disabled_by_default(self):
+        e = Encoder()
+        e.encode([('custom-key', 'custom-value')])
+
+        assert e.huffman_coder.cache is None
+        assert len(HUFFMAN_CACHE) == 0
+
+    def test_shared_between_encoders(self):
+        headers = [('content-type', 'text/html; charset=utf-8')]
+        first = Encoder(huffman_cache=True)
+        second = Encoder(huffman_cache=True)
+        hits = HUFFMAN_CACHE.hits
+
+        assert first.encode(headers) == Encoder().encode(headers)
+        assert b'text/html; charset=utf-8' in HUFFMAN_CACHE
+
+        assert second.encode(headers) == Encoder().encode(headers)
+        assert HUFFMAN_CACHE.hits == hits + 1
+
+    def test_not_used_without_huffman(self):
+        e = Encoder(huffman_cache=True)
+        e.encode([('custom-key', 'custom-value')], huffman=False)
+
+        assert len(HUFFMAN_CACHE) == 0
+
+    @pytest.mark.parametrize('header', [
+        NeverIndexedHeaderTuple('authorization', 'Bearer secret-token-123'),
+        ('authorization', 'Bearer secret-token-123', True),
+        ('x-api-key', 'Bearer secret-token-123', True),
+    ])
+    def test_sensitive_values_not_cached(self, header):
+        """
+        Sensitive values are never kept in the process-wide cache.
+        """
+        e = Encoder(huffman_cache=True)
+        assert e.encode([header]) == Encoder().encode([header])
+        assert e.encode_many([[header]]) == [Encoder().encode([header])]
+
+        assert b'Bearer secret-token-123' not in HUFFMAN_CACHE
+
+
+class TestHPACKEncoderEncodeInto(object):
+    """
+    Tests for encoding header blocks straight into a buffer.
+    """
+    headers = [
+        (':status', '200'),
+        ('content-type', 'text/html; charset=utf-8'),
+        ('custom-key', 'custom-value'),
+    ]
+
+    @pytest.mark.parametrize('block_cache_size', [0, 4])
+    def test_matches_encode(self, block_cache_size):
+        e = Encoder(block_cache_size=block_cache_size)
+        plain = Encoder()
+
+        for _ in range(3):
+            buf = bytearray()
+            size = e.encode_into(self.headers, buf)
+            expected = plain.encode(self.headers)
+
+            assert size == len(expected)
+            assert buf == expected
+
+    def test_bytearray_at_offset(self):
+        e = Encoder()
+        e.header_table_size = 1024
+        expected = Encoder()
+        expected.header_table_size = 1024
+        expected = expected.encode(self.headers)
+
+        buf = bytearray(b'\x00' * 9)
+        size = e.encode_into(self.headers, buf, offset=9)
+
+        assert size == len(expected)
+        assert buf == b'\x00' * 9 + expected
+
+    def test_bytearray_overwritten_in_place(self):
+        expected = Encoder().encode(self.headers)
+        buf = bytearray(b'\xff' * (len(expected) + 10))
+
+        size = Encoder().encode_into(self.headers, buf, offset=2)
+
+        assert buf[:2] == b'\xff\xff'
+        assert buf[2:2 + size] == expected
+        assert buf[2 + size:] == b'\xff' * 8
+
+    def test_memoryview(self):
+        expected = Encoder().encode(self.headers)
+        buf = bytearray(len(expected) + 4)
+
+        size = Encoder().encode_into(self.headers, memoryview(buf), offset=4)
+
+        assert size == len(expected)
+        assert buf[4:] == expected
+
+    @pytest.mark.parametrize('typecode', ['B', 'H'])
+    @pytest.mark.parametrize('wrap', [False, True], ids=['array', 'view'])
+    def test_array(self, typecode, wrap):
+        """
+        Buffers with larger items are written as bytes, at a byte offset.
+        """
+        expected = Encoder().encode(self.headers)
+        buf = array.array(typecode, b'\x00' * (2 * len(expected) + 4))
+
+        target = memoryview(buf) if wrap else buf
+        size = Encoder().encode_into(self.headers, target, offset=3)
+
+        assert size == len(expected)
+        assert buf.tobytes()[3:3 + size] == expected
+
+    def test_array_too_small(self):
+        expected = Encoder().encode(self.headers)
+        buf = array.array('H', [0]) * ((len(expected) - 1) // 2)
+
+        with pytest.raises(ValueError):
+            Encoder().encode_into(self.headers, buf)
+
+    def test_memoryview_too_small(self):
+        expected = Encoder().encode(self.headers)
+        buf = memoryview(bytearray(len(expected) - 1))
+
+        with pytest.raises(ValueError):
+            Encoder().encode_into(self.headers, buf)
+
+    @pytest.mark.parametrize('offset', [-1, 4])
+    def test_offset_outside_buffer(self, offset):
+        e = Encoder()
+
+        with pytest.raises(ValueError):
+            e.encode_into(self.headers, bytearray(3), offset=offset)
+        assert not e.header_table.dynamic_entries
+
+    @pytest.mark.parametrize(
+        'buf', [
+            b'\x00' * 256,
+            memoryview(b'\x00' * 256),
+            memoryview(array.array('H', b'\x00' * 256)).toreadonly(),
+            memoryview(bytearray(512))[::2],
+        ],
+        ids=['bytes', 'memoryview', 'array', 'non-contiguous']
+    )
+    def test_unusable_buffer(self, buf):
+        """
+        A read-only buffer, or one that can't be viewed as bytes, is rejected
+        before the header table is changed.
+        """
+        e = Encoder()
+
+        with pytest.raises(TypeError):
+            e.encode_into(self.headers, buf)
+        assert not e.header_table.dynamic_entries
+
+
+class TestHPACKEncoderEncodeMany(object):
+    """
+    Tests for encoding many header sets at once.
+    """
+    header_sets = [
+        [(':status', '200'), ('content-type', 'text/html')],
+        [(':status', '200'), ('content-type', 'text/html')],
+        {':status': '404', 'custom-key': 'custom-value'},
+        [HeaderTuple(':status', '200'),
+         NeverIndexedHeaderTuple('authorization', 'secret')],
+        [(':status', '304'), ('etag', 'abc', True)],
+    ]
+
+    def sequential(self, encoder, header_sets, huffman=True):
+        return [encoder.encode(h, huffman) for h in header_sets]
+
+    @pytest.mark.parametrize('huffman', [True, False])
+    @pytest.mark.parametrize('block_cache_size', [0, 4])
+    def test_matches_sequential_encode(self, huffman, block_cache_size):
+        e = Encoder(block_cache_size=block_cache_size)
+        plain = Encoder()
+
+        blocks = e.encode_many(self.header_sets, huffman=huffman)
+
+        assert blocks == self.sequential(plain, self.header_sets, huffman)
+        assert (
+            list(e.header_table.dynamic_entries) ==
+            list(plain.header_table.dynamic_entries)
+        )
+
+    def test_table_size_changes_only_in_first_block(self):
+        e = Encoder()
+        plain = Encoder()
+        for encoder in (e, plain):
+            encoder.header_table_size = 1024
+            encoder.header_table_size = 2048
+
+        headers = [(':status', '200')]
+        blocks = e.encode_many([headers, headers])
+
+        assert blocks == self.sequential(plain, [headers, headers])
+        assert blocks[0].startswith(b'\x3f\xe1\x07\x3f\xe1\x0f')
+        assert blocks[1] == b'\x88'
+
+    def test_empty(self):
+        e = Encoder()
+        e.header_table_size = 1024
+
+        assert e.encode_many([]) == []
+        assert e.encode([]) == b'\x3f\xe1\x07'
+
+    @given(values=sets(text(), min_size=1, max_size=10))
+    def test_round_trip(self, values):
+        header_sets = [[('custom-key', v), (':path', v)] for v in values]
+        d = Decoder()
+
+        blocks = Encoder().encode_many(header_sets)
+
+        assert [d.decode(b) for b in blocks] == header_sets
+
+
+class TestHPACKEncoderFork(object):
+    """
+    Tests for forking an encoder with a warmed header table.
+    """
+    header_sets = [
+        [(':method', 'GET'), ('custom-key', 'custom-value'), ('a', 'b' * 50)],
+        [('custom-key', 'custom-value'), ('a', 'b' * 50), ('c', 'd')],
+    ]
+
+    def warmed(self, **kwargs):
+        e = Encoder(**kwargs)
+        d = Decoder()
+        d.decode(e.encode(self.header_sets[0]))
+        return e, d
+
+    def test_forks_encode_independently(self):
+        e, d = self.warmed()
+        forks = [e.fork() for _ in range(3)]
+        decoders = [Decoder() for _ in forks]
+        for decoder in decoders:
+            decoder.restore(d.snapshot())
+
+        for fork, decoder in zip(forks, decoders):
+            for header_set in self.header_sets:
+                assert decoder.decode(fork.encode(header_set)) == header_set
+
+        # The original still encodes against its own, unchanged table.
+        for header_set in self.header_sets:
+            assert d.decode(e.encode(header_set)) == header_set
+
+    def test_fork_encodes_like_original(self):
+        e, _ = self.warmed()
+        forked = e.fork()
+
+        for header_set in self.header_sets:
+            assert forked.encode(header_set) == e.encode(header_set)
+
+    def test_fork_keeps_table_size_changes(self):
+        e = Encoder()
+        e.header_table_size = 1024
+        forked = e.fork()
+
+        assert forked.table_size_changes == [1024]
+        assert forked.table_size_changes is not e.table_size_changes
+        assert forked.encode([]) == e.encode([])
+
+    def test_fork_has_empty_block_cache(self):
+        e, _ = self.warmed(block_cache_size=8)
+        e.encode(self.header_sets[1])
+        forked = e.fork()
+
+        assert forked.block_cache is not e.block_cache
+        assert forked.block_cache.maxsize == 8
+        assert len(forked.block_cache) == 0
+
+    def test_fork_shares_policy_and_coder(self):
+        policy = DenylistIndexingPolicy()
+        e = Encoder(indexing_policy=policy)
+        forked = e.fork()
+
+        assert forked.indexing_policy is policy
+        assert forked.huffman_coder is e.huffman_coder
+
 
 class TestHPACKDecoder(object):
     # These tests are stolen entirely from the IETF specification examples.
@@ -354,6 +922,22 @@ class TestHPACKDecoder(object):
             (n.encode('utf-8'), v.encode('utf-8')) for n, v in header_set
         ]
 
+    def test_decoding_from_bytearray(self):
+        """
+        Header blocks may be passed in any bytes-like object, including
+        mutable ones.
+        """
+        d = Decoder()
+        data = bytearray(b'\x40\x0acustom-key\x0dcustom-header')
+
+        assert d.decode(data) == [('custom-key', 'custom-header')]
+        assert d.decode(data[:1] + b'\x0acustom-key\x0dcustom-header') == [
+            ('custom-key', 'custom-header')
+        ]
+        assert d.decode(bytearray(b'\xbe')) == [
+            ('custom-key', 'custom-header')
+        ]
+
     def test_raw_decoding(self):
         """
         The header field representation is decoded as a raw byte string instead
@@ -370,6 +954,65 @@ class TestHPACKDecoder(object):
 
         assert d.decode(data, raw=True) == header_set
 
+    def test_raw_decoding_from_bytearray_returns_bytes(self):
+        d = Decoder()
+        data = bytearray(b'\x04\x0c/sample/path')
+
+        headers = d.decode(data, raw=True)
+        assert headers == [(b':path', b'/sample/path')]
+        assert all(isinstance(v, bytes) for v in headers[0])
+
+    def test_zero_copy_decoding(self):
+        """
+        With zero_copy, plain literals that are not indexed are returned as
+        views of the header block.
+        """
+        d = Decoder()
+        data = bytearray(b'\x00\x0acustom-key\x0dcustom-header')
+
+        headers = d.decode(data, raw=True, zero_copy=True)
+        assert headers == [(b'custom-key', b'custom-header')]
+        name, value = headers[0]
+        assert isinstance(name, memoryview)
+        assert isinstance(value, memoryview)
+
+        # The views share memory with the block.
+        data[2:12] = b'CUSTOM-KEY'
+        assert name == b'CUSTOM-KEY'
+
+    def test_zero_copy_decoding_copies_indexed_and_huffman_strings(self):
+        """
+        Headers added to the table, Huffman-coded strings and names from the
+        table are never views of the header block.
+        """
+        d = Decoder()
+        data = (
+            b'\x40\x0acustom-key\x0dcustom-header'
+            b'\x04\x89\x61\x03\xa6\xba\x0a\xc5\x63\x4c\xff'
+        )
+
+        headers = d.decode(data, raw=True, zero_copy=True)
+        assert headers == [
+            (b'custom-key', b'custom-header'), (b':path', b'/sample/path')
+        ]
+        assert all(isinstance(s, bytes) for h in headers for s in h)
+        assert list(d.header_table.dynamic_entries) == [
+            (b'custom-key', b'custom-header')
+        ]
+        assert all(
+            isinstance(s, bytes)
+            for entry in d.header_table.dynamic_entries
+            for s in entry
+        )
+
+    def test_zero_copy_ignored_unless_raw(self):
+        d = Decoder()
+        data = b'\x00\x0acustom-key\x0dcustom-header'
+
+        assert d.decode(data, zero_copy=True) == [
+            ('custom-key', 'custom-header')
+        ]
+
     def test_literal_header_field_without_indexing(self):
         """
         The header field representation uses an indexed name and a literal
@@ -382,6 +1025,12 @@ class TestHPACKDecoder(object):
         assert d.decode(data) == header_set
         assert list(d.header_table.dynamic_entries) == []
 
+    def test_slotted(self):
+        d = Decoder()
+
+        assert not hasattr(d, '__dict__')
+        assert not hasattr(d.header_table, '__dict__')
+
     def test_header_table_size_getter(self):
         d = Decoder()
         assert d.header_table_size
@@ -717,6 +1366,19 @@ class TestHPACKDecoder(object):
         with pytest.raises(HPACKDecodingError):
             d.decode(data)
 
+    @pytest.mark.parametrize(
+        'data', [b'\x40', b'\x00', b'\x10', b'\x40\x01a', b'\x41']
+    )
+    def test_missing_string_length(self, data):
+        """
+        If a header block ends where a string length should be, an error is
+        raised.
+        """
+        d = Decoder()
+
+        with pytest.raises(HPACKDecodingError):
+            d.decode(data)
+
     def test_truncated_header_value(self):
         """
         If a header value is truncated an error is raised.
@@ -737,6 +1399,558 @@ class TestHPACKDecoder(object):
             d.decode(data)
 
 
+class TestHPACKDecoderFusedLoop(object):
+    """
+    Tests for decoding whole header blocks in a single loop.
+    """
+    header_sets = [
+        [(':method', 'GET'), (':path', '/'), ('custom-key', 'custom-value')],
+        [(':method', 'GET'), (':path', '/'), ('custom-key', 'custom-value')],
+        [(':status', '200'), ('content-type', 'a' * 200)],
+        [NeverIndexedHeaderTuple('authorization', 'secret'),
+         NeverIndexedHeaderTuple('custom-secret', 'secret')],
+        [('content-length', '1234'), ('date', 'Tue, 16 Oct 2026')],
+    ]
+
+    def blocks(self):
+        e = Encoder(indexing_policy=DenylistIndexingPolicy([b'date']))
+        blocks = []
+        for huffman in (True, False):
+            for header_set in self.header_sets:
+                blocks.append(e.encode(header_set, huffman=huffman))
+            e.header_table_size = 100
+        return blocks
+
+    @pytest.mark.parametrize('raw', [True, False])
+    def test_matches_field_by_field_decoding(self, raw):
+        fused = Decoder()
+        by_field = Decoder()
+        by_field._fused = False
+
+        for block in self.blocks():
+            result = fused.decode(block, raw=raw)
+            expected = by_field.decode(block, raw=raw)
+
+            assert result == expected
+            assert list(map(type, result)) == list(map(type, expected))
+            assert (
+                list(fused.header_table.dynamic_entries) ==
+                list(by_field.header_table.dynamic_entries)
+            )
+
+    def test_subclass_overrides_respected(self):
+        class UpperDecoder(Decoder):
+            def _decode_indexed(self, data, offset):
+                header, offset = super(UpperDecoder, self)._decode_indexed(
+                    data, offset
+                )
+                return HeaderTuple(header[0].upper(), header[1]), offset
+
+        d = UpperDecoder()
+
+        assert not d._fused
+        assert Decoder()._fused
+        assert d.decode(b'\x82') == [(':METHOD', 'GET')]
+
+    @pytest.mark.parametrize('data', [
+        b'\x40\x05abc', b'\x00\x01a\x05', b'\x00', b'\x7f', b'\xff\x80',
+    ])
+    def test_truncated_blocks_rejected(self, data):
+        with pytest.raises(HPACKDecodingError):
+            Decoder().decode(data)
+
+    def test_invalid_index_rejected(self):
+        with pytest.raises(InvalidTableIndex):
+            Decoder().decode(b'\x80')
+
+
+class TestHPACKDecodeMany(object):
+    """
+    Tests for decoding many header blocks at once.
+    """
+    header_sets = [
+        [(':status', '200'), ('content-type', 'text/html')],
+        [(':status', '200'), ('content-type', 'text/html')],
+        [(':status', '404'), ('custom-key', 'custom-value')],
+        [],
+        [(':status', '304'), ('etag', 'abc', True)],
+    ]
+
+    def blocks(self):
+        return Encoder().encode_many(self.header_sets)
+
+    @pytest.mark.parametrize('raw', [True, False])
+    def test_matches_sequential_decode(self, raw):
+        blocks = self.blocks()
+        d = Decoder()
+        plain = Decoder()
+
+        result = d.decode_many(blocks, raw=raw)
+
+        assert result == [plain.decode(b, raw=raw) for b in blocks]
+        assert isinstance(result[4][1], NeverIndexedHeaderTuple)
+        assert (
+            list(d.header_table.dynamic_entries) ==
+            list(plain.header_table.dynamic_entries)
+        )
+
+    @pytest.mark.parametrize('raw', [True, False])
+    def test_flat(self, raw):
+        blocks = self.blocks()
+
+        headers, offsets = Decoder().decode_many(blocks, raw=raw, flat=True)
+
+        assert offsets == [0, 2, 4, 6, 6, 8]
+        assert [
+            headers[offsets[i]:offsets[i + 1]] for i in range(len(blocks))
+        ] == Decoder().decode_many(blocks, raw=raw)
+
+    def test_bytearrays_return_bytes(self):
+        blocks = [bytearray(b) for b in self.blocks()]
+
+        result = Decoder().decode_many(blocks, raw=True)
+
+        assert result[0] == [
+            (b':status', b'200'), (b'content-type', b'text/html')
+        ]
+        assert all(type(h[1]) is bytes for hs in result for h in hs)
+
+    def test_empty(self):
+        assert Decoder().decode_many([]) == []
+        assert Decoder().decode_many([], flat=True) == ([], [0])
+
+    def test_table_size_update_allowed_at_start_of_each_block(self):
+        e = Encoder()
+        e.header_table_size = 1024
+        first = e.encode([(':status', '200')])
+        e.header_table_size = 2048
+        second = e.encode([(':status', '200')])
+
+        assert Decoder().decode_many([first, second]) == [
+            [(':status', '200')], [(':status', '200')]
+        ]
+
+    def test_max_header_list_size_applies_per_block(self):
+        d = Decoder(max_header_list_size=50)
+        blocks = Encoder().encode_many([[('a', 'b' * 10)]] * 3)
+
+        assert len(d.decode_many(blocks)) == 3
+
+        blocks = [Encoder().encode([('a', 'b' * 10), ('c', 'd')])]
+        with pytest.raises(OversizedHeaderListError):
+            d.decode_many(blocks)
+
+
+class TestHPACKDecoderInterning(object):
+    """
+    Tests for sharing the unicode strings of decoded headers.
+    """
+    headers = [
+        (':method', 'GET'),
+        ('content-type', 'text/html'),
+        ('custom-key', 'custom-value'),
+    ]
+
+    def test_static_entries_shared(self):
+        first = Decoder().decode(Encoder().encode(self.headers))
+        second = Decoder().decode(Encoder().encode(self.headers))
+
+        assert first[0] is second[0]
+        assert type(first[0]) is HeaderTuple
+        assert first[1][0] is second[1][0]
+
+    def test_disabled_by_default(self):
+        d = Decoder()
+        e = Encoder(indexing_policy=DenylistIndexingPolicy([b'custom-key']))
+        first = d.decode(e.encode(self.headers))
+        second = d.decode(e.encode(self.headers))
+
+        assert d.intern_pool is None
+        assert first == second
+        assert first[2][1] is not second[2][1]
+
+    def test_pool_shares_strings(self):
+        d = Decoder(intern_pool_size=16)
+        e = Encoder()
+        first = d.decode(e.encode(self.headers))
+        second = d.decode(e.encode(self.headers))
+
+        assert first == second == self.headers
+        assert first[1][1] is second[1][1]
+        assert first[2][0] is second[2][0]
+        assert first[2][1] is second[2][1]
+
+    def test_pool_bounded(self):
+        d = Decoder(intern_pool_size=4)
+        e = Encoder()
+        for i in range(10):
+            d.decode(e.encode([('custom-key-%d' % i, 'value-%d' % i)]))
+
+        assert len(d.intern_pool) == 4
+
+    def test_never_indexed_values_not_pooled(self):
+        d = Decoder(intern_pool_size=16)
+        e = Encoder()
+        headers = [NeverIndexedHeaderTuple('custom-key', 'secret')]
+
+        result = d.decode(e.encode(headers))
+
+        assert result == headers
+        assert type(result[0]) is NeverIndexedHeaderTuple
+        assert b'custom-key' in d.intern_pool
+        assert b'secret' not in d.intern_pool
+
+    def test_dynamic_entry_text_not_kept_by_default(self):
+        d = Decoder()
+        e = Encoder()
+        first = d.decode(e.encode(self.headers))
+        second = d.decode(e.encode(self.headers))
+
+        assert d.cache_text is False
+        assert first == second == self.headers
+        assert first[2] is not second[2]
+        assert d.header_table.get_text(b'custom-key', b'custom-value') is None
+
+    def test_dynamic_entries_decoded_once(self):
+        d = Decoder(cache_text=True)
+        e = Encoder()
+        first = d.decode(e.encode(self.headers))
+        second = d.decode(e.encode(self.headers))
+
+        assert first == second == self.headers
+        assert first[2] is second[2]
+        assert type(second[2]) is HeaderTuple
+
+    def test_dynamic_entry_text_dropped_on_eviction(self):
+        d = Decoder(cache_text=True)
+        e = Encoder()
+        headers = [('custom-key', 'custom-value')]
+        first = d.decode(e.encode(headers))
+
+        for encoder in (d, e):
+            encoder.header_table_size = 0
+            encoder.header_table_size = 4096
+        second = d.decode(e.encode(headers))
+
+        assert first == second
+        assert first[0] is not second[0]
+        assert d.header_table.get_text(
+            b'custom-key', b'custom-value'
+        ) is second[0]
+
+    def test_dynamic_entry_text_needs_valid_utf8(self):
+        d = Decoder(cache_text=True)
+        e = Encoder()
+        headers = [(b'custom-key', b'\xff')]
+        block = e.encode(headers)
+
+        assert d.decode(block, raw=True) == headers
+        with pytest.raises(HPACKDecodingError):
+            d.decode(e.encode(headers))
+
+    def test_raw_not_pooled(self):
+        d = Decoder(intern_pool_size=16)
+        d.decode(Encoder().encode(self.headers), raw=True)
+
+        assert len(d.intern_pool) == 0
+
+
+class TestHPACKStreamingDecoder(object):
+    """
+    Tests for decoding header blocks a fragment at a time.
+    """
+    block = (
+        b'\x82\x87\x85\x01\x0fwww.example.com@\ncustom-key\x0ccustom-value'
+    )
+    header_set = [
+        (':method', 'GET',),
+        (':scheme', 'https',),
+        (':path', '/index.html',),
+        (':authority', 'www.example.com',),
+        ('custom-key', 'custom-value'),
+    ]
+
+    def test_decodes_fields_as_they_complete(self):
+        """
+        Each header is returned by the feed call that completes it.
+        """
+        d = Decoder()
+
+        assert d.feed(self.block[:5]) == self.header_set[:3]
+        assert d.feed(self.block[5:25]) == self.header_set[3:4]
+        assert d.feed(self.block[25:]) == self.header_set[4:]
+        d.finish()
+
+        assert list(d.header_table.dynamic_entries) == [
+            (b'custom-key', b'custom-value')
+        ]
+
+    def test_every_split_point(self):
+        """
+        Splitting a header block anywhere decodes the same headers.
+        """
+        for split in range(len(self.block) + 1):
+            d = Decoder()
+            headers = d.feed(self.block[:split])
+            headers += d.feed(self.block[split:])
+            d.finish()
+            assert headers == self.header_set
+
+    def test_byte_at_a_time(self):
+        """
+        Header blocks can be decoded a single byte at a time, and the decoder
+        can then be reused for the next block.
+        """
+        d = Decoder()
+        for _ in range(2):
+            headers = []
+            for i in range(len(self.block)):
+                headers += d.feed(self.block[i:i + 1], raw=True)
+            d.finish()
+
+            assert headers == [
+                (n.encode('utf-8'), v.encode('utf-8'))
+                for n, v in self.header_set
+            ]
+
+    def test_finish_rejects_truncated_block(self):
+        """
+        Finishing a block partway through a representation is an error.
+        """
+        d = Decoder()
+        d.feed(self.block[:-1])
+
+        with pytest.raises(HPACKDecodingError):
+            d.finish()
+
+        # The decoder is ready for the next block.
+        assert d.feed(b'\x82') == [(':method', 'GET')]
+        d.finish()
+
+    def test_table_size_update_after_headers_rejected(self):
+        """
+        A table size update in a later fragment of a block that already held
+        a header is forbidden.
+        """
+        d = Decoder()
+        d.feed(b'\x82')
+
+        with pytest.raises(HPACKDecodingError):
+            d.feed(b'?a')
+
+    def test_table_size_update_at_start_allowed(self):
+        d = Decoder()
+        assert d.feed(b'?') == []
+        assert d.feed(b'a\x82') == [(':method', 'GET')]
+        d.finish()
+
+        assert d.header_table_size == 128
+
+    def test_finish_checks_table_size(self):
+        """
+        As with decode, the peer must have shrunk the table by the end of the
+        block.
+        """
+        d = Decoder()
+        d.max_allowed_table_size = 128
+        d.feed(b'\x82')
+
+        with pytest.raises(InvalidTableSizeError):
+            d.finish()
+
+    def test_max_header_list_size(self):
+        d = Decoder(max_header_list_size=44)
+        data = b'\x14\x0c/sample/path'
+
+        with pytest.raises(OversizedHeaderListError):
+            d.feed(data)
+
+    def test_oversized_literal_rejected_before_buffering(self):
+        """
+        A literal that is declared too long to fit is rejected as soon as its
+        length arrives.
+        """
+        d = Decoder(max_header_list_size=1000)
+        # A literal value 2000 bytes long.
+        data = b'\x04\x7f\xd1\x0f'
+
+        with pytest.raises(OversizedHeaderListError):
+            d.feed(data)
+
+    def test_oversized_huffman_literal_rejected_before_buffering(self):
+        d = Decoder(max_header_list_size=1000)
+        # A Huffman-coded literal name and value, 4000 bytes each.
+        data = b'\x00\xff\xa1\x1f'
+
+        with pytest.raises(OversizedHeaderListError):
+            d.feed(data)
+
+    def test_huffman_literal_within_bound_buffered(self):
+        """
+        A Huffman-coded literal that could decode small enough is buffered.
+        """
+        d = Decoder(max_header_list_size=100)
+        # A Huffman-coded literal value 100 bytes long, which decodes to at
+        # least 26 bytes.
+        data = b'\x04\xe4'
+
+        assert d.feed(data) == []
+
+    @pytest.mark.parametrize(
+        'start',
+        [b'\xff', b'\x7f', b'\x00\x7f', b'\x04\x7f'],
+        ids=['index', 'name index', 'name length', 'value length']
+    )
+    def test_endless_integer_rejected(self, start):
+        """
+        An integer whose continuation bytes never end is rejected once it
+        is longer than any valid integer, rather than buffered forever.
+        """
+        d = Decoder(max_header_list_size=4096)
+        d.feed(start)
+
+        with pytest.raises(HPACKDecodingError):
+            for _ in range(10):
+                d.feed(b'\x80')
+
+    def test_long_literal_fed_in_small_fragments(self):
+        """
+        A literal fed a byte at a time decodes once its last byte arrives.
+        """
+        e = Encoder()
+        header_set = [('custom-key', 'v' * 5000)]
+        block = e.encode(header_set, huffman=False)
+        d = Decoder()
+
+        headers = []
+        for i in range(len(block)):
+            headers += d.feed(block[i:i + 1])
+        d.finish()
+
+        assert headers == header_set
+
+
+class TestSnapshots(object):
+    """
+    Tests for carrying an encoder's or decoder's compression context over to
+    a new one.
+    """
+    header_sets = [
+        [(':method', 'GET'), (':path', '/'), ('custom-key', 'custom-value')],
+        [(':method', 'GET'), ('custom-key', 'custom-value'), ('a', 'b' * 50)],
+        [('custom-key', 'custom-value'), ('a', 'b' * 50), ('c', 'd')],
+    ]
+
+    def test_encoder_restore_encodes_identically(self):
+        e = Encoder()
+        d = Decoder()
+        for header_set in self.header_sets:
+            d.decode(e.encode(header_set))
+
+        restored = Encoder()
+        restored.restore(e.snapshot())
+        for header_set in self.header_sets:
+            block = e.encode(header_set)
+            assert restored.encode(header_set) == block
+            assert d.decode(block) == header_set
+
+    def test_encoder_keeps_pending_table_size_changes(self):
+        e = Encoder()
+        e.header_table_size = 1024
+        e.header_table_size = 2048
+
+        restored = Encoder()
+        restored.restore(e.snapshot())
+
+        assert restored.table_size_changes == [1024, 2048]
+        assert restored.header_table_size == 2048
+        assert restored.encode([]) == e.encode([])
+
+    def test_decoder_restore_decodes_identically(self):
+        e = Encoder()
+        d = Decoder()
+        d.max_allowed_table_size = 8192
+        for header_set in self.header_sets:
+            d.decode(e.encode(header_set))
+
+        restored = Decoder()
+        restored.restore(d.snapshot())
+
+        assert restored.max_allowed_table_size == 8192
+        for header_set in self.header_sets:
+            assert restored.decode(e.encode(header_set)) == header_set
+
+    def test_decoder_keeps_fed_fragment(self):
+        e = Encoder()
+        block = e.encode(self.header_sets[0])
+        d = Decoder()
+        headers = d.feed(block[:-3])
+
+        restored = Decoder()
+        restored.restore(d.snapshot())
+        headers += restored.feed(block[-3:])
+        restored.finish()
+
+        assert headers == self.header_sets[0]
+
+    def test_encoder_and_decoder_snapshots_differ(self):
+        with pytest.raises(InvalidSnapshotError):
+            Decoder().restore(Encoder().snapshot())
+        with pytest.raises(InvalidSnapshotError):
+            Encoder().restore(Decoder().snapshot())
+
+    @pytest.mark.parametrize('cls', [Encoder, Decoder])
+    def test_invalid_snapshot_leaves_state_unchanged(self, cls):
+        source = cls()
+        source.header_table.add(b'new', b'entry')
+        obj = cls()
+        obj.header_table.add(b'old', b'entry')
+
+        with pytest.raises(InvalidSnapshotError):
+            obj.restore(source.snapshot()[:-1])
+        assert list(obj.header_table.dynamic_entries) == [(b'old', b'entry')]
+
+
+class TestDebugLogging(object):
+    """
+    Debug messages are only logged when debug logging is turned on.
+    """
+    def teardown_method(self, method):
+        set_debug_logging(False)
+
+    def exercise(self):
+        e = Encoder()
+        d = Decoder()
+        e.header_table_size = 100
+        header_set = [('custom-key', 'a' * 30), ('custom-key', 'b' * 30)]
+        d.decode(e.encode(header_set))
+        d.feed(e.encode(header_set))
+        d.finish()
+        decode_integer(bytes(encode_integer(200, 7)), 7)
+
+    def test_off_logs_nothing(self, caplog):
+        caplog.set_level(logging.DEBUG)
+        set_debug_logging(False)
+        self.exercise()
+
+        assert not [r for r in caplog.records if r.name.startswith('hpack')]
+
+    def test_on_logs_debug_messages(self, caplog):
+        caplog.set_level(logging.DEBUG)
+        set_debug_logging(True)
+        self.exercise()
+
+        messages = [
+            r.getMessage() for r in caplog.records
+            if r.name.startswith('hpack')
+        ]
+        for prefix in ['Encoding 200', 'Decoded 200', 'HPACK encoding',
+                       'Encoded header block', 'Adding', 'Decoding',
+                       'Decoding fragment', 'Decoded', 'Resizing',
+                       'Evicting']:
+            assert any(m.startswith(prefix) for m in messages), prefix
+
+
 class TestDictToIterable(object):
     """
     The dict_to_iterable function has some subtle requirements: validates that
@@ -37,6 +37,31 @@ class TestHPACKDecoderIntegration(object):
                 isinstance(header, HeaderTuple) for header in decoded_headers
             )
 
+    def test_can_decode_a_story_in_fragments(self, story):
+        d = Decoder()
+
+        # We test against draft 9 of the HPACK spec.
+        if story['draft'] != 9:
+            skip("We test against draft 9, not draft %d" % story['draft'])
+
+        for case in story['cases']:
+            try:
+                d.header_table_size = case['header_table_size']
+            except KeyError:
+                pass
+            wire = unhexlify(case['wire'])
+            decoded_headers = []
+            for i in range(0, len(wire), 7):
+                decoded_headers += d.feed(wire[i:i + 7])
+            d.finish()
+
+            correct_headers = [
+                (item[0], item[1])
+                for header in case['headers']
+                for item in header.items()
+            ]
+            assert correct_headers == decoded_headers
+
     def test_can_encode_a_story_no_huffman(self, raw_story):
         d = Decoder()
         e = Encoder()
@@ -73,3 +98,31 @@ class TestHPACKDecoderIntegration(object):
             decoded_headers = d.decode(encoded)
 
             assert input_headers == decoded_headers
+
+    def test_can_encode_a_story_with_block_cache(self, raw_story):
+        e = Encoder()
+        cached = Encoder(block_cache_size=16)
+
+        for case in raw_story['cases']:
+            input_headers = [
+                (item[0], item[1])
+                for header in case['headers']
+                for item in header.items()
+            ]
+
+            for _ in range(2):
+                assert cached.encode(input_headers) == e.encode(input_headers)
+
+    def test_can_encode_a_story_with_huffman_cache(self, raw_story):
+        d = Decoder()
+        e = Encoder(huffman_cache=True)
+
+        for case in raw_story['cases']:
+            input_headers = [
+                (item[0], item[1])
+                for header in case['headers']
+                for item in header.items()
+            ]
+
+            encoded = e.encode(input_headers, huffman=True)
+            assert input_headers == d.decode(encoded)
@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+import textwrap
+
+import hpack
+from hpack.cache import LRUCache
 from hpack.exceptions import HPACKDecodingError
-from hpack.huffman_table import decode_huffman
+from hpack.huffman_table import (
+    decode_huffman, decode_huffman_nibbles, HUFFMAN_STATES, HUFFMAN_FLAGS,
+    HUFFMAN_SYMBOLS
+)
 from hpack.huffman import HuffmanEncoder
 from hpack.huffman_constants import REQUEST_CODES, REQUEST_CODES_LENGTH
 
@@ -33,8 +43,38 @@ class TestHuffman(object):
             encoder.encode(b"custom-value") == b'%\xa8I\xe9[\xb8\xe8\xb4\xbf'
         )
 
+    def test_huffman_encode_with_cache(self):
+        cache = LRUCache(10)
+        encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH, cache)
+        expected = b'\xf1\xe3\xc2\xe5\xf2:k\xa0\xab\x90\xf4\xff'
+
+        assert encoder.encode(b"www.example.com") == expected
+        assert encoder.encode(b"www.example.com") == expected
+        assert encoder.encode(b"") == b""
+        assert cache.get(b"www.example.com") == expected
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    def test_encoders_share_bit_strings(self):
+        """
+        Encoders using the same code table share their precomputed codes, so
+        creating one is cheap.
+        """
+        first = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+        second = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+        assert first._bit_strings is second._bit_strings
+
 
 class TestHuffmanDecoder(object):
+    def test_table_has_sixteen_entries_per_state(self):
+        """
+        The unpacked nibble table has 16 entries for every state.
+        """
+        assert len(HUFFMAN_STATES) == 256 * 16
+        assert len(HUFFMAN_FLAGS) == 256 * 16
+        assert len(HUFFMAN_SYMBOLS) == 256 * 16
+        assert max(HUFFMAN_STATES) == 255
+
     @given(data=binary())
     @example(b'\xff')
     @example(b'\x5f\xff\xff\xff\xff')
@@ -53,3 +93,74 @@ class TestHuffmanDecoder(object):
             result = b''
 
         assert isinstance(result, bytes)
+
+    @given(data=binary())
+    @example(b'\xff')
+    @example(b'\x5f\xff\xff\xff\xff')
+    @example(b'\x00\x3f\xff\xff\xff')
+    @example(b'\xfe\x3f')
+    def test_byte_decoder_matches_nibble_decoder(self, data):
+        """
+        The byte-at-a-time decoder accepts and rejects exactly the same
+        strings as the nibble-based decoder, and decodes them identically.
+        """
+        try:
+            expected = decode_huffman_nibbles(data)
+        except HPACKDecodingError as e:
+            expected = str(e)
+
+        try:
+            result = decode_huffman(data)
+        except HPACKDecodingError as e:
+            result = str(e)
+
+        assert result == expected
+
+    @given(data=binary())
+    def test_huffman_round_trips(self, data):
+        encoder = HuffmanEncoder(REQUEST_CODES, REQUEST_CODES_LENGTH)
+        assert decode_huffman(encoder.encode(data)) == data
+
+
+class TestHuffmanDecoderImport(object):
+    """
+    The byte-at-a-time decoding table is only built when something is first
+    Huffman-decoded, so processes that don't do that never pay for it.
+    """
+    def run(self, code):
+        """
+        Runs code in a fresh interpreter that imports hpack, and returns
+        whether the decoding table had been built by the end.
+        """
+        code = textwrap.dedent(code) + textwrap.dedent("""
+            import hpack.huffman_table
+            print(hpack.huffman_table._BYTE_NEXT_STATE is not None)
+        """)
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(hpack.__file__))
+        output = subprocess.check_output(
+            [sys.executable, '-c', 'import hpack\n' + code], env=env
+        )
+        return output.strip() == b'True'
+
+    def test_not_built_on_import(self):
+        assert not self.run('')
+
+    def test_not_built_by_encoding(self):
+        assert not self.run("""
+            hpack.Encoder().encode([('custom-key', 'custom-value')])
+        """)
+
+    def test_not_built_by_decoding_plain_literals(self):
+        assert not self.run("""
+            e = hpack.Encoder()
+            d = hpack.Decoder()
+            d.decode(e.encode([('custom-key', 'custom-value')], False))
+        """)
+
+    def test_built_by_huffman_decoding(self):
+        assert self.run("""
+            e = hpack.Encoder()
+            d = hpack.Decoder()
+            d.decode(e.encode([('custom-key', 'custom-value')]))
+        """)
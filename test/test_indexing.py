@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from hpack.indexing import (
+    IndexingPolicy, DenylistIndexingPolicy, MaxSizeIndexingPolicy,
+    AdaptiveIndexingPolicy, CombinedIndexingPolicy, DEFAULT_DENYLIST
+)
+
+
+class TestIndexingPolicy(object):
+    def test_indexes_everything(self):
+        policy = IndexingPolicy()
+        assert policy.should_index(b'date', b'Mon, 1 Jan 2018')
+        policy.reused(b'date', b'Mon, 1 Jan 2018')
+        assert policy.should_index(b'date', b'Mon, 1 Jan 2018')
+
+
+class TestDenylistIndexingPolicy(object):
+    def test_default_denylist(self):
+        policy = DenylistIndexingPolicy()
+        assert policy.names == DEFAULT_DENYLIST
+        assert not policy.should_index(b'content-length', b'1234')
+        assert not policy.should_index(b':path', b'/search?q=hpack')
+        assert policy.should_index(b'content-type', b'text/html')
+
+    def test_custom_denylist(self):
+        policy = DenylistIndexingPolicy([b'date'])
+        assert not policy.should_index(b'date', b'Mon, 1 Jan 2018')
+        assert policy.should_index(b'content-length', b'1234')
+
+
+class TestMaxSizeIndexingPolicy(object):
+    def test_limits_entry_size(self):
+        policy = MaxSizeIndexingPolicy(40)
+        # Entries carry 32 octets of overhead.
+        assert policy.should_index(b'name', b'valu')
+        assert not policy.should_index(b'name', b'value')
+
+    def test_default_size(self):
+        policy = MaxSizeIndexingPolicy()
+        assert policy.should_index(b'cookie', b'a' * 474)
+        assert not policy.should_index(b'cookie', b'a' * 475)
+
+
+class TestAdaptiveIndexingPolicy(object):
+    def test_indexes_during_warmup(self):
+        policy = AdaptiveIndexingPolicy(warmup=4)
+        assert all(
+            policy.should_index(b'x-id', str(i).encode('ascii'))
+            for i in range(4)
+        )
+        assert not policy.should_index(b'x-id', b'4')
+
+    def test_keeps_indexing_reused_names(self):
+        policy = AdaptiveIndexingPolicy(min_reuse=0.5, warmup=2)
+        for _ in range(10):
+            assert policy.should_index(b'server', b'nginx')
+            policy.reused(b'server', b'nginx')
+
+    def test_stops_indexing_rarely_reused_names(self):
+        policy = AdaptiveIndexingPolicy(min_reuse=0.5, warmup=4)
+        for i in range(4):
+            assert policy.should_index(b'x-id', str(i).encode('ascii'))
+        policy.reused(b'x-id', b'3')
+
+        assert not policy.should_index(b'x-id', b'4')
+
+        # Enough reuses bring it back.
+        policy.reused(b'x-id', b'3')
+        assert policy.should_index(b'x-id', b'5')
+
+    def test_probes_names_that_are_not_indexed(self):
+        policy = AdaptiveIndexingPolicy(warmup=1, probe_interval=4)
+        decisions = [policy.should_index(b'x-id', b'v') for _ in range(9)]
+        assert decisions == [
+            True, False, False, False, True, False, False, False, True
+        ]
+
+    def test_limits_tracked_names(self):
+        policy = AdaptiveIndexingPolicy(warmup=1, max_names=1)
+        assert policy.should_index(b'a', b'')
+        assert policy.should_index(b'b', b'')
+        assert policy.should_index(b'b', b'')
+        policy.reused(b'b', b'')
+        assert not policy.should_index(b'a', b'')
+
+
+class TestCombinedIndexingPolicy(object):
+    def test_all_policies_must_agree(self):
+        policy = CombinedIndexingPolicy(
+            DenylistIndexingPolicy(), MaxSizeIndexingPolicy(40)
+        )
+        assert policy.should_index(b'name', b'valu')
+        assert not policy.should_index(b'name', b'value')
+        assert not policy.should_index(b'content-length', b'1')
+
+    def test_reuse_is_passed_on(self):
+        adaptive = AdaptiveIndexingPolicy(warmup=1)
+        policy = CombinedIndexingPolicy(IndexingPolicy(), adaptive)
+        assert policy.should_index(b'server', b'nginx')
+        policy.reused(b'server', b'nginx')
+        assert policy.should_index(b'server', b'nginx')
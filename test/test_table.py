@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 from hpack.table import HeaderTable, table_entry_size
-from hpack.exceptions import InvalidTableIndex
+from hpack.exceptions import InvalidTableIndex, InvalidSnapshotError
 import pytest
 import sys
+
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+
 _ver = sys.version_info
 is_py2 = _ver[0] == 2
 is_py3 = _ver[0] == 3
 
+NAMES = [b'TestName', b'OtherName', b':authority', b'a' * 40]
+VALUES = [b'TestValue', b'OtherValue', b'', b'b' * 40]
+
 
 class TestPackageFunctions(object):
     def test_table_entry_size(self):
@@ -156,3 +163,273 @@ class TestHeaderTable(object):
         tbl.maxsize = 146
         assert len(tbl.dynamic_entries) == 2
         assert tbl._current_size == 98
+
+    def test_search_prefers_most_recent_duplicate(self):
+        tbl = HeaderTable()
+        off = len(HeaderTable.STATIC_TABLE)
+        tbl.add(b'TestName', b'TestValue')
+        tbl.add(b'TestName', b'OtherValue')
+        tbl.add(b'TestName', b'TestValue')
+        assert tbl.search(b'TestName', b'TestValue') == (
+            off + 1, b'TestName', b'TestValue'
+        )
+        assert tbl.search(b'TestName', b'OtherValue') == (
+            off + 2, b'TestName', b'OtherValue'
+        )
+        assert tbl.search(b'TestName', b'NotInTable') == (
+            off + 1, b'TestName', None
+        )
+
+    def test_search_static_partial_beats_dynamic_partial(self):
+        tbl = HeaderTable()
+        tbl.add(b':authority', b'example.com')
+        assert tbl.search(b':authority', b'NotInTable') == (
+            1, b':authority', None
+        )
+
+    def test_search_after_eviction(self):
+        tbl = HeaderTable()
+        off = len(HeaderTable.STATIC_TABLE)
+        tbl.maxsize = 99
+        tbl.add(b'TestName', b'TestValue')
+        tbl.add(b'TestName', b'TestValue')
+        tbl.add(b'OtherName', b'TestValue')
+        assert tbl.search(b'TestName', b'TestValue') == (
+            off + 2, b'TestName', b'TestValue'
+        )
+        tbl.add(b'OtherName', b'TestValue')
+        assert tbl.search(b'TestName', b'TestValue') is None
+        tbl.maxsize = 0
+        assert tbl.search(b'OtherName', b'TestValue') is None
+
+    def test_text_kept_until_eviction(self):
+        tbl = HeaderTable()
+        tbl.maxsize = 99
+        tbl.set_text(b'TestName', b'TestValue', 'not in table')
+        assert tbl.get_text(b'TestName', b'TestValue') is None
+
+        tbl.add(b'TestName', b'TestValue')
+        tbl.set_text(b'TestName', b'TestValue', 'text')
+        tbl.add(b'TestName', b'TestValue')
+        tbl.add(b'OtherName', b'TestValue')
+        assert tbl.get_text(b'TestName', b'TestValue') == 'text'
+
+        tbl.add(b'OtherName', b'TestValue')
+        assert tbl.get_text(b'TestName', b'TestValue') is None
+
+    def test_text_dropped_when_cleared(self):
+        tbl = HeaderTable()
+        tbl.add(b'TestName', b'TestValue')
+        tbl.set_text(b'TestName', b'TestValue', 'text')
+        tbl.maxsize = 0
+        assert tbl.get_text(b'TestName', b'TestValue') is None
+
+    @given(
+        entries=lists(
+            tuples(sampled_from(NAMES), sampled_from(VALUES)), max_size=50
+        ),
+        maxsize=integers(min_value=0, max_value=500),
+        name=sampled_from(NAMES),
+        value=sampled_from(VALUES),
+    )
+    def test_search_matches_linear_scan(self, entries, maxsize, name, value):
+        """
+        The indexed search finds exactly what a scan of the table would.
+        """
+        tbl = HeaderTable()
+        tbl.maxsize = maxsize
+        for entry in entries:
+            tbl.add(*entry)
+
+        expected = None
+        header_name_search_result = HeaderTable.STATIC_TABLE_MAPPING.get(name)
+        if header_name_search_result:
+            index = header_name_search_result[1].get(value)
+            if index is not None:
+                assert tbl.search(name, value) == (index, name, value)
+                return
+            expected = (header_name_search_result[0], name, None)
+        offset = HeaderTable.STATIC_TABLE_LENGTH + 1
+        for (i, (n, v)) in enumerate(tbl.dynamic_entries):
+            if n == name:
+                if v == value:
+                    expected = (i + offset, n, v)
+                    break
+                elif expected is None:
+                    expected = (i + offset, n, None)
+
+        assert tbl.search(name, value) == expected
+
+    @given(
+        entries=lists(
+            tuples(sampled_from(NAMES), sampled_from(VALUES)), max_size=50
+        ),
+        maxsizes=lists(integers(min_value=0, max_value=500), max_size=3),
+    )
+    def test_size_matches_entries(self, entries, maxsizes):
+        """
+        The table's size always agrees with the entries it holds, however
+        they are evicted.
+        """
+        tbl = HeaderTable()
+        for i, entry in enumerate(entries):
+            if maxsizes and i % 10 == 0:
+                tbl.maxsize = maxsizes[i % len(maxsizes)]
+            tbl.add(*entry)
+
+            assert tbl._current_size == sum(
+                table_entry_size(n, v) for n, v in tbl.dynamic_entries
+            )
+            assert tbl._current_size <= tbl.maxsize
+            assert len(tbl._entry_sizes) == len(tbl.dynamic_entries)
+
+
+class TestHeaderTableSnapshot(object):
+    def filled_table(self):
+        tbl = HeaderTable()
+        tbl.maxsize = 200
+        for i in range(6):
+            tbl.add(('name-%d' % i).encode('ascii'), b'v' * 20)
+        return tbl
+
+    def test_restore_round_trips(self):
+        tbl = self.filled_table()
+        restored = HeaderTable()
+        restored.restore(tbl.snapshot())
+
+        assert restored.maxsize == tbl.maxsize
+        assert restored.resized == tbl.resized
+        assert restored._current_size == tbl._current_size
+        assert list(restored.dynamic_entries) == list(tbl.dynamic_entries)
+        for name, value in tbl.dynamic_entries:
+            assert restored.search(name, value) == tbl.search(name, value)
+
+    def test_restore_replaces_entries(self):
+        tbl = HeaderTable()
+        tbl.add(b'old-name', b'old-value')
+        tbl.restore(HeaderTable().snapshot())
+
+        assert not tbl.dynamic_entries
+        assert tbl.search(b'old-name', b'old-value') is None
+
+    def test_restore_changes_generation(self):
+        tbl = HeaderTable()
+        generation = tbl.generation
+        tbl.restore(tbl.snapshot())
+
+        assert tbl.generation != generation
+
+    @pytest.mark.parametrize('cut', [1, 5, 12, 20])
+    def test_truncated_snapshot(self, cut):
+        data = self.filled_table().snapshot()
+        tbl = HeaderTable()
+        tbl.add(b'kept', b'entry')
+
+        with pytest.raises(InvalidSnapshotError):
+            tbl.restore(data[:-cut])
+        assert list(tbl.dynamic_entries) == [(b'kept', b'entry')]
+
+    def test_trailing_data(self):
+        with pytest.raises(InvalidSnapshotError):
+            HeaderTable().restore(HeaderTable().snapshot() + b'\x00')
+
+    def test_wrong_tag(self):
+        data = HeaderTable().snapshot()
+        with pytest.raises(InvalidSnapshotError):
+            HeaderTable().restore(b'E' + data[1:])
+
+    def test_unknown_version(self):
+        data = HeaderTable().snapshot()
+        with pytest.raises(InvalidSnapshotError):
+            HeaderTable().restore(data[:1] + b'\xff' + data[2:])
+
+    def test_entries_larger_than_table(self):
+        data = bytearray(self.filled_table().snapshot())
+        # Shrink the maximum size, which follows the two byte header.
+        data[2:6] = b'\x00\x00\x00\x10'
+        with pytest.raises(InvalidSnapshotError):
+            HeaderTable().restore(bytes(data))
+
+
+class TestHeaderTableFork(object):
+    def warmed_table(self):
+        tbl = HeaderTable()
+        for i in range(10):
+            tbl.add(('name-%d' % i).encode('ascii'), b'value')
+        return tbl
+
+    def test_fork_shares_entries(self):
+        tbl = self.warmed_table()
+        forked = tbl.fork()
+
+        assert forked.dynamic_entries is tbl.dynamic_entries
+        assert forked._header_index is tbl._header_index
+        assert forked.search(b'name-3', b'value') == \
+            tbl.search(b'name-3', b'value')
+        assert forked.generation == tbl.generation
+
+    def test_add_to_fork_leaves_original(self):
+        tbl = self.warmed_table()
+        original = list(tbl.dynamic_entries)
+        forked = tbl.fork()
+        forked.add(b'new-name', b'new-value')
+
+        assert list(tbl.dynamic_entries) == original
+        assert tbl.search(b'new-name', b'new-value') is None
+        assert forked.search(b'new-name', b'new-value')[0] == \
+            HeaderTable.STATIC_TABLE_LENGTH + 1
+
+    def test_add_to_original_leaves_fork(self):
+        tbl = self.warmed_table()
+        forked = tbl.fork()
+        original = list(forked.dynamic_entries)
+        tbl.add(b'new-name', b'new-value')
+
+        assert list(forked.dynamic_entries) == original
+        assert forked.search(b'new-name', b'new-value') is None
+
+    def test_shrinking_fork_leaves_original(self):
+        tbl = self.warmed_table()
+        size = tbl._current_size
+        forked = tbl.fork()
+        forked.maxsize = 100
+
+        assert tbl._current_size == size
+        assert len(tbl.dynamic_entries) == 10
+        assert len(forked.dynamic_entries) == 2
+
+    def test_clearing_fork_leaves_original(self):
+        tbl = self.warmed_table()
+        forked = tbl.fork()
+        forked.maxsize = 0
+
+        assert len(tbl.dynamic_entries) == 10
+        assert tbl.search(b'name-0', b'value') is not None
+        assert not forked.dynamic_entries
+
+    def test_set_text_on_fork_leaves_original(self):
+        tbl = self.warmed_table()
+        forked = tbl.fork()
+        forked.set_text(b'name-0', b'value', (u'name-0', u'value'))
+
+        assert forked.get_text(b'name-0', b'value') == (u'name-0', u'value')
+        assert tbl.get_text(b'name-0', b'value') is None
+
+    def test_last_sharer_stops_copying(self):
+        tbl = self.warmed_table()
+        forked = tbl.fork()
+        forked.add(b'new-name', b'new-value')
+        entries = tbl.dynamic_entries
+        tbl.add(b'other-name', b'other-value')
+
+        assert tbl.dynamic_entries is entries
+
+    def test_fork_of_fork(self):
+        tbl = self.warmed_table()
+        first = tbl.fork()
+        second = first.fork()
+        first.add(b'new-name', b'new-value')
+
+        assert list(tbl.dynamic_entries) == list(second.dynamic_entries)
+        assert second.dynamic_entries is tbl.dynamic_entries
+        assert first.search(b'new-name', b'new-value') is not None